@@ -13,7 +13,7 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
     def __init__(self):
         """Initializes a tagging analysis plugin."""
         super().__init__()
-        self._tagging_rules = None
+        self._tagging_rules_index = None
 
     def ExamineEvent(self, analysis_mediator, event, event_data, event_data_stream):
         """Labels events according to the rules in a tagging file.
@@ -25,8 +25,12 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
           event_data (EventData): event data.
           event_data_stream (EventDataStream): event data stream.
         """
+        # Only the rules that apply to the data type of the event are evaluated.
+        data_type = getattr(event_data, "data_type", None)
+        tagging_rules = self._tagging_rules_index.GetTaggingRulesByDataType(data_type)
+
         matched_label_names = []
-        for label_name, filter_objects in self._tagging_rules.items():
+        for label_name, filter_objects in tagging_rules:
             for filter_object in filter_objects:
                 # Note that tagging events based on existing labels is currently
                 # not supported.
@@ -51,7 +55,7 @@ class TaggingAnalysisPlugin(interface.AnalysisPlugin):
           tagging_file_path (str): path of the tagging file.
         """
         tagging_file_object = tagging_file.TaggingFile(tagging_file_path)
-        self._tagging_rules = tagging_file_object.GetEventTaggingRules()
+        self._tagging_rules_index = tagging_file_object.GetEventTaggingRulesIndex()
 
 
 manager.AnalysisPluginManager.RegisterPlugin(TaggingAnalysisPlugin)
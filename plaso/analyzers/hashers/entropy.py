@@ -3,6 +3,11 @@
 import collections
 import math
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from plaso.analyzers.hashers import interface
 from plaso.analyzers.hashers import manager
 
@@ -14,12 +19,60 @@ class EntropyHasher(interface.BaseHasher):
     ATTRIBUTE_NAME = "file_entropy"
     DESCRIPTION = "Calculates the byte entropy of input data."
 
+    _NUMPY_CHUNK_SIZE = 1024 * 1024
+
     def __init__(self):
         """Initializes the entropy hasher."""
         super().__init__()
-        self._byte_frequency_counter = collections.Counter()
+        self._byte_frequencies = [0] * 256
+        self._byte_values = []
         self._file_length = 0
 
+    def _GetByteFrequencies(self, data):
+        """Counts the occurrences of the byte values in a block of data.
+
+        Args:
+          data (bytes): block of data.
+
+        Returns:
+          tuple[list[int], list[int]]: number of occurrences per byte value and
+              the byte values that occur in the block of data, but not in
+              previous blocks, in order of their first occurrence.
+        """
+        if numpy is None:
+            byte_frequency_counter = collections.Counter(data)
+
+            byte_frequencies = [0] * 256
+            byte_values = []
+            for byte_value, byte_frequency in byte_frequency_counter.items():
+                byte_frequencies[byte_value] = byte_frequency
+                if not self._byte_frequencies[byte_value]:
+                    byte_values.append(byte_value)
+
+            return byte_frequencies, byte_values
+
+        # The data is counted in chunks since bincount converts the byte values
+        # to platform integers, which would otherwise require a copy of 8 times
+        # the size of the data.
+        byte_array = numpy.frombuffer(data, dtype=numpy.uint8)
+        byte_frequencies_array = numpy.zeros(256, dtype=numpy.int64)
+        for chunk_offset in range(0, len(byte_array), self._NUMPY_CHUNK_SIZE):
+            byte_frequencies_array += numpy.bincount(
+                byte_array[chunk_offset : chunk_offset + self._NUMPY_CHUNK_SIZE],
+                minlength=256,
+            )
+
+        byte_frequencies = byte_frequencies_array.tolist()
+
+        byte_values = [
+            byte_value
+            for byte_value, byte_frequency in enumerate(byte_frequencies)
+            if byte_frequency and not self._byte_frequencies[byte_value]
+        ]
+        byte_values.sort(key=data.find)
+
+        return byte_frequencies, byte_values
+
     def GetStringDigest(self):
         """Calculates the byte entropy value.
 
@@ -33,9 +86,11 @@ class EntropyHasher(interface.BaseHasher):
         if self._file_length == 0:
             return "0.000000"
 
+        # The byte probabilities are summed in order of the first occurrence of
+        # the byte values for consistent results.
         entropy = 0.0
-        for byte_frequency in self._byte_frequency_counter.values():
-            byte_probability = byte_frequency / self._file_length
+        for byte_value in self._byte_values:
+            byte_probability = self._byte_frequencies[byte_value] / self._file_length
             if byte_probability:
                 entropy += -byte_probability * math.log(byte_probability, 2)
         return f"{entropy:.6f}"
@@ -50,9 +105,16 @@ class EntropyHasher(interface.BaseHasher):
           data(bytes): block of data with which to update the context of the entropy
               calculator.
         """
-        # The call to update() determines the number of occurrences of a byte value
-        # within data.
-        self._byte_frequency_counter.update(data)
+        byte_frequencies, byte_values = self._GetByteFrequencies(data)
+
+        self._byte_values.extend(byte_values)
+
+        self._byte_frequencies = [
+            frequency + block_frequency
+            for frequency, block_frequency in zip(
+                self._byte_frequencies, byte_frequencies
+            )
+        ]
         self._file_length += len(data)
 
 
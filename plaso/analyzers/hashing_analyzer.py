@@ -1,5 +1,7 @@
 """The hashing analyzer implementation."""
 
+from concurrent import futures
+
 from plaso.analyzers import interface
 from plaso.analyzers import logger
 from plaso.analyzers import manager
@@ -13,6 +15,13 @@ class HashingAnalyzer(interface.BaseAnalyzer):
 
     In Plaso, hashers are classes that map arbitrarily sized file content to a fixed
     size value. See: https://en.wikipedia.org/wiki/Hash_function
+
+    Large blocks of data are hashed by the hashers in parallel on a pool of
+    threads, one per hasher. Since hashlib releases the GIL while hashing large
+    buffers, this allows the hashers to run concurrently with each other and
+    with the caller reading the next block of data. The results of pending
+    updates are awaited before the next block is analyzed or the results are
+    retrieved.
     """
 
     NAME = "hashing"
@@ -22,11 +31,27 @@ class HashingAnalyzer(interface.BaseAnalyzer):
 
     INCREMENTAL_ANALYZER = True
 
+    # Minimum size of a block of data to hash on the thread pool, smaller blocks
+    # are hashed on the calling thread since the overhead of dispatching them
+    # outweighs the time to hash them.
+    _MINIMUM_THREADED_DATA_SIZE = 1024 * 1024
+
     def __init__(self):
         """Initializes a hashing analyzer."""
         super().__init__()
         self._hasher_names_string = ""
         self._hashers = []
+        self._hashers_thread_pool = None
+        self._pending_updates = []
+
+    def _WaitForPendingUpdates(self):
+        """Waits for the pending hasher updates to complete."""
+        pending_updates = self._pending_updates
+        self._pending_updates = []
+
+        for pending_update in pending_updates:
+            # Note that result() raises the exception of a failed update.
+            pending_update.result()
 
     def Analyze(self, data):
         """Updates the internal state of the analyzer, processing a block of data.
@@ -37,8 +62,22 @@ class HashingAnalyzer(interface.BaseAnalyzer):
         Args:
           data (bytes): block of data from the data stream.
         """
-        for hasher in self._hashers:
-            hasher.Update(data)
+        self._WaitForPendingUpdates()
+
+        if len(data) < self._MINIMUM_THREADED_DATA_SIZE:
+            for hasher in self._hashers:
+                hasher.Update(data)
+            return
+
+        if not self._hashers_thread_pool:
+            self._hashers_thread_pool = futures.ThreadPoolExecutor(
+                max_workers=max(len(self._hashers), 1), thread_name_prefix="Hasher"
+            )
+
+        self._pending_updates = [
+            self._hashers_thread_pool.submit(hasher.Update, data)
+            for hasher in self._hashers
+        ]
 
     def GetResults(self):
         """Retrieves the hashing results.
@@ -46,6 +85,8 @@ class HashingAnalyzer(interface.BaseAnalyzer):
         Returns:
           list[AnalyzerResult]: results.
         """
+        self._WaitForPendingUpdates()
+
         results = []
         for hasher in self._hashers:
             logger.debug(f"Processing results for hasher {hasher.NAME:s}")
@@ -58,6 +99,8 @@ class HashingAnalyzer(interface.BaseAnalyzer):
 
     def Reset(self):
         """Resets the internal state of the analyzer."""
+        self._WaitForPendingUpdates()
+
         hasher_names = hashers_manager.HashersManager.GetHasherNamesFromString(
             self._hasher_names_string
         )
@@ -76,6 +119,12 @@ class HashingAnalyzer(interface.BaseAnalyzer):
         hasher_names_string = ", ".join(hasher_names)
         logger.debug(f"[SetHasherNames] hasher names: {hasher_names_string:s}")
 
+        self._WaitForPendingUpdates()
+
+        if self._hashers_thread_pool:
+            self._hashers_thread_pool.shutdown()
+            self._hashers_thread_pool = None
+
         self._hashers = hashers_manager.HashersManager.GetHashers(hasher_names)
         self._hasher_names_string = hasher_names_string
 
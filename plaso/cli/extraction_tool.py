@@ -88,11 +88,14 @@ class ExtractionTool(
         self._artifacts_registry = None
         self._buffer_size = 0
         self._command_line_arguments = None
+        self._data_stream_deduplication = definitions.DATA_STREAM_DEDUPLICATION_NONE
         self._enable_sigsegv_handler = False
         self._expanded_parser_filter_expression = None
         self._extract_winevt_resources = True
         self._extract_winreg_binary = True
         self._number_of_extraction_workers = 0
+        self._parse_cache_path = None
+        self._parse_cache_size = None
         self._parser_filter_expression = None
         self._preferred_codepage = None
         self._preferred_language = None
@@ -109,6 +112,8 @@ class ExtractionTool(
         self._status_view_file = "status.info"
         self._status_view_interval = 0.5
         self._status_view_mode = status_view.StatusView.MODE_WINDOW
+        self._storage_compression_dictionaries = None
+        self._storage_compression_format = definitions.DEFAULT_COMPRESSION_FORMAT
         self._storage_file_path = None
         self._storage_format = definitions.STORAGE_FORMAT_SQLITE
         self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
@@ -192,6 +197,9 @@ class ExtractionTool(
         configuration.custom_artifacts_path = self._custom_artifacts_path
         configuration.data_location = self._data_location
         configuration.extraction.archive_types_string = self._archive_types_string
+        configuration.extraction.data_stream_deduplication = (
+            self._data_stream_deduplication
+        )
         configuration.artifact_filters = self._artifact_filters
         configuration.credentials = self._credential_configurations
         configuration.debug_output = self._debug_mode
@@ -201,6 +209,8 @@ class ExtractionTool(
         )
         configuration.extraction.extract_winreg_binary = self._extract_winreg_binary
         configuration.extraction.hasher_names_string = self._hasher_names_string
+        configuration.extraction.parse_cache_path = self._parse_cache_path
+        configuration.extraction.parse_cache_size = self._parse_cache_size
         configuration.extraction.process_compressed_streams = (
             self._process_compressed_streams
         )
@@ -844,7 +854,11 @@ class ExtractionTool(
             )
 
         try:
-            storage_writer.Open(path=self._storage_file_path)
+            storage_writer.Open(
+                path=self._storage_file_path,
+                compression_dictionaries=self._storage_compression_dictionaries,
+                compression_format=self._storage_compression_format,
+            )
         except OSError as exception:
             raise OSError(f"Unable to open storage with error: {exception!s}")
 
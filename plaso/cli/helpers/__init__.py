@@ -23,6 +23,7 @@ from plaso.cli.helpers import nsrlsvr_analysis
 from plaso.cli.helpers import opensearch_output
 from plaso.cli.helpers import opensearch_ts_output
 from plaso.cli.helpers import output_modules
+from plaso.cli.helpers import parquet_output
 from plaso.cli.helpers import parsers
 from plaso.cli.helpers import profiling
 from plaso.cli.helpers import process_resources
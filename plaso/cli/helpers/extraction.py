@@ -1,8 +1,11 @@
 """The extraction CLI arguments helper."""
 
+import os
+
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
+from plaso.lib import definitions
 from plaso.lib import errors
 
 
@@ -23,6 +26,24 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
           argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
               argparse group.
         """
+        argument_group.add_argument(
+            "--data_stream_deduplication",
+            "--data-stream-deduplication",
+            metavar="POLICY",
+            dest="data_stream_deduplication",
+            choices=sorted(definitions.DATA_STREAM_DEDUPLICATION_POLICIES),
+            default=definitions.DATA_STREAM_DEDUPLICATION_NONE,
+            help=(
+                "Deduplication policy of data streams with identical content, "
+                "such as files in multiple Volume Shadow Snapshots (VSS). The "
+                "content of a duplicate data stream is not extracted, but its "
+                "file system metadata is. Supported policies are: content, to "
+                "deduplicate data streams with identical content, location, to "
+                "deduplicate data streams with identical content and location "
+                "and none, to not deduplicate data streams. The default is none."
+            ),
+        )
+
         argument_group.add_argument(
             "--extract_winreg_binary",
             "--extract-winreg-binary",
@@ -35,6 +56,39 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
             ),
         )
 
+        argument_group.add_argument(
+            "--parse_cache",
+            "--parse-cache",
+            dest="parse_cache",
+            type=str,
+            action="store",
+            default=None,
+            metavar="DIRECTORY",
+            help=(
+                "Path to the directory of a persistent cache of parse results. "
+                "The parse results of data streams that were parsed by an "
+                "earlier run with the same parsers and plaso version, such as "
+                "re-running on the same source, are reused instead of parsing "
+                "the data streams again. The directory is created if it does "
+                "not exist."
+            ),
+        )
+
+        argument_group.add_argument(
+            "--parse_cache_size",
+            "--parse-cache-size",
+            dest="parse_cache_size",
+            type=int,
+            action="store",
+            default=None,
+            metavar="SIZE",
+            help=(
+                "Maximum size in bytes of the persistent cache of parse results. "
+                "The least recently used parse results are removed when the "
+                "cache exceeds this size. The default is 4 GiB."
+            ),
+        )
+
         argument_group.add_argument(
             "--preferred_year",
             "--preferred-year",
@@ -81,12 +135,47 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
 
         preferred_year = cls._ParseNumericOption(options, "preferred_year")
 
+        data_stream_deduplication = getattr(
+            options,
+            "data_stream_deduplication",
+            definitions.DATA_STREAM_DEDUPLICATION_NONE,
+        )
+        if (
+            data_stream_deduplication
+            not in definitions.DATA_STREAM_DEDUPLICATION_POLICIES
+        ):
+            raise errors.BadConfigOption(
+                f"Unsupported data stream deduplication policy: "
+                f"{data_stream_deduplication!s}."
+            )
+
         extract_winreg_binary = getattr(options, "extract_winreg_binary", False)
+
+        parse_cache_path = cls._ParseStringOption(options, "parse_cache")
+        if parse_cache_path and os.path.exists(parse_cache_path):
+            if not os.path.isdir(parse_cache_path):
+                raise errors.BadConfigOption(
+                    f"Parse cache: {parse_cache_path:s} is not a directory."
+                )
+
+        parse_cache_size = cls._ParseNumericOption(options, "parse_cache_size")
+        if parse_cache_size is not None and parse_cache_size <= 0:
+            raise errors.BadConfigOption(
+                "Invalid parse cache size value must be larger than 0."
+            )
+
         process_compressed_streams = getattr(
             options, "process_compressed_streams", True
         )
 
+        setattr(
+            configuration_object,
+            "_data_stream_deduplication",
+            data_stream_deduplication,
+        )
         setattr(configuration_object, "_extract_winreg_binary", extract_winreg_binary)
+        setattr(configuration_object, "_parse_cache_path", parse_cache_path)
+        setattr(configuration_object, "_parse_cache_size", parse_cache_size)
         setattr(configuration_object, "_preferred_year", preferred_year)
         setattr(
             configuration_object,
@@ -31,8 +31,10 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         "timestamp_desc",
     ]
 
+    _DEFAULT_BULK_SIZE = 5 * 1024 * 1024
     _DEFAULT_FLUSH_INTERVAL = 1000
     _DEFAULT_INDEX_NAME = uuid4().hex
+    _DEFAULT_NUMBER_OF_BULK_SENDERS = 2
     _DEFAULT_PORT = 9200
     _DEFAULT_SERVER = "127.0.0.1"
 
@@ -69,6 +71,31 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
             help="Events to queue up before bulk insert to OpenSearch.",
         )
 
+        argument_group.add_argument(
+            "--bulk_size",
+            "--bulk-size",
+            dest="bulk_size",
+            type=int,
+            action="store",
+            default=cls._DEFAULT_BULK_SIZE,
+            metavar="SIZE",
+            help=(
+                "Size in bytes of the serialized events to queue up before bulk "
+                "insert to OpenSearch."
+            ),
+        )
+
+        argument_group.add_argument(
+            "--bulk_senders",
+            "--bulk-senders",
+            dest="bulk_senders",
+            type=int,
+            action="store",
+            default=cls._DEFAULT_NUMBER_OF_BULK_SENDERS,
+            metavar="NUMBER",
+            help=("Number of bulk inserts to OpenSearch that are sent concurrently."),
+        )
+
         argument_group.add_argument(
             "--opensearch-server",
             "--opensearch_server",
@@ -183,6 +210,20 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
         flush_interval = cls._ParseNumericOption(
             options, "flush_interval", default_value=cls._DEFAULT_FLUSH_INTERVAL
         )
+        bulk_size = cls._ParseNumericOption(
+            options, "bulk_size", default_value=cls._DEFAULT_BULK_SIZE
+        )
+        number_of_bulk_senders = cls._ParseNumericOption(
+            options, "bulk_senders", default_value=cls._DEFAULT_NUMBER_OF_BULK_SENDERS
+        )
+
+        if bulk_size <= 0:
+            raise errors.BadConfigOption(f"Invalid bulk size: {bulk_size:d}")
+
+        if number_of_bulk_senders <= 0:
+            raise errors.BadConfigOption(
+                f"Invalid number of bulk senders: {number_of_bulk_senders:d}"
+            )
 
         mappings_file_path = cls._ParseStringOption(options, "opensearch_mappings")
         opensearch_user = cls._ParseStringOption(options, "opensearch_user")
@@ -216,6 +257,8 @@ class OpenSearchOutputArgumentsHelper(interface.ArgumentsHelper):
 
         output_module.SetIndexName(index_name)
         output_module.SetFlushInterval(flush_interval)
+        output_module.SetBulkSize(bulk_size)
+        output_module.SetNumberOfBulkSenders(number_of_bulk_senders)
 
         output_module.SetUsername(opensearch_user)
         output_module.SetPassword(opensearch_password)
@@ -5,6 +5,7 @@ import sys
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
+from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.output import manager as output_manager
 
@@ -45,6 +46,19 @@ class OutputModulesArgumentsHelper(interface.ArgumentsHelper):
             dest="write",
             help="Output filename.",
         )
+        argument_group.add_argument(
+            "--output_compression",
+            "--output-compression",
+            metavar="FORMAT",
+            dest="output_compression",
+            choices=sorted(definitions.OUTPUT_COMPRESSION_FORMATS),
+            default=None,
+            help=(
+                "Compression format of the output file, supported compression "
+                "formats are: gzip, lz4 and zstd. Only supported by output "
+                "formats that write text."
+            ),
+        )
         # TODO: determine if this is repeated elsewhere and refactor this into
         # a helper function.
         arguments = sys.argv[1:]
@@ -88,6 +102,15 @@ class OutputModulesArgumentsHelper(interface.ArgumentsHelper):
 
         output_format = getattr(options, "output_format", "dynamic")
         output_filename = getattr(options, "write", None)
+        output_compression = getattr(options, "output_compression", None)
+
+        if (
+            output_compression
+            and output_compression not in definitions.OUTPUT_COMPRESSION_FORMATS
+        ):
+            raise errors.BadConfigOption(
+                f"Unsupported output compression format: {output_compression:s}."
+            )
 
         if output_format != "list":
             if not output_manager.OutputManager.HasOutputClass(output_format):
@@ -97,6 +120,7 @@ class OutputModulesArgumentsHelper(interface.ArgumentsHelper):
 
         setattr(configuration_object, "_output_format", output_format)
         setattr(configuration_object, "_output_filename", output_filename)
+        setattr(configuration_object, "_output_compression", output_compression)
 
 
 manager.ArgumentHelperManager.RegisterHelper(OutputModulesArgumentsHelper)
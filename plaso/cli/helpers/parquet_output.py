@@ -0,0 +1,100 @@
+"""The Parquet output module CLI arguments helper."""
+
+from plaso.lib import errors
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.output import parquet
+
+
+class ParquetOutputArgumentsHelper(interface.ArgumentsHelper):
+    """Parquet output module CLI arguments helper."""
+
+    NAME = "parquet"
+    CATEGORY = "output"
+    DESCRIPTION = "Argument helper for the Parquet output module."
+
+    _DEFAULT_FIELDS = ",".join(
+        [
+            "datetime",
+            "timestamp_desc",
+            "source",
+            "source_long",
+            "message",
+            "parser",
+            "display_name",
+            "tag",
+        ]
+    )
+
+    _DEFAULT_ROW_GROUP_SIZE = parquet.ParquetOutputModule.DEFAULT_ROW_GROUP_SIZE
+
+    @classmethod
+    def AddArguments(cls, argument_group):
+        """Adds command line arguments the helper supports to an argument group.
+
+        This function takes an argument parser or an argument group object and adds
+        to it all the command line arguments this helper supports.
+
+        Args:
+          argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+              argparse group.
+        """
+        argument_group.add_argument(
+            "--fields",
+            dest="fields",
+            type=str,
+            action="store",
+            default=cls._DEFAULT_FIELDS,
+            help="Defines which fields should be included in the output.",
+        )
+
+        argument_group.add_argument(
+            "--row_group_size",
+            "--row-group-size",
+            dest="row_group_size",
+            type=int,
+            action="store",
+            default=cls._DEFAULT_ROW_GROUP_SIZE,
+            metavar="NUMBER",
+            help="Number of events that are buffered and written per row group.",
+        )
+
+    @classmethod
+    def ParseOptions(cls, options, output_module):  # pylint: disable=arguments-renamed
+        """Parses and validates options.
+
+        Args:
+          options (argparse.Namespace): parser options.
+          output_module (ParquetOutputModule): output module to configure.
+
+        Raises:
+          BadConfigObject: when the output module object is of the wrong type.
+          BadConfigOption: when the output filename was not provided or
+              the row group size is invalid.
+        """
+        if not isinstance(output_module, parquet.ParquetOutputModule):
+            raise errors.BadConfigObject(
+                "Output module is not an instance of ParquetOutputModule"
+            )
+
+        fields = cls._ParseStringOption(
+            options, "fields", default_value=cls._DEFAULT_FIELDS
+        )
+
+        filename = getattr(options, "write", None)
+        if not filename:
+            raise errors.BadConfigOption(
+                'Output filename was not provided use "-w filename" to specify.'
+            )
+
+        row_group_size = cls._ParseNumericOption(
+            options, "row_group_size", default_value=cls._DEFAULT_ROW_GROUP_SIZE
+        )
+        if row_group_size <= 0:
+            raise errors.BadConfigOption(f"Invalid row group size: {row_group_size:d}")
+
+        output_module.SetFields([name.strip() for name in fields.split(",")])
+        output_module.SetRowGroupSize(row_group_size)
+
+
+manager.ArgumentHelperManager.RegisterHelper(ParquetOutputArgumentsHelper)
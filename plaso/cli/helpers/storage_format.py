@@ -1,10 +1,13 @@
 """The storage format CLI arguments helper."""
 
+import io
+
 from plaso.cli import tools
 from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.storage import compression
 
 
 class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
@@ -44,6 +47,39 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
             ),
         )
 
+        compression_formats = sorted(definitions.COMPRESSION_FORMATS)
+        compression_formats_string = ", ".join(compression_formats)
+        argument_group.add_argument(
+            "--storage_compression",
+            "--storage-compression",
+            action="store",
+            choices=compression_formats,
+            dest="storage_compression",
+            type=str,
+            metavar="FORMAT",
+            default=definitions.DEFAULT_COMPRESSION_FORMAT,
+            help=(
+                f"Compression format of the storage file, the default is: "
+                f"{definitions.DEFAULT_COMPRESSION_FORMAT:s}. Supported options: "
+                f"{compression_formats_string:s}"
+            ),
+        )
+
+        argument_group.add_argument(
+            "--storage_compression_dictionaries",
+            "--storage-compression-dictionaries",
+            action="store",
+            dest="storage_compression_dictionaries",
+            type=str,
+            metavar="PATH",
+            default=None,
+            help=(
+                "Path to a file containing compression dictionaries per event "
+                "data type, such as created by utils/benchmark_storage_compression.py. "
+                "Only supported by the lz4 and zlib storage compression formats."
+            ),
+        )
+
         storage_formats_string = ", ".join(task_storage_formats)
         argument_group.add_argument(
             "--task_storage_format",
@@ -72,8 +108,8 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
         Raises:
           BadConfigObject: when the configuration object is of the wrong type.
-          BadConfigOption: if the storage format or task storage is not defined
-              or supported.
+          BadConfigOption: if the storage format, storage compression or task
+              storage is not defined or supported.
         """
         if not isinstance(configuration_object, tools.CLITool):
             raise errors.BadConfigObject(
@@ -91,6 +127,52 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
         setattr(configuration_object, "_storage_format", storage_format)
 
+        storage_compression = cls._ParseStringOption(
+            options,
+            "storage_compression",
+            default_value=definitions.DEFAULT_COMPRESSION_FORMAT,
+        )
+        if storage_compression not in definitions.COMPRESSION_FORMATS:
+            raise errors.BadConfigOption(
+                f"Unsupported storage compression format: {storage_compression:s}"
+            )
+
+        setattr(
+            configuration_object, "_storage_compression_format", storage_compression
+        )
+
+        compression_dictionaries = None
+
+        path = cls._ParseStringOption(options, "storage_compression_dictionaries")
+        if path:
+            if storage_compression not in (
+                definitions.COMPRESSION_FORMATS_WITH_DICTIONARY
+            ):
+                raise errors.BadConfigOption(
+                    f"Storage compression format: {storage_compression:s} does not "
+                    f"support compression dictionaries."
+                )
+
+            try:
+                with io.open(path, "rt", encoding="utf-8") as file_object:
+                    compression_dictionaries = (
+                        compression.CompressionDictionariesSerializer.ReadSerialized(
+                            file_object.read()
+                        )
+                    )
+
+            except (OSError, ValueError) as exception:
+                raise errors.BadConfigOption(
+                    f"Unable to read storage compression dictionaries file: "
+                    f"{path:s} with error: {exception!s}"
+                )
+
+        setattr(
+            configuration_object,
+            "_storage_compression_dictionaries",
+            compression_dictionaries,
+        )
+
         task_storage_format = cls._ParseStringOption(options, "task_storage_format")
         if not task_storage_format:
             raise errors.BadConfigOption("Unable to determine task storage format.")
@@ -88,6 +88,14 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
     _CONTAINER_TYPE_RECOVERY_WARNING = warnings.RecoveryWarning.CONTAINER_TYPE
     _CONTAINER_TYPE_TIMELINING_WARNING = warnings.TimeliningWarning.CONTAINER_TYPE
 
+    # Prefixes of the names of the warnings counters and the corresponding
+    # warning attribute container types.
+    _WARNING_CONTAINER_TYPES = (
+        ("extraction_warnings", _CONTAINER_TYPE_EXTRACTION_WARNING),
+        ("recovery_warnings", _CONTAINER_TYPE_RECOVERY_WARNING),
+        ("timelining_warnings", _CONTAINER_TYPE_TIMELINING_WARNING),
+    )
+
     def __init__(self, input_reader=None, output_writer=None):
         """Initializes the CLI tool object.
 
@@ -122,110 +130,67 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
         Returns:
           dict[str, collections.Counter]: storage counters.
         """
-        extraction_warnings_by_path_spec = collections.Counter()
-        extraction_warnings_by_parser_chain = collections.Counter()
+        storage_counters = {}
 
-        for warning in storage_reader.GetAttributeContainers(
-            self._CONTAINER_TYPE_EXTRACTION_WARNING
-        ):
-            path_spec_string = self._GetPathSpecificationString(warning.path_spec)
+        # TODO: determine analysis report counter from actual stored analysis
+        # reports or remove.
+        storage_counters["analysis_reports"] = collections.Counter()
 
-            count_container = extraction_warnings_by_path_spec.get(path_spec_string)
-            if not count_container:
-                count_container = counts.WarningCount(number_of_events=0)
-                extraction_warnings_by_path_spec[path_spec_string] = count_container
-            count_container.number_of_events += 1
+        storage_counters["data_types"] = storage_reader.GetDataTypesCounter()
+        storage_counters["event_labels"] = storage_reader.GetEventLabelsCounter()
+        storage_counters["parsers"] = storage_reader.GetParsersCounter()
 
-            count_container = extraction_warnings_by_parser_chain.get(
-                warning.parser_chain
-            )
-            if not count_container:
-                count_container = counts.WarningCount(number_of_events=0)
-                extraction_warnings_by_parser_chain[warning.parser_chain] = (
-                    count_container
+        warnings_counters = self._GetStoredWarningsCounters(storage_reader)
+        if warnings_counters is None:
+            # Stores created before the warnings counters were maintained by
+            # the storage writer require all the warnings to be read.
+            warnings_counters = {}
+            for counter_name_prefix, container_type in self._WARNING_CONTAINER_TYPES:
+                warnings_by_path_spec, warnings_by_parser_chain = (
+                    self._CalculateWarningsCounters(storage_reader, container_type)
+                )
+                warnings_counters[f"{counter_name_prefix:s}_by_path_spec"] = (
+                    warnings_by_path_spec
+                )
+                warnings_counters[f"{counter_name_prefix:s}_by_parser_chain"] = (
+                    warnings_by_parser_chain
                 )
-            count_container.number_of_events += 1
 
-        recovery_warnings_by_path_spec = collections.Counter()
-        recovery_warnings_by_parser_chain = collections.Counter()
+        storage_counters.update(warnings_counters)
 
-        for warning in storage_reader.GetAttributeContainers(
-            self._CONTAINER_TYPE_RECOVERY_WARNING
-        ):
-            path_spec_string = self._GetPathSpecificationString(warning.path_spec)
+        return storage_counters
 
-            count_container = recovery_warnings_by_path_spec.get(path_spec_string)
-            if not count_container:
-                count_container = counts.WarningCount(number_of_events=0)
-                recovery_warnings_by_path_spec[path_spec_string] = count_container
-            count_container.number_of_events += 1
+    def _CalculateWarningsCounters(self, storage_reader, container_type):
+        """Calculates the warnings counters by reading all the warnings.
 
-            count_container = recovery_warnings_by_parser_chain.get(
-                warning.parser_chain
-            )
-            if not count_container:
-                count_container = counts.WarningCount(number_of_events=0)
-                recovery_warnings_by_parser_chain[warning.parser_chain] = (
-                    count_container
-                )
-            count_container.number_of_events += 1
+        Args:
+          storage_reader (StorageReader): storage reader.
+          container_type (str): attribute container type of the warnings.
 
-        timelining_warnings_by_path_spec = collections.Counter()
-        timelining_warnings_by_parser_chain = collections.Counter()
+        Returns:
+          tuple[collections.Counter, collections.Counter]: number of warnings per
+              path specification and per parser chain.
+        """
+        warnings_by_path_spec = collections.Counter()
+        warnings_by_parser_chain = collections.Counter()
 
-        if storage_reader.HasAttributeContainers(
-            self._CONTAINER_TYPE_TIMELINING_WARNING
-        ):
-            for warning in storage_reader.GetAttributeContainers(
-                self._CONTAINER_TYPE_TIMELINING_WARNING
-            ):
+        if storage_reader.HasAttributeContainers(container_type):
+            for warning in storage_reader.GetAttributeContainers(container_type):
                 path_spec_string = self._GetPathSpecificationString(warning.path_spec)
 
-                count_container = timelining_warnings_by_path_spec.get(path_spec_string)
+                count_container = warnings_by_path_spec.get(path_spec_string)
                 if not count_container:
                     count_container = counts.WarningCount(number_of_events=0)
-                    timelining_warnings_by_path_spec[path_spec_string] = count_container
+                    warnings_by_path_spec[path_spec_string] = count_container
                 count_container.number_of_events += 1
 
-                count_container = timelining_warnings_by_parser_chain.get(
-                    warning.parser_chain
-                )
+                count_container = warnings_by_parser_chain.get(warning.parser_chain)
                 if not count_container:
                     count_container = counts.WarningCount(number_of_events=0)
-                    timelining_warnings_by_parser_chain[warning.parser_chain] = (
-                        count_container
-                    )
+                    warnings_by_parser_chain[warning.parser_chain] = count_container
                 count_container.number_of_events += 1
 
-        storage_counters = {}
-
-        # TODO: determine analysis report counter from actual stored analysis
-        # reports or remove.
-        storage_counters["analysis_reports"] = collections.Counter()
-
-        storage_counters["data_types"] = storage_reader.GetDataTypesCounter()
-        storage_counters["event_labels"] = storage_reader.GetEventLabelsCounter()
-        storage_counters["parsers"] = storage_reader.GetParsersCounter()
-
-        storage_counters["extraction_warnings_by_path_spec"] = (
-            extraction_warnings_by_path_spec
-        )
-        storage_counters["extraction_warnings_by_parser_chain"] = (
-            extraction_warnings_by_parser_chain
-        )
-        storage_counters["recovery_warnings_by_path_spec"] = (
-            recovery_warnings_by_path_spec
-        )
-        storage_counters["recovery_warnings_by_parser_chain"] = (
-            recovery_warnings_by_parser_chain
-        )
-        storage_counters["timelining_warnings_by_path_spec"] = (
-            timelining_warnings_by_path_spec
-        )
-        storage_counters["timelining_warnings_by_parser_chain"] = (
-            timelining_warnings_by_parser_chain
-        )
-        return storage_counters
+        return warnings_by_path_spec, warnings_by_parser_chain
 
     def _CheckStorageFile(self, storage_file_path, warn_about_existing=False):
         """Checks if the storage file path is valid.
@@ -692,6 +657,59 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
 
         return storage_reader
 
+    def _GetStoredWarningsCounters(self, storage_reader):
+        """Retrieves the warnings counters maintained by the storage writer.
+
+        Args:
+          storage_reader (StorageReader): storage reader.
+
+        Returns:
+          dict[str, collections.Counter]: warnings counters per counter name or
+              None if the store does not contain warnings counters for all its
+              warnings, such as a store created by an older version of Plaso.
+        """
+        stored_warnings_counters = storage_reader.GetWarningsCounters()
+
+        warnings_counters = {}
+        for counter_name_prefix, container_type in self._WARNING_CONTAINER_TYPES:
+            number_of_warnings = 0
+            if storage_reader.HasAttributeContainers(container_type):
+                number_of_warnings = storage_reader.GetNumberOfAttributeContainers(
+                    container_type
+                )
+
+            counter_name = f"{counter_name_prefix:s}_by_parser_chain"
+            warnings_by_parser_chain = stored_warnings_counters.get(
+                counter_name, collections.Counter()
+            )
+            number_of_counted_warnings = sum(
+                warning_count.number_of_events
+                for warning_count in warnings_by_parser_chain.values()
+            )
+            if number_of_counted_warnings != number_of_warnings:
+                return None
+
+            warnings_counters[counter_name] = warnings_by_parser_chain
+
+            # The path specification strings are stored unaltered and made
+            # printable here.
+            warnings_by_path_spec = collections.Counter()
+
+            counter_name = f"{counter_name_prefix:s}_by_path_spec"
+            for name, warning_count in stored_warnings_counters.get(
+                counter_name, collections.Counter()
+            ).items():
+                path_spec_string = self._GetPrintableComparableString(name)
+                count_container = warnings_by_path_spec.get(path_spec_string)
+                if not count_container:
+                    count_container = counts.WarningCount(number_of_events=0)
+                    warnings_by_path_spec[path_spec_string] = count_container
+                count_container.number_of_events += warning_count.number_of_events
+
+            warnings_counters[counter_name] = warnings_by_path_spec
+
+        return warnings_counters
+
     def _PrintAnalysisReportCounter(
         self, analysis_reports_counter, session_identifier=None
     ):
@@ -1478,6 +1496,7 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
         Args:
           storage_reader (StorageReader): storage reader.
         """
+        event_shard_period = storage_reader.GetEventShardPeriod()
         format_version = storage_reader.GetFormatVersion()
         serialization_format = storage_reader.GetSerializationFormat()
 
@@ -1487,6 +1506,8 @@ class PinfoTool(tools.CLITool, tool_options.StorageFileOptions):
         table_view.AddRow(["Filename", os.path.basename(self._storage_file_path)])
         table_view.AddRow(["Format version", format_version])
         table_view.AddRow(["Serialization format", serialization_format])
+        if event_shard_period:
+            table_view.AddRow(["Event shard period", event_shard_period])
         table_view.Write(self._output_writer)
 
     def _PrintWarningCountersJSON(
@@ -55,7 +55,9 @@ class PsortTool(analysis_tool.AnalysisTool, tool_options.OutputModuleOptions):
               that the stdout output writer should be used.
         """
         super().__init__(input_reader=input_reader, output_writer=output_writer)
+        self._additional_storage_file_paths = []
         self._deduplicate_events = True
+        self._number_of_worker_processes = 0
         self._preferred_language = None
         self._process_memory_limit = None
         self._status_view = status_view.StatusView(self._output_writer, self.NAME)
@@ -241,6 +243,15 @@ class PsortTool(analysis_tool.AnalysisTool, tool_options.OutputModuleOptions):
                 f"than 0.0 minutes."
             )
 
+        number_of_worker_processes = getattr(options, "workers", None) or 0
+
+        if number_of_worker_processes < 0:
+            raise errors.BadConfigOption(
+                f"Invalid number of workers: {number_of_worker_processes:d}, value "
+                f"must be 0 or greater."
+            )
+
+        self._number_of_worker_processes = number_of_worker_processes
         self._worker_memory_limit = worker_memory_limit
         self._worker_timeout = worker_timeout
 
@@ -285,6 +296,38 @@ class PsortTool(analysis_tool.AnalysisTool, tool_options.OutputModuleOptions):
                 "killed by the main (foreman) process."
             ),
         )
+        argument_group.add_argument(
+            "--workers",
+            dest="workers",
+            action="store",
+            type=int,
+            default=0,
+            help=(
+                "Number of worker processes that format the events of the output. "
+                "The default is 0, which formats the events in the main process."
+            ),
+        )
+
+    def AddStorageOptions(self, argument_parser):
+        """Adds the storage options to the argument group.
+
+        Args:
+          argument_parser (argparse.ArgumentParser): argparse argument parser.
+        """
+        super().AddStorageOptions(argument_parser)
+
+        argument_parser.add_argument(
+            "additional_storage_files",
+            metavar="PATH",
+            nargs="*",
+            type=str,
+            default=[],
+            help=(
+                "Paths to additional storage files, of which the events are merged "
+                "with those of the first storage file, for example the storage "
+                "files of different hosts."
+            ),
+        )
 
     def ListLanguageTags(self):
         """Lists the language tags."""
@@ -486,16 +529,27 @@ class PsortTool(analysis_tool.AnalysisTool, tool_options.OutputModuleOptions):
         self._command_line_arguments = self.GetCommandLineArguments()
 
         self._storage_file_path = self.ParseStringOption(options, "storage_file")
+        self._additional_storage_file_paths = (
+            getattr(options, "additional_storage_files", None) or []
+        )
 
         self._EnforceProcessMemoryLimit(self._process_memory_limit)
 
         self._analysis_plugins = self._CreateAnalysisPlugins(options)
+        if self._analysis_plugins and self._additional_storage_file_paths:
+            raise errors.BadConfigOption(
+                "Analysis plugins not supported in combination with multiple "
+                "storage files."
+            )
+
         self._output_module = self._CreateOutputModule(options)
 
         check_readable_only = not self._analysis_plugins
         self._CheckStorageFile(
             self._storage_file_path, check_readable_only=check_readable_only
         )
+        for storage_file_path in self._additional_storage_file_paths:
+            self._CheckStorageFile(storage_file_path, check_readable_only=True)
 
     def ProcessStorage(self):
         """Processes a Plaso storage file.
@@ -540,26 +594,62 @@ class PsortTool(analysis_tool.AnalysisTool, tool_options.OutputModuleOptions):
         # TODO: abort if session.aborted is True
 
         if self._output_format != "null":
-            storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
-                self._storage_file_path
-            )
             # TODO: add single process output and formatting engine support.
             output_engine = multi_output_engine.OutputAndFormattingMultiProcessEngine()
 
             output_engine.SetStatusUpdateInterval(self._status_view_interval)
 
-            output_engine.ExportEvents(
-                storage_reader,
-                self._output_module,
-                configuration,
-                deduplicate_events=self._deduplicate_events,
-                event_filter=self._event_filter,
-                status_update_callback=status_update_callback,
-                time_slice=self._time_slice,
-                use_time_slicer=self._use_time_slicer,
-            )
-            self._output_module.Close()
-            self._output_module = None
+            storage_reader = None
+            additional_storage_readers = []
+
+            try:
+                storage_reader = (
+                    storage_factory.StorageFactory.CreateStorageReaderForFile(
+                        self._storage_file_path
+                    )
+                )
+                if not storage_reader:
+                    raise RuntimeError("Unable to create storage reader.")
+
+                for storage_file_path in self._additional_storage_file_paths:
+                    additional_storage_reader = (
+                        storage_factory.StorageFactory.CreateStorageReaderForFile(
+                            storage_file_path
+                        )
+                    )
+                    if not additional_storage_reader:
+                        raise RuntimeError(
+                            f"Unable to create storage reader for: "
+                            f"{storage_file_path:s}"
+                        )
+
+                    additional_storage_readers.append(additional_storage_reader)
+
+                output_engine.ExportEvents(
+                    storage_reader,
+                    self._output_module,
+                    configuration,
+                    additional_storage_readers=additional_storage_readers,
+                    deduplicate_events=self._deduplicate_events,
+                    event_filter=self._event_filter,
+                    number_of_worker_processes=self._number_of_worker_processes,
+                    status_update_callback=status_update_callback,
+                    storage_file_path=self._storage_file_path,
+                    time_slice=self._time_slice,
+                    use_time_slicer=self._use_time_slicer,
+                )
+
+            finally:
+                if storage_reader:
+                    storage_reader.Close()
+
+                for additional_storage_reader in additional_storage_readers:
+                    additional_storage_reader.Close()
+
+                # The output module is closed on error as well, to stop
+                # the compression thread of compressed output.
+                self._output_module.Close()
+                self._output_module = None
 
         if self._quiet_mode:
             return
@@ -280,6 +280,9 @@ class StatusView:
         if processing_status and processing_status.events_status:
             self._PrintEventsStatus(processing_status.events_status)
 
+        if processing_status and processing_status.output_status:
+            self._PrintOutputStatus(processing_status)
+
         self._output_writer.Write("\n")
 
     def _GetPathSpecificationString(self, path_spec):
@@ -528,6 +531,46 @@ class StatusView:
             self._output_writer.Write("\n")
             table_view.Write(self._output_writer)
 
+    def _PrintOutputStatus(self, processing_status):
+        """Prints the status of the output.
+
+        Args:
+          processing_status (ProcessingStatus): processing status.
+        """
+        output_status = processing_status.output_status
+
+        processing_time = time.time() - processing_status.start_time
+        throughput = self._FormatSizeInUnitsOf1024(
+            int(output_status.number_of_sent_bytes / max(processing_time, 1.0))
+        )
+
+        table_view = views.CLITabularTableView(
+            column_names=[
+                "Output:",
+                "Stored",
+                "Failed",
+                "Retried",
+                "Pending",
+                "Sent",
+                "Throughput",
+            ],
+            column_sizes=[15, 15, 15, 15, 15, 15, 0],
+            have_ansi_support=self._have_ansi_support,
+        )
+        table_view.AddRow(
+            [
+                "",
+                output_status.number_of_stored_documents,
+                output_status.number_of_failed_documents,
+                output_status.number_of_retried_documents,
+                self._FormatSizeInUnitsOf1024(output_status.number_of_pending_bytes),
+                self._FormatSizeInUnitsOf1024(output_status.number_of_sent_bytes),
+                f"{throughput:s}/s",
+            ]
+        )
+        self._output_writer.Write("\n")
+        table_view.Write(self._output_writer)
+
     def _PrintTasksStatus(self, processing_status):
         """Prints the status of the tasks.
 
@@ -106,6 +106,7 @@ class OutputModuleOptions:
         """Initializes output module options."""
         super().__init__()
         self._output_additional_fields = []
+        self._output_compression = None
         self._output_custom_fields = []
         self._output_custom_formatters_path = None
         self._output_dynamic_time = None
@@ -149,6 +150,12 @@ class OutputModuleOptions:
                 f"Unable to create output module with error: {exception!s}"
             )
 
+        if self._output_compression and not output_module.SUPPORTS_OUTPUT_COMPRESSION:
+            raise errors.BadConfigOption(
+                f"Output format: {self._output_format:s} does not support output "
+                f"compression"
+            )
+
         if output_module.WRITES_OUTPUT_FILE:
             if not self._output_filename:
                 raise errors.BadConfigOption(
@@ -160,7 +167,9 @@ class OutputModuleOptions:
                     f"Output file already exists: {self._output_filename:s}"
                 )
 
-            output_module.Open(path=self._output_filename)
+            output_module.Open(
+                path=self._output_filename, compression_format=self._output_compression
+            )
         else:
             output_module.Open()
 
@@ -313,7 +322,7 @@ class OutputModuleOptions:
                 "Defines additional fields to be included in the output besides the "
                 "default fields. Multiple additional field names can be defined as a "
                 "list of comma separated values. Output formats that support "
-                "additional fields are: dynamic, opensearch and xlsx."
+                "additional fields are: dynamic, opensearch, parquet and xlsx."
             ),
         )
         argument_group.add_argument(
@@ -328,8 +337,8 @@ class OutputModuleOptions:
                 'default fields. A custom field is defined as "name:value". Multiple '
                 "custom field names can be defined as list of comma separated values. "
                 "Note that regular fields will are favoured above custom fields with "
-                "same name. Output formats that support this are: dynamic, opensearch "
-                "and xlsx."
+                "same name. Output formats that support this are: dynamic, opensearch, "
+                "parquet and xlsx."
             ),
         )
         argument_group.add_argument(
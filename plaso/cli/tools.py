@@ -156,10 +156,21 @@ class CLITool:
         if not path_spec:
             return "N/A"
 
+        return self._GetPrintableComparableString(path_spec.comparable)
+
+    def _GetPrintableComparableString(self, comparable):
+        """Retrieves a printable string representation of a comparable string.
+
+        Args:
+          comparable (str): comparable string of a path specification.
+
+        Returns:
+          str: printable string representation of the comparable string.
+        """
         return "\n".join(
             [
                 line.translate(definitions.NON_PRINTABLE_CHARACTER_TRANSLATION_TABLE)
-                for line in path_spec.comparable.split("\n")
+                for line in comparable.split("\n")
             ]
         )
 
@@ -84,22 +84,30 @@ class WarningCount(interface.AttributeContainer):
     """Warning count attribute container.
 
     Attributes:
-      number_of_events (int): number of events generated by the parser or
-          parser plugin.
+      counter_name (str): name of the counter the count is part of, such as
+          "extraction_warnings_by_parser_chain".
+      name (str): name of the value the warnings are counted by, such as
+          a parser chain or path specification.
+      number_of_events (int): number of warnings.
     """
 
     CONTAINER_TYPE = "warning_count"
 
-    SCHEMA = {"number_of_events": "int"}
+    SCHEMA = {"counter_name": "str", "name": "str", "number_of_events": "int"}
 
-    def __init__(self, number_of_events=None):
+    def __init__(self, counter_name=None, name=None, number_of_events=None):
         """Initializes a warning count attribute container.
 
         Args:
-          number_of_events (Optional[int]): number of events generated by
-              the parser or parser plugin.
+          counter_name (Optional[str]): name of the counter the count is part of,
+              such as "extraction_warnings_by_parser_chain".
+          name (Optional[str]): name of the value the warnings are counted by,
+              such as a parser chain or path specification.
+          number_of_events (Optional[int]): number of warnings.
         """
         super().__init__()
+        self.counter_name = counter_name
+        self.name = name
         self.number_of_events = number_of_events
 
 
@@ -285,6 +285,9 @@ class EventDataStream(interface.AttributeContainer):
     a data stream, such as the content of a file or extended attribute.
 
     Attributes:
+      duplicate_of (str): display name of an earlier data stream with identical
+          content, where the content of this data stream was not extracted since
+          it was already extracted from the earlier data stream.
       file_entropy (str): byte entropy value of the data stream.
       md5_hash (str): MD5 digest hash of the data stream.
       path_spec (dfvfs.PathSpec): path specification of the data stream.
@@ -297,6 +300,7 @@ class EventDataStream(interface.AttributeContainer):
     CONTAINER_TYPE = "event_data_stream"
 
     SCHEMA = {
+        "duplicate_of": "str",
         "file_entropy": "str",
         "md5_hash": "str",
         "path_spec": "dfvfs.PathSpec",
@@ -308,6 +312,7 @@ class EventDataStream(interface.AttributeContainer):
     def __init__(self):
         """Initializes an event data attribute container."""
         super().__init__()
+        self.duplicate_of = None
         self.file_entropy = None
         self.md5_hash = None
         self.path_spec = None
@@ -28,7 +28,11 @@ class Task(interface.AttributeContainer):
           processed as number of milliseconds since January 1, 1970, 00:00:00 UTC.
       merge_priority (int): priority used for the task storage file merge, where
           a lower value indicates a higher priority to merge.
+      original_task_identifier (str): identifier of the task that was originally
+          abandoned, if this task is a retry task.
       path_spec (dfvfs.PathSpec): path specification.
+      path_specs (list[dfvfs.PathSpec]): path specifications of a batch of file
+          entries that are processed by a single task.
       session_identifier (str): the identifier of the session the task is part of.
       start_time (int): time that the task was started. Contains the number
           of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -46,7 +50,9 @@ class Task(interface.AttributeContainer):
         "identifier": "str",
         "last_processing_time": "int",
         "merge_priority": "int",
+        "original_task_identifier": "str",
         "path_spec": "dfvfs.PathSpec",
+        "path_specs": "List[dfvfs.PathSpec]",
         "session_identifier": "str",
         "start_time": "int",
         "storage_file_size": "int",
@@ -68,7 +74,9 @@ class Task(interface.AttributeContainer):
         self.identifier = f"{uuid.uuid4().hex:s}"
         self.last_processing_time = None
         self.merge_priority = None
+        self.original_task_identifier = None
         self.path_spec = None
+        self.path_specs = None
         self.session_identifier = session_identifier
         self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
         self.storage_file_size = None
@@ -98,7 +106,11 @@ class Task(interface.AttributeContainer):
         retry_task = Task(session_identifier=self.session_identifier)
         retry_task.file_entry_type = self.file_entry_type
         retry_task.merge_priority = self.merge_priority
+        retry_task.original_task_identifier = (
+            self.original_task_identifier or self.identifier
+        )
         retry_task.path_spec = self.path_spec
+        retry_task.path_specs = self.path_specs
         retry_task.storage_file_size = self.storage_file_size
         retry_task.storage_format = self.storage_format
 
@@ -106,6 +118,21 @@ class Task(interface.AttributeContainer):
 
         return retry_task
 
+    def GetPathSpecs(self):
+        """Retrieves the path specifications to process.
+
+        Returns:
+          list[dfvfs.PathSpec]: path specifications of the batch of file entries
+              or of the single path specification of the task.
+        """
+        if self.path_specs:
+            return self.path_specs
+
+        if self.path_spec:
+            return [self.path_spec]
+
+        return []
+
     def UpdateProcessingTime(self):
         """Updates the processing time to now."""
         self.last_processing_time = int(
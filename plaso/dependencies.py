@@ -25,7 +25,7 @@ PYTHON_DEPENDENCIES = {
     "dfwinreg": ("__version__", "20240229", None, True),
     "dtfabric": ("__version__", "20230518", None, True),
     "flor": ("__version__", "1.1.3", None, False),
-    "lz4": ("__version__", "0.10.0", None, True),
+    "lz4": ("__version__", "2.1.0", None, True),
     "opensearchpy": ("__versionstr__", "", None, False),
     "pefile": ("__version__", "2023.2.7", None, True),
     "psutil": ("__version__", "5.4.3", None, True),
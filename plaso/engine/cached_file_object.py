@@ -0,0 +1,264 @@
+"""Block-cached file-like object."""
+
+import collections
+import os
+
+
+class BlockCachedFileObject:
+    """Block-cached file-like object.
+
+    The block-cached file-like object wraps a dfVFS file-like object and keeps
+    the blocks that were read in a bounded least recently used (LRU) cache. This
+    allows the analyzers, the format scanners and the parsers to share a single
+    read of a data stream, which prevents for example having to decompress
+    the same data of a compressed storage media image multiple times.
+    """
+
+    _DEFAULT_BLOCK_SIZE = 64 * 1024
+
+    _DEFAULT_MAXIMUM_CACHE_SIZE = 32 * 1024 * 1024
+
+    def __init__(self, file_object, block_size=None, maximum_cache_size=None):
+        """Initializes a block-cached file-like object.
+
+        Args:
+          file_object (dfvfs.FileIO): file-like object to cache.
+          block_size (Optional[int]): size of a cached block, where None
+              represents the default block size.
+          maximum_cache_size (Optional[int]): maximum number of bytes of blocks
+              to cache, where None represents the default maximum cache size.
+        """
+        super().__init__()
+        self._block_size = block_size or self._DEFAULT_BLOCK_SIZE
+        self._blocks = collections.OrderedDict()
+        self._cached_data_size = 0
+        self._current_offset = 0
+        self._file_object = file_object
+        self._maximum_cache_size = (
+            maximum_cache_size or self._DEFAULT_MAXIMUM_CACHE_SIZE
+        )
+        self._size = file_object.get_size()
+
+        self.number_of_cache_hits = 0
+        self.number_of_cache_misses = 0
+
+    def __enter__(self):
+        """Enters a with statement."""
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        """Exits a with statement."""
+        self.close()
+
+    def _CacheBlock(self, block_number, block_data):
+        """Caches a block.
+
+        Least recently used blocks are removed from the cache to make room for
+        the block.
+
+        Args:
+          block_number (int): number of the block.
+          block_data (bytes): data of the block.
+        """
+        while self._blocks and (
+            self._cached_data_size + len(block_data) > self._maximum_cache_size
+        ):
+            _, removed_block_data = self._blocks.popitem(last=False)
+            self._cached_data_size -= len(removed_block_data)
+
+        self._blocks[block_number] = block_data
+        self._cached_data_size += len(block_data)
+
+    def _ReadBlocks(self, block_number, number_of_blocks):
+        """Reads consecutive blocks from the wrapped file-like object.
+
+        Args:
+          block_number (int): number of the first block to read.
+          number_of_blocks (int): number of blocks to read.
+
+        Returns:
+          bytes: data of the blocks, which can be smaller than the requested
+              number of blocks at the end of the data or if the wrapped file-like
+              object returned less data than requested.
+        """
+        block_offset = block_number * self._block_size
+        read_size = min(number_of_blocks * self._block_size, self._size - block_offset)
+
+        self._file_object.seek(block_offset, os.SEEK_SET)
+        data = self._file_object.read(read_size)
+
+        self.number_of_cache_misses += number_of_blocks
+
+        # If the wrapped file-like object returned less data than requested only
+        # cache the complete blocks, so that the missing data is read again.
+        if len(data) < read_size:
+            number_of_blocks = len(data) // self._block_size
+
+        # Cache the blocks that fit in the cache, which prevents a single large
+        # read from evicting all previously cached blocks with its own blocks.
+        number_of_blocks = min(
+            number_of_blocks, self._maximum_cache_size // self._block_size
+        )
+
+        for block_index in range(number_of_blocks):
+            data_offset = block_index * self._block_size
+            self._CacheBlock(
+                block_number + block_index,
+                data[data_offset : data_offset + self._block_size],
+            )
+
+        return data
+
+    # Note: that the following functions do not follow the style guide
+    # because they are part of the file-like object interface.
+    # pylint: disable=invalid-name
+
+    def close(self):
+        """Closes the file-like object.
+
+        The block-cached file-like object is shared between the analyzers, the
+        format scanners and the parsers, hence closing it is a no-op, as is the
+        case for the wrapped dfVFS file-like object.
+        """
+        return
+
+    def get_offset(self):
+        """Retrieves the current offset into the file-like object.
+
+        Returns:
+          int: current offset into the file-like object.
+        """
+        return self._current_offset
+
+    def get_size(self):
+        """Retrieves the size of the file-like object.
+
+        Returns:
+          int: size of the file-like object data.
+        """
+        return self._size
+
+    def read(self, size=None):
+        """Reads a byte string from the file-like object at the current offset.
+
+        The function will read a byte string of the specified size or
+        all of the remaining data if no size was specified.
+
+        Args:
+          size (Optional[int]): number of bytes to read, where None is all
+              remaining data.
+
+        Returns:
+          bytes: data read.
+
+        Raises:
+          OSError: if the read failed.
+        """
+        if size is not None and size < 0:
+            raise OSError("Invalid size value out of bounds.")
+
+        remaining_size = self._size - self._current_offset
+        if size is None or size > remaining_size:
+            size = remaining_size
+
+        if size <= 0:
+            return b""
+
+        first_block_number = self._current_offset // self._block_size
+        last_block_number = (self._current_offset + size - 1) // self._block_size
+
+        segments = []
+        block_number = first_block_number
+        while block_number <= last_block_number:
+            block_data = self._blocks.get(block_number, None)
+            if block_data is not None:
+                self._blocks.move_to_end(block_number)
+                self.number_of_cache_hits += 1
+
+                segments.append(block_data)
+                block_number += 1
+                continue
+
+            next_block_number = block_number + 1
+            while (
+                next_block_number <= last_block_number
+                and next_block_number not in self._blocks
+            ):
+                next_block_number += 1
+
+            number_of_blocks = next_block_number - block_number
+            block_data = self._ReadBlocks(block_number, number_of_blocks)
+            segments.append(block_data)
+
+            if len(block_data) < number_of_blocks * self._block_size:
+                break
+
+            block_number = next_block_number
+
+        data_offset = self._current_offset - (first_block_number * self._block_size)
+        if len(segments) == 1:
+            data = segments[0]
+        else:
+            data = b"".join(segments)
+
+        if data_offset > 0 or len(data) > data_offset + size:
+            data = data[data_offset : data_offset + size]
+
+        self._current_offset += len(data)
+
+        return data
+
+    def readable(self):
+        """Determines if the file-like object is readable.
+
+        Returns:
+          bool: True since the file-like object is readable.
+        """
+        return True
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Seeks to an offset within the file-like object.
+
+        Args:
+          offset (int): offset to seek to.
+          whence (Optional(int)): value that indicates whether offset is an
+              absolute or relative position within the file.
+
+        Raises:
+          OSError: if the seek failed.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._current_offset
+        elif whence == os.SEEK_END:
+            offset += self._size
+        elif whence != os.SEEK_SET:
+            raise OSError("Unsupported whence.")
+
+        if offset < 0:
+            raise OSError("Invalid offset value less than zero.")
+
+        self._current_offset = offset
+
+    def seekable(self):
+        """Determines if the file-like object is seekable.
+
+        Returns:
+          bool: True since the file-like object is seekable.
+        """
+        return True
+
+    def tell(self):
+        """Retrieves the current offset into the file-like object.
+
+        Returns:
+          int: current offset into the file-like object.
+        """
+        return self._current_offset
+
+    def writable(self):
+        """Determines if the file-like object is writable.
+
+        Returns:
+          bool: False since the file-like object is read-only.
+        """
+        return False
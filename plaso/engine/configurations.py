@@ -54,6 +54,9 @@ class ExtractionConfiguration(interface.AttributeContainer):
     Attributes:
       archive_types_string (str): comma separated archive types for which embedded
           file entries should be processed.
+      data_stream_deduplication (str): deduplication policy of data streams with
+          identical content, such as "content" or "location", where None or
+          "none" represents no deduplication.
       extract_winevt_resources (bool): True if Windows EventLog resources should
           be extracted.
       extract_winreg_binary (bool): True if Windows Registry binary values should
@@ -62,6 +65,10 @@ class ExtractionConfiguration(interface.AttributeContainer):
           should process, where 0 or None represents unlimited.
       hasher_names_string (str): comma separated names of hashers to use during
           processing.
+      parse_cache_path (str): path of the directory of the persistent cache of
+          parse results, where None represents no cache.
+      parse_cache_size (int): maximum size in bytes of the persistent cache of
+          parse results, where None represents the default maximum size.
       process_compressed_streams (bool): True if file content in compressed
           streams should be processed.
       yara_rules_string (str): Yara rule definitions.
@@ -73,10 +80,13 @@ class ExtractionConfiguration(interface.AttributeContainer):
         """Initializes an extraction configuration object."""
         super().__init__()
         self.archive_types_string = None
+        self.data_stream_deduplication = None
         self.extract_winevt_resources = True
         self.extract_winreg_binary = False
         self.hasher_file_size_limit = None
         self.hasher_names_string = None
+        self.parse_cache_path = None
+        self.parse_cache_size = None
         self.process_compressed_streams = True
         self.yara_rules_string = None
 
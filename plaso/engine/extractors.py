@@ -1,6 +1,8 @@
 """Extractor classes, used to extract information from sources."""
 
 import copy
+import hashlib
+import os
 
 import pysigscan
 
@@ -9,6 +11,8 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import resolver as path_spec_resolver
 
+import plaso
+
 from plaso.engine import logger
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -23,6 +27,10 @@ class EventDataExtractor:
     _PARSE_RESULT_SUCCESS = 2
     _PARSE_RESULT_UNSUPPORTED = 3
 
+    # Size of the reads when hashing the content of a data stream for the parse
+    # results cache.
+    _PARSE_RESULTS_KEY_READ_SIZE = 4 * 1024 * 1024
+
     def __init__(self, force_parser=False, parser_filter_expression=None):
         """Initializes an event extractor.
 
@@ -43,6 +51,8 @@ class EventDataExtractor:
         self._formats_with_signatures = None
         self._mft_parser = None
         self._non_sigscan_parser_names = None
+        self._parse_results_cache = None
+        self._parser_filter_expression = parser_filter_expression
         self._parsers = None
         self._usnjrnl_parser = None
 
@@ -64,6 +74,79 @@ class EventDataExtractor:
 
         return False
 
+    def _GetParseResultsKey(
+        self,
+        parser_mediator,
+        file_entry,
+        data_stream_name,
+        file_object,
+        content_digest=None,
+    ):
+        """Retrieves the key of the parse results of a data stream.
+
+        Besides the content of the data stream, the parse results can depend on
+        the location and the date and time values of the file entry, such as
+        the year of a date-less log, the parsers and their version and the
+        settings of the parser mediator, such as the environment variables used
+        to expand Windows paths, hence these are part of the key.
+
+        Args:
+          parser_mediator (ParserMediator): mediates interactions between parsers
+              and other components, such as storage and dfVFS.
+          file_entry (dfvfs.FileEntry): file entry.
+          data_stream_name (str): data stream name.
+          file_object (file): file-like object of the data stream.
+          content_digest (Optional[str]): digest of the content of the data
+              stream, where None represents the content should be hashed.
+
+        Returns:
+          str: key of the parse results or None if parsing was aborted.
+        """
+        if not content_digest:
+            content_hash = hashlib.blake2b(digest_size=16)
+
+            file_object.seek(0, os.SEEK_SET)
+            data = file_object.read(self._PARSE_RESULTS_KEY_READ_SIZE)
+            while data:
+                if parser_mediator.abort:
+                    return None
+
+                content_hash.update(data)
+                data = file_object.read(self._PARSE_RESULTS_KEY_READ_SIZE)
+
+            content_digest = f"blake2b:{content_hash.hexdigest():s}"
+
+        key_values = [
+            plaso.__version__,
+            self._parser_filter_expression or "",
+            f"{self._force_parser!s}",
+            parser_mediator.GetCodePage(),
+            parser_mediator.GetLanguageTag(),
+            f"{parser_mediator.extract_winevt_resources!s}",
+            f"{parser_mediator.extract_winreg_binary_values!s}",
+            parser_mediator.GetRelativePath() or "",
+            data_stream_name or "",
+        ]
+
+        environment_variables = parser_mediator.GetEnvironmentVariables() or []
+        key_values.append(f"{len(environment_variables):d}")
+        key_values.extend(
+            sorted(
+                f"{environment_variable.name!s}={environment_variable.value!s}"
+                for environment_variable in environment_variables
+            )
+        )
+
+        for attribute_name in ("change_time", "creation_time", "modification_time"):
+            date_time = getattr(file_entry, attribute_name, None)
+            date_time_string = date_time.CopyToDateTimeString() if date_time else None
+            key_values.append(date_time_string or "")
+
+        key_values.extend([f"{file_object.get_size():d}", content_digest])
+
+        key_string = "\x00".join(key_values)
+        return hashlib.blake2b(key_string.encode("utf-8"), digest_size=32).hexdigest()
+
     def _GetSignatureMatchParserNames(self, file_object):
         """Determines if a file-like object matches one of the known signatures.
 
@@ -157,6 +240,50 @@ class EventDataExtractor:
             parser_mediator, parser, file_entry, file_object=file_object
         )
 
+    def _ParseDataStreamWithParsers(self, parser_mediator, file_entry, file_object):
+        """Parses a data stream of a file entry with the enabled parsers.
+
+        Args:
+          parser_mediator (ParserMediator): mediates interactions between parsers
+              and other components, such as storage and dfVFS.
+          file_entry (dfvfs.FileEntry): file entry.
+          file_object (file): file-like object of the data stream.
+
+        Raises:
+          RuntimeError: if the parser object is missing.
+        """
+        parser_mediator.SampleFormatCheckStartTiming("format_scanner")
+        try:
+            parser_names = self._GetSignatureMatchParserNames(file_object)
+        finally:
+            parser_mediator.SampleFormatCheckStopTiming("format_scanner")
+
+        parse_with_non_sigscan_parsers = True
+        if parser_names:
+            parse_result = self._ParseFileEntryWithParsers(
+                parser_mediator, parser_names, file_entry, file_object=file_object
+            )
+            if parse_result in (self._PARSE_RESULT_FAILURE, self._PARSE_RESULT_SUCCESS):
+                parse_with_non_sigscan_parsers = False
+
+        if parse_with_non_sigscan_parsers:
+            self._ParseFileEntryWithParsers(
+                parser_mediator,
+                self._non_sigscan_parser_names,
+                file_entry,
+                file_object=file_object,
+            )
+
+        if self._force_parser and self._usnjrnl_parser:
+            # TODO: the usnjrnl needs to be adjusted to be used on an export of
+            # $UsnJrnl:$J
+            self._ParseFileEntryWithParser(
+                parser_mediator,
+                self._usnjrnl_parser,
+                file_entry,
+                file_object=file_object,
+            )
+
     def _ParseFileEntryWithParser(
         self, parser_mediator, parser, file_entry, file_object=None
     ):
@@ -270,53 +397,69 @@ class EventDataExtractor:
 
         return parse_results
 
-    def ParseDataStream(self, parser_mediator, file_entry, data_stream_name):
+    def ParseDataStream(
+        self,
+        parser_mediator,
+        file_entry,
+        data_stream_name,
+        content_digest=None,
+        file_object=None,
+    ):
         """Parses a data stream of a file entry with the enabled parsers.
 
+        If a parse results cache is set, the parse results of a data stream that
+        was parsed before are reproduced from the cache instead of parsing the
+        data stream.
+
         Args:
           parser_mediator (ParserMediator): mediates interactions between parsers
               and other components, such as storage and dfVFS.
           file_entry (dfvfs.FileEntry): file entry.
           data_stream_name (str): data stream name.
+          content_digest (Optional[str]): digest of the content of the data
+              stream, such as calculated for deduplication, where None
+              represents the content should be hashed when a parse results
+              cache is set.
+          file_object (Optional[file]): file-like object of the data stream,
+              such as a block-cached file-like object that already contains
+              data read by the analyzers, where None represents the file-like
+              object should be retrieved from the file entry.
 
         Raises:
           RuntimeError: if the file-like object or the parser object is missing.
         """
-        file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+        if not file_object:
+            file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
         if not file_object:
             raise RuntimeError("Unable to retrieve file-like object from file entry.")
 
-        parser_mediator.SampleFormatCheckStartTiming("format_scanner")
-        try:
-            parser_names = self._GetSignatureMatchParserNames(file_object)
-        finally:
-            parser_mediator.SampleFormatCheckStopTiming("format_scanner")
+        if not self._parse_results_cache:
+            self._ParseDataStreamWithParsers(parser_mediator, file_entry, file_object)
+            return
 
-        parse_with_non_sigscan_parsers = True
-        if parser_names:
-            parse_result = self._ParseFileEntryWithParsers(
-                parser_mediator, parser_names, file_entry, file_object=file_object
-            )
-            if parse_result in (self._PARSE_RESULT_FAILURE, self._PARSE_RESULT_SUCCESS):
-                parse_with_non_sigscan_parsers = False
+        parse_results_key = self._GetParseResultsKey(
+            parser_mediator,
+            file_entry,
+            data_stream_name,
+            file_object,
+            content_digest=content_digest,
+        )
+        if not parse_results_key:
+            return
 
-        if parse_with_non_sigscan_parsers:
-            self._ParseFileEntryWithParsers(
-                parser_mediator,
-                self._non_sigscan_parser_names,
-                file_entry,
-                file_object=file_object,
-            )
+        parse_results = self._parse_results_cache.GetParseResults(parse_results_key)
+        if parse_results is not None:
+            parser_mediator.ProduceParseResults(parse_results)
+            return
 
-        if self._force_parser and self._usnjrnl_parser:
-            # TODO: the usnjrnl needs to be adjusted to be used on an export of
-            # $UsnJrnl:$J
-            self._ParseFileEntryWithParser(
-                parser_mediator,
-                self._usnjrnl_parser,
-                file_entry,
-                file_object=file_object,
-            )
+        parser_mediator.StartRecordingParseResults()
+        try:
+            self._ParseDataStreamWithParsers(parser_mediator, file_entry, file_object)
+        finally:
+            parse_results = parser_mediator.StopRecordingParseResults()
+
+        if parse_results is not None and not parser_mediator.abort:
+            self._parse_results_cache.SetParseResults(parse_results_key, parse_results)
 
     def ParseFileEntryMetadata(self, parser_mediator, file_entry):
         """Parses the file entry metadata such as file system data.
@@ -371,6 +514,15 @@ class EventDataExtractor:
                 file_object=volume_file_object,
             )
 
+    def SetParseResultsCache(self, parse_results_cache):
+        """Sets the parse results cache.
+
+        Args:
+          parse_results_cache (ParseResultsCache): persistent cache of parse
+              results, where None disables caching of the parse results.
+        """
+        self._parse_results_cache = parse_results_cache
+
 
 class PathSpecExtractor:
     """Path specification extractor.
@@ -0,0 +1,372 @@
+"""Persistent cache of parse results."""
+
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+from plaso.containers import events
+from plaso.containers import warnings
+from plaso.engine import logger
+from plaso.serializer import json_serializer
+
+
+class ParseResultsCache:
+    """Persistent cache of parse results.
+
+    The parse results of a data stream, such as the event data produced by
+    the parsers, are stored in a SQLite database in the cache directory. This
+    allows the parse results to be reused by subsequent extraction runs on
+    the same source. The database can be shared by multiple worker processes.
+
+    When the total size of the cached parse results exceeds the maximum size,
+    the least recently used parse results are removed from the cache.
+
+    Attributes:
+      number_of_cache_hits (int): number of parse results retrieved from
+          the cache.
+      number_of_cache_misses (int): number of parse results not found in
+          the cache.
+    """
+
+    _DATABASE_FILENAME = "parse_results.db"
+
+    _DEFAULT_MAXIMUM_SIZE = 4 * 1024 * 1024 * 1024
+
+    _FORMAT_VERSION = 1
+
+    _CREATE_METADATA_TABLE_QUERY = (
+        "CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value INTEGER)"
+    )
+
+    _CREATE_PARSE_RESULTS_TABLE_QUERY = (
+        "CREATE TABLE IF NOT EXISTS parse_results (key TEXT PRIMARY KEY, "
+        "data BLOB, size INTEGER, last_access_time INTEGER)"
+    )
+
+    _CREATE_PARSE_RESULTS_INDEX_QUERY = (
+        "CREATE INDEX IF NOT EXISTS parse_results_last_access_time "
+        "ON parse_results (last_access_time)"
+    )
+
+    # Names of the attributes, per supported container type, that are set when
+    # the parse results are produced and that are set again when the parse
+    # results are reused.
+    _PRODUCED_ATTRIBUTE_NAMES = {
+        events.DateLessLogHelper.CONTAINER_TYPE: ["_event_data_stream_identifier"],
+        events.EventData.CONTAINER_TYPE: [
+            "_event_data_stream_identifier",
+            "_event_values_hash",
+        ],
+        warnings.ExtractionWarning.CONTAINER_TYPE: ["path_spec"],
+        warnings.RecoveryWarning.CONTAINER_TYPE: ["path_spec"],
+    }
+
+    # Time in seconds to wait for another process that is using the database.
+    _TIMEOUT = 60.0
+
+    def __init__(self, maximum_size=None):
+        """Initializes a persistent cache of parse results.
+
+        Args:
+          maximum_size (Optional[int]): maximum number of bytes of parse results
+              to cache, where None represents the default maximum size.
+        """
+        super().__init__()
+        self._connection = None
+        self._maximum_size = maximum_size or self._DEFAULT_MAXIMUM_SIZE
+        self._serializer = json_serializer.JSONAttributeContainerSerializer
+
+        self.number_of_cache_hits = 0
+        self.number_of_cache_misses = 0
+
+    def _DeleteLeastRecentlyUsedParseResults(self, cursor, cached_size):
+        """Deletes the least recently used parse results.
+
+        Args:
+          cursor (sqlite3.Cursor): cursor of a write transaction.
+          cached_size (int): total size of the cached parse results.
+
+        Returns:
+          int: total size of the cached parse results after the least recently
+              used parse results were deleted.
+        """
+        while cached_size > self._maximum_size:
+            cursor.execute(
+                "SELECT key, size FROM parse_results "
+                "ORDER BY last_access_time LIMIT 64"
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            for key, size in rows:
+                cursor.execute("DELETE FROM parse_results WHERE key = ?", (key,))
+                cached_size -= size
+                if cached_size <= self._maximum_size:
+                    break
+
+        return max(cached_size, 0)
+
+    def _DeserializeParseResults(self, data):
+        """Deserializes parse results.
+
+        Args:
+          data (bytes): compressed and serialized parse results.
+
+        Returns:
+          list[tuple[AttributeContainer, bool, bool]]: attribute containers
+              produced by the parsers and if the containers were corrupted and
+              recovered.
+
+        Raises:
+          ValueError: if the parse results cannot be deserialized.
+        """
+        try:
+            json_list = json.loads(zlib.decompress(data).decode("utf-8"))
+        except (UnicodeDecodeError, zlib.error) as exception:
+            raise ValueError(f"Unable to decompress data with error: {exception!s}")
+
+        parse_results = []
+        for json_dict in json_list:
+            container = self._serializer.ReadSerializedDict(json_dict["container"])
+            if container.CONTAINER_TYPE not in self._PRODUCED_ATTRIBUTE_NAMES:
+                raise ValueError(
+                    f"Unsupported attribute container type: "
+                    f"{container.CONTAINER_TYPE:s}"
+                )
+
+            parse_results.append(
+                (container, json_dict["corrupted"], json_dict["recovered"])
+            )
+
+        return parse_results
+
+    def _SerializeParseResults(self, parse_results):
+        """Serializes parse results.
+
+        Args:
+          parse_results (list[tuple[AttributeContainer, bool, bool]]): attribute
+              containers produced by the parsers and if the containers were
+              corrupted and recovered.
+
+        Returns:
+          bytes: compressed and serialized parse results or None if the parse
+              results cannot be serialized.
+        """
+        json_list = []
+        for container, corrupted, recovered in parse_results:
+            produced_attribute_names = self._PRODUCED_ATTRIBUTE_NAMES.get(
+                container.CONTAINER_TYPE, None
+            )
+            if produced_attribute_names is None:
+                return None
+
+            # Event data with binary or dictionary attribute values cannot be
+            # read back by the JSON serializer.
+            if container.CONTAINER_TYPE == events.EventData.CONTAINER_TYPE and any(
+                isinstance(attribute_value, (bytes, dict))
+                for _, attribute_value in container.GetAttributes()
+            ):
+                return None
+
+            json_dict = self._serializer.WriteSerializedDict(container)
+            for attribute_name in produced_attribute_names:
+                json_dict.pop(attribute_name, None)
+
+            json_list.append(
+                {"container": json_dict, "corrupted": corrupted, "recovered": recovered}
+            )
+
+        try:
+            json_string = json.dumps(json_list)
+        except (TypeError, ValueError):
+            return None
+
+        return zlib.compress(json_string.encode("utf-8"))
+
+    def Close(self):
+        """Closes the cache.
+
+        Raises:
+          OSError: if the cache is not opened.
+        """
+        if not self._connection:
+            raise OSError("Cache not opened.")
+
+        self._connection.close()
+        self._connection = None
+
+    def GetParseResults(self, key):
+        """Retrieves parse results from the cache.
+
+        Args:
+          key (str): key of the parse results.
+
+        Returns:
+          list[tuple[AttributeContainer, bool, bool]]: attribute containers
+              produced by the parsers and if the containers were corrupted and
+              recovered, or None if the parse results are not cached.
+
+        Raises:
+          OSError: if the cache is not opened.
+        """
+        if not self._connection:
+            raise OSError("Cache not opened.")
+
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute("SELECT data FROM parse_results WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            if row:
+                cursor.execute(
+                    "UPDATE parse_results SET last_access_time = ? WHERE key = ?",
+                    (time.time_ns(), key),
+                )
+
+        except sqlite3.Error as exception:
+            logger.warning(
+                f"Unable to retrieve parse results from cache with error: "
+                f"{exception!s}"
+            )
+            row = None
+
+        parse_results = None
+        if row:
+            try:
+                parse_results = self._DeserializeParseResults(row[0])
+            except (KeyError, TypeError, ValueError) as exception:
+                logger.warning(
+                    f"Unable to deserialize cached parse results with error: "
+                    f"{exception!s}"
+                )
+
+        if parse_results is None:
+            self.number_of_cache_misses += 1
+        else:
+            self.number_of_cache_hits += 1
+
+        return parse_results
+
+    def Open(self, path):
+        """Opens the cache.
+
+        Args:
+          path (str): path of the cache directory, which is created if it does
+              not exist.
+
+        Raises:
+          OSError: if the cache is already opened or cannot be opened.
+        """
+        if self._connection:
+            raise OSError("Cache already opened.")
+
+        database_path = os.path.join(path, self._DATABASE_FILENAME)
+
+        try:
+            os.makedirs(path, exist_ok=True)
+
+            # Note that the transactions are managed explicitly.
+            connection = sqlite3.connect(
+                database_path, isolation_level=None, timeout=self._TIMEOUT
+            )
+
+        except (OSError, sqlite3.Error) as exception:
+            raise OSError(
+                f"Unable to open cache: {database_path:s} with error: {exception!s}"
+            )
+
+        try:
+            cursor = connection.cursor()
+
+            # The write-ahead log allows worker processes to read from the cache
+            # while another worker process writes to it.
+            cursor.execute("PRAGMA journal_mode=WAL")
+
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(self._CREATE_METADATA_TABLE_QUERY)
+            cursor.execute("SELECT value FROM metadata WHERE name = 'format_version'")
+            row = cursor.fetchone()
+
+            if not row or row[0] != self._FORMAT_VERSION:
+                # Parse results of an unsupported format version are discarded.
+                cursor.execute("DROP TABLE IF EXISTS parse_results")
+                cursor.execute(
+                    "INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)",
+                    ("format_version", self._FORMAT_VERSION),
+                )
+                cursor.execute(
+                    "INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)",
+                    ("cached_size", 0),
+                )
+
+            cursor.execute(self._CREATE_PARSE_RESULTS_TABLE_QUERY)
+            cursor.execute(self._CREATE_PARSE_RESULTS_INDEX_QUERY)
+            cursor.execute("COMMIT")
+
+        except sqlite3.Error as exception:
+            connection.close()
+            raise OSError(
+                f"Unable to open cache: {database_path:s} with error: {exception!s}"
+            )
+
+        self._connection = connection
+
+    def SetParseResults(self, key, parse_results):
+        """Stores parse results in the cache.
+
+        Parse results that cannot be serialized or that are larger than
+        the maximum size of the cache are not stored.
+
+        Args:
+          key (str): key of the parse results.
+          parse_results (list[tuple[AttributeContainer, bool, bool]]): attribute
+              containers produced by the parsers and if the containers were
+              corrupted and recovered.
+
+        Raises:
+          OSError: if the cache is not opened.
+        """
+        if not self._connection:
+            raise OSError("Cache not opened.")
+
+        data = self._SerializeParseResults(parse_results)
+        if data is None or len(data) > self._maximum_size:
+            return
+
+        cursor = self._connection.cursor()
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            cursor.execute("SELECT value FROM metadata WHERE name = 'cached_size'")
+            row = cursor.fetchone()
+            cached_size = row[0] if row else 0
+
+            cursor.execute("SELECT size FROM parse_results WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            if row:
+                cached_size -= row[0]
+
+            cursor.execute(
+                "INSERT OR REPLACE INTO parse_results (key, data, size, "
+                "last_access_time) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(data), len(data), time.time_ns()),
+            )
+            cached_size = self._DeleteLeastRecentlyUsedParseResults(
+                cursor, cached_size + len(data)
+            )
+
+            cursor.execute(
+                "UPDATE metadata SET value = ? WHERE name = 'cached_size'",
+                (cached_size,),
+            )
+            cursor.execute("COMMIT")
+
+        except sqlite3.Error as exception:
+            logger.warning(
+                f"Unable to store parse results in cache with error: {exception!s}"
+            )
+            if self._connection.in_transaction:
+                self._connection.rollback()
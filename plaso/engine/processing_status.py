@@ -281,6 +281,7 @@ class ProcessingStatus:
           caused critical errors during processing.
       events_status (EventsStatus): status information about events.
       foreman_status (ProcessingStatus): foreman processing status.
+      output_status (OutputStatus): status information about the output.
       start_time (float): time that the processing was started. Contains the
           number of micro seconds since January 1, 1970, 00:00:00 UTC.
       tasks_status (TasksStatus): status information about tasks.
@@ -295,6 +296,7 @@ class ProcessingStatus:
         self.error_path_specs = []
         self.events_status = None
         self.foreman_status = None
+        self.output_status = None
         self.start_time = time.time()
         self.tasks_status = None
 
@@ -467,6 +469,14 @@ class ProcessingStatus:
         """
         self.events_status = events_status
 
+    def UpdateOutputStatus(self, output_status):
+        """Updates the output status.
+
+        Args:
+          output_status (OutputStatus): status information about the output.
+        """
+        self.output_status = output_status
+
     def UpdateTasksStatus(self, tasks_status):
         """Updates the tasks status.
 
@@ -572,11 +582,38 @@ class EventsStatus:
         self.total_number_of_events = 0
 
 
+class OutputStatus:
+    """The status of an output module that sends events to a server.
+
+    Attributes:
+      number_of_failed_documents (int): number of documents that could not be
+          stored.
+      number_of_pending_bytes (int): number of bytes of serialized documents
+          that are queued or being sent.
+      number_of_retried_documents (int): number of documents that were sent
+          again after being rejected.
+      number_of_sent_bytes (int): number of bytes of serialized documents that
+          were sent.
+      number_of_stored_documents (int): number of documents that were stored.
+    """
+
+    def __init__(self):
+        """Initializes an output status."""
+        super().__init__()
+        self.number_of_failed_documents = 0
+        self.number_of_pending_bytes = 0
+        self.number_of_retried_documents = 0
+        self.number_of_sent_bytes = 0
+        self.number_of_stored_documents = 0
+
+
 class TasksStatus:
     """The status of the tasks.
 
     Attributes:
       number_of_abandoned_tasks (int): number of abandoned tasks.
+      number_of_prefetched_containers (int): number of attribute containers
+          that were read ahead from task stores and are waiting to be merged.
       number_of_queued_tasks (int): number of active tasks.
       number_of_tasks_pending_merge (int): number of tasks pending merge.
       number_of_tasks_processing (int): number of tasks processing.
@@ -587,6 +624,7 @@ class TasksStatus:
         """Initializes a tasks status."""
         super().__init__()
         self.number_of_abandoned_tasks = 0
+        self.number_of_prefetched_containers = 0
         self.number_of_queued_tasks = 0
         self.number_of_tasks_pending_merge = 0
         self.number_of_tasks_processing = 0
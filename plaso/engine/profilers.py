@@ -229,7 +229,7 @@ class TaskQueueProfiler(SampleFileProfiler):
 
     _FILENAME_PREFIX = "task_queue"
 
-    _FILE_HEADER = "Time\tQueued\tProcessing\tTo merge\tAbandoned\tTotal\n"
+    _FILE_HEADER = "Time\tQueued\tProcessing\tTo merge\tAbandoned\tTotal\tMerge queue\n"
 
     def Sample(self, tasks_status):
         """Takes a sample of the status of queued tasks for profiling.
@@ -244,7 +244,8 @@ class TaskQueueProfiler(SampleFileProfiler):
                 f"{tasks_status.number_of_tasks_processing:d}\t"
                 f"{tasks_status.number_of_tasks_pending_merge:d}\t"
                 f"{tasks_status.number_of_abandoned_tasks:d}\t"
-                f"{tasks_status.total_number_of_tasks:d}\n"
+                f"{tasks_status.total_number_of_tasks:d}\t"
+                f"{tasks_status.number_of_prefetched_containers:d}\n"
             )
         )
 
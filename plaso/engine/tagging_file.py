@@ -7,6 +7,72 @@ from plaso.filters import event_filter
 from plaso.lib import errors
 
 
+class EventTaggingRulesIndex:
+    """Index of event tagging rules by the data types they apply to.
+
+    Rules that are restricted to specific data types, such as
+    "data_type is 'fs:stat' AND ...", are only returned for events with one
+    of these data types. Rules that are not restricted to specific data types
+    are returned for all events.
+    """
+
+    def __init__(self, tagging_rules):
+        """Initializes an event tagging rules index.
+
+        Args:
+          tagging_rules (dict[str, list[EventObjectFilter]]): tagging rules, that
+              consists of one or more filter objects per label.
+        """
+        super().__init__()
+        self._generic_rules = []
+        self._label_names = list(tagging_rules.keys())
+        self._rules_per_data_type = {}
+        self._tagging_rules_per_data_type = {}
+
+        for label_index, label_name in enumerate(self._label_names):
+            for filter_object in tagging_rules[label_name]:
+                data_types = filter_object.GetDataTypes()
+                if data_types is None:
+                    self._generic_rules.append((label_index, filter_object))
+                else:
+                    for data_type in data_types:
+                        self._rules_per_data_type.setdefault(data_type, []).append(
+                            (label_index, filter_object)
+                        )
+
+    def GetTaggingRulesByDataType(self, data_type):
+        """Retrieves the tagging rules that apply to a specific data type.
+
+        Args:
+          data_type (str): data type of the event data.
+
+        Returns:
+          list[tuple[str, list[EventObjectFilter]]]: label names and the filter
+              objects of the rules per label, that apply to the data type, in
+              the order the labels are defined in the tagging file.
+        """
+        tagging_rules = self._tagging_rules_per_data_type.get(data_type, None)
+        if tagging_rules is None:
+            filter_objects_per_label_index = {}
+            for label_index, filter_object in sorted(
+                self._generic_rules + self._rules_per_data_type.get(data_type, []),
+                key=lambda rule: rule[0],
+            ):
+                filter_objects_per_label_index.setdefault(label_index, []).append(
+                    filter_object
+                )
+
+            tagging_rules = [
+                (self._label_names[label_index], filter_objects)
+                for label_index, filter_objects in (
+                    filter_objects_per_label_index.items()
+                )
+            ]
+            self._tagging_rules_per_data_type[data_type] = tagging_rules
+
+        return tagging_rules
+
+
 class TaggingFile:
     """Tagging file that defines one or more event tagging rules."""
 
@@ -33,9 +99,12 @@ class TaggingFile:
     def GetEventTaggingRules(self):
         """Retrieves the event tagging rules from the tagging file.
 
+        Every rule is compiled into a separate filter object, which allows
+        the rules to be indexed by the data types they apply to.
+
         Returns:
-          dict[str, EventObjectFilter]: tagging rules, that consists of one or more
-              filter objects per label.
+          dict[str, list[EventObjectFilter]]: tagging rules, that consists of one
+              or more filter objects per label.
 
         Raises:
           TaggingFileError: if a filter expression cannot be compiled.
@@ -65,18 +134,32 @@ class TaggingFile:
         filter_objects_per_label = {}
 
         for label_name, rules in rules_per_label.items():
-            filter_object = event_filter.EventObjectFilter()
-
-            try:
-                filter_rule = " OR ".join([f"({rule:s})" for rule in rules])
-                filter_object.CompileFilter(filter_rule)
-            except errors.ParseError as exception:
-                raise errors.TaggingFileError(
-                    f"Unable to compile filter for label: {label_name:s} with error: "
-                    f"{exception!s}"
-                )
+            filter_objects = []
+            for rule in rules:
+                filter_object = event_filter.EventObjectFilter()
+
+                try:
+                    filter_object.CompileFilter(rule)
+                except errors.ParseError as exception:
+                    raise errors.TaggingFileError(
+                        f"Unable to compile filter for label: {label_name:s} with "
+                        f"error: {exception!s}"
+                    )
+
+                filter_objects.append(filter_object)
 
-            # TODO: change other code remove list around filter_object
-            filter_objects_per_label[label_name] = [filter_object]
+            filter_objects_per_label[label_name] = filter_objects
 
         return filter_objects_per_label
+
+    def GetEventTaggingRulesIndex(self):
+        """Retrieves the event tagging rules indexed by data type.
+
+        Returns:
+          EventTaggingRulesIndex: event tagging rules index.
+
+        Raises:
+          TaggingFileError: if a filter expression cannot be compiled.
+        """
+        tagging_rules = self.GetEventTaggingRules()
+        return EventTaggingRulesIndex(tagging_rules)
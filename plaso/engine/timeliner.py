@@ -560,6 +560,22 @@ class EventDataTimeliner:
                     storage_writer, event_data, warning_message
                 )
 
+    def Reset(self):
+        """Resets the counters and the cached base dates.
+
+        The base dates are cached by event data stream identifier, which is only
+        unique within a single storage, hence the timeliner needs to be reset
+        before processing the event data of another storage, such as a task
+        storage.
+        """
+        self._base_dates = {}
+
+        self.data_types_counter = collections.Counter()
+        self.event_labels_counter = collections.Counter()
+        self.number_of_produced_event_tags = 0
+        self.number_of_produced_events = 0
+        self.parsers_counter = collections.Counter()
+
     def SetPreferredTimeZone(self, time_zone_string):
         """Sets the preferred time zone for zone-less date and time values.
 
@@ -1,6 +1,7 @@
 """The event extraction worker."""
 
 import copy
+import hashlib
 import os
 import re
 import time
@@ -18,6 +19,7 @@ from plaso.analyzers import hashing_analyzer
 from plaso.analyzers import manager as analyzers_manager
 from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.engine import cached_file_object
 from plaso.engine import extractors
 from plaso.engine import logger
 from plaso.lib import definitions
@@ -134,6 +136,10 @@ class EventExtractionWorker:
 
     _TYPES_WITH_ROOT_METADATA = frozenset([dfvfs_definitions.TYPE_INDICATOR_GZIP])
 
+    # Size of the reads when hashing the content of a data stream for the data
+    # stream index.
+    _DATA_STREAM_INDEX_READ_SIZE = 4 * 1024 * 1024
+
     def __init__(self, force_parser=False, parser_filter_expression=None):
         """Initializes an event extraction worker.
 
@@ -156,6 +162,8 @@ class EventExtractionWorker:
         self._analyzers_profiler = None
         self._achive_type_scanner = self._CreateArchiveTypeScanner([])
         self._archive_types = []
+        self._data_stream_deduplication = None
+        self._data_stream_index = None
         self._event_data_extractor = extractors.EventDataExtractor(
             force_parser=force_parser, parser_filter_expression=parser_filter_expression
         )
@@ -169,7 +177,13 @@ class EventExtractionWorker:
         self.processing_status = definitions.STATUS_INDICATOR_IDLE
 
     def _AnalyzeDataStream(
-        self, file_entry, data_stream_name, display_name, event_data_stream
+        self,
+        file_entry,
+        data_stream_name,
+        display_name,
+        event_data_stream,
+        file_object=None,
+        content_hash=None,
     ):
         """Analyzes the contents of a specific data stream of a file entry.
 
@@ -185,6 +199,16 @@ class EventExtractionWorker:
               currently being analyzed.
           event_data_stream (EventDataStream): event data stream attribute
                container.
+          file_object (Optional[BlockCachedFileObject]): file-like object of
+              the data stream, where None represents the file-like object should
+              be retrieved from the file entry.
+          content_hash (Optional[hashlib._Hash]): hash object that should be
+              updated with the content of the data stream, where None represents
+              the content should not be hashed.
+
+        Returns:
+          bool: True if the entire content of the data stream was read and
+              the content hash, if any, was updated with it.
 
         Raises:
           RuntimeError: if the file-like object cannot be retrieved from
@@ -196,7 +220,10 @@ class EventExtractionWorker:
             self._processing_profiler.StartTiming("analyzing")
 
         try:
-            file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+            if not file_object:
+                file_object = file_entry.GetFileObject(
+                    data_stream_name=data_stream_name
+                )
             if not file_object:
                 raise RuntimeError(
                     (
@@ -205,7 +232,9 @@ class EventExtractionWorker:
                     )
                 )
 
-            self._AnalyzeFileObject(file_object, display_name, event_data_stream)
+            result = self._AnalyzeFileObject(
+                file_object, display_name, event_data_stream, content_hash=content_hash
+            )
 
         finally:
             if self._processing_profiler:
@@ -213,7 +242,11 @@ class EventExtractionWorker:
 
         logger.debug(f"[AnalyzeDataStream] completed analyzing file: {display_name:s}")
 
-    def _AnalyzeFileObject(self, file_object, display_name, event_data_stream):
+        return result
+
+    def _AnalyzeFileObject(
+        self, file_object, display_name, event_data_stream, content_hash=None
+    ):
         """Processes a file-like object with analyzers.
 
         Args:
@@ -222,6 +255,13 @@ class EventExtractionWorker:
               currently being analyzed.
           event_data_stream (EventDataStream): event data stream attribute
                container.
+          content_hash (Optional[hashlib._Hash]): hash object that should be
+              updated with the content of the file-like object, where None
+              represents the content should not be hashed.
+
+        Returns:
+          bool: True if the entire content of the file-like object was read and
+              the content hash, if any, was updated with it.
         """
         maximum_read_size = max(
             analyzer_object.SIZE_LIMIT for analyzer_object in self._analyzers
@@ -239,7 +279,7 @@ class EventExtractionWorker:
             and self._hasher_file_size_limit
             and file_size > self._hasher_file_size_limit
         ):
-            return
+            return False
 
         file_object.seek(0, os.SEEK_SET)
 
@@ -248,6 +288,9 @@ class EventExtractionWorker:
             if self._abort:
                 break
 
+            if content_hash is not None:
+                content_hash.update(data)
+
             for analyzer_object in self._analyzers:
                 if self._abort:
                     break
@@ -295,6 +338,8 @@ class EventExtractionWorker:
 
         self.processing_status = definitions.STATUS_INDICATOR_RUNNING
 
+        return not self._abort
+
     def _CanSkipDataStream(self, file_entry, data_stream):
         """Determines if analysis and extraction of a data stream can be skipped.
 
@@ -464,7 +509,12 @@ class EventExtractionWorker:
         return scanner_object
 
     def _ExtractContentFromDataStream(
-        self, parser_mediator, file_entry, data_stream_name
+        self,
+        parser_mediator,
+        file_entry,
+        data_stream_name,
+        content_digest=None,
+        file_object=None,
     ):
         """Extracts content from a data stream.
 
@@ -474,6 +524,12 @@ class EventExtractionWorker:
           file_entry (dfvfs.FileEntry): file entry to extract its content.
           data_stream_name (str): name of the data stream whose content is to be
               extracted.
+          content_digest (Optional[str]): digest of the content of the data
+              stream, where None represents the digest should be calculated if
+              needed.
+          file_object (Optional[BlockCachedFileObject]): file-like object of
+              the data stream, where None represents the file-like object should
+              be retrieved from the file entry.
         """
         self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
 
@@ -481,7 +537,11 @@ class EventExtractionWorker:
             self._processing_profiler.StartTiming("extracting")
 
         self._event_data_extractor.ParseDataStream(
-            parser_mediator, file_entry, data_stream_name
+            parser_mediator,
+            file_entry,
+            data_stream_name,
+            content_digest=content_digest,
+            file_object=file_object,
         )
         if self._processing_profiler:
             self._processing_profiler.StopTiming("extracting")
@@ -584,6 +644,143 @@ class EventExtractionWorker:
 
         return type_indicators
 
+    def _GetCachedFileObject(self, file_entry, data_stream_name):
+        """Retrieves a block-cached file-like object of a data stream.
+
+        The block-cached file-like object allows the analyzers, the archive type
+        scanner and the parsers to share the data read from the data stream.
+
+        Args:
+          file_entry (dfvfs.FileEntry): file entry containing the data stream.
+          data_stream_name (str): name of the data stream.
+
+        Returns:
+          BlockCachedFileObject: block-cached file-like object or None if
+              the file-like object cannot be retrieved from the file entry.
+        """
+        file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+        if not file_object:
+            return None
+
+        return cached_file_object.BlockCachedFileObject(file_object)
+
+    def _GetContentDigest(self, file_object, event_data_stream, content_hash=None):
+        """Retrieves a digest of the content of a data stream.
+
+        The SHA-256 hash calculated by the hashing analyzer is reused, since it
+        covers the entire data stream, otherwise the BLAKE2b content hash that
+        was updated while analyzing the data stream is used. The content is only
+        read again if neither is available.
+
+        Args:
+          file_object (Optional[BlockCachedFileObject]): file-like object of
+              the data stream, where None represents the content should not be
+              hashed.
+          event_data_stream (EventDataStream): event data stream attribute
+              container.
+          content_hash (Optional[hashlib._Hash]): BLAKE2b hash object that was
+              updated with the entire content of the data stream, where None
+              represents the content was not hashed while analyzing.
+
+        Returns:
+          str: digest of the content, prefixed with the name of the hash
+              algorithm, or None if not available or hashing was aborted.
+        """
+        if self._abort:
+            return None
+
+        sha256_hash = getattr(event_data_stream, "sha256_hash", None)
+        if sha256_hash:
+            return f"sha256:{sha256_hash:s}"
+
+        if content_hash is not None:
+            return f"blake2b:{content_hash.hexdigest():s}"
+
+        if not file_object:
+            return None
+
+        self.processing_status = definitions.STATUS_INDICATOR_HASHING
+
+        if self._processing_profiler:
+            self._processing_profiler.StartTiming("hashing")
+
+        try:
+            content_hash = hashlib.blake2b(digest_size=16)
+
+            file_object.seek(0, os.SEEK_SET)
+            data = file_object.read(self._DATA_STREAM_INDEX_READ_SIZE)
+            while data:
+                if self._abort:
+                    return None
+
+                content_hash.update(data)
+                data = file_object.read(self._DATA_STREAM_INDEX_READ_SIZE)
+
+        finally:
+            if self._processing_profiler:
+                self._processing_profiler.StopTiming("hashing")
+
+            self.processing_status = definitions.STATUS_INDICATOR_RUNNING
+
+        return f"blake2b:{content_hash.hexdigest():s}"
+
+    def _GetDuplicateDataStream(
+        self, file_entry, data_stream_name, display_name, file_object, content_digest
+    ):
+        """Determines if a data stream is a duplicate of an earlier data stream.
+
+        The data stream is looked up in the data stream index by its size and
+        a digest of its content and, depending on the deduplication policy, its
+        location. If the data stream is not in the index it is added.
+
+        Args:
+          file_entry (dfvfs.FileEntry): file entry containing the data stream.
+          data_stream_name (str): name of the data stream.
+          display_name (str): human readable representation of the file entry
+              currently being processed.
+          file_object (BlockCachedFileObject): file-like object of the data
+              stream.
+          content_digest (str): digest of the content of the data stream.
+
+        Returns:
+          str: display name of the earlier data stream with identical content or
+              None if the data stream is not a duplicate.
+        """
+        if self._processing_profiler:
+            self._processing_profiler.StartTiming("deduplicating")
+
+        try:
+            key = f"{file_object.get_size():d}:{content_digest:s}"
+
+            if (
+                self._data_stream_deduplication
+                == definitions.DATA_STREAM_DEDUPLICATION_LOCATION
+            ):
+                location = getattr(file_entry.path_spec, "location", None) or ""
+                key = f"{location:s}:{data_stream_name:s}:{key:s}"
+
+            # Note that setdefault is used to atomically add the data stream to
+            # an index that is shared between worker processes.
+            try:
+                earlier_display_name = self._data_stream_index.setdefault(
+                    key, display_name
+                )
+            except (EOFError, OSError) as exception:
+                logger.warning(
+                    f"Unable to look up data stream of: {display_name:s} in data "
+                    f"stream index with error: {exception!s}"
+                )
+                return None
+
+        finally:
+            if self._processing_profiler:
+                self._processing_profiler.StopTiming("deduplicating")
+
+        if earlier_display_name == display_name:
+            return None
+
+        return earlier_display_name
+
     def _IsMetadataFile(self, file_entry):
         """Determines if the file entry is a metadata file.
 
@@ -858,7 +1055,10 @@ class EventExtractionWorker:
             f"[ProcessFileEntryDataStream] processing data stream: "
             f'"{data_stream_name:s}" of file entry: {display_name:s}'
         )
+        content_digest = None
         event_data_stream = None
+        file_object = None
+        skip_content_extraction = False
         if data_stream:
             display_name = parser_mediator.GetDisplayName()
 
@@ -869,12 +1069,54 @@ class EventExtractionWorker:
             event_data_stream = events.EventDataStream()
             event_data_stream.path_spec = path_spec
 
+            if self._analyzers or self._data_stream_index is not None:
+                file_object = self._GetCachedFileObject(file_entry, data_stream.name)
+
+            # Determine if the content of the file entry should not be extracted.
+            skip_content_extraction = self._CanSkipContentExtraction(file_entry)
+
+            # Note that the content of a data stream that is not extracted does
+            # not need to be deduplicated.
+            deduplicate_data_stream = bool(
+                self._data_stream_index is not None
+                and file_object
+                and not skip_content_extraction
+            )
+
+            content_hash = None
+            if deduplicate_data_stream and self._analyzers:
+                # The content is hashed while it is read by the analyzers to
+                # prevent it from being read again to determine the content digest.
+                content_hash = hashlib.blake2b(digest_size=16)
+
             if self._analyzers:
                 # Since AnalyzeDataStream generates event data stream attributes it
                 # needs to be called before producing events.
-                self._AnalyzeDataStream(
-                    file_entry, data_stream.name, display_name, event_data_stream
+                analyzed_data_stream = self._AnalyzeDataStream(
+                    file_entry,
+                    data_stream.name,
+                    display_name,
+                    event_data_stream,
+                    file_object=file_object,
+                    content_hash=content_hash,
                 )
+                if not analyzed_data_stream:
+                    content_hash = None
+
+            if deduplicate_data_stream:
+                content_digest = self._GetContentDigest(
+                    file_object, event_data_stream, content_hash=content_hash
+                )
+                if content_digest:
+                    event_data_stream.duplicate_of = self._GetDuplicateDataStream(
+                        file_entry,
+                        data_stream.name,
+                        display_name,
+                        file_object,
+                        content_digest,
+                    )
+            else:
+                content_digest = self._GetContentDigest(None, event_data_stream)
 
         parser_mediator.ProduceEventDataStream(event_data_stream)
 
@@ -885,8 +1127,16 @@ class EventExtractionWorker:
         if not data_stream:
             return
 
-        # Determine if the content of the file entry should not be extracted.
-        skip_content_extraction = self._CanSkipContentExtraction(file_entry)
+        # The content of a duplicate data stream was already extracted from
+        # an earlier data stream.
+        if event_data_stream.duplicate_of:
+            logger.debug(
+                f"Skipping content extraction of: {display_name:s} duplicate of: "
+                f"{event_data_stream.duplicate_of:s}"
+            )
+            self.processing_status = definitions.STATUS_INDICATOR_IDLE
+            return
+
         if skip_content_extraction:
             display_name = parser_mediator.GetDisplayName()
             logger.debug(f"Skipping content extraction of: {display_name:s}")
@@ -911,9 +1161,10 @@ class EventExtractionWorker:
         else:
             results = []
             try:
-                file_object = file_entry.GetFileObject(
-                    data_stream_name=data_stream_name
-                )
+                if not file_object:
+                    file_object = self._GetCachedFileObject(
+                        file_entry, data_stream_name
+                    )
                 if file_object:
                     scan_state = pysigscan.scan_state()
                     self._achive_type_scanner.scan_file_object(scan_state, file_object)
@@ -949,7 +1200,11 @@ class EventExtractionWorker:
 
                 # Note that ZIP is also a compound format.
                 self._ExtractContentFromDataStream(
-                    parser_mediator, file_entry, data_stream.name
+                    parser_mediator,
+                    file_entry,
+                    data_stream.name,
+                    content_digest=content_digest,
+                    file_object=file_object,
                 )
             else:
                 if len(results) > 1:
@@ -960,7 +1215,11 @@ class EventExtractionWorker:
                     )
 
                 self._ExtractContentFromDataStream(
-                    parser_mediator, file_entry, data_stream.name
+                    parser_mediator,
+                    file_entry,
+                    data_stream.name,
+                    content_digest=content_digest,
+                    file_object=file_object,
                 )
 
     def _ProcessMetadataFile(self, parser_mediator, file_entry):
@@ -1008,6 +1267,26 @@ class EventExtractionWorker:
         ]
         self._achive_type_scanner = self._CreateArchiveTypeScanner(self._archive_types)
 
+    def _SetDataStreamDeduplication(self, data_stream_deduplication):
+        """Sets the deduplication policy of data streams.
+
+        Args:
+          data_stream_deduplication (str): deduplication policy of data streams
+              with identical content, such as "content" or "location", where None
+              or "none" represents no deduplication.
+        """
+        if data_stream_deduplication == definitions.DATA_STREAM_DEDUPLICATION_NONE:
+            data_stream_deduplication = None
+
+        self._data_stream_deduplication = data_stream_deduplication
+
+        # By default the data stream index is only used by this worker, use
+        # SetDataStreamIndex to share the index between workers.
+        if not data_stream_deduplication:
+            self._data_stream_index = None
+        elif self._data_stream_index is None:
+            self._data_stream_index = {}
+
     def _SetHashers(self, hasher_names_string):
         """Sets the hasher names.
 
@@ -1089,6 +1368,18 @@ class EventExtractionWorker:
 
         self.ProcessFileEntry(parser_mediator, file_entry)
 
+    def SetDataStreamIndex(self, data_stream_index):
+        """Sets the data stream index used to deduplicate data streams.
+
+        Args:
+          data_stream_index (dict[str, str]): display names of the data streams
+              per size, content hash and, depending on the deduplication policy,
+              location, such as a dictionary proxy that is shared between worker
+              processes.
+        """
+        if self._data_stream_deduplication:
+            self._data_stream_index = data_stream_index
+
     # TODO: move the functionality of this method into the constructor.
     def SetExtractionConfiguration(self, configuration):
         """Sets the extraction configuration settings.
@@ -1097,6 +1388,7 @@ class EventExtractionWorker:
           configuration (ExtractionConfiguration): extraction configuration.
         """
         self._SetArchiveTypes(configuration.archive_types_string)
+        self._SetDataStreamDeduplication(configuration.data_stream_deduplication)
         self._hasher_file_size_limit = configuration.hasher_file_size_limit
         self._SetHashers(configuration.hasher_names_string)
         self._process_compressed_streams = configuration.process_compressed_streams
@@ -1110,6 +1402,15 @@ class EventExtractionWorker:
         """
         self._analyzers_profiler = analyzers_profiler
 
+    def SetParseResultsCache(self, parse_results_cache):
+        """Sets the parse results cache.
+
+        Args:
+          parse_results_cache (ParseResultsCache): persistent cache of parse
+              results, where None disables caching of the parse results.
+        """
+        self._event_data_extractor.SetParseResultsCache(parse_results_cache)
+
     def SetProcessingProfiler(self, processing_profiler):
         """Sets the processing profiler.
 
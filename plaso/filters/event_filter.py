@@ -11,11 +11,13 @@ class EventObjectFilter:
         super().__init__()
         self._event_filter = None
         self._filter_expression = None
+        self._match_function = None
 
     def CompileFilter(self, filter_expression):
         """Compiles the filter expression.
 
-        The filter expression contains an object filter expression.
+        The filter expression contains an object filter expression, which is
+        compiled into a match function that is used to match events.
 
         Args:
           filter_expression (str): filter expression.
@@ -28,6 +30,43 @@ class EventObjectFilter:
 
         self._event_filter = expression.Compile()
         self._filter_expression = filter_expression
+        self._match_function = self._event_filter.CompileMatchFunction()
+
+    def GetDataTypes(self):
+        """Retrieves the data types of the events that can match the filter.
+
+        The data types allow to skip events that cannot match the filter without
+        evaluating it.
+
+        Returns:
+          frozenset[str]: data types of the events that can match the filter or
+              None if the filter is not restricted to specific data types.
+        """
+        if not self._event_filter:
+            return None
+
+        return self._event_filter.GetDataTypes()
+
+    def GetSQLExpression(self, attribute_expressions):
+        """Retrieves a SQL expression that represents the filter.
+
+        The SQL expression allows storage to skip events that cannot match
+        the filter. Events that match the SQL expression still need to be
+        matched against the filter.
+
+        Args:
+          attribute_expressions (dict[str, str]): SQL expressions of the event
+              attributes that are supported, such as "timestamp", "data_type",
+              "_parser_chain" and "tag".
+
+        Returns:
+          str: SQL expression or None if the filter cannot be represented by
+              a SQL expression.
+        """
+        if not self._event_filter:
+            return None
+
+        return self._event_filter.GetSQLExpression(attribute_expressions)
 
     def Match(self, event, event_data, event_data_stream, event_tag):
         """Determines if an event matches the filter.
@@ -41,9 +80,7 @@ class EventObjectFilter:
         Returns:
           bool: True if the event matches the filter, False otherwise.
         """
-        if not self._event_filter:
+        if not self._match_function:
             return True
 
-        return self._event_filter.Matches(
-            event, event_data, event_data_stream, event_tag
-        )
+        return self._match_function(event, event_data, event_data_stream, event_tag)
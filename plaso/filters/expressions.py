@@ -173,6 +173,7 @@ class EventExpression(Expression):
     _EVENT_FILTER_ALIAS = {
         "date": "timestamp",
         "datetime": "timestamp",
+        "parser": "_parser_chain",
         "time": "timestamp",
     }
 
@@ -2,6 +2,7 @@
 
 import abc
 import codecs
+import operator
 import re
 
 from dfdatetime import interface as dfdatetime_interface
@@ -12,6 +13,21 @@ from plaso.filters import value_types
 from plaso.lib import errors
 
 
+def _MatchAll(event, event_data, event_data_stream, event_tag):
+    """Match function of filters that match all events.
+
+    Args:
+      event (EventObject): event to compare against the filter.
+      event_data (EventData): event data to compare against the filter.
+      event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag to compare against the filter.
+
+    Returns:
+      bool: True.
+    """
+    return True
+
+
 class Filter:
     """Filter interface.
 
@@ -19,6 +35,9 @@ class Filter:
       args (list[object]): arguments provided to the filter.
     """
 
+    # Relative cost of matching the filter.
+    _MATCH_COST = 4
+
     def __init__(self, arguments=None):
         """Initializes a filter.
 
@@ -52,6 +71,81 @@ class Filter:
             return codecs.decode(value, "utf8", "ignore")
         return value
 
+    def _CompileSubFilterMatchFunctions(self):
+        """Compiles the match functions of the sub filters.
+
+        Sub filters of the same boolean operator are flattened and the sub
+        filters are ordered by their cost of matching, so that cheap filters
+        can short-circuit the evaluation of expensive ones.
+
+        Returns:
+          list[function]: match functions of the sub filters.
+        """
+        sub_filters = []
+        for sub_filter in self.args:
+            # Note that an empty sub filter matches all events and therefore
+            # cannot be flattened.
+            if isinstance(sub_filter, self.__class__) and sub_filter.args:
+                sub_filters.extend(sub_filter.args)
+            else:
+                sub_filters.append(sub_filter)
+
+        sub_filters = sorted(
+            sub_filters, key=lambda sub_filter: sub_filter.GetMatchCost()
+        )
+
+        return [sub_filter.CompileMatchFunction() for sub_filter in sub_filters]
+
+    def CompileMatchFunction(self):
+        """Compiles the filter into a match function.
+
+        The match function is equivalent to Matches, but the values that do not
+        depend on the event, such as attribute accessors, are determined ahead
+        of time.
+
+        Returns:
+          function: match function, that takes an event, event data, event data
+              stream and event tag as arguments and returns True if they match
+              the filter.
+        """
+        return self.Matches
+
+    def GetDataTypes(self):
+        """Retrieves the data types of the events that can match the filter.
+
+        Returns:
+          frozenset[str]: data types of the events that can match the filter or
+              None if the filter is not restricted to specific data types.
+        """
+        return None
+
+    def GetMatchCost(self):
+        """Retrieves the relative cost of matching the filter.
+
+        Returns:
+          int: relative cost of matching the filter, where filters with a lower
+              cost are evaluated first when combined.
+        """
+        return self._MATCH_COST
+
+    def GetSQLExpression(self, attribute_expressions):
+        """Retrieves a SQL expression that represents the filter.
+
+        The SQL expression is a necessary condition of the filter, every event
+        that matches the filter also matches the SQL expression, but not every
+        event that matches the SQL expression matches the filter.
+
+        Args:
+          attribute_expressions (dict[str, str]): SQL expressions of the event
+              attributes that are supported, such as "timestamp", "data_type",
+              "_parser_chain" and "tag".
+
+        Returns:
+          str: SQL expression or None if the filter cannot be represented by
+              a SQL expression.
+        """
+        return None
+
     @abc.abstractmethod
     def Matches(self, event, event_data, event_data_stream, event_tag):
         """Determines if the event, data and tag match the filter.
@@ -73,6 +167,67 @@ class AndFilter(Filter):
     Note that if no conditions are passed, all objects will pass.
     """
 
+    def CompileMatchFunction(self):
+        """Compiles the filter into a match function.
+
+        Returns:
+          function: match function, that takes an event, event data, event data
+              stream and event tag as arguments and returns True if they match
+              the filter.
+        """
+        match_functions = self._CompileSubFilterMatchFunctions()
+
+        def _Match(event, event_data, event_data_stream, event_tag):
+            for match_function in match_functions:
+                if not match_function(event, event_data, event_data_stream, event_tag):
+                    return False
+            return True
+
+        return _Match
+
+    def GetDataTypes(self):
+        """Retrieves the data types of the events that can match the filter.
+
+        Returns:
+          frozenset[str]: data types of the events that can match the filter or
+              None if the filter is not restricted to specific data types.
+        """
+        data_types = None
+        for sub_filter in self.args:
+            sub_filter_data_types = sub_filter.GetDataTypes()
+            if sub_filter_data_types is not None:
+                if data_types is None:
+                    data_types = sub_filter_data_types
+                else:
+                    data_types = data_types.intersection(sub_filter_data_types)
+
+        return data_types
+
+    def GetSQLExpression(self, attribute_expressions):
+        """Retrieves a SQL expression that represents the filter.
+
+        Arguments that cannot be represented by a SQL expression are left out,
+        since they only further restrict the events that match.
+
+        Args:
+          attribute_expressions (dict[str, str]): SQL expressions of the event
+              attributes that are supported.
+
+        Returns:
+          str: SQL expression or None if the filter cannot be represented by
+              a SQL expression.
+        """
+        sql_expressions = []
+        for sub_filter in self.args:
+            sql_expression = sub_filter.GetSQLExpression(attribute_expressions)
+            if sql_expression:
+                sql_expressions.append(f"({sql_expression:s})")
+
+        if not sql_expressions:
+            return None
+
+        return " AND ".join(sql_expressions)
+
     def Matches(self, event, event_data, event_data_stream, event_tag):
         """Determines if the event, data and tag match the filter.
 
@@ -98,6 +253,71 @@ class OrFilter(Filter):
     Note that if no conditions are passed, all objects will pass.
     """
 
+    def CompileMatchFunction(self):
+        """Compiles the filter into a match function.
+
+        Returns:
+          function: match function, that takes an event, event data, event data
+              stream and event tag as arguments and returns True if they match
+              the filter.
+        """
+        if not self.args:
+            return _MatchAll
+
+        match_functions = self._CompileSubFilterMatchFunctions()
+
+        def _Match(event, event_data, event_data_stream, event_tag):
+            for match_function in match_functions:
+                if match_function(event, event_data, event_data_stream, event_tag):
+                    return True
+            return False
+
+        return _Match
+
+    def GetDataTypes(self):
+        """Retrieves the data types of the events that can match the filter.
+
+        Returns:
+          frozenset[str]: data types of the events that can match the filter or
+              None if the filter is not restricted to specific data types.
+        """
+        if not self.args:
+            return None
+
+        data_types = set()
+        for sub_filter in self.args:
+            sub_filter_data_types = sub_filter.GetDataTypes()
+            if sub_filter_data_types is None:
+                return None
+
+            data_types.update(sub_filter_data_types)
+
+        return frozenset(data_types)
+
+    def GetSQLExpression(self, attribute_expressions):
+        """Retrieves a SQL expression that represents the filter.
+
+        Args:
+          attribute_expressions (dict[str, str]): SQL expressions of the event
+              attributes that are supported.
+
+        Returns:
+          str: SQL expression or None if the filter cannot be represented by
+              a SQL expression.
+        """
+        sql_expressions = []
+        for sub_filter in self.args:
+            sql_expression = sub_filter.GetSQLExpression(attribute_expressions)
+            if not sql_expression:
+                return None
+
+            sql_expressions.append(f"({sql_expression:s})")
+
+        if not sql_expressions:
+            return None
+
+        return " OR ".join(sql_expressions)
+
     def Matches(self, event, event_data, event_data_stream, event_tag):
         """Determines if the event, data and tag match the filter.
 
@@ -141,6 +361,18 @@ class Operator(Filter):
 class IdentityFilter(Operator):
     """A filter which always evaluates to True."""
 
+    _MATCH_COST = 0
+
+    def CompileMatchFunction(self):
+        """Compiles the filter into a match function.
+
+        Returns:
+          function: match function, that takes an event, event data, event data
+              stream and event tag as arguments and returns True if they match
+              the filter.
+        """
+        return _MatchAll
+
     def Matches(self, event, event_data, event_data_stream, event_tag):
         """Determines if the event, data and tag match the filter.
 
@@ -208,9 +440,16 @@ class GenericBinaryOperator(BinaryOperator):
     _EVENT_ATTRIBUTE_NAMES = frozenset(["timestamp", "timestamp_desc"])
 
     _UNSUPPORTED_ATTRIBUTE_NAMES = frozenset(
-        ["message", "parser", "source", "source_long", "source_short", "sourcetype"]
+        ["message", "source", "source_long", "source_short", "sourcetype"]
     )
 
+    # Function that compares the event value with the filter value or None if
+    # the operator only defines _CompareValue.
+    _COMPARE_FUNCTION = None
+
+    # SQL operator that corresponds to the operator or None if not supported.
+    _SQL_OPERATOR = None
+
     def __init__(self, arguments=None, **kwargs):
         """Initializes a generic binary operator.
 
@@ -232,6 +471,134 @@ class GenericBinaryOperator(BinaryOperator):
           bool: True if the values match according to the operator, False otherwise.
         """
 
+    def _CompileCompareFunction(self):
+        """Compiles the comparison of an event value with the filter value.
+
+        Returns:
+          function: compare function, that takes an event value as argument and
+              returns True if the value matches according to the operator.
+        """
+        filter_value = self.right_operand
+
+        compare_function = self._COMPARE_FUNCTION or self._CompareValue
+
+        def _CompareValue(event_value):
+            return compare_function(event_value, filter_value)
+
+        return _CompareValue
+
+    def _CompileGetValueFunction(self):
+        """Compiles the retrieval of the value of the attribute of the filter.
+
+        Returns:
+          function: get value function, that takes an event, event data, event
+              data stream and event tag as arguments and returns the attribute
+              value or None if not available. The function is equivalent to
+              _GetValue.
+        """
+        attribute_name = self.left_operand
+
+        if attribute_name in self._UNSUPPORTED_ATTRIBUTE_NAMES:
+            logger.warning(
+                f"Expansion of {attribute_name:s} in event filter no longer "
+                f"supported"
+            )
+
+        if attribute_name == "timestamp":
+
+            def _GetTimestampValue(event, event_data, event_data_stream, event_tag):
+                attribute_value = getattr(event, "timestamp", None)
+                if attribute_value is not None and not isinstance(
+                    attribute_value,
+                    (
+                        dfdatetime_interface.DateTimeValues,
+                        value_types.DateTimeValueType,
+                    ),
+                ):
+                    attribute_value = value_types.DateTimeValueType(attribute_value)
+                return attribute_value
+
+            return _GetTimestampValue
+
+        if attribute_name in self._EVENT_ATTRIBUTE_NAMES:
+
+            def _GetEventValue(event, event_data, event_data_stream, event_tag):
+                return getattr(event, attribute_name, None)
+
+            return _GetEventValue
+
+        # The attribute names of an event data stream, as returned by
+        # GetAttributeNames, consist of the serializable protected attributes
+        # and the public attributes.
+        is_protected_attribute = attribute_name.startswith("_")
+
+        def _HasEventDataStreamValue(event_data_stream):
+            if is_protected_attribute:
+                # pylint: disable=protected-access
+                return (
+                    attribute_name
+                    in event_data_stream._SERIALIZABLE_PROTECTED_ATTRIBUTES
+                )
+            return attribute_name in event_data_stream.__dict__
+
+        if attribute_name == "tag":
+
+            def _GetTagValue(event, event_data, event_data_stream, event_tag):
+                if event_data_stream and _HasEventDataStreamValue(event_data_stream):
+                    return getattr(event_data_stream, attribute_name, None)
+                return getattr(event_tag, "labels", None)
+
+            return _GetTagValue
+
+        def _GetEventDataValue(event, event_data, event_data_stream, event_tag):
+            if event_data_stream and _HasEventDataStreamValue(event_data_stream):
+                return getattr(event_data_stream, attribute_name, None)
+            return getattr(event_data, attribute_name, None)
+
+        return _GetEventDataValue
+
+    def _CopyStringToSQL(self, string):
+        """Copies a string to a SQL string literal.
+
+        Args:
+          string (str): string.
+
+        Returns:
+          str: SQL string literal.
+        """
+        string = string.replace("'", "''")
+        return f"'{string:s}'"
+
+    def _CopyStringToSQLLikePattern(self, string):
+        """Copies a string to a SQL LIKE pattern that contains the string.
+
+        Args:
+          string (str): string.
+
+        Returns:
+          str: SQL LIKE expression, with backslash as escape character.
+        """
+        for character in ("\\", "%", "_"):
+            string = string.replace(character, f"\\{character:s}")
+
+        string = self._CopyStringToSQL(f"%{string:s}%")
+        return f"LIKE {string:s} ESCAPE '\\'"
+
+    def _GetSQLTimestamp(self, value):
+        """Retrieves a timestamp for use in a SQL expression.
+
+        Args:
+          value (object): value defined by the filter.
+
+        Returns:
+          int: number of microseconds since January 1, 1970, 00:00:00 UTC or
+              None if not available.
+        """
+        if not isinstance(value, dfdatetime_interface.DateTimeValues):
+            return None
+
+        return value.GetPlasoTimestamp()
+
     def _GetValue(
         self, attribute_name, event, event_data, event_data_stream, event_tag
     ):
@@ -283,11 +650,103 @@ class GenericBinaryOperator(BinaryOperator):
 
         return attribute_value
 
+    def CompileMatchFunction(self):
+        """Compiles the filter into a match function.
+
+        Returns:
+          function: match function, that takes an event, event data, event data
+              stream and event tag as arguments and returns True if they match
+              the filter.
+        """
+        attribute_name = self.left_operand
+
+        get_value = self._CompileGetValueFunction()
+        compare_value = self._CompileCompareFunction()
+
+        bool_value = self._bool_value
+        negated_bool_value = not bool_value
+
+        if (
+            attribute_name in self._EVENT_ATTRIBUTE_NAMES
+            or attribute_name == "tag"
+            or attribute_name.startswith("_")
+        ):
+
+            def _Match(event, event_data, event_data_stream, event_tag):
+                value = get_value(event, event_data, event_data_stream, event_tag)
+                if value and compare_value(value):
+                    return bool_value
+                return negated_bool_value
+
+            return _Match
+
+        # Most filters match public event data attributes, hence retrieving
+        # their value is inlined.
+        def _MatchEventDataValue(event, event_data, event_data_stream, event_tag):
+            if event_data_stream and attribute_name in event_data_stream.__dict__:
+                value = getattr(event_data_stream, attribute_name, None)
+            else:
+                value = getattr(event_data, attribute_name, None)
+
+            if value and compare_value(value):
+                return bool_value
+            return negated_bool_value
+
+        return _MatchEventDataValue
+
     def FlipBool(self):
         """Negates the internal boolean value attribute."""
         logger.debug("Negative matching.")
         self._bool_value = not self._bool_value
 
+    def GetSQLExpression(self, attribute_expressions):
+        """Retrieves a SQL expression that represents the filter.
+
+        String values are compared with the SQL operator of the filter and
+        timestamps are compared with a margin of 1 microsecond, to account for
+        date and time values with a higher precision.
+
+        Args:
+          attribute_expressions (dict[str, str]): SQL expressions of the event
+              attributes that are supported.
+
+        Returns:
+          str: SQL expression or None if the filter cannot be represented by
+              a SQL expression.
+        """
+        # A negated filter also matches events without the attribute.
+        if not self._bool_value or not self._SQL_OPERATOR:
+            return None
+
+        attribute_expression = attribute_expressions.get(self.left_operand, None)
+        if not attribute_expression or self.left_operand == "tag":
+            return None
+
+        if self.left_operand == "timestamp":
+            timestamp = self._GetSQLTimestamp(self.right_operand)
+            if timestamp is None:
+                return None
+
+            if self._SQL_OPERATOR in ("<", "<="):
+                return f"{attribute_expression:s} <= {timestamp + 1:d}"
+
+            if self._SQL_OPERATOR in (">", ">="):
+                return f"{attribute_expression:s} >= {timestamp - 1:d}"
+
+            if self._SQL_OPERATOR == "=":
+                return (
+                    f"{attribute_expression:s} BETWEEN {timestamp - 1:d} AND "
+                    f"{timestamp + 1:d}"
+                )
+
+            return None
+
+        if not isinstance(self.right_operand, str):
+            return None
+
+        string = self._CopyStringToSQL(self.right_operand)
+        return f"{attribute_expression:s} {self._SQL_OPERATOR:s} {string:s}"
+
     def Matches(self, event, event_data, event_data_stream, event_tag):
         """Determines if the event, data and tag match the filter.
 
@@ -312,6 +771,42 @@ class GenericBinaryOperator(BinaryOperator):
 class EqualsOperator(GenericBinaryOperator):
     """Equals (==) operator."""
 
+    _COMPARE_FUNCTION = operator.eq
+
+    _MATCH_COST = 1
+
+    _SQL_OPERATOR = "="
+
+    def GetMatchCost(self):
+        """Retrieves the relative cost of matching the filter.
+
+        Returns:
+          int: relative cost of matching the filter, where filters with a lower
+              cost are evaluated first when combined.
+        """
+        # A data type comparison is cheap and excludes most events.
+        if self._bool_value and self.left_operand == "data_type":
+            return 0
+
+        return self._MATCH_COST
+
+    def GetDataTypes(self):
+        """Retrieves the data types of the events that can match the filter.
+
+        Returns:
+          frozenset[str]: data types of the events that can match the filter or
+              None if the filter is not restricted to specific data types.
+        """
+        # A negated filter also matches events of other data types.
+        if (
+            not self._bool_value
+            or self.left_operand != "data_type"
+            or not isinstance(self.right_operand, str)
+        ):
+            return None
+
+        return frozenset([self.right_operand])
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if two values are equal.
 
@@ -328,6 +823,12 @@ class EqualsOperator(GenericBinaryOperator):
 class NotEqualsOperator(GenericBinaryOperator):
     """Not equals (!=) operator."""
 
+    _COMPARE_FUNCTION = operator.ne
+
+    _MATCH_COST = 1
+
+    _SQL_OPERATOR = "<>"
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if two values are not equal.
 
@@ -344,6 +845,10 @@ class NotEqualsOperator(GenericBinaryOperator):
 class LessThanOperator(GenericBinaryOperator):
     """Less than (<) operator."""
 
+    _COMPARE_FUNCTION = operator.lt
+
+    _SQL_OPERATOR = "<"
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if the event value is less than the second.
 
@@ -360,6 +865,10 @@ class LessThanOperator(GenericBinaryOperator):
 class LessEqualOperator(GenericBinaryOperator):
     """Less than or equals (<=) operator."""
 
+    _COMPARE_FUNCTION = operator.le
+
+    _SQL_OPERATOR = "<="
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if the event value is less than or equals the second.
 
@@ -377,6 +886,10 @@ class LessEqualOperator(GenericBinaryOperator):
 class GreaterThanOperator(GenericBinaryOperator):
     """Greater than (>) operator."""
 
+    _COMPARE_FUNCTION = operator.gt
+
+    _SQL_OPERATOR = ">"
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if the event value is greater than the second.
 
@@ -393,6 +906,10 @@ class GreaterThanOperator(GenericBinaryOperator):
 class GreaterEqualOperator(GenericBinaryOperator):
     """Greater than or equals (>=) operator."""
 
+    _COMPARE_FUNCTION = operator.ge
+
+    _SQL_OPERATOR = ">="
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if the event value is greater than or equals the second.
 
@@ -410,6 +927,65 @@ class GreaterEqualOperator(GenericBinaryOperator):
 class Contains(GenericBinaryOperator):
     """Operator to determine if a value contains another value."""
 
+    _MATCH_COST = 2
+
+    def _CompileCompareFunction(self):
+        """Compiles the comparison of an event value with the filter value.
+
+        Returns:
+          function: compare function, that takes an event value as argument and
+              returns True if the value matches according to the operator.
+        """
+        filter_value = self.right_operand
+        if not isinstance(filter_value, str):
+            return super()._CompileCompareFunction()
+
+        lower_case_filter_value = filter_value.lower()
+
+        def _CompareValue(event_value):
+            if isinstance(event_value, str):
+                return lower_case_filter_value in event_value.lower()
+
+            try:
+                return filter_value in event_value
+            except (AttributeError, TypeError):
+                return False
+
+        return _CompareValue
+
+    def GetSQLExpression(self, attribute_expressions):
+        """Retrieves a SQL expression that represents the filter.
+
+        A string is matched with a SQL LIKE pattern, which is case insensitive
+        for ASCII characters. A tag label is matched against the JSON
+        serialized labels of the event tag.
+
+        Args:
+          attribute_expressions (dict[str, str]): SQL expressions of the event
+              attributes that are supported.
+
+        Returns:
+          str: SQL expression or None if the filter cannot be represented by
+              a SQL expression.
+        """
+        if not self._bool_value or self.left_operand == "timestamp":
+            return None
+
+        attribute_expression = attribute_expressions.get(self.left_operand, None)
+        if not attribute_expression:
+            return None
+
+        # LIKE is only case insensitive for ASCII characters.
+        if not isinstance(self.right_operand, str) or not self.right_operand.isascii():
+            return None
+
+        string = self.right_operand
+        if self.left_operand == "tag":
+            string = f'"{string:s}"'
+
+        like_pattern = self._CopyStringToSQLLikePattern(string)
+        return f"{attribute_expression:s} {like_pattern:s}"
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if the second value is part of the first.
 
@@ -439,6 +1015,101 @@ class Contains(GenericBinaryOperator):
 class InSet(GenericBinaryOperator):
     """Operator to determine if a value is part of another value."""
 
+    _MATCH_COST = 1
+
+    # Types of values for which set and sequence membership are equivalent.
+    _HASHABLE_VALUE_TYPES = (bytes, float, int, str)
+
+    def _CompileCompareFunction(self):
+        """Compiles the comparison of an event value with the filter value.
+
+        Returns:
+          function: compare function, that takes an event value as argument and
+              returns True if the value matches according to the operator.
+        """
+        filter_value = self.right_operand
+        if not isinstance(filter_value, (list, tuple)) or not all(
+            isinstance(value, self._HASHABLE_VALUE_TYPES) for value in filter_value
+        ):
+            return super()._CompileCompareFunction()
+
+        filter_values_set = frozenset(filter_value)
+        hashable_value_types = self._HASHABLE_VALUE_TYPES
+
+        def _CompareValue(event_value):
+            if isinstance(event_value, hashable_value_types):
+                if event_value in filter_values_set:
+                    return True
+
+            elif event_value in filter_value:
+                return True
+
+            # event_value might be an iterable
+            # first we need to skip strings or we'll do silly things
+            if isinstance(event_value, (bytes, str)):
+                return False
+
+            try:
+                for value in event_value:
+                    if isinstance(value, hashable_value_types):
+                        if value not in filter_values_set:
+                            return False
+                    elif value not in filter_value:
+                        return False
+                return True
+            except TypeError:
+                return False
+
+        return _CompareValue
+
+    def GetDataTypes(self):
+        """Retrieves the data types of the events that can match the filter.
+
+        Returns:
+          frozenset[str]: data types of the events that can match the filter or
+              None if the filter is not restricted to specific data types.
+        """
+        if (
+            not self._bool_value
+            or self.left_operand != "data_type"
+            or not isinstance(self.right_operand, (list, tuple))
+            or not all(isinstance(value, str) for value in self.right_operand)
+        ):
+            return None
+
+        return frozenset(self.right_operand)
+
+    def GetSQLExpression(self, attribute_expressions):
+        """Retrieves a SQL expression that represents the filter.
+
+        Args:
+          attribute_expressions (dict[str, str]): SQL expressions of the event
+              attributes that are supported.
+
+        Returns:
+          str: SQL expression or None if the filter cannot be represented by
+              a SQL expression.
+        """
+        if not self._bool_value or self.left_operand in ("tag", "timestamp"):
+            return None
+
+        attribute_expression = attribute_expressions.get(self.left_operand, None)
+        if not attribute_expression:
+            return None
+
+        if not isinstance(self.right_operand, (list, tuple)) or not all(
+            isinstance(value, str) for value in self.right_operand
+        ):
+            return None
+
+        if not self.right_operand:
+            return None
+
+        strings = ", ".join(
+            self._CopyStringToSQL(value) for value in self.right_operand
+        )
+        return f"{attribute_expression:s} IN ({strings:s})"
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if the event value is part of the second.
 
@@ -478,6 +1149,8 @@ class Regexp(GenericBinaryOperator):
       compiled_re (???): compiled regular expression.
     """
 
+    _MATCH_COST = 3
+
     def __init__(self, arguments=None, **kwargs):
         """Initializes a regular expression operator.
 
@@ -504,6 +1177,31 @@ class Regexp(GenericBinaryOperator):
 
         self.compiled_re = compiled_re
 
+    def _CompileCompareFunction(self):
+        """Compiles the comparison of an event value with the filter value.
+
+        Returns:
+          function: compare function, that takes an event value as argument and
+              returns True if the value matches according to the operator.
+        """
+        copy_value_to_string = self._CopyValueToString
+        search = self.compiled_re.search
+
+        def _CompareValue(event_value):
+            if isinstance(event_value, str):
+                return search(event_value) is not None
+
+            try:
+                string_value = copy_value_to_string(event_value)
+                if search(string_value):
+                    return True
+            except TypeError:
+                pass
+
+            return False
+
+        return _CompareValue
+
     def _CompareValue(self, event_value, filter_value):
         """Compares if the event value matches a regular expression.
 
@@ -12,6 +12,7 @@ field.
 
 import abc
 import re
+import string
 
 from plaso.formatters import logger
 
@@ -210,6 +211,12 @@ class EventFormatter:
         "{([a-z][a-zA-Z0-9_]*)[!]?[^:}]*[:]?[^}]*}"
     )
 
+    _ATTRIBUTE_NAME_RE = re.compile("^[a-z][a-zA-Z0-9_]*$")
+
+    _CONVERSION_FUNCTIONS = {"a": ascii, "r": repr, "s": str}
+
+    _STRING_FORMATTER = string.Formatter()
+
     def __init__(self, data_type="internal"):
         """Initializes an event formatter.
 
@@ -230,6 +237,70 @@ class EventFormatter:
         """str: unique identifier for the event data supported by the formatter."""
         return self._data_type.lower()
 
+    def _CompileFormatString(self, format_string):
+        """Compiles a format string into a format function.
+
+        Format strings that contain a single attribute without nested format
+        specifiers, such as "Type: {file_entry_type}", are compiled into
+        a function that formats the value of the attribute directly. Other
+        format strings are formatted with str.format_map().
+
+        Args:
+          format_string (str): format string.
+
+        Returns:
+          function: format function that takes the event values and the value of
+              the attribute in the format string as arguments and returns
+              the formatted string.
+        """
+        try:
+            format_string_parts = list(self._STRING_FORMATTER.parse(format_string))
+        except ValueError:
+            format_string_parts = None
+
+        if format_string_parts and len(format_string_parts) <= 2:
+            prefix, attribute_name, format_spec, conversion = format_string_parts[0]
+            suffix = ""
+            if len(format_string_parts) == 2:
+                suffix, next_attribute_name, _, _ = format_string_parts[1]
+                if next_attribute_name is not None:
+                    attribute_name = None
+
+            if attribute_name is None and len(format_string_parts) == 1:
+                # Note that the literal text has its escaped braces resolved.
+                def _FormatText(event_values, attribute_value):
+                    return prefix
+
+                return _FormatText
+
+            if (
+                attribute_name
+                and self._ATTRIBUTE_NAME_RE.match(attribute_name)
+                and "{" not in format_spec
+            ):
+                conversion_function = self._CONVERSION_FUNCTIONS.get(conversion, None)
+
+                if not format_spec and not conversion_function:
+
+                    def _FormatValue(event_values, attribute_value):
+                        return f"{prefix:s}{attribute_value}{suffix:s}"
+
+                    return _FormatValue
+
+                def _FormatValueWithSpecification(event_values, attribute_value):
+                    if conversion_function:
+                        attribute_value = conversion_function(attribute_value)
+
+                    formatted_value = format(attribute_value, format_spec)
+                    return f"{prefix:s}{formatted_value:s}{suffix:s}"
+
+                return _FormatValueWithSpecification
+
+        def _FormatString(event_values, attribute_value):
+            return format_string.format_map(event_values)
+
+        return _FormatString
+
     def _FormatMessage(self, format_string, event_values):
         """Determines the formatted message.
 
@@ -241,9 +312,9 @@ class EventFormatter:
           str: formatted message.
         """
         try:
-            message_string = format_string.format(**event_values)
+            message_string = format_string.format_map(event_values)
 
-        except KeyError as exception:
+        except (KeyError, TypeError, ValueError) as exception:
             data_type = event_values.get("data_type") or "N/A"
             display_name = event_values.get("display_name") or "N/A"
             event_identifier = event_values.get("uuid") or "N/A"
@@ -282,6 +353,18 @@ class EventFormatter:
         # string.strip().
         return message_string.replace("\r", "").replace("\n", "")
 
+    def Compile(self):
+        """Compiles the format strings.
+
+        Compiling the format strings once, when the formatter is read, prevents
+        the format strings from being interpreted every time an event is
+        formatted.
+
+        Raises:
+          RuntimeError: when an invalid format string is encountered.
+        """
+        return
+
     def FormatEventValues(self, output_mediator, event_values):
         """Formats event values using the helper.
 
@@ -443,16 +526,25 @@ class ConditionalEventFormatter(EventFormatter):
               pieces.
           format_string_separator (Optional[str]): string by which separate format
               string pieces should be joined.
-          format_string_short_pieces (Optional[list[str]]): short message format
-              string pieces.
+          format_string_short_pieces (Optional[list[str]|str]): short message
+              format string pieces or a short message format string, which is
+              formatted as a whole.
         """
+        format_string_short = None
+        if isinstance(format_string_short_pieces, str):
+            format_string_short = format_string_short_pieces
+            format_string_short_pieces = None
+
         if format_string_separator is None:
             format_string_separator = self._DEFAULT_FORMAT_STRING_SEPARATOR
 
         super().__init__(data_type=data_type)
+        self._compiled_format_string_pieces = None
+        self._compiled_format_string_short_pieces = None
         self._format_string_pieces = format_string_pieces or []
         self._format_string_pieces_map = []
         self._format_string_separator = format_string_separator
+        self._format_string_short = format_string_short
         self._format_string_short_pieces = format_string_short_pieces or []
         self._format_string_short_pieces_map = []
 
@@ -511,29 +603,113 @@ class ConditionalEventFormatter(EventFormatter):
             self._format_string_short_pieces, self._format_string_short_pieces_map
         )
 
-    def _ConditionalFormatMessage(
-        self, format_string_pieces, format_string_pieces_map, event_values
+    def _CompileFormatStringPieces(
+        self, format_string_pieces, format_string_pieces_map
     ):
+        """Compiles format string pieces.
+
+        Args:
+          format_string_pieces (list[str]): format string pieces.
+          format_string_pieces_map (list[str]): format string pieces map.
+
+        Returns:
+          list[tuple[str, str, function]]: attribute name, format string piece
+              and format function per format string piece.
+        """
+        return [
+            (
+                attribute_name,
+                format_string_piece,
+                self._CompileFormatString(format_string_piece),
+            )
+            for format_string_piece, attribute_name in zip(
+                format_string_pieces, format_string_pieces_map
+            )
+        ]
+
+    def _ConditionalFormatMessage(self, compiled_format_string_pieces, event_values):
         """Determines the conditional formatted message.
 
         Args:
-          format_string_pieces (dict[str, str]): format string pieces.
-          format_string_pieces_map (list[int, str]): format string pieces map.
+          compiled_format_string_pieces (list[tuple[str, str, function]]):
+              attribute name, format string piece and format function per
+              format string piece.
           event_values (dict[str, object]): event values.
 
         Returns:
           str: conditional formatted message.
+        """
+        string_pieces = []
+        try:
+            for attribute_name, _, format_function in compiled_format_string_pieces:
+                if not attribute_name:
+                    string_pieces.append(format_function(event_values, None))
+                else:
+                    attribute_value = event_values.get(attribute_name, None)
+                    if attribute_value is not None:
+                        string_pieces.append(
+                            format_function(event_values, attribute_value)
+                        )
+
+        except (KeyError, TypeError, UnicodeDecodeError, ValueError):
+            # Format the message from the format string pieces so that the error
+            # is reported.
+            format_string_pieces = [
+                format_string_piece
+                for attribute_name, format_string_piece, _ in (
+                    compiled_format_string_pieces
+                )
+                if not attribute_name
+                or event_values.get(attribute_name, None) is not None
+            ]
+            format_string = self._format_string_separator.join(format_string_pieces)
+            return self._FormatMessage(format_string, event_values)
+
+        message_string = self._format_string_separator.join(string_pieces)
+
+        # Strip carriage return and linefeed form the message strings.
+        return message_string.replace("\r", "").replace("\n", "")
+
+    def Compile(self):
+        """Compiles the format strings.
+
+        Compiling the format strings once, when the formatter is read, prevents
+        the format strings from being interpreted every time an event is
+        formatted.
 
         Raises:
           RuntimeError: when an invalid format string piece is encountered.
         """
-        string_pieces = []
-        for map_index, attribute_name in enumerate(format_string_pieces_map):
-            if not attribute_name or event_values.get(attribute_name, None) is not None:
-                string_pieces.append(format_string_pieces[map_index])
+        if self._format_string_short:
+            format_string_short = self._format_string_short
+
+            # The short message format string is formatted as a whole.
+            def _FormatStringShort(event_values, attribute_value):
+                return format_string_short.format_map(event_values)
+
+            self._compiled_format_string_short_pieces = [
+                ("", format_string_short, _FormatStringShort)
+            ]
+
+        try:
+            self._CreateFormatStringMaps()
+
+        finally:
+            # Note that only the format string pieces that precede an invalid
+            # format string piece are compiled, since the format string pieces
+            # maps end there. This way the invalid format string piece is only
+            # reported once.
+            self._compiled_format_string_pieces = self._CompileFormatStringPieces(
+                self._format_string_pieces, self._format_string_pieces_map
+            )
 
-        format_string = self._format_string_separator.join(string_pieces)
-        return self._FormatMessage(format_string, event_values)
+            if not self._format_string_short:
+                self._compiled_format_string_short_pieces = (
+                    self._CompileFormatStringPieces(
+                        self._format_string_short_pieces,
+                        self._format_string_short_pieces_map,
+                    )
+                )
 
     def GetFormatStringAttributeNames(self):
         """Retrieves the attribute names in the format string.
@@ -562,11 +738,11 @@ class ConditionalEventFormatter(EventFormatter):
         Returns:
           str: message.
         """
-        if not self._format_string_pieces_map:
-            self._CreateFormatStringMaps()
+        if self._compiled_format_string_pieces is None:
+            self.Compile()
 
         return self._ConditionalFormatMessage(
-            self._format_string_pieces, self._format_string_pieces_map, event_values
+            self._compiled_format_string_pieces, event_values
         )
 
     def GetMessageShort(self, event_values):
@@ -578,20 +754,19 @@ class ConditionalEventFormatter(EventFormatter):
         Returns:
           str: short message.
         """
-        if not self._format_string_pieces_map:
-            self._CreateFormatStringMaps()
-
-        if self._format_string_short_pieces and self._format_string_short_pieces != [
-            ""
-        ]:
-            format_string_pieces = self._format_string_short_pieces
-            format_string_pieces_map = self._format_string_short_pieces_map
+        if self._compiled_format_string_pieces is None:
+            self.Compile()
+
+        if self._format_string_short or (
+            self._format_string_short_pieces
+            and self._format_string_short_pieces != [""]
+        ):
+            compiled_format_string_pieces = self._compiled_format_string_short_pieces
         else:
-            format_string_pieces = self._format_string_pieces
-            format_string_pieces_map = self._format_string_pieces_map
+            compiled_format_string_pieces = self._compiled_format_string_pieces
 
         short_message_string = self._ConditionalFormatMessage(
-            format_string_pieces, format_string_pieces_map, event_values
+            compiled_format_string_pieces, event_values
         )
 
         # Truncate the short message string if necessary.
@@ -24,10 +24,52 @@ NON_PRINTABLE_CHARACTERS.update(
 NON_PRINTABLE_CHARACTER_TRANSLATION_TABLE = str.maketrans(NON_PRINTABLE_CHARACTERS)
 
 # Compression formats.
+COMPRESSION_FORMAT_LZ4 = "lz4"
 COMPRESSION_FORMAT_NONE = "none"
 COMPRESSION_FORMAT_ZLIB = "zlib"
+COMPRESSION_FORMAT_ZSTD = "zstd"
 
-COMPRESSION_FORMATS = frozenset([COMPRESSION_FORMAT_NONE, COMPRESSION_FORMAT_ZLIB])
+COMPRESSION_FORMATS = frozenset(
+    [
+        COMPRESSION_FORMAT_LZ4,
+        COMPRESSION_FORMAT_NONE,
+        COMPRESSION_FORMAT_ZLIB,
+        COMPRESSION_FORMAT_ZSTD,
+    ]
+)
+
+# Compression formats that support a preset compression dictionary.
+COMPRESSION_FORMATS_WITH_DICTIONARY = frozenset(
+    [COMPRESSION_FORMAT_LZ4, COMPRESSION_FORMAT_ZLIB]
+)
+
+DEFAULT_COMPRESSION_FORMAT = COMPRESSION_FORMAT_ZLIB
+
+# Compression formats of output files.
+OUTPUT_COMPRESSION_FORMAT_GZIP = "gzip"
+OUTPUT_COMPRESSION_FORMAT_LZ4 = "lz4"
+OUTPUT_COMPRESSION_FORMAT_ZSTD = "zstd"
+
+OUTPUT_COMPRESSION_FORMATS = frozenset(
+    [
+        OUTPUT_COMPRESSION_FORMAT_GZIP,
+        OUTPUT_COMPRESSION_FORMAT_LZ4,
+        OUTPUT_COMPRESSION_FORMAT_ZSTD,
+    ]
+)
+
+# Deduplication policies of data streams with identical content.
+DATA_STREAM_DEDUPLICATION_CONTENT = "content"
+DATA_STREAM_DEDUPLICATION_LOCATION = "location"
+DATA_STREAM_DEDUPLICATION_NONE = "none"
+
+DATA_STREAM_DEDUPLICATION_POLICIES = frozenset(
+    [
+        DATA_STREAM_DEDUPLICATION_CONTENT,
+        DATA_STREAM_DEDUPLICATION_LOCATION,
+        DATA_STREAM_DEDUPLICATION_NONE,
+    ]
+)
 
 # Operating system families.
 OPERATING_SYSTEM_FAMILY_LINUX = "Linux"
@@ -47,23 +89,37 @@ OPERATING_SYSTEM_FAMILIES = frozenset(
 )
 
 # Serialization formats.
+SERIALIZER_FORMAT_BINARY = "binary"
 SERIALIZER_FORMAT_JSON = "json"
 
 SERIALIZER_FORMATS = frozenset([SERIALIZER_FORMAT_JSON])
 
+# Serialization formats of event data in a storage file.
+EVENT_DATA_SERIALIZER_FORMATS = frozenset(
+    [SERIALIZER_FORMAT_BINARY, SERIALIZER_FORMAT_JSON]
+)
+
 # Source types.
 SOURCE_TYPE_ARCHIVE = "archive"
 
 # Storage formats.
 STORAGE_FORMAT_SQLITE = "sqlite"
+STORAGE_FORMAT_SQLITE_SHARDED = "sqlite_sharded"
 STORAGE_FORMAT_REDIS = "redis"
 
-SESSION_STORAGE_FORMATS = frozenset([STORAGE_FORMAT_SQLITE])
+SESSION_STORAGE_FORMATS = frozenset(
+    [STORAGE_FORMAT_SQLITE, STORAGE_FORMAT_SQLITE_SHARDED]
+)
 
 TASK_STORAGE_FORMATS = frozenset([STORAGE_FORMAT_SQLITE, STORAGE_FORMAT_REDIS])
 
 DEFAULT_STORAGE_FORMAT = STORAGE_FORMAT_SQLITE
 
+# Event shard periods.
+EVENT_SHARD_PERIOD_MONTH = "month"
+
+EVENT_SHARD_PERIODS = frozenset([EVENT_SHARD_PERIOD_MONTH])
+
 # Storage types.
 
 # The session storage contains the results of one or more sessions.
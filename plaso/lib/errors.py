@@ -77,6 +77,10 @@ class TaggingFileError(Error):
     """Raised when the tagging file is invalid."""
 
 
+class TaskMergeError(Error):
+    """Raised when the results of a task cannot be merged."""
+
+
 class UnableToLoadRegistryHelper(Error):
     """Raised when unable to load a Registry helper object."""
 
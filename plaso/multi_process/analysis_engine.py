@@ -112,20 +112,15 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         logger.debug("Processing events.")
 
         filter_limit = getattr(event_filter, "limit", None)
+        filter_limit_reached = False
+        number_of_read_events = 0
 
-        for event in storage_writer.GetSortedEvents():
-            event_data_identifier = event.GetEventDataIdentifier()
-            event_data = storage_writer.GetAttributeContainerByIdentifier(
-                events.EventData.CONTAINER_TYPE, event_data_identifier
-            )
-
-            event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-            if event_data_stream_identifier:
-                event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
-                    events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier
-                )
-            else:
-                event_data_stream = None
+        for (
+            event,
+            event_data,
+            event_data_stream,
+        ) in storage_writer.GetSortedEventTriples(event_filter=event_filter):
+            number_of_read_events += 1
 
             event_identifier = event.GetIdentifier()
             event_tag = storage_writer.GetEventTagByEventIdentifer(event_identifier)
@@ -158,8 +153,16 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                 and filter_limit
                 and filter_limit == self._number_of_consumed_events
             ):
+                filter_limit_reached = True
                 break
 
+        if event_filter and not filter_limit_reached:
+            # Events skipped by the storage did not match the event filter.
+            number_of_events = storage_writer.GetNumberOfAttributeContainers(
+                events.EventObject.CONTAINER_TYPE
+            )
+            number_of_filtered_events += number_of_events - number_of_read_events
+
         logger.debug("Finished pushing events to analysis plugins.")
         # Signal that we have finished adding events.
         for event_queue in self._event_queues.values():
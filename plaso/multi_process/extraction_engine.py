@@ -1,6 +1,7 @@
 """The task-based multi-process processing extraction engine."""
 
 import collections
+import functools
 import heapq
 import logging
 import multiprocessing
@@ -12,6 +13,7 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import warnings
@@ -90,10 +92,15 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     * merge results returned by extraction worker processes.
     """
 
+    _CONTAINER_TYPE_DATA_TYPE_COUNT = counts.DataTypeCount.CONTAINER_TYPE
     _CONTAINER_TYPE_DATE_LESS_LOG_HELPER = events.DateLessLogHelper.CONTAINER_TYPE
+    _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
     _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
     _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+    _CONTAINER_TYPE_EVENT_LABEL_COUNT = counts.EventLabelCount.CONTAINER_TYPE
     _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
+    _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
+    _CONTAINER_TYPE_PARSER_COUNT = counts.ParserCount.CONTAINER_TYPE
 
     # Maximum number of dfVFS file system objects to cache in the foreman process.
     _FILE_SYSTEM_CACHE_SIZE = 3
@@ -101,6 +108,17 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # Maximum number of concurrent tasks.
     _MAXIMUM_NUMBER_OF_TASKS = 10000
 
+    # Maximum number of task stores pending merge that are read ahead.
+    _MAXIMUM_NUMBER_OF_PREFETCHED_TASKS = 4
+
+    # Maximum number of path specifications of small file entries that are
+    # batched into a single task.
+    _TASK_BATCH_MAXIMUM_NUMBER_OF_PATH_SPECS = 32
+
+    # Maximum combined size of the file entries that are batched into a single
+    # task, where larger file entries get a task of their own.
+    _TASK_BATCH_MAXIMUM_SIZE = 4 * 1024 * 1024
+
     _TASK_QUEUE_TIMEOUT_SECONDS = 2
 
     _WORKER_PROCESSES_MINIMUM = 2
@@ -113,6 +131,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         maximum_number_of_tasks=None,
         number_of_worker_processes=0,
         status_update_callback=None,
+        task_batch_maximum_number_of_path_specs=None,
+        task_batch_maximum_size=None,
         worker_memory_limit=None,
         worker_timeout=None,
     ):
@@ -124,6 +144,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           number_of_worker_processes (Optional[int]): number of worker processes.
           status_update_callback (Optional[function]): callback function for status
               updates.
+          task_batch_maximum_number_of_path_specs (Optional[int]): maximum number
+              of path specifications of small file entries to batch into a single
+              task, where None represents the default and 0 or 1 represents no
+              batching.
+          task_batch_maximum_size (Optional[int]): maximum combined size in bytes
+              of the file entries batched into a single task, where None represents
+              the default.
           worker_memory_limit (Optional[int]): maximum amount of memory a worker is
               allowed to consume, where None represents the default memory limit
               and 0 represents no limit.
@@ -160,6 +187,14 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
             number_of_worker_processes = cpu_count
 
+        if task_batch_maximum_number_of_path_specs is None:
+            task_batch_maximum_number_of_path_specs = (
+                self._TASK_BATCH_MAXIMUM_NUMBER_OF_PATH_SPECS
+            )
+
+        if task_batch_maximum_size is None:
+            task_batch_maximum_size = self._TASK_BATCH_MAXIMUM_SIZE
+
         if worker_memory_limit is None:
             worker_memory_limit = definitions.DEFAULT_WORKER_MEMORY_LIMIT
 
@@ -167,29 +202,37 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             worker_timeout = definitions.DEFAULT_WORKER_TIMEOUT
 
         super().__init__()
+        self._data_stream_index = None
+        self._data_stream_index_manager = None
         self._data_types_counter = collections.Counter()
         self._enable_sigsegv_handler = False
-        self._event_data_timeliner = None
+        self._event_labels_counter = collections.Counter()
         self._extraction_worker = None
+        self._failed_merge_helpers = {}
         self._file_system_cache = []
         self._maximum_number_of_containers = 50
         self._maximum_number_of_tasks = maximum_number_of_tasks
         self._merge_task = None
-        self._merge_task_on_hold = None
         self._number_of_consumed_event_data = 0
         self._number_of_consumed_sources = 0
         self._number_of_produced_event_data = 0
         self._number_of_produced_events = 0
         self._number_of_produced_sources = 0
         self._number_of_worker_processes = number_of_worker_processes
+        self._parsers_counter = collections.Counter()
         self._path_spec_extractor = extractors.PathSpecExtractor()
         self._resolver_context = context.Context()
         self._status = definitions.STATUS_INDICATOR_IDLE
         self._status_update_callback = status_update_callback
         self._system_configurations = None
+        self._task_batch_maximum_number_of_path_specs = (
+            task_batch_maximum_number_of_path_specs
+        )
+        self._task_batch_maximum_size = task_batch_maximum_size
+        self._task_batch_path_specs = []
+        self._task_batch_size = 0
         self._task_manager = task_manager.TaskManager()
-        self._task_merge_helper = None
-        self._task_merge_helper_on_hold = None
+        self._task_merge_helpers = []
         self._task_queue = None
         self._task_queue_port = None
         self._task_storage_format = None
@@ -197,6 +240,36 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         self._worker_memory_limit = worker_memory_limit
         self._worker_timeout = worker_timeout
 
+    def _AddToTaskBatch(self, session_identifier, path_spec, file_size):
+        """Adds the path specification of a small file entry to the task batch.
+
+        Args:
+          session_identifier (str): the identifier of the session the tasks are
+              part of.
+          path_spec (dfvfs.PathSpec): path specification.
+          file_size (int): size of the file entry in bytes.
+
+        Returns:
+          Task: batched task that is ready to be scheduled or None if the task
+              batch can hold more path specifications.
+        """
+        task = None
+        if (
+            self._task_batch_path_specs
+            and self._task_batch_size + file_size > self._task_batch_maximum_size
+        ):
+            task = self._CreateBatchedTask(session_identifier)
+
+        self._task_batch_path_specs.append(path_spec)
+        self._task_batch_size += file_size
+
+        if not task and len(self._task_batch_path_specs) >= (
+            self._task_batch_maximum_number_of_path_specs
+        ):
+            task = self._CreateBatchedTask(session_identifier)
+
+        return task
+
     def _CacheFileSystem(self, file_system):
         """Caches a dfVFS file system object.
 
@@ -303,9 +376,36 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                     file_system_path_spec,
                 )
 
+    def _CreateBatchedTask(self, session_identifier):
+        """Creates a task to process the path specifications in the task batch.
+
+        Args:
+          session_identifier (str): the identifier of the session the tasks are
+              part of.
+
+        Returns:
+          Task: batched task or None if the task batch is empty.
+        """
+        if not self._task_batch_path_specs:
+            return None
+
+        task = self._task_manager.CreateTask(
+            session_identifier, storage_format=self._task_storage_format
+        )
+        task.file_entry_type = dfvfs_definitions.FILE_ENTRY_TYPE_FILE
+        task.path_specs = self._task_batch_path_specs
+
+        self._task_batch_path_specs = []
+        self._task_batch_size = 0
+
+        return task
+
     def _CreateTask(self, storage_writer, session_identifier, event_source):
         """Creates a task to processes an event source.
 
+        The path specifications of small file entries are batched into a single
+        task to reduce the overhead of creating and merging task storage.
+
         Args:
           storage_writer (StorageWriter): storage writer for a session storage.
           session_identifier (str): the identifier of the session the tasks are
@@ -313,7 +413,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           event_source (EventSource): event source.
 
         Returns:
-          Task: task or None if no task could be created.
+          Task: task or None if no task could be created or if the path
+              specification was added to a task batch that is not yet full.
         """
         file_entry = path_spec_resolver.Resolver.OpenFileEntry(
             event_source.path_spec, resolver_context=self._resolver_context
@@ -336,6 +437,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             logger.debug(f"Excluded from extraction: {display_name:s}.")
             return None
 
+        if self._task_batch_maximum_number_of_path_specs > 1 and file_entry.IsFile():
+            file_size = file_entry.size or 0
+            if file_size < self._task_batch_maximum_size:
+                return self._AddToTaskBatch(
+                    session_identifier, event_source.path_spec, file_size
+                )
+
         task = self._task_manager.CreateTask(
             session_identifier, storage_format=self._task_storage_format
         )
@@ -402,15 +510,46 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             ]
         )
 
+    def _GetTasksStatus(self):
+        """Retrieves status information about the tasks.
+
+        Returns:
+          TasksStatus: tasks status information.
+        """
+        tasks_status = self._task_manager.GetStatusInformation()
+        tasks_status.number_of_prefetched_containers = sum(
+            merge_helper.number_of_queued_containers
+            for _, merge_helper in self._task_merge_helpers
+        )
+        return tasks_status
+
     def _MergeAttributeContainer(self, storage_writer, merge_helper, container):
         """Merges an attribute container from a task store into the storage writer.
 
+        Events are generated from event data by the extraction worker processes,
+        hence merging consists of copying the attribute containers and remapping
+        the identifiers they reference.
+
         Args:
           storage_writer (StorageWriter): storage writer.
           merge_helper (ExtractionTaskMergeHelper): helper to merge attribute
               containers.
           container (AttributeContainer): attribute container.
         """
+        # The counts are accumulated by the foreman and written when processing
+        # has completed.
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_DATA_TYPE_COUNT:
+            self._data_types_counter[container.name] += container.number_of_events
+            return
+
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_LABEL_COUNT:
+            self._event_labels_counter[container.label] += container.number_of_events
+            return
+
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_PARSER_COUNT:
+            self._parsers_counter[container.name] += container.number_of_events
+            return
+
         self._status = definitions.STATUS_INDICATOR_MERGING
 
         if container.CONTAINER_TYPE in (
@@ -444,6 +583,50 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                 )
                 return
 
+        elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+            event_data_identifier = container.GetEventDataIdentifier()
+            event_data_lookup_key = event_data_identifier.CopyToString()
+
+            event_data_identifier = merge_helper.GetAttributeContainerIdentifier(
+                event_data_lookup_key
+            )
+            if event_data_identifier:
+                container.SetEventDataIdentifier(event_data_identifier)
+            else:
+                identifier = container.GetIdentifier()
+                identifier_string = identifier.CopyToString()
+
+                # TODO: store this as a merge warning so this is preserved
+                # in the storage file.
+                logger.error(
+                    f"Unable to merge event attribute container: "
+                    f"{identifier_string:s} since corresponding event data: "
+                    f"{event_data_lookup_key:s} could not be found."
+                )
+                return
+
+        elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
+            event_identifier = container.GetEventIdentifier()
+            event_lookup_key = event_identifier.CopyToString()
+
+            event_identifier = merge_helper.GetAttributeContainerIdentifier(
+                event_lookup_key
+            )
+            if event_identifier:
+                container.SetEventIdentifier(event_identifier)
+            else:
+                identifier = container.GetIdentifier()
+                identifier_string = identifier.CopyToString()
+
+                # TODO: store this as a merge warning so this is preserved
+                # in the storage file.
+                logger.error(
+                    f"Unable to merge event tag attribute container: "
+                    f"{identifier_string:s} since corresponding event: "
+                    f"{event_lookup_key:s} could not be found."
+                )
+                return
+
         elif container.CONTAINER_TYPE in (
             "windows_eventlog_message_string",
             "windows_wevt_template_event",
@@ -476,6 +659,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
         lookup_key = None
         if container.CONTAINER_TYPE in (
+            self._CONTAINER_TYPE_EVENT,
             self._CONTAINER_TYPE_EVENT_DATA,
             self._CONTAINER_TYPE_EVENT_DATA_STREAM,
             "windows_eventlog_message_file",
@@ -491,30 +675,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             identifier = container.GetIdentifier()
             merge_helper.SetAttributeContainerIdentifier(lookup_key, identifier)
 
-        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
-            self._number_of_produced_event_data += 1
-
-            self._status = definitions.STATUS_INDICATOR_TIMELINING
-
-            event_data_stream_identifier = container.GetEventDataStreamIdentifier()
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+            self._number_of_produced_events += 1
 
-            event_data_stream = None
-            if event_data_stream_identifier:
-                event_data_stream = (
-                    self._storage_writer.GetAttributeContainerByIdentifier(
-                        self._CONTAINER_TYPE_EVENT_DATA_STREAM,
-                        event_data_stream_identifier,
-                    )
-                )
-
-            # Generate events on merge.
-            self._event_data_timeliner.ProcessEventData(
-                storage_writer, container, event_data_stream
-            )
-            self._number_of_consumed_event_data += 1
-            self._number_of_produced_events += (
-                self._event_data_timeliner.number_of_produced_events
-            )
+        elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+            self._number_of_produced_event_data += 1
 
         elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_SOURCE:
             self._number_of_produced_sources += 1
@@ -556,8 +721,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         """Merges a task storage with the session storage.
 
         This function checks all task stores that are ready to merge and updates
-        the scheduled tasks. Note that to prevent this function holding up
-        the task scheduling loop only the first available task storage is merged.
+        the scheduled tasks. The task stores pending merge are read ahead by
+        prefetch threads. Note that to prevent this function holding up the task
+        scheduling loop only a limited number of attribute containers is merged.
 
         Args:
           storage_writer (StorageWriter): storage writer for a session storage used
@@ -598,105 +764,158 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         if self._processing_profiler:
             self._processing_profiler.StopTiming("merge_check")
 
-        task = None
-        if not self._task_merge_helper_on_hold:
-            task = self._task_manager.GetTaskPendingMerge(self._merge_task)
+        self._StartMergeTaskStoragePrefetching()
 
-        if task or self._task_merge_helper:
-            if self._processing_profiler:
-                self._processing_profiler.StartTiming("merge")
-
-            if task:
-                if self._task_merge_helper:
-                    self._merge_task_on_hold = self._merge_task
-                    self._task_merge_helper_on_hold = self._task_merge_helper
+        if not self._task_merge_helpers:
+            return
 
-                    self._task_manager.SampleTaskStatus(
-                        self._merge_task_on_hold, "merge_on_hold"
-                    )
+        if self._processing_profiler:
+            self._processing_profiler.StartTiming("merge")
 
-                self._merge_task = task
-                try:
-                    task_storage_reader = self._GetMergeTaskStorage(
-                        self._task_storage_format, task
-                    )
-                    self._task_merge_helper = merge_helpers.ExtractionTaskMergeHelper(
-                        task_storage_reader, task.identifier
-                    )
-                    self._task_manager.SampleTaskStatus(task, "merge_started")
+        merge_duration = time.time()
 
-                except OSError as exception:
-                    logger.error(
-                        f"Unable to merge results of task: {task.identifier:s} with "
-                        f"error: {exception!s}"
-                    )
-                    self._task_merge_helper = None
+        # Merge the prefetched attribute containers in order of merge priority,
+        # where a task whose containers are not prefetched yet is skipped in
+        # favor of the next one to keep the merge flowing.
+        failed_tasks = []
+        fully_merged_tasks = []
+        number_of_containers = 0
 
-            if self._task_merge_helper:
-                merge_duration = time.time()
+        for task, merge_helper in self._task_merge_helpers:
+            maximum_number_of_containers = (
+                self._maximum_number_of_containers - number_of_containers
+            )
+            if maximum_number_of_containers <= 0:
+                break
 
-                number_of_containers = self._MergeAttributeContainers(
+            try:
+                number_of_containers += self._MergeAttributeContainers(
                     storage_writer,
-                    self._task_merge_helper,
-                    maximum_number_of_containers=self._maximum_number_of_containers,
+                    merge_helper,
+                    maximum_number_of_containers=maximum_number_of_containers,
                 )
-                merge_duration = time.time() - merge_duration
+            except errors.TaskMergeError as exception:
+                logger.error(f"{exception!s}, task will be retried.")
+                failed_tasks.append((task, merge_helper))
+                continue
 
-                fully_merged = self._task_merge_helper.fully_merged
+            if merge_helper.fully_merged:
+                fully_merged_tasks.append(task)
 
-                if merge_duration > 0.0 and number_of_containers > 0:
-                    # Limit the number of attribute containers from a single task-based
-                    # storage file that are merged per loop to keep tasks flowing.
-                    containers_per_second = number_of_containers / merge_duration
-                    maximum_number_of_containers = int(0.5 * containers_per_second)
+        merge_duration = time.time() - merge_duration
 
-                    if fully_merged:
-                        self._maximum_number_of_containers = max(
-                            self._maximum_number_of_containers,
-                            maximum_number_of_containers,
-                        )
-                    else:
-                        self._maximum_number_of_containers = (
-                            maximum_number_of_containers
-                        )
+        if merge_duration > 0.0 and number_of_containers > 0:
+            # Limit the number of attribute containers from task-based storage
+            # files that are merged per loop to keep tasks flowing.
+            containers_per_second = number_of_containers / merge_duration
+            maximum_number_of_containers = int(0.5 * containers_per_second)
 
+            if fully_merged_tasks:
+                self._maximum_number_of_containers = max(
+                    self._maximum_number_of_containers, maximum_number_of_containers
+                )
             else:
-                # TODO: Do something more sensible when this happens, perhaps
-                # retrying the task once that is implemented. For now, we mark the task
-                # as fully merged because we can't continue with it.
-                fully_merged = True
+                self._maximum_number_of_containers = max(
+                    1, maximum_number_of_containers
+                )
 
-            if self._processing_profiler:
-                self._processing_profiler.StopTiming("merge")
+        if self._processing_profiler:
+            self._processing_profiler.StopTiming("merge")
+
+        # The merge helper of a task that failed is kept, such that the attribute
+        # containers that were merged are skipped when the retry task is merged.
+        for task, merge_helper in failed_tasks:
+            self._StopMergeTaskStoragePrefetching(task)
+
+            original_task_identifier = task.original_task_identifier or task.identifier
+            self._failed_merge_helpers[original_task_identifier] = merge_helper
 
-            if fully_merged:
-                self._task_merge_helper.Close()
+            try:
+                self._RemoveMergeTaskStorage(self._task_storage_format, task)
+            except OSError as exception:
+                logger.error(f"{exception!s}")
+
+            try:
+                self._task_manager.AbandonMergingTask(task)
 
-                self._RemoveMergeTaskStorage(
-                    self._task_storage_format, self._merge_task
+            except KeyError as exception:
+                logger.error(
+                    f"Unable to abandon task: {task.identifier:s} "
+                    f"with error: {exception!s}"
                 )
-                try:
-                    self._task_manager.CompleteTask(self._merge_task)
 
-                except KeyError as exception:
-                    logger.error(
-                        f"Unable to complete task: {self._merge_task.identifier:s} "
-                        f"with error: {exception!s}"
-                    )
+        for task in fully_merged_tasks:
+            self._StopMergeTaskStoragePrefetching(task)
 
-                if not self._task_merge_helper_on_hold:
-                    self._merge_task = None
-                    self._task_merge_helper = None
-                else:
-                    self._merge_task = self._merge_task_on_hold
-                    self._task_merge_helper = self._task_merge_helper_on_hold
+            if task.original_task_identifier:
+                self._failed_merge_helpers.pop(task.original_task_identifier, None)
 
-                    self._merge_task_on_hold = None
-                    self._task_merge_helper_on_hold = None
+            self._RemoveMergeTaskStorage(self._task_storage_format, task)
+            try:
+                self._task_manager.CompleteTask(task)
 
-                    self._task_manager.SampleTaskStatus(
-                        self._merge_task, "merge_resumed"
-                    )
+            except KeyError as exception:
+                logger.error(
+                    f"Unable to complete task: {task.identifier:s} "
+                    f"with error: {exception!s}"
+                )
+
+        if self._task_merge_helpers:
+            self._merge_task = self._task_merge_helpers[0][0]
+        else:
+            self._merge_task = None
+
+    def _StartMergeTaskStoragePrefetching(self):
+        """Starts prefetching the task stores that are pending merge.
+
+        Up to _MAXIMUM_NUMBER_OF_PREFETCHED_TASKS task stores are read ahead
+        by a separate thread each, in order of merge priority.
+        """
+        while len(self._task_merge_helpers) < self._MAXIMUM_NUMBER_OF_PREFETCHED_TASKS:
+            task = self._task_manager.GetTaskPendingMerge(None)
+            if not task:
+                break
+
+            open_task_storage_reader = functools.partial(
+                self._GetMergeTaskStorage,
+                self._task_storage_format,
+                task,
+                profile_storage=False,
+            )
+            failed_merge_helper = None
+            if task.original_task_identifier:
+                failed_merge_helper = self._failed_merge_helpers.get(
+                    task.original_task_identifier
+                )
+
+            merge_helper = merge_helpers.PrefetchingExtractionTaskMergeHelper(
+                open_task_storage_reader,
+                task.identifier,
+                failed_merge_helper=failed_merge_helper,
+            )
+            self._task_merge_helpers.append((task, merge_helper))
+            self._task_manager.SampleTaskStatus(task, "merge_started")
+
+        # Tasks with a higher merge priority, such as tasks that produce event
+        # sources, are merged first. Note that the sort is stable and that
+        # a partially merged task keeps its position among equal priorities.
+        self._task_merge_helpers.sort(key=lambda item: item[0].merge_priority)
+
+    def _StopMergeTaskStoragePrefetching(self, task=None):
+        """Stops prefetching task stores.
+
+        Args:
+          task (Optional[Task]): task to stop prefetching the task store of,
+              where None represents all tasks.
+        """
+        task_merge_helpers = []
+        for merge_task, merge_helper in self._task_merge_helpers:
+            if task and merge_task.identifier != task.identifier:
+                task_merge_helpers.append((merge_task, merge_helper))
+            else:
+                merge_helper.Close()
+
+        self._task_merge_helpers = task_merge_helpers
 
     def _ProduceExtractionWarning(self, storage_writer, message, path_spec):
         """Produces an extraction warning.
@@ -763,13 +982,20 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                         self._task_manager.SampleTaskStatus(task, "schedule_attempted")
 
                     else:
-                        path_spec_string = self._GetPathSpecificationString(
-                            task.path_spec
-                        )
-                        logger.debug(
-                            f"Scheduled task: {task.identifier:s} for path "
-                            f"specification: {path_spec_string:s}"
-                        )
+                        if task.path_specs:
+                            number_of_path_specs = len(task.path_specs)
+                            logger.debug(
+                                f"Scheduled task: {task.identifier:s} for batch of "
+                                f"{number_of_path_specs:d} path specifications"
+                            )
+                        else:
+                            path_spec_string = self._GetPathSpecificationString(
+                                task.path_spec
+                            )
+                            logger.debug(
+                                f"Scheduled task: {task.identifier:s} for path "
+                                f"specification: {path_spec_string:s}"
+                            )
                         self._task_manager.SampleTaskStatus(task, "scheduled")
 
                         task = None
@@ -784,6 +1010,11 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                 if not task and not event_source:
                     event_source = event_source_heap.PopEventSource()
 
+                    # Schedule a partially filled task batch when no more event
+                    # sources are available, to keep the worker processes busy.
+                    if not event_source:
+                        task = self._CreateBatchedTask(session_identifier)
+
                 has_pending_tasks = self._task_manager.HasPendingTasks()
 
             except KeyboardInterrupt:
@@ -809,12 +1040,19 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                 )
                 event_source = None
 
+        self._task_batch_path_specs = []
+        self._task_batch_size = 0
+
+        self._StopMergeTaskStoragePrefetching()
+        self._merge_task = None
+
         for task in self._task_manager.GetFailedTasks():
-            self._ProduceExtractionWarning(
-                storage_writer,
-                "Worker failed to process path specification",
-                task.path_spec,
-            )
+            for path_spec in task.GetPathSpecs():
+                self._ProduceExtractionWarning(
+                    storage_writer,
+                    "Worker failed to process path specification",
+                    path_spec,
+                )
 
         self._status = definitions.STATUS_INDICATOR_IDLE
 
@@ -844,6 +1082,10 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         self._number_of_produced_events = 0
         self._number_of_produced_sources = 0
 
+        self._data_types_counter = collections.Counter()
+        self._event_labels_counter = collections.Counter()
+        self._parsers_counter = collections.Counter()
+
         stored_data_types_counter = storage_writer.GetDataTypesCounter()
         stored_parsers_counter = storage_writer.GetParsersCounter()
         stored_event_labels_counter = storage_writer.GetEventLabelsCounter()
@@ -859,13 +1101,13 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             self._status = definitions.STATUS_INDICATOR_COMPLETED
 
         storage_writer.UpdateDataTypesCounter(
-            stored_data_types_counter, self._event_data_timeliner.data_types_counter
+            stored_data_types_counter, self._data_types_counter
         )
         storage_writer.UpdateParsersCounter(
-            stored_parsers_counter, self._event_data_timeliner.parsers_counter
+            stored_parsers_counter, self._parsers_counter
         )
         storage_writer.UpdateEventLabelsCounter(
-            stored_event_labels_counter, self._event_data_timeliner.event_labels_counter
+            stored_event_labels_counter, self._event_labels_counter
         )
         if self._processing_profiler:
             self._processing_profiler.StopTiming("process_source")
@@ -873,7 +1115,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         # Update the foreman process and task status in case we are using a filter file.
         self._UpdateForemanProcessStatus()
 
-        tasks_status = self._task_manager.GetStatusInformation()
+        tasks_status = self._GetTasksStatus()
         if self._task_queue_profiler:
             self._task_queue_profiler.Sample(tasks_status)
 
@@ -932,6 +1174,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
             self._system_configurations,
             self._windows_event_log_providers,
             self._registry_find_specs,
+            data_stream_index=self._data_stream_index,
             enable_sigsegv_handler=self._enable_sigsegv_handler,
             name=process_name,
         )
@@ -1128,7 +1371,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
         self._UpdateForemanProcessStatus()
 
-        tasks_status = self._task_manager.GetStatusInformation()
+        tasks_status = self._GetTasksStatus()
         if self._task_queue_profiler:
             self._task_queue_profiler.Sample(tasks_status)
 
@@ -1196,13 +1439,16 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                 f"Unable to build collection filters with error: {exception!s}"
             )
 
-        self._event_data_timeliner = timeliner.EventDataTimeliner(
+        # Events are generated by the timeliner in the worker processes, the
+        # timeliner is created here to check its configuration before the worker
+        # processes are started.
+        event_data_timeliner = timeliner.EventDataTimeliner(
             data_location=processing_configuration.data_location,
             preferred_year=processing_configuration.preferred_year,
             system_configurations=system_configurations,
         )
         try:
-            self._event_data_timeliner.SetPreferredTimeZone(
+            event_data_timeliner.SetPreferredTimeZone(
                 processing_configuration.preferred_time_zone
             )
         except ValueError as exception:
@@ -1238,6 +1484,15 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         # Set up the task storage before the worker processes.
         self._StartTaskStorage(self._task_storage_format)
 
+        # Set up the data stream index, that is shared between the worker
+        # processes, before the worker processes.
+        if processing_configuration.extraction.data_stream_deduplication not in (
+            None,
+            definitions.DATA_STREAM_DEDUPLICATION_NONE,
+        ):
+            self._data_stream_index_manager = multiprocessing.Manager()
+            self._data_stream_index = self._data_stream_index_manager.dict()
+
         for worker_number in range(self._number_of_worker_processes):
             process_name = f"Worker_{self._last_worker_number:02d}"
             worker_process = self._StartWorkerProcess(process_name)
@@ -1288,6 +1543,12 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         # failsafe.
         self._task_queue.Close(abort=True)
 
+        if self._data_stream_index_manager:
+            self._data_stream_index_manager.shutdown()
+
+        self._data_stream_index = None
+        self._data_stream_index_manager = None
+
         if self._processing_status.error_path_specs:
             task_storage_abort = True
         else:
@@ -1311,7 +1572,6 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
         # Reset values.
         self._enable_sigsegv_handler = None
-        self._event_data_timeliner = None
         self._file_system_cache = []
         self._processing_configuration = None
         self._storage_file_path = None
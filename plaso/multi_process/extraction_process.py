@@ -4,6 +4,10 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import counts
+from plaso.containers import events
+from plaso.engine import parse_results_cache
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -16,6 +20,8 @@ from plaso.parsers import mediator as parsers_mediator
 class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     """Multi-processing extraction worker process."""
 
+    _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+
     # Maximum number of dfVFS file system objects to cache in the worker process.
     _FILE_SYSTEM_CACHE_SIZE = 3
 
@@ -26,6 +32,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         system_configurations,
         windows_event_log_providers,
         registry_find_specs,
+        data_stream_index=None,
         **kwargs,
     ):
         """Initializes an extraction worker process.
@@ -42,15 +49,24 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
               EventLog providers.
           registry_find_specs (list[dfwinreg.FindSpec]): Windows Registry find
               specifications.
+          data_stream_index (Optional[DictProxy]): data stream index that is
+              shared between the worker processes to deduplicate data streams,
+              where None represents the worker process uses its own data stream
+              index if data stream deduplication is enabled.
           kwargs: keyword arguments to pass to multiprocessing.Process.
         """
         super().__init__(processing_configuration, **kwargs)
         self._abort = False
         self._buffer_size = 0
         self._current_display_name = ""
+        self._data_stream_index = data_stream_index
+        self._event_data_timeliner = None
         self._extraction_worker = None
         self._file_system_cache = []
+        self._number_of_consumed_event_data = 0
         self._number_of_consumed_sources = 0
+        self._number_of_produced_events = 0
+        self._parse_results_cache = None
         self._parser_mediator = None
         self._registry_find_specs = registry_find_specs
         self._resolver_context = None
@@ -169,13 +185,13 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
             "display_name": self._current_display_name,
             "identifier": self._name,
             "last_activity_timestamp": last_activity_timestamp,
-            "number_of_consumed_event_data": None,
+            "number_of_consumed_event_data": self._number_of_consumed_event_data,
             "number_of_consumed_event_tags": None,
             "number_of_consumed_events": None,
             "number_of_consumed_sources": self._number_of_consumed_sources,
             "number_of_produced_event_data": number_of_produced_event_data,
             "number_of_produced_event_tags": None,
-            "number_of_produced_events": None,
+            "number_of_produced_events": self._number_of_produced_events,
             "number_of_produced_sources": number_of_produced_sources,
             "processing_status": processing_status,
             "task_identifier": task_identifier,
@@ -213,6 +229,18 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         self._extraction_worker.SetExtractionConfiguration(
             self._processing_configuration.extraction
         )
+        if self._data_stream_index is not None:
+            self._extraction_worker.SetDataStreamIndex(self._data_stream_index)
+
+        self._StartParseResultsCache(self._processing_configuration.extraction)
+        self._event_data_timeliner = timeliner.EventDataTimeliner(
+            data_location=self._processing_configuration.data_location,
+            preferred_year=self._processing_configuration.preferred_year,
+            system_configurations=self._system_configurations,
+        )
+        self._event_data_timeliner.SetPreferredTimeZone(
+            self._processing_configuration.preferred_time_zone
+        )
         self._parser_mediator.StartProfiling(
             self._processing_configuration.profiling,
             self._name,
@@ -270,9 +298,12 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         if self._processing_profiler:
             self._extraction_worker.SetProcessingProfiler(None)
 
+        self._StopParseResultsCache()
+
         self._StopProfiling()
         self._parser_mediator.StopProfiling()
 
+        self._event_data_timeliner = None
         self._extraction_worker = None
         self._file_system_cache = []
         self._parser_mediator = None
@@ -290,6 +321,76 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         except errors.QueueAlreadyClosed:
             logger.error(f"Queue for {self.name:s} was already closed.")
 
+    def _ProcessEventData(self, storage_writer):
+        """Generates events from the event data written to the task storage.
+
+        The events, event tags and timelining warnings are written to the task
+        storage, together with the number of events per data type, parser and
+        event label, so that the foreman only needs to merge them.
+
+        Args:
+          storage_writer (StorageWriter): storage writer for a task storage.
+        """
+        if self._processing_profiler:
+            self._processing_profiler.StartTiming("process_event_data")
+
+        self._event_data_timeliner.Reset()
+
+        event_data = storage_writer.GetFirstWrittenEventData()
+
+        while event_data:
+            if self._abort:
+                break
+
+            event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+
+            event_data_stream = None
+            if event_data_stream_identifier:
+                event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
+                    self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+                    event_data_stream_identifier,
+                )
+
+            self._event_data_timeliner.ProcessEventData(
+                storage_writer, event_data, event_data_stream
+            )
+            self._number_of_consumed_event_data += 1
+            self._number_of_produced_events += (
+                self._event_data_timeliner.number_of_produced_events
+            )
+
+            event_data = storage_writer.GetNextWrittenEventData()
+
+        for (
+            name,
+            number_of_events,
+        ) in self._event_data_timeliner.data_types_counter.items():
+            data_type_count = counts.DataTypeCount(
+                name=name, number_of_events=number_of_events
+            )
+            storage_writer.AddAttributeContainer(data_type_count)
+
+        for (
+            label,
+            number_of_events,
+        ) in self._event_data_timeliner.event_labels_counter.items():
+            event_label_count = counts.EventLabelCount(
+                label=label, number_of_events=number_of_events
+            )
+            storage_writer.AddAttributeContainer(event_label_count)
+
+        for (
+            name,
+            number_of_events,
+        ) in self._event_data_timeliner.parsers_counter.items():
+            parser_count = counts.ParserCount(
+                name=name, number_of_events=number_of_events
+            )
+            storage_writer.AddAttributeContainer(parser_count)
+
+        if self._processing_profiler:
+            self._processing_profiler.StopTiming("process_event_data")
+
     def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
         """Processes a path specification.
 
@@ -371,11 +472,23 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         try:
             task_storage_writer.AddAttributeContainer(task)
 
-            # TODO: add support for more task types.
-            self._ProcessPathSpec(
-                self._extraction_worker, self._parser_mediator, task.path_spec
-            )
-            self._number_of_consumed_sources += 1
+            # A batched task contains multiple path specifications that are
+            # processed individually so that a failure to process one file entry
+            # does not affect the others.
+            for path_spec in task.GetPathSpecs():
+                if self._abort:
+                    break
+
+                self._ProcessPathSpec(
+                    self._extraction_worker, self._parser_mediator, path_spec
+                )
+                self._number_of_consumed_sources += 1
+
+            # Events are generated after all path specifications of the task have
+            # been processed since date-less log helpers are produced after the
+            # event data they apply to.
+            if not self._abort:
+                self._ProcessEventData(task_storage_writer)
 
         finally:
             task.aborted = self._abort
@@ -399,6 +512,45 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
 
         logger.debug(f"Completed processing task: {task.identifier:s}.")
 
+    def _StartParseResultsCache(self, configuration):
+        """Starts the persistent cache of parse results.
+
+        Args:
+          configuration (ExtractionConfiguration): extraction configuration.
+        """
+        if not configuration.parse_cache_path:
+            return
+
+        cache = parse_results_cache.ParseResultsCache(
+            maximum_size=configuration.parse_cache_size
+        )
+        try:
+            cache.Open(configuration.parse_cache_path)
+        except OSError as exception:
+            logger.warning(
+                f"Unable to open parse results cache with error: {exception!s}"
+            )
+            return
+
+        self._extraction_worker.SetParseResultsCache(cache)
+        self._parse_results_cache = cache
+
+    def _StopParseResultsCache(self):
+        """Stops the persistent cache of parse results."""
+        if not self._parse_results_cache:
+            return
+
+        self._extraction_worker.SetParseResultsCache(None)
+
+        logger.debug(
+            f"{self._name!s} (PID: {self._pid:d}) parse results cache hits: "
+            f"{self._parse_results_cache.number_of_cache_hits:d}, misses: "
+            f"{self._parse_results_cache.number_of_cache_misses:d}"
+        )
+
+        self._parse_results_cache.Close()
+        self._parse_results_cache = None
+
     def SignalAbort(self):
         """Signals the process to abort."""
         self._abort = True
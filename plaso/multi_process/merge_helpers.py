@@ -1,11 +1,17 @@
 """Classes to assist in merging attribute containers of tasks."""
 
+import queue
+import threading
+
 from plaso.containers import analysis_results
 from plaso.containers import artifacts
+from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import reports
 from plaso.containers import warnings
+from plaso.lib import errors
+from plaso.multi_process import logger
 
 
 class BaseTaskMergeHelper:
@@ -26,12 +32,15 @@ class BaseTaskMergeHelper:
         """
         super().__init__()
         self._container_identifier_mappings = {}
-        self._generator = self._GetAttributeContainers(task_storage_reader)
+        self._generator = None
         self._task_storage_reader = task_storage_reader
 
         self.fully_merged = False
         self.task_identifier = task_identifier
 
+        if task_storage_reader:
+            self._generator = self._GetAttributeContainers(task_storage_reader)
+
     def _GetAttributeContainers(self, task_storage_reader):
         """Retrieves attribute containers to merge.
 
@@ -44,8 +53,6 @@ class BaseTaskMergeHelper:
         for container_type in self._CONTAINER_TYPES:
             yield from task_storage_reader.GetAttributeContainers(container_type)
 
-        self.fully_merged = True
-
     def Close(self):
         """Closes the task storage reader."""
         self._task_storage_reader.Close()
@@ -61,6 +68,7 @@ class BaseTaskMergeHelper:
             container = next(self._generator)
         except StopIteration:
             container = None
+            self.fully_merged = True
 
         return container
 
@@ -86,6 +94,197 @@ class BaseTaskMergeHelper:
         self._container_identifier_mappings[lookup_key] = identifier
 
 
+class BasePrefetchingTaskMergeHelper(BaseTaskMergeHelper):
+    """Interface of helper for merging prefetched task attribute containers.
+
+    The attribute containers are read and deserialized ahead of time by
+    a separate thread, such that the thread merging the attribute containers
+    only needs to remap identifiers and write the attribute containers.
+
+    If the task storage cannot be read, the merge of the task fails and the task
+    is retried. The attribute containers that were merged before the failure
+    are skipped when the task storage of the retry task is merged.
+
+    Attributes:
+      number_of_merged_containers (int): number of attribute containers of
+          the task that were retrieved to merge, including those of earlier
+          attempts to merge the task.
+      task_identifier (str): identifier of the task that is merged.
+    """
+
+    # Maximum number of prefetched attribute containers that are queued.
+    _MAXIMUM_NUMBER_OF_QUEUED_CONTAINERS = 10000
+
+    # Number of seconds to wait for the queue before checking for an abort.
+    _QUEUE_TIMEOUT = 0.1
+
+    def __init__(
+        self,
+        open_task_storage_reader,
+        task_identifier,
+        failed_merge_helper=None,
+        maximum_number_of_queued_containers=None,
+    ):
+        """Initialize a helper for merging prefetched task attribute containers.
+
+        Args:
+          open_task_storage_reader (function): function that opens and returns
+              the task storage reader. Note that this function is called from
+              the prefetch thread, since storage readers, such as SQLite, are
+              bound to the thread they are opened in.
+          task_identifier (str): identifier of the task that is merged.
+          failed_merge_helper (Optional[BasePrefetchingTaskMergeHelper]): helper
+              of an earlier attempt to merge the task that failed, where None
+              represents the task was not merged before.
+          maximum_number_of_queued_containers (Optional[int]): maximum number of
+              prefetched attribute containers that are queued, where None
+              represents the default.
+        """
+        super().__init__(None, task_identifier)
+        self._abort_event = threading.Event()
+        self._exception = None
+        self._number_of_containers_to_skip = 0
+        self._open_task_storage_reader = open_task_storage_reader
+        self._queue = queue.Queue(
+            maxsize=(
+                maximum_number_of_queued_containers
+                or self._MAXIMUM_NUMBER_OF_QUEUED_CONTAINERS
+            )
+        )
+
+        self.number_of_merged_containers = 0
+
+        if failed_merge_helper:
+            # The identifiers of the attribute containers that are skipped are
+            # needed to remap the identifiers referenced by the other attribute
+            # containers.
+            self._container_identifier_mappings = (
+                failed_merge_helper.GetAttributeContainerIdentifierMappings()
+            )
+            self._number_of_containers_to_skip = (
+                failed_merge_helper.number_of_merged_containers
+            )
+            self.number_of_merged_containers = (
+                failed_merge_helper.number_of_merged_containers
+            )
+
+        self._thread = threading.Thread(
+            name=f"Prefetch-{task_identifier:s}",
+            target=self._PrefetchAttributeContainers,
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def number_of_queued_containers(self):
+        """int: number of prefetched attribute containers waiting to be merged."""
+        return self._queue.qsize()
+
+    def _PrefetchAttributeContainers(self):
+        """Reads attribute containers and queues them to be merged.
+
+        A None value is queued to signal that no more attribute containers are
+        available. If reading fails the exception is stored before the None
+        value is queued, so that the end of the attribute containers is not
+        mistaken for a fully merged task.
+        """
+        try:
+            task_storage_reader = self._open_task_storage_reader()
+            try:
+                for container in self._GetAttributeContainers(task_storage_reader):
+                    if not self._PutOnQueue(container):
+                        break
+
+            finally:
+                task_storage_reader.Close()
+
+        # All exceptions need to be caught here to make sure the end of
+        # the attribute containers is signaled to the merging thread.
+        except Exception as exception:  # pylint: disable=broad-except
+            logger.error(
+                f"Unable to read results of task: {self.task_identifier:s} with "
+                f"error: {exception!s}"
+            )
+            self._exception = exception
+
+        self._PutOnQueue(None)
+
+    def _PutOnQueue(self, container):
+        """Puts an attribute container on the queue.
+
+        Args:
+          container (AttributeContainer): attribute container or None to signal
+              that no more attribute containers are available.
+
+        Returns:
+          bool: True if the attribute container was queued or False if the helper
+              was closed.
+        """
+        while not self._abort_event.is_set():
+            try:
+                self._queue.put(container, timeout=self._QUEUE_TIMEOUT)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def Close(self):
+        """Stops the prefetch thread."""
+        self._abort_event.set()
+        self._thread.join()
+
+    def GetAttributeContainer(self):
+        """Retrieves a prefetched attribute container to merge.
+
+        This function does not wait for the prefetch thread when no attribute
+        container has been prefetched yet. Attribute containers that were merged
+        by an earlier attempt to merge the task are skipped.
+
+        Returns:
+          AttributeContainer: attribute container or None if not available.
+
+        Raises:
+          TaskMergeError: if the attribute containers could not be read.
+        """
+        if self.fully_merged:
+            return None
+
+        while True:
+            try:
+                container = self._queue.get_nowait()
+            except queue.Empty:
+                return None
+
+            if container is None or not self._number_of_containers_to_skip:
+                break
+
+            self._number_of_containers_to_skip -= 1
+
+        if container is None:
+            if self._exception:
+                raise errors.TaskMergeError(
+                    f"Unable to read results of task: {self.task_identifier:s} "
+                    f"with error: {self._exception!s}"
+                )
+
+            self.fully_merged = True
+
+        else:
+            self.number_of_merged_containers += 1
+
+        return container
+
+    def GetAttributeContainerIdentifierMappings(self):
+        """Retrieves the attribute container identifier mappings.
+
+        Returns:
+          dict[str, AttributeContainerIdentifier]: attribute container identifiers
+              per lookup key.
+        """
+        return self._container_identifier_mappings
+
+
 class AnalysisTaskMergeHelper(BaseTaskMergeHelper):
     """Assists in merging attribute containers of an analysis task."""
 
@@ -114,14 +313,25 @@ class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
     _CONTAINER_TYPES = (
         event_sources.EventSource.CONTAINER_TYPE,
         events.EventDataStream.CONTAINER_TYPE,
-        # The date-less log helper is needed to generate event from the event
-        # data by the timeliner and therefore needs to be merged before event
-        # data containers.
         events.DateLessLogHelper.CONTAINER_TYPE,
         events.EventData.CONTAINER_TYPE,
+        # Events are generated from the event data by the timeliner in the
+        # extraction worker processes.
+        events.EventObject.CONTAINER_TYPE,
+        events.EventTag.CONTAINER_TYPE,
+        counts.DataTypeCount.CONTAINER_TYPE,
+        counts.EventLabelCount.CONTAINER_TYPE,
+        counts.ParserCount.CONTAINER_TYPE,
         warnings.ExtractionWarning.CONTAINER_TYPE,
         warnings.RecoveryWarning.CONTAINER_TYPE,
+        warnings.TimeliningWarning.CONTAINER_TYPE,
         artifacts.WindowsEventLogMessageFileArtifact.CONTAINER_TYPE,
         artifacts.WindowsEventLogMessageStringArtifact.CONTAINER_TYPE,
         artifacts.WindowsWevtTemplateEvent.CONTAINER_TYPE,
     )
+
+
+class PrefetchingExtractionTaskMergeHelper(BasePrefetchingTaskMergeHelper):
+    """Assists in merging prefetched attribute containers of an extraction task."""
+
+    _CONTAINER_TYPES = ExtractionTaskMergeHelper._CONTAINER_TYPES
@@ -1,6 +1,8 @@
 """The output and formatting multi-processing engine."""
 
+import collections
 import heapq
+import multiprocessing
 import os
 
 from plaso.containers import events
@@ -10,9 +12,54 @@ from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.multi_process import engine
 from plaso.multi_process import logger
+from plaso.output import interface as output_interface
 from plaso.output import mediator as output_mediator
+from plaso.storage import factory as storage_factory
 from plaso.storage import time_range as storage_time_range
 
+# The output and formatting engine of a worker process.
+_worker_output_engine = None
+
+
+def _FormatEventsInTimeRange(time_range):
+    """Formats the events in a time range in a worker process.
+
+    Args:
+      time_range (TimeRange): time range of the events to format.
+
+    Returns:
+      tuple: containing:
+
+        list[tuple[bool, object]]: output field values in output order.
+        int: number of events read from the storage.
+        int: number of events exported.
+        EventsStatus: status of the events.
+    """
+    # pylint: disable=protected-access
+    return _worker_output_engine._FormatEventsInTimeRange(time_range)
+
+
+def _InitializeWorkerProcess(
+    output_engine, storage_file_path, output_module, deduplicate_events, event_filter
+):
+    """Initializes a worker process.
+
+    Args:
+      output_engine (OutputAndFormattingMultiProcessEngine): output and
+          formatting engine, as copied into the worker process.
+      storage_file_path (str): path of the storage file.
+      output_module (OutputModule): output module.
+      deduplicate_events (bool): True if events should be deduplicated.
+      event_filter (EventObjectFilter): event filter or None.
+    """
+    global _worker_output_engine  # pylint: disable=global-statement
+
+    # pylint: disable=protected-access
+    output_engine._InitializeWorker(
+        storage_file_path, output_module, deduplicate_events, event_filter
+    )
+    _worker_output_engine = output_engine
+
 
 class PsortEventHeap:
     """Psort event heap."""
@@ -33,18 +80,28 @@ class PsortEventHeap:
         Returns:
           tuple: containing:
 
-            str: identifier of the event MACB group or None if the event cannot
-                be grouped.
             str: identifier of the event content.
+            int: index of the storage reader the event originates from.
             EventObject: event.
             EventData: event data.
             EventDataStream: event data stream.
         """
         try:
-            event_values_hash, _, event, event_data, event_data_stream = heapq.heappop(
-                self._heap
+            (
+                event_values_hash,
+                storage_index,
+                _,
+                event,
+                event_data,
+                event_data_stream,
+            ) = heapq.heappop(self._heap)
+            return (
+                event_values_hash,
+                storage_index,
+                event,
+                event_data,
+                event_data_stream,
             )
-            return event_values_hash, event, event_data, event_data_stream
 
         except IndexError:
             return None
@@ -55,9 +112,8 @@ class PsortEventHeap:
         Yields:
           tuple: containing:
 
-            str: identifier of the event MACB group or None if the event cannot
-                be grouped.
             str: identifier of the event content.
+            int: index of the storage reader the event originates from.
             EventObject: event.
             EventData: event data.
             EventDataStream: event data stream.
@@ -67,13 +123,15 @@ class PsortEventHeap:
             yield heap_values
             heap_values = self.PopEvent()
 
-    def PushEvent(self, event, event_data, event_data_stream):
+    def PushEvent(self, event, event_data, event_data_stream, storage_index=0):
         """Pushes an event onto the heap.
 
         Args:
           event (EventObject): event.
           event_data (EventData): event data.
           event_data_stream (EventDataStream): event data stream.
+          storage_index (Optional[int]): index of the storage reader the event
+              originates from.
         """
         event_values_hash = getattr(event_data, "_event_values_hash", None)
         if event_values_hash is None:
@@ -87,13 +145,103 @@ class PsortEventHeap:
 
         # Note that only events with the same timestamp are stored in the event
         # heap. The event values hash is stored first to cluster events with
-        # similar event values.
+        # similar event values, followed by the storage index to cluster these
+        # events per storage reader.
         heapq.heappush(
             self._heap,
-            (event_values_hash, timestamp_desc, event, event_data, event_data_stream),
+            (
+                event_values_hash,
+                storage_index,
+                timestamp_desc,
+                event,
+                event_data,
+                event_data_stream,
+            ),
         )
 
 
+class PsortFieldValuesRecorder(output_interface.OutputModule):
+    """Psort output field values recorder.
+
+    The recorder retrieves output field values using an output module, but
+    records them instead of writing them to the output. This allows a worker
+    process to format events and the main process to write them.
+
+    Attributes:
+      field_values (list[tuple[bool, object]]): output field values in output
+          order, where the boolean indicates the values are of a MACB group
+          and the object contains the output field values per name or, for
+          a MACB group, a list of output field values per name.
+    """
+
+    def __init__(self, output_module):
+        """Initializes a psort output field values recorder.
+
+        Args:
+          output_module (OutputModule): output module that formats the output
+              field values.
+        """
+        super().__init__()
+        self._output_module = output_module
+        self.field_values = []
+
+    def GetFieldValues(
+        self, output_mediator, event, event_data, event_data_stream, event_tag
+    ):
+        """Retrieves the output field values.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          event (EventObject): event.
+          event_data (EventData): event data.
+          event_data_stream (EventDataStream): event data stream.
+          event_tag (EventTag): event tag.
+
+        Returns:
+          dict[str, str]: output field values per name.
+        """
+        return self._output_module.GetFieldValues(
+            output_mediator, event, event_data, event_data_stream, event_tag
+        )
+
+    def GetMACBGroupFieldValues(self, output_mediator, macb_group):
+        """Retrieves the output field values of a MACB group.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
+              group of event, event_data, event_data_stream and event_tag objects
+              with identical timestamps, attributes and values.
+
+        Returns:
+          list[dict[str, str]]: output field values per name of the MACB group.
+        """
+        return self._output_module.GetMACBGroupFieldValues(output_mediator, macb_group)
+
+    def WriteFieldValues(self, output_mediator, field_values):
+        """Records field values.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          field_values (dict[str, str]): output field values per name.
+        """
+        self.field_values.append((False, field_values))
+
+    def WriteMACBGroupFieldValues(self, output_mediator, macb_group_field_values):
+        """Records the output field values of a MACB group.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          macb_group_field_values (list[dict[str, str]]): output field values per
+              name of the MACB group.
+        """
+        self.field_values.append((True, macb_group_field_values))
+
+
 class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     """Output and formatting multi-processing engine."""
 
@@ -106,6 +254,17 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
     _MESSAGE_FORMATTERS_FILE_NAME = "formatters.yaml"
 
+    # The number of time ranges per worker process that can be pending, where
+    # the formatted output of pending time ranges is buffered in memory.
+    _PENDING_TIME_RANGES_PER_WORKER = 2
+
+    # The maximum number of events in the time range of a worker process task.
+    _TIME_RANGE_MAXIMUM_EVENTS = 50000
+
+    # The number of time ranges per worker process, where more time ranges
+    # spread the work more evenly over the worker processes.
+    _TIME_RANGES_PER_WORKER = 4
+
     def __init__(self):
         """Initializes an output and formatting multi-processing engine."""
         super().__init__()
@@ -114,11 +273,19 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         self._events_status = processing_status.EventsStatus()
         self._export_event_heap = PsortEventHeap()
         self._export_event_timestamp = 0
+        self._has_event_tags = []
         self._number_of_consumed_events = 0
         self._output_mediator = None
+        self._output_mediators = []
+        self._output_module = None
         self._processing_configuration = None
         self._status = definitions.STATUS_INDICATOR_IDLE
         self._status_update_callback = None
+        self._worker_deduplicate_events = True
+        self._worker_event_filter = None
+        self._worker_output_module = None
+        self._worker_storage_file_path = None
+        self._worker_storage_reader = None
 
     def _CreateOutputMediator(self, storage_reader, processing_configuration):
         """Creates an output mediator.
@@ -166,8 +333,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
     def _ExportEvent(
         self,
-        storage_reader,
+        storage_readers,
         output_module,
+        storage_index,
         event,
         event_data,
         event_data_stream,
@@ -176,8 +344,10 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         """Exports an event using an output module.
 
         Args:
-          storage_reader (StorageReader): storage reader.
+          storage_readers (list[StorageReader]): storage readers.
           output_module (OutputModule): output module.
+          storage_index (int): index of the storage reader the event originates
+              from.
           event (EventObject): event.
           event_data (EventData): event data.
           event_data_stream (EventDataStream): event data stream.
@@ -189,34 +359,44 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
             or self._export_event_heap.number_of_events > self._HEAP_MAXIMUM_EVENTS
         ):
             self._FlushExportBuffer(
-                storage_reader, output_module, deduplicate_events=deduplicate_events
+                storage_readers, output_module, deduplicate_events=deduplicate_events
             )
             self._export_event_timestamp = event.timestamp
 
-        self._export_event_heap.PushEvent(event, event_data, event_data_stream)
+        self._export_event_heap.PushEvent(
+            event, event_data, event_data_stream, storage_index=storage_index
+        )
 
     def _ExportEvents(
         self,
-        storage_reader,
+        storage_readers,
         output_module,
         deduplicate_events=True,
         event_filter=None,
+        time_range=None,
         time_slice=None,
         use_time_slicer=False,
     ):
         """Exports events using an output module.
 
         Args:
-          storage_reader (StorageReader): storage reader.
+          storage_readers (list[StorageReader]): storage readers, where the sorted
+              events of the storage readers are merged.
           output_module (OutputModule): output module.
           deduplicate_events (Optional[bool]): True if events should be
               deduplicated.
           event_filter (Optional[EventObjectFilter]): event filter.
+          time_range (Optional[TimeRange]): time range of the events to export,
+              where None represents all events. Only used when no time slice
+              is defined.
           time_slice (Optional[TimeRange]): time range that defines a time slice
               to filter events.
           use_time_slicer (Optional[bool]): True if the 'time slicer' should be
               used. The 'time slicer' will provide a context of events around
               an event of interest.
+
+        Returns:
+          int: number of events read from the storage.
         """
         self._status = definitions.STATUS_INDICATOR_EXPORTING
 
@@ -235,25 +415,42 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         filter_limit = getattr(event_filter, "limit", None)
         forward_entries = 0
 
+        # The storage can only skip the events that do not match the event filter
+        # when the events around an event of interest are not needed.
+        storage_event_filter = None
+        if event_filter and not time_slice:
+            storage_event_filter = event_filter
+
+        filter_limit_reached = False
+        number_of_read_events = 0
+
         self._events_status.number_of_filtered_events = 0
         self._events_status.number_of_events_from_time_slice = 0
 
-        for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
-            event_data_identifier = event.GetEventDataIdentifier()
-            event_data = storage_reader.GetAttributeContainerByIdentifier(
-                events.EventData.CONTAINER_TYPE, event_data_identifier
-            )
+        # Skip the event tag lookups when the storage contains no event tags.
+        self._has_event_tags = [
+            storage_reader.HasAttributeContainers(events.EventTag.CONTAINER_TYPE)
+            for storage_reader in storage_readers
+        ]
 
-            event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-            if event_data_stream_identifier:
-                event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
-                    events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier
-                )
-            else:
-                event_data_stream = None
+        for (
+            storage_index,
+            event,
+            event_data,
+            event_data_stream,
+        ) in self._GetSortedEventTriples(
+            storage_readers,
+            event_filter=storage_event_filter,
+            time_range=time_slice_range or time_range,
+        ):
+            number_of_read_events += 1
 
-            event_identifier = event.GetIdentifier()
-            event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
+            event_tag = None
+            if self._has_event_tags[storage_index]:
+                event_identifier = event.GetIdentifier()
+                event_tag = storage_readers[storage_index].GetEventTagByEventIdentifer(
+                    event_identifier
+                )
 
             if time_slice_range and event.timestamp != time_slice.event_timestamp:
                 self._events_status.number_of_events_from_time_slice += 1
@@ -271,13 +468,16 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
                     self._events_status.number_of_filtered_events += 1
 
                 elif forward_entries == 0:
-                    time_slice_buffer.Append((event, event_data))
+                    time_slice_buffer.Append(
+                        (storage_index, event, event_data, event_data_stream)
+                    )
                     self._events_status.number_of_filtered_events += 1
 
                 elif forward_entries <= time_slice_buffer.size:
                     self._ExportEvent(
-                        storage_reader,
+                        storage_readers,
                         output_module,
+                        storage_index,
                         event,
                         event_data,
                         event_data_stream,
@@ -298,15 +498,18 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
                 if filter_match == True and time_slice_buffer:
                     # Empty the time slice buffer.
                     for (
+                        storage_index_in_buffer,
                         event_in_buffer,
                         event_data_in_buffer,
+                        event_data_stream_in_buffer,
                     ) in time_slice_buffer.Flush():
                         self._ExportEvent(
-                            storage_reader,
+                            storage_readers,
                             output_module,
+                            storage_index_in_buffer,
                             event_in_buffer,
                             event_data_in_buffer,
-                            event_data_stream,
+                            event_data_stream_in_buffer,
                             deduplicate_events=deduplicate_events,
                         )
                         self._number_of_consumed_events += 1
@@ -316,8 +519,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
                     forward_entries = 1
 
                 self._ExportEvent(
-                    storage_reader,
+                    storage_readers,
                     output_module,
+                    storage_index,
                     event,
                     event_data,
                     event_data_stream,
@@ -331,44 +535,146 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
                     and filter_limit
                     and filter_limit == self._number_of_consumed_events
                 ):
+                    filter_limit_reached = True
                     break
 
-        self._FlushExportBuffer(storage_reader, output_module)
+        if storage_event_filter and not time_range and not filter_limit_reached:
+            # Events skipped by the storage did not match the event filter.
+            number_of_events = sum(
+                storage_reader.GetNumberOfAttributeContainers(
+                    events.EventObject.CONTAINER_TYPE
+                )
+                for storage_reader in storage_readers
+            )
+            self._events_status.number_of_filtered_events += (
+                number_of_events - number_of_read_events
+            )
+
+        self._FlushExportBuffer(
+            storage_readers, output_module, deduplicate_events=deduplicate_events
+        )
+
+        return number_of_read_events
+
+    def _ExportEventsWithWorkers(
+        self,
+        storage_reader,
+        output_module,
+        worker_pool,
+        number_of_worker_processes,
+        event_filter=None,
+    ):
+        """Exports events using an output module and worker processes.
+
+        The sorted events are split into time ranges that are formatted by the
+        worker processes. The output field values of the time ranges are written
+        to the output module in order.
+
+        Args:
+          storage_reader (StorageReader): storage reader.
+          output_module (OutputModule): output module.
+          worker_pool (multiprocessing.pool.Pool): pool of worker processes.
+          number_of_worker_processes (int): number of worker processes.
+          event_filter (Optional[EventObjectFilter]): event filter.
+        """
+        self._status = definitions.STATUS_INDICATOR_EXPORTING
+
+        self._events_status.number_of_filtered_events = 0
+        self._events_status.number_of_events_from_time_slice = 0
+
+        time_ranges = self._GetWorkerTimeRanges(
+            storage_reader, number_of_worker_processes
+        )
+
+        number_of_read_events = 0
+
+        for (
+            field_values_list,
+            number_of_read_events_in_range,
+            number_of_consumed_events,
+            events_status,
+        ) in self._GetWorkerResults(
+            worker_pool, number_of_worker_processes, time_ranges
+        ):
+            for is_macb_group, field_values in field_values_list:
+                if is_macb_group:
+                    output_module.WriteMACBGroupFieldValues(
+                        self._output_mediator, field_values
+                    )
+                else:
+                    output_module.WriteFieldValues(self._output_mediator, field_values)
+
+            number_of_read_events += number_of_read_events_in_range
+            self._number_of_consumed_events += number_of_consumed_events
+
+            self._events_status.number_of_duplicate_events += (
+                events_status.number_of_duplicate_events
+            )
+            self._events_status.number_of_filtered_events += (
+                events_status.number_of_filtered_events
+            )
+            self._events_status.number_of_macb_grouped_events += (
+                events_status.number_of_macb_grouped_events
+            )
+
+        if event_filter:
+            # Events skipped by the storage did not match the event filter.
+            number_of_events = storage_reader.GetNumberOfAttributeContainers(
+                events.EventObject.CONTAINER_TYPE
+            )
+            self._events_status.number_of_filtered_events += (
+                number_of_events - number_of_read_events
+            )
 
     def _FlushExportBuffer(
-        self, storage_reader, output_module, deduplicate_events=True
+        self, storage_readers, output_module, deduplicate_events=True
     ):
         """Flushes buffered events and writes them to the output module.
 
         Args:
-          storage_reader (StorageReader): storage reader.
+          storage_readers (list[StorageReader]): storage readers.
           output_module (OutputModule): output module.
           deduplicate_events (Optional[bool]): True if events should be
               deduplicated.
         """
-        last_event_values_hash = None
+        exported_event_values = set()
         last_macb_group_identifier = None
-        last_timestamp_desc = None
         macb_group = []
+        macb_group_output_mediator = None
 
         for (
             event_values_hash,
+            storage_index,
             event,
             event_data,
             event_data_stream,
         ) in self._export_event_heap.PopEvents():
             timestamp_desc = event.timestamp_desc
 
-            if (
-                deduplicate_events
-                and timestamp_desc == last_timestamp_desc
-                and event_values_hash == last_event_values_hash
-            ):
-                self._events_status.number_of_duplicate_events += 1
-                continue
+            # Note that duplicate events are also removed when they originate
+            # from different storage readers.
+            if deduplicate_events:
+                lookup_key = (event_values_hash, timestamp_desc)
+                if lookup_key in exported_event_values:
+                    self._events_status.number_of_duplicate_events += 1
+                    continue
+
+                exported_event_values.add(lookup_key)
+
+            event_tag = None
+            if self._has_event_tags[storage_index]:
+                event_identifier = event.GetIdentifier()
+                event_tag = storage_readers[storage_index].GetEventTagByEventIdentifer(
+                    event_identifier
+                )
 
-            event_identifier = event.GetIdentifier()
-            event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
+            # The output mediator of the storage reader the event originates
+            # from is used to retain values, such as the fallback hostname, that
+            # are specific to the storage reader.
+            if self._output_mediators:
+                output_mediator_object = self._output_mediators[storage_index]
+            else:
+                output_mediator_object = self._output_mediator
 
             if timestamp_desc in (
                 definitions.TIME_DESCRIPTION_LAST_ACCESS,
@@ -376,25 +682,25 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
                 definitions.TIME_DESCRIPTION_METADATA_MODIFICATION,
                 definitions.TIME_DESCRIPTION_MODIFICATION,
             ):
-                macb_group_identifier = event_values_hash
+                macb_group_identifier = (storage_index, event_values_hash)
             else:
                 macb_group_identifier = None
 
             if macb_group_identifier is None:
                 if macb_group:
                     output_module.WriteFieldValuesOfMACBGroup(
-                        self._output_mediator, macb_group
+                        macb_group_output_mediator, macb_group
                     )
                     macb_group = []
 
                 field_values = output_module.GetFieldValues(
-                    self._output_mediator,
+                    output_mediator_object,
                     event,
                     event_data,
                     event_data_stream,
                     event_tag,
                 )
-                output_module.WriteFieldValues(self._output_mediator, field_values)
+                output_module.WriteFieldValues(output_mediator_object, field_values)
 
             else:
                 if (
@@ -405,18 +711,229 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
                 else:
                     output_module.WriteFieldValuesOfMACBGroup(
-                        self._output_mediator, macb_group
+                        macb_group_output_mediator, macb_group
                     )
                     macb_group = [(event, event_data, event_data_stream, event_tag)]
 
+                macb_group_output_mediator = output_mediator_object
+
                 self._events_status.number_of_macb_grouped_events += 1
 
-            last_event_values_hash = event_values_hash
             last_macb_group_identifier = macb_group_identifier
-            last_timestamp_desc = timestamp_desc
 
         if macb_group:
-            output_module.WriteFieldValuesOfMACBGroup(self._output_mediator, macb_group)
+            output_module.WriteFieldValuesOfMACBGroup(
+                macb_group_output_mediator, macb_group
+            )
+
+    def _FormatEventsInTimeRange(self, time_range):
+        """Formats the events in a time range in a worker process.
+
+        Args:
+          time_range (TimeRange): time range of the events to format.
+
+        Returns:
+          tuple: containing:
+
+            list[tuple[bool, object]]: output field values in output order.
+            int: number of events read from the storage.
+            int: number of events exported.
+            EventsStatus: status of the events.
+        """
+        if not self._worker_storage_reader:
+            # Note that a storage reader is opened per worker process since
+            # the storage reader of the main process cannot be shared.
+            self._worker_storage_reader = (
+                storage_factory.StorageFactory.CreateStorageReaderForFile(
+                    self._worker_storage_file_path
+                )
+            )
+            self._output_mediator = self._CreateOutputMediator(
+                self._worker_storage_reader, self._processing_configuration
+            )
+            self._output_mediators = [self._output_mediator]
+
+        field_values_recorder = PsortFieldValuesRecorder(self._worker_output_module)
+
+        self._events_status = processing_status.EventsStatus()
+        self._export_event_timestamp = 0
+        self._number_of_consumed_events = 0
+
+        number_of_read_events = self._ExportEvents(
+            [self._worker_storage_reader],
+            field_values_recorder,
+            deduplicate_events=self._worker_deduplicate_events,
+            event_filter=self._worker_event_filter,
+            time_range=time_range,
+        )
+
+        return (
+            field_values_recorder.field_values,
+            number_of_read_events,
+            self._number_of_consumed_events,
+            self._events_status,
+        )
+
+    def _GetSortedEventTriples(
+        self, storage_readers, event_filter=None, time_range=None
+    ):
+        """Retrieves the sorted events of one or more storage readers.
+
+        The sorted events of the individual storage readers are merged, such
+        that only the next event of every storage reader is kept in memory.
+        Events with the same timestamp are returned in storage reader order.
+
+        Args:
+          storage_readers (list[StorageReader]): storage readers.
+          event_filter (Optional[EventObjectFilter]): event filter.
+          time_range (Optional[TimeRange]): time range of the events to retrieve,
+              where None represents all events.
+
+        Yields:
+          tuple: containing:
+
+            int: index of the storage reader the event originates from.
+            EventObject: event.
+            EventData: event data.
+            EventDataStream: event data stream.
+        """
+        if len(storage_readers) == 1:
+            yield from self._GetSortedEventTriplesOfStorageReader(
+                0, storage_readers[0], event_filter=event_filter, time_range=time_range
+            )
+            return
+
+        sorted_event_triples = [
+            self._GetSortedEventTriplesOfStorageReader(
+                storage_index,
+                storage_reader,
+                event_filter=event_filter,
+                time_range=time_range,
+            )
+            for storage_index, storage_reader in enumerate(storage_readers)
+        ]
+        yield from heapq.merge(
+            *sorted_event_triples, key=lambda event_values: event_values[1].timestamp
+        )
+
+    def _GetSortedEventTriplesOfStorageReader(
+        self, storage_index, storage_reader, event_filter=None, time_range=None
+    ):
+        """Retrieves the sorted events of a storage reader.
+
+        Args:
+          storage_index (int): index of the storage reader.
+          storage_reader (StorageReader): storage reader.
+          event_filter (Optional[EventObjectFilter]): event filter.
+          time_range (Optional[TimeRange]): time range of the events to retrieve,
+              where None represents all events.
+
+        Yields:
+          tuple: containing:
+
+            int: index of the storage reader the event originates from.
+            EventObject: event.
+            EventData: event data.
+            EventDataStream: event data stream.
+        """
+        for (
+            event,
+            event_data,
+            event_data_stream,
+        ) in storage_reader.GetSortedEventTriples(
+            event_filter=event_filter, time_range=time_range
+        ):
+            yield storage_index, event, event_data, event_data_stream
+
+    def _GetWorkerResults(self, worker_pool, number_of_worker_processes, time_ranges):
+        """Retrieves the results of the worker processes in order.
+
+        The number of pending time ranges is bounded, so that the output of fast
+        worker processes is not buffered without limit while waiting for a slow
+        worker process.
+
+        Args:
+          worker_pool (multiprocessing.pool.Pool): pool of worker processes.
+          number_of_worker_processes (int): number of worker processes.
+          time_ranges (list[TimeRange]): time ranges, sorted by time.
+
+        Yields:
+          tuple[list[tuple[bool, object]], int, int, EventsStatus]: field values,
+              number of read events, number of consumed events and events status
+              of a time range.
+        """
+        maximum_number_of_pending_results = max(
+            number_of_worker_processes * self._PENDING_TIME_RANGES_PER_WORKER, 1
+        )
+        pending_results = collections.deque()
+
+        for time_range in time_ranges:
+            if len(pending_results) >= maximum_number_of_pending_results:
+                yield pending_results.popleft().get()
+
+            pending_results.append(
+                worker_pool.apply_async(_FormatEventsInTimeRange, (time_range,))
+            )
+
+        while pending_results:
+            yield pending_results.popleft().get()
+
+    def _GetWorkerTimeRanges(self, storage_reader, number_of_worker_processes):
+        """Splits the sorted events into time ranges for the worker processes.
+
+        Events with the same timestamp are deduplicated and grouped together,
+        hence a time range only ends where the timestamp of the events changes.
+
+        Args:
+          storage_reader (StorageReader): storage reader.
+          number_of_worker_processes (int): number of worker processes.
+
+        Returns:
+          list[TimeRange]: time ranges, sorted by time.
+        """
+        number_of_events = storage_reader.GetNumberOfAttributeContainers(
+            events.EventObject.CONTAINER_TYPE
+        )
+        maximum_number_of_events = number_of_events // (
+            number_of_worker_processes * self._TIME_RANGES_PER_WORKER
+        )
+        maximum_number_of_events = max(
+            min(maximum_number_of_events, self._TIME_RANGE_MAXIMUM_EVENTS), 1
+        )
+
+        # The boundaries are read from the timestamps only, so that the worker
+        # processes can start without the events being read in advance.
+        timestamps = sorted(
+            set(storage_reader.GetEventTimestampBoundaries(maximum_number_of_events))
+        )
+
+        time_ranges = [
+            storage_time_range.TimeRange(start_timestamp, end_timestamp - 1)
+            for start_timestamp, end_timestamp in zip(timestamps[:-1], timestamps[1:])
+        ]
+        if timestamps:
+            time_ranges.append(
+                storage_time_range.TimeRange(timestamps[-1], timestamps[-1])
+            )
+
+        return time_ranges
+
+    def _InitializeWorker(
+        self, storage_file_path, output_module, deduplicate_events, event_filter
+    ):
+        """Initializes the engine in a worker process.
+
+        Args:
+          storage_file_path (str): path of the storage file.
+          output_module (OutputModule): output module.
+          deduplicate_events (bool): True if events should be deduplicated.
+          event_filter (EventObjectFilter): event filter or None.
+        """
+        self._worker_deduplicate_events = deduplicate_events
+        self._worker_event_filter = event_filter
+        self._worker_output_module = output_module
+        self._worker_storage_file_path = storage_file_path
+        self._worker_storage_reader = None
 
     def _ReadMessageFormatters(
         self, output_mediator_object, data_location, custom_formatters_path
@@ -476,6 +993,67 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
                     f"{formatters_file:s} with error: {exception!s}"
                 )
 
+    def _StartWorkerPool(
+        self,
+        output_module,
+        number_of_worker_processes,
+        storage_file_path,
+        deduplicate_events=True,
+        event_filter=None,
+        time_slice=None,
+    ):
+        """Starts the pool of worker processes that format events.
+
+        Args:
+          output_module (OutputModule): output module.
+          number_of_worker_processes (int): number of worker processes.
+          storage_file_path (str): path of the storage file.
+          deduplicate_events (Optional[bool]): True if events should be
+              deduplicated.
+          event_filter (Optional[EventObjectFilter]): event filter.
+          time_slice (Optional[TimeSlice]): slice of time to output.
+
+        Returns:
+          multiprocessing.pool.Pool: pool of worker processes or None if the
+              events cannot be formatted by worker processes.
+        """
+        if time_slice:
+            logger.warning(
+                "Worker processes not supported in combination with a time slice."
+            )
+            return None
+
+        if getattr(event_filter, "limit", None):
+            logger.warning(
+                "Worker processes not supported in combination with an event "
+                "filter limit."
+            )
+            return None
+
+        if not storage_file_path:
+            logger.warning("Worker processes not supported without storage file.")
+            return None
+
+        # The worker processes are forked, such that the configured output module
+        # and event filter do not need to be serialized.
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Worker processes not supported on platform without fork.")
+            return None
+
+        context = multiprocessing.get_context("fork")
+
+        return context.Pool(
+            processes=number_of_worker_processes,
+            initializer=_InitializeWorkerProcess,
+            initargs=(
+                self,
+                storage_file_path,
+                output_module,
+                deduplicate_events,
+                event_filter,
+            ),
+        )
+
     def _UpdateForemanProcessStatus(self):
         """Update the foreman process status."""
         used_memory = self._process_information.GetUsedMemory() or 0
@@ -499,6 +1077,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         )
         self._processing_status.UpdateEventsStatus(self._events_status)
 
+        if self._output_module:
+            self._processing_status.UpdateOutputStatus(self._output_module.GetStatus())
+
     def _UpdateStatus(self):
         """Update the status."""
         self._UpdateForemanProcessStatus()
@@ -511,9 +1092,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         storage_reader,
         output_module,
         processing_configuration,
+        additional_storage_readers=None,
         deduplicate_events=True,
         event_filter=None,
+        number_of_worker_processes=0,
         status_update_callback=None,
+        storage_file_path=None,
         time_slice=None,
         use_time_slicer=False,
     ):
@@ -524,11 +1108,20 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           output_module (OutputModule): output module.
           processing_configuration (ProcessingConfiguration): processing
               configuration.
+          additional_storage_readers (Optional[list[StorageReader]]): storage
+              readers of additional storage files, of which the sorted events
+              are merged with those of the storage reader.
           deduplicate_events (Optional[bool]): True if events should be
-              deduplicated.
+              deduplicated, including duplicate events that originate from
+              different storage files.
           event_filter (Optional[EventObjectFilter]): event filter.
+          number_of_worker_processes (Optional[int]): number of worker processes
+              that format events, where 0 represents formatting the events in
+              the main process.
           status_update_callback (Optional[function]): callback function for status
               updates.
+          storage_file_path (Optional[str]): path of the storage file, which is
+              opened by the worker processes.
           time_slice (Optional[TimeSlice]): slice of time to output.
           use_time_slicer (Optional[bool]): True if the 'time slicer' should be
               used. The 'time slicer' will provide a context of events around
@@ -539,43 +1132,82 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
               read.
         """
         self._events_status = processing_status.EventsStatus()
+        self._output_module = output_module
         self._processing_configuration = processing_configuration
         self._status_update_callback = status_update_callback
 
+        storage_readers = [storage_reader]
+        storage_readers.extend(additional_storage_readers or [])
+
         total_number_of_events = 0
-        if storage_reader.HasAttributeContainers("parser_count"):
-            parsers_counter = {
-                parser_count.name: parser_count.number_of_events
-                for parser_count in storage_reader.GetAttributeContainers(
-                    "parser_count"
-                )
-            }
-            total_number_of_events = parsers_counter["total"]
+        for storage_reader_object in storage_readers:
+            if storage_reader_object.HasAttributeContainers("parser_count"):
+                parsers_counter = {
+                    parser_count.name: parser_count.number_of_events
+                    for parser_count in storage_reader_object.GetAttributeContainers(
+                        "parser_count"
+                    )
+                }
+                total_number_of_events += parsers_counter["total"]
 
         self._events_status.total_number_of_events = total_number_of_events
 
-        self._output_mediator = self._CreateOutputMediator(
-            storage_reader, processing_configuration
-        )
-        output_module.WriteHeader(output_mediator)
-
-        self._StartStatusUpdateThread()
-
-        self._StartProfiling(self._processing_configuration.profiling)
+        self._output_mediators = [
+            self._CreateOutputMediator(storage_reader_object, processing_configuration)
+            for storage_reader_object in storage_readers
+        ]
+        self._output_mediator = self._output_mediators[0]
+        output_module.WriteHeader(self._output_mediator)
+
+        worker_pool = None
+        if number_of_worker_processes > 0 and len(storage_readers) > 1:
+            logger.warning(
+                "Worker processes not supported in combination with multiple "
+                "storage files."
+            )
 
-        try:
-            self._ExportEvents(
-                storage_reader,
+        elif number_of_worker_processes > 0:
+            worker_pool = self._StartWorkerPool(
                 output_module,
+                number_of_worker_processes,
+                storage_file_path,
                 deduplicate_events=deduplicate_events,
                 event_filter=event_filter,
                 time_slice=time_slice,
-                use_time_slicer=use_time_slicer,
             )
 
+        # Note that the worker processes are started before the status update
+        # thread, since a thread should not be running when a process is forked.
+        self._StartStatusUpdateThread()
+
+        self._StartProfiling(self._processing_configuration.profiling)
+
+        try:
+            if worker_pool:
+                self._ExportEventsWithWorkers(
+                    storage_reader,
+                    output_module,
+                    worker_pool,
+                    number_of_worker_processes,
+                    event_filter=event_filter,
+                )
+            else:
+                self._ExportEvents(
+                    storage_readers,
+                    output_module,
+                    deduplicate_events=deduplicate_events,
+                    event_filter=event_filter,
+                    time_slice=time_slice,
+                    use_time_slicer=use_time_slicer,
+                )
+
             self._status = definitions.STATUS_INDICATOR_COMPLETED
 
         finally:
+            if worker_pool:
+                worker_pool.terminate()
+                worker_pool.join()
+
             # Stop the status update thread after close of the storage writer
             # so we include the storage sync to disk in the status updates.
             self._StopStatusUpdateThread()
@@ -590,5 +1222,7 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         # Reset values.
         self._events_status = None
         self._output_mediator = None
+        self._output_mediators = []
+        self._output_module = None
         self._processing_configuration = None
         self._status_update_callback = None
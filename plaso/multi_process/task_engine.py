@@ -63,12 +63,15 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
         return False
 
-    def _GetMergeTaskStorage(self, task_storage_format, task):
+    def _GetMergeTaskStorage(self, task_storage_format, task, profile_storage=True):
         """Retrieves a task store ready to be merged with the session store.
 
         Args:
           task_storage_format (str): storage format used to store task results.
           task (Task): task the storage changes are part of.
+          profile_storage (Optional[bool]): True if the storage profiler should
+              be set. Note that the storage profiler should not be set when
+              the task store is read by a different thread.
 
         Returns:
           StorageReader: storage reader of the task storage.
@@ -91,7 +94,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         task_storage_reader = storage_factory.StorageFactory.CreateTaskStorageReader(
             task_storage_format, task, merge_storage_file_path
         )
-        task_storage_reader.SetStorageProfiler(self._storage_profiler)
+        if profile_storage:
+            task_storage_reader.SetStorageProfiler(self._storage_profiler)
 
         return task_storage_reader
 
@@ -261,6 +261,28 @@ class TaskManager:
             self._latest_task_processing_time, task.last_processing_time
         )
 
+    def AbandonMergingTask(self, task):
+        """Marks a task that could not be merged as abandoned.
+
+        An abandoned task is retried, since its results are incomplete.
+
+        Args:
+          task (Task): task.
+
+        Raises:
+          KeyError: if the task was not merging.
+        """
+        with self._lock:
+            if task.identifier not in self._tasks_merging:
+                raise KeyError(f"Task {task.identifier:s} was not merging.")
+
+            logger.debug(f"Abandoned merging task: {task.identifier:s}")
+
+            self.SampleTaskStatus(task, "abandoned_merging")
+
+            self._tasks_abandoned[task.identifier] = task
+            del self._tasks_merging[task.identifier]
+
     def CheckTaskToMerge(self, task):
         """Checks if the task should be merged.
 
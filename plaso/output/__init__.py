@@ -8,6 +8,7 @@ from plaso.output import l2t_csv
 from plaso.output import null
 from plaso.output import opensearch
 from plaso.output import opensearch_ts
+from plaso.output import parquet
 from plaso.output import rawpy
 from plaso.output import tln
 from plaso.output import xlsx
@@ -1,6 +1,8 @@
 """Output module field formatting helper."""
 
 import abc
+import bisect
+import collections
 import datetime
 import math
 import pytz
@@ -35,6 +37,143 @@ class EventFormattingHelper:
         """
 
 
+class ISO8601DateTimeConverter:
+    """Converts timestamps to ISO 8601 date and time strings in a time zone.
+
+    Timelines have a high locality of timestamps, hence the date and time in
+    seconds of the last converted second and the UTC offset of the time zone
+    interval, for example daylight saving time, that contains it are cached.
+    Only the microseconds are formatted per timestamp.
+
+    Attributes:
+      time_zone (pytz.tzinfo): time zone.
+    """
+
+    _EPOCH = datetime.datetime(1970, 1, 1, tzinfo=pytz.UTC)
+
+    _EPOCH_NAIVE = datetime.datetime(1970, 1, 1)
+
+    _ONE_SECOND = datetime.timedelta(seconds=1)
+
+    def __init__(self, time_zone):
+        """Initializes an ISO 8601 date and time converter.
+
+        Args:
+          time_zone (pytz.tzinfo): time zone.
+        """
+        super().__init__()
+        self._interval_end = None
+        self._interval_start = None
+        self._interval_utc_offset = None
+        self._interval_utc_offset_string = None
+        self._last_date_time_string = None
+        self._last_seconds = None
+        self._utc_transition_times = None
+
+        self.time_zone = time_zone
+
+        utc_transition_times = getattr(time_zone, "_utc_transition_times", None)
+        if utc_transition_times:
+            self._utc_transition_times = [
+                (utc_transition_time - self._EPOCH_NAIVE) // self._ONE_SECOND
+                for utc_transition_time in utc_transition_times
+            ]
+
+    def _GetInterval(self, seconds):
+        """Retrieves the time zone interval that contains a timestamp.
+
+        Args:
+          seconds (int): number of seconds since January 1, 1970 00:00:00 UTC.
+
+        Returns:
+          tuple[int, int]: start and end of the interval in number of seconds
+              since January 1, 1970 00:00:00 UTC, where None represents
+              an unbounded interval. If the time zone does not provide its
+              transition times the interval only contains the timestamp.
+        """
+        if not self._utc_transition_times:
+            if self.time_zone is pytz.UTC or isinstance(
+                self.time_zone, pytz.tzinfo.StaticTzInfo
+            ):
+                return None, None
+
+            return seconds, seconds + 1
+
+        # Note that this mimics the lookup of the UTC offset by pytz.
+        index = max(0, bisect.bisect_right(self._utc_transition_times, seconds) - 1)
+
+        interval_start = None
+        if index > 0:
+            interval_start = self._utc_transition_times[index]
+
+        interval_end = None
+        if index + 1 < len(self._utc_transition_times):
+            interval_end = self._utc_transition_times[index + 1]
+
+        return interval_start, interval_end
+
+    def _UpdateInterval(self, seconds):
+        """Updates the cached time zone interval.
+
+        Args:
+          seconds (int): number of seconds since January 1, 1970 00:00:00 UTC.
+
+        Returns:
+          str: date and time in seconds, formatted as "YYYY-MM-DDThh:mm:ss".
+
+        Raises:
+          OverflowError: if the date and time cannot be represented.
+        """
+        datetime_object = self._EPOCH + datetime.timedelta(seconds=seconds)
+        datetime_object = datetime_object.astimezone(self.time_zone)
+        isoformat_string = datetime_object.isoformat()
+
+        self._interval_start, self._interval_end = self._GetInterval(seconds)
+        self._interval_utc_offset = datetime_object.utcoffset()
+        self._interval_utc_offset_string = isoformat_string[-6:]
+
+        return isoformat_string[:19]
+
+    def CopyTimestampToString(self, timestamp):
+        """Copies a timestamp to an ISO 8601 date and time string.
+
+        Args:
+          timestamp (int): number of microseconds since January 1, 1970
+              00:00:00 UTC.
+
+        Returns:
+          str: date and time string, formatted as "YYYY-MM-DDThh:mm:ss.######"
+              followed by the time zone offset, such as "+01:00".
+
+        Raises:
+          OverflowError: if the date and time cannot be represented.
+        """
+        seconds, microseconds = divmod(timestamp, 1000000)
+
+        if seconds != self._last_seconds:
+            if (
+                self._interval_utc_offset is None
+                or (self._interval_start is not None and seconds < self._interval_start)
+                or (self._interval_end is not None and seconds >= self._interval_end)
+            ):
+                date_time_string = self._UpdateInterval(seconds)
+            else:
+                datetime_object = (
+                    self._EPOCH_NAIVE
+                    + datetime.timedelta(seconds=seconds)
+                    + self._interval_utc_offset
+                )
+                date_time_string = datetime_object.isoformat()
+
+            self._last_date_time_string = date_time_string
+            self._last_seconds = seconds
+
+        return (
+            f"{self._last_date_time_string:s}.{microseconds:06d}"
+            f"{self._interval_utc_offset_string:s}"
+        )
+
+
 class FieldFormattingHelper:
     """Output module field formatting helper."""
 
@@ -43,12 +182,18 @@ class FieldFormattingHelper:
     # Maps the name of a field to callback function that formats the field value.
     _FIELD_FORMAT_CALLBACKS = {}
 
+    # Maximum number of event data of which the formatted field values are
+    # cached.
+    _MAXIMUM_NUMBER_OF_CACHED_EVENT_DATA = 16384
+
     def __init__(self):
         """Initializes a field formatting helper."""
         event_data_stream = events.EventDataStream()
 
         super().__init__()
         self._callback_functions = {}
+        self._date_time_converter = None
+        self._event_data_field_values_cache = collections.OrderedDict()
         self._event_data_stream_field_names = event_data_stream.GetAttributeNames()
         self._event_tag_field_names = []
 
@@ -155,19 +300,17 @@ class FieldFormattingHelper:
             if not timestamp:
                 return "0000-00-00T00:00:00.000000+00:00"
 
-            try:
-                # Note that setting tzinfo to None can have unexpected results on
-                # certain platforms.
-                datetime_object = datetime.datetime(
-                    1970, 1, 1, tzinfo=pytz.UTC
-                ) + datetime.timedelta(microseconds=timestamp)
-
-                datetime_object = datetime_object.astimezone(output_mediator.time_zone)
+            if (
+                not self._date_time_converter
+                or self._date_time_converter.time_zone != output_mediator.time_zone
+            ):
+                self._date_time_converter = ISO8601DateTimeConverter(
+                    output_mediator.time_zone
+                )
 
-                iso8601_string = datetime_object.isoformat()
-                iso8601_string = (
-                    f"{iso8601_string[:19]:s}.{datetime_object.microsecond:06d}"
-                    f"{iso8601_string[-6:]:s}"
+            try:
+                iso8601_string = self._date_time_converter.CopyTimestampToString(
+                    timestamp
                 )
 
             except (OSError, OverflowError, TypeError, ValueError) as exception:
@@ -199,11 +342,19 @@ class FieldFormattingHelper:
         """
         display_name = getattr(event_data, "display_name", None)
         if not display_name:
-            path_spec = getattr(event_data_stream, "path_spec", None)
-            if path_spec:
-                display_name = output_mediator.GetDisplayNameForPathSpec(path_spec)
-            else:
-                display_name = "-"
+            cached_field_values = self._GetCachedEventDataFieldValues(
+                output_mediator, event_data
+            )
+
+            display_name = cached_field_values.get("display_name", None)
+            if display_name is None:
+                path_spec = getattr(event_data_stream, "path_spec", None)
+                if path_spec:
+                    display_name = output_mediator.GetDisplayNameForPathSpec(path_spec)
+                else:
+                    display_name = "-"
+
+                cached_field_values["display_name"] = display_name
 
         return display_name
 
@@ -321,18 +472,8 @@ class FieldFormattingHelper:
         Returns:
           str: message field.
         """
-        message_formatter = output_mediator.GetMessageFormatter(event_data.data_type)
-        if not message_formatter:
-            logger.warning(
-                f"Using default message formatter for data type: "
-                f"{event_data.data_type:s}"
-            )
-            message_formatter = self._DEFAULT_MESSAGE_FORMATTER
-
-        event_values = event_data.CopyToDict()
-        message_formatter.FormatEventValues(output_mediator, event_values)
-
-        return message_formatter.GetMessage(event_values)
+        cached_field_values = self._FormatMessages(output_mediator, event_data)
+        return cached_field_values["message"]
 
     def _FormatMessageShort(
         self, output_mediator, event, event_data, event_data_stream
@@ -349,18 +490,44 @@ class FieldFormattingHelper:
         Returns:
           str: short message field.
         """
-        message_formatter = output_mediator.GetMessageFormatter(event_data.data_type)
-        if not message_formatter:
-            logger.warning(
-                f"Using default message formatter for data type: "
-                f"{event_data.data_type:s}"
+        cached_field_values = self._FormatMessages(output_mediator, event_data)
+        return cached_field_values["message_short"]
+
+    def _FormatMessages(self, output_mediator, event_data):
+        """Formats the message and short message fields.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          event_data (EventData): event data.
+
+        Returns:
+          dict[str, str]: cached field values of the event data, that contain
+              the message and short message fields.
+        """
+        cached_field_values = self._GetCachedEventDataFieldValues(
+            output_mediator, event_data
+        )
+        if "message" not in cached_field_values:
+            message_formatter = output_mediator.GetMessageFormatter(
+                event_data.data_type
             )
-            message_formatter = self._DEFAULT_MESSAGE_FORMATTER
+            if not message_formatter:
+                logger.warning(
+                    f"Using default message formatter for data type: "
+                    f"{event_data.data_type:s}"
+                )
+                message_formatter = self._DEFAULT_MESSAGE_FORMATTER
+
+            event_values = event_data.CopyToDict()
+            message_formatter.FormatEventValues(output_mediator, event_values)
 
-        event_values = event_data.CopyToDict()
-        message_formatter.FormatEventValues(output_mediator, event_values)
+            cached_field_values["message"] = message_formatter.GetMessage(event_values)
+            cached_field_values["message_short"] = message_formatter.GetMessageShort(
+                event_values
+            )
 
-        return message_formatter.GetMessageShort(event_values)
+        return cached_field_values
 
     def _FormatParser(self, output_mediator, event, event_data, event_data_stream):
         """Formats a parser field.
@@ -390,9 +557,8 @@ class FieldFormattingHelper:
         Returns:
           str: source field.
         """
-        data_type = getattr(event_data, "data_type", None) or "-"
-        _, source = output_mediator.GetSourceMapping(data_type)
-        return source or "N/A"
+        cached_field_values = self._FormatSources(output_mediator, event_data)
+        return cached_field_values["source"]
 
     def _FormatSourceShort(self, output_mediator, event, event_data, event_data_stream):
         """Formats a short source field.
@@ -407,9 +573,32 @@ class FieldFormattingHelper:
         Returns:
           str: short source field.
         """
-        data_type = getattr(event_data, "data_type", None) or "-"
-        source_short, _ = output_mediator.GetSourceMapping(data_type)
-        return source_short or "N/A"
+        cached_field_values = self._FormatSources(output_mediator, event_data)
+        return cached_field_values["source_short"]
+
+    def _FormatSources(self, output_mediator, event_data):
+        """Formats the source and short source fields.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          event_data (EventData): event data.
+
+        Returns:
+          dict[str, str]: cached field values of the event data, that contain
+              the source and short source fields.
+        """
+        cached_field_values = self._GetCachedEventDataFieldValues(
+            output_mediator, event_data
+        )
+        if "source" not in cached_field_values:
+            data_type = getattr(event_data, "data_type", None) or "-"
+            source_short, source = output_mediator.GetSourceMapping(data_type)
+
+            cached_field_values["source"] = source or "N/A"
+            cached_field_values["source_short"] = source_short or "N/A"
+
+        return cached_field_values
 
     def _FormatTag(self, output_mediator, event_tag):
         """Formats an event tag field.
@@ -574,6 +763,53 @@ class FieldFormattingHelper:
 
     # pylint: enable=unused-argument
 
+    def _GetCachedEventDataFieldValues(self, output_mediator, event_data):
+        """Retrieves the cached field values of event data.
+
+        Event data is typically referenced by multiple events, for example one
+        per timestamp of a file entry, hence the field values that only depend
+        on the event data are formatted once and cached per event data
+        identifier. Since events are formatted in chronological order, the
+        event data that was least recently used has the oldest timestamp and
+        is evicted first.
+
+        Event data identifiers are only unique within a storage file, hence
+        the field values are also cached per output mediator, of which there
+        is one per storage reader.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          event_data (EventData): event data.
+
+        Returns:
+          dict[str, str]: cached field values of the event data, to which newly
+              formatted field values can be added.
+        """
+        event_data_identifier = event_data.GetIdentifier()
+        identifier_string = event_data_identifier.CopyToString()
+        if not identifier_string:
+            return {}
+
+        lookup_key = (id(output_mediator), identifier_string)
+
+        cached_values = self._event_data_field_values_cache.get(lookup_key, None)
+        if cached_values:
+            self._event_data_field_values_cache.move_to_end(lookup_key)
+        else:
+            # Note that references to the output mediator and event data are kept
+            # so that their memory address based identifiers cannot be reused.
+            cached_values = (output_mediator, event_data, {})
+            self._event_data_field_values_cache[lookup_key] = cached_values
+
+            if (
+                len(self._event_data_field_values_cache)
+                > self._MAXIMUM_NUMBER_OF_CACHED_EVENT_DATA
+            ):
+                self._event_data_field_values_cache.popitem(last=False)
+
+        return cached_values[2]
+
     def _ReportEventError(self, event, event_data, error_message):
         """Reports an event related error.
 
@@ -17,6 +17,9 @@ class OutputModule:
     # Value to indicate the output module supports outputting custom fields.
     SUPPORTS_CUSTOM_FIELDS = False
 
+    # Value to indicate the output module supports compression of the output.
+    SUPPORTS_OUTPUT_COMPRESSION = False
+
     # Value to indicate the output module writes to an output file.
     WRITES_OUTPUT_FILE = False
 
@@ -62,6 +65,26 @@ class OutputModule:
           dict[str, str]: output field values per name.
         """
 
+    def GetMACBGroupFieldValues(self, output_mediator, macb_group):
+        """Retrieves the output field values of a MACB group.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
+              group of event, event_data, event_data_stream and event_tag objects
+              with identical timestamps, attributes and values.
+
+        Returns:
+          list[dict[str, str]]: output field values per name of the MACB group.
+        """
+        return [
+            self.GetFieldValues(
+                output_mediator, event, event_data, event_data_stream, event_tag
+            )
+            for event, event_data, event_data_stream, event_tag in macb_group
+        ]
+
     def GetMissingArguments(self):
         """Retrieves arguments required by the module that have not been specified.
 
@@ -71,6 +94,14 @@ class OutputModule:
         """
         return []
 
+    def GetStatus(self):
+        """Retrieves the status of the output.
+
+        Returns:
+          OutputStatus: status of the output or None if not available.
+        """
+        return None
+
     def Open(self, **kwargs):  # pylint: disable=unused-argument
         """Opens the output."""
         return
@@ -95,10 +126,21 @@ class OutputModule:
               group of event, event_data, event_data_stream and event_tag objects
               with identical timestamps, attributes and values.
         """
-        for event, event_data, event_data_stream, event_tag in macb_group:
-            field_values = self.GetFieldValues(
-                output_mediator, event, event_data, event_data_stream, event_tag
-            )
+        macb_group_field_values = self.GetMACBGroupFieldValues(
+            output_mediator, macb_group
+        )
+        self.WriteMACBGroupFieldValues(output_mediator, macb_group_field_values)
+
+    def WriteMACBGroupFieldValues(self, output_mediator, macb_group_field_values):
+        """Writes the output field values of a MACB group to the output.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          macb_group_field_values (list[dict[str, str]]): output field values per
+              name of the MACB group.
+        """
+        for field_values in macb_group_field_values:
             self.WriteFieldValues(output_mediator, field_values)
 
     def WriteFooter(self):
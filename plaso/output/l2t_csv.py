@@ -4,6 +4,7 @@ For documentation on the L2T CSV format see:
   https://forensics.wiki/l2t_csv
 """
 
+import collections
 import datetime
 import pytz
 
@@ -22,8 +23,8 @@ from plaso.output import text_file
 class L2TCSVEventFormattingHelper(shared_dsv.DSVEventFormattingHelper):
     """L2T CSV output module event formatting helper."""
 
-    def GetFormattedMACBGroup(self, output_mediator, macb_group):
-        """Retrieves a string representation of a MACB group.
+    def GetMACBGroupFieldValues(self, output_mediator, macb_group):
+        """Retrieves the output field values of a MACB group.
 
         Args:
           output_mediator (OutputMediator): mediates interactions between output
@@ -33,11 +34,11 @@ class L2TCSVEventFormattingHelper(shared_dsv.DSVEventFormattingHelper):
               with identical timestamps, attributes and values.
 
         Returns:
-          str: string representation of the MACB group.
+          dict[str, str]: output field values per name of the MACB group.
         """
         timestamp_descriptions = [event.timestamp_desc for event, _, _, _ in macb_group]
 
-        field_values = []
+        field_values = collections.OrderedDict()
         for field_name in self._field_names:
             if field_name == "MACB":
                 field_value = output_mediator.GetMACBRepresentationFromDescriptions(
@@ -61,9 +62,9 @@ class L2TCSVEventFormattingHelper(shared_dsv.DSVEventFormattingHelper):
                 field_value = "-"
 
             field_value = self._SanitizeField(field_value)
-            field_values.append(field_value)
+            field_values[field_name] = field_value
 
-        return self.field_delimiter.join(field_values)
+        return field_values
 
 
 class L2TCSVFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
@@ -335,8 +336,10 @@ class L2TCSVOutputModule(text_file.SortedTextFileOutputModule):
         )
         return "".join([output_text, "\n"])
 
-    def WriteFieldValuesOfMACBGroup(self, output_mediator, macb_group):
-        """Writes field values of a MACB group to the output.
+    def GetMACBGroupFieldValues(self, output_mediator, macb_group):
+        """Retrieves the output field values of a MACB group.
+
+        The events of a MACB group are represented by a single line.
 
         Args:
           output_mediator (OutputMediator): mediates interactions between output
@@ -344,11 +347,29 @@ class L2TCSVOutputModule(text_file.SortedTextFileOutputModule):
           macb_group (list[tuple[event, event_data, event_data_stream, event_tag]]):
               group of event, event_data, event_data_stream and event_tag objects
               with identical timestamps, attributes and values.
+
+        Returns:
+          list[dict[str, str]]: output field values per name of the MACB group.
         """
-        output_text = self._event_formatting_helper.GetFormattedMACBGroup(
+        field_values = self._event_formatting_helper.GetMACBGroupFieldValues(
             output_mediator, macb_group
         )
-        self.WriteLine(output_text)
+        return [field_values]
+
+    def WriteMACBGroupFieldValues(self, output_mediator, macb_group_field_values):
+        """Writes the output field values of a MACB group to the output.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          macb_group_field_values (list[dict[str, str]]): output field values per
+              name of the MACB group.
+        """
+        for field_values in macb_group_field_values:
+            output_text = self._event_formatting_helper.field_delimiter.join(
+                field_values.values()
+            )
+            self.WriteLine(output_text)
 
     def WriteHeader(self, output_mediator):
         """Writes the header to the output.
@@ -9,6 +9,7 @@ from plaso.formatters import manager as formatters_manager
 from plaso.formatters import yaml_formatters_file
 from plaso.helpers.windows import languages
 from plaso.lib import definitions
+from plaso.output import logger
 from plaso.output import winevt_rc
 
 
@@ -116,6 +117,16 @@ class OutputMediator:
                 if custom_formatter_helper:
                     message_formatter.AddHelper(custom_formatter_helper)
 
+            try:
+                message_formatter.Compile()
+            except RuntimeError as exception:
+                # Note that the format string pieces preceding the invalid format
+                # string piece are still used to format messages.
+                logger.warning(
+                    f"Unable to compile message formatter for data type: "
+                    f"{message_formatter.data_type:s} with error: {exception!s}"
+                )
+
             self._message_formatters[message_formatter.data_type] = message_formatter
             self._source_mappings[message_formatter.data_type] = (
                 message_formatter.source_mapping
@@ -16,7 +16,7 @@ class OpenSearchOutputModule(shared_opensearch.SharedOpenSearchOutputModule):
         """Writes field values to the output.
 
         Events are buffered in the form of documents and inserted to OpenSearch
-        when the flush interval (threshold) has been reached.
+        when the flush interval (threshold) or bulk size has been reached.
 
         Args:
           output_mediator (OutputMediator): mediates interactions between output
@@ -25,12 +25,7 @@ class OpenSearchOutputModule(shared_opensearch.SharedOpenSearchOutputModule):
         """
         event_document = {"index": {"_index": self._index_name}}
 
-        self._event_documents.append(event_document)
-        self._event_documents.append(field_values)
-        self._number_of_buffered_events += 1
-
-        if self._number_of_buffered_events > self._flush_interval:
-            self._FlushEvents()
+        self._BufferEventDocument(event_document, field_values)
 
     def WriteHeader(self, output_mediator):
         """Connects to the OpenSearch server and creates the index.
@@ -25,7 +25,7 @@ class OpenSearchTimesketchOutputModule(shared_opensearch.SharedOpenSearchOutputM
         """Writes field values to the output.
 
         Events are buffered in the form of documents and inserted to OpenSearch
-        when the flush interval (threshold) has been reached.
+        when the flush interval (threshold) or bulk size has been reached.
 
         Args:
           output_mediator (OutputMediator): mediates interactions between output
@@ -38,12 +38,7 @@ class OpenSearchTimesketchOutputModule(shared_opensearch.SharedOpenSearchOutputM
         # support shared indices.
         field_values["__ts_timeline_id"] = self._timeline_identifier
 
-        self._event_documents.append(event_document)
-        self._event_documents.append(field_values)
-        self._number_of_buffered_events += 1
-
-        if self._number_of_buffered_events > self._flush_interval:
-            self._FlushEvents()
+        self._BufferEventDocument(event_document, field_values)
 
     def GetMissingArguments(self):
         """Retrieves a list of arguments that are missing from the input.
@@ -0,0 +1,266 @@
+"""Output module for the Apache Parquet output format."""
+
+import os
+
+from dfdatetime import semantic_time as dfdatetime_semantic_time
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from plaso.output import dynamic
+from plaso.output import interface
+from plaso.output import manager
+
+
+class ParquetOutputModule(interface.OutputModule):
+    """Output module for the Apache Parquet output format.
+
+    The field values are buffered and written as a row group per batch of
+    events. The datetime field is stored as a timestamp column and fields
+    with a low number of distinct values, such as the parser, are stored as
+    dictionary encoded columns.
+    """
+
+    NAME = "parquet"
+    DESCRIPTION = "Apache Parquet columnar output"
+
+    SUPPORTS_ADDITIONAL_FIELDS = True
+    SUPPORTS_CUSTOM_FIELDS = True
+
+    WRITES_OUTPUT_FILE = True
+
+    DEFAULT_ROW_GROUP_SIZE = 131072
+
+    _COMPRESSION = "zstd"
+
+    _DEFAULT_FIELDS = [
+        "datetime",
+        "timestamp_desc",
+        "source",
+        "source_long",
+        "message",
+        "parser",
+        "display_name",
+        "tag",
+    ]
+
+    # Names of the fields that are expected to have a low number of distinct
+    # values and are stored as dictionary encoded columns.
+    _DICTIONARY_ENCODED_FIELDS = frozenset(
+        [
+            "data_type",
+            "host",
+            "hostname",
+            "parser",
+            "source",
+            "source_long",
+            "sourcetype",
+            "timestamp_desc",
+            "timezone",
+            "type",
+            "zone",
+        ]
+    )
+
+    def __init__(self):
+        """Initializes an output module."""
+        super().__init__()
+        self._column_values = []
+        self._custom_fields = {}
+        self._field_formatting_helper = dynamic.DynamicFieldFormattingHelper()
+        self._field_names = list(self._DEFAULT_FIELDS)
+        self._number_of_buffered_rows = 0
+        self._path = None
+        self._row_group_size = self.DEFAULT_ROW_GROUP_SIZE
+        self._schema = None
+        self._writer = None
+
+    def _FlushRowGroup(self):
+        """Writes the buffered field values as a row group."""
+        if not self._number_of_buffered_rows:
+            return
+
+        arrays = [
+            pyarrow.array(column_values, type=field.type)
+            for field, column_values in zip(self._schema, self._column_values)
+        ]
+        table = pyarrow.Table.from_arrays(arrays, schema=self._schema)
+        self._writer.write_table(table, row_group_size=self._number_of_buffered_rows)
+
+        self._column_values = [[] for _ in self._field_names]
+        self._number_of_buffered_rows = 0
+
+    def _GetSchema(self, output_mediator):
+        """Retrieves the schema of the output.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+
+        Returns:
+          pyarrow.Schema: schema of the output.
+        """
+        schema_fields = []
+        for field_name in self._field_names:
+            if field_name == "datetime":
+                time_zone = f"{output_mediator.time_zone!s}"
+                field_type = pyarrow.timestamp("us", tz=time_zone)
+            elif field_name in self._DICTIONARY_ENCODED_FIELDS:
+                field_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+            else:
+                field_type = pyarrow.string()
+
+            schema_fields.append(pyarrow.field(field_name, field_type))
+
+        return pyarrow.schema(schema_fields)
+
+    def Close(self):
+        """Closes the output."""
+        if self._writer:
+            try:
+                self._FlushRowGroup()
+            finally:
+                self._writer.close()
+                self._writer = None
+
+        self._column_values = []
+        self._number_of_buffered_rows = 0
+        self._schema = None
+
+    def GetFieldValues(
+        self, output_mediator, event, event_data, event_data_stream, event_tag
+    ):
+        """Retrieves the output field values.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          event (EventObject): event.
+          event_data (EventData): event data.
+          event_data_stream (EventDataStream): event data stream.
+          event_tag (EventTag): event tag.
+
+        Returns:
+          dict[str, object]: output field values per name, where the datetime
+              field contains the number of microseconds since January 1, 1970
+              00:00:00 UTC or None if the event has no date and time value.
+        """
+        field_values = {}
+        for field_name in self._field_names:
+            if field_name == "datetime":
+                # Events without a date and time value, such as "Not set", are
+                # stored as null instead of January 1, 1970 00:00:00 UTC.
+                timestamp = event.timestamp or None
+                if isinstance(event.date_time, dfdatetime_semantic_time.SemanticTime):
+                    timestamp = None
+
+                field_values["datetime"] = timestamp
+                continue
+
+            field_value = self._field_formatting_helper.GetFormattedField(
+                output_mediator,
+                field_name,
+                event,
+                event_data,
+                event_data_stream,
+                event_tag,
+            )
+            if field_value is None and field_name in self._custom_fields:
+                field_value = self._custom_fields.get(field_name)
+
+            field_values[field_name] = field_value
+
+        return field_values
+
+    def Open(self, path=None, **kwargs):  # pylint: disable=arguments-differ
+        """Opens the output.
+
+        The Parquet file is created when the header is written, since the
+        schema depends on the time zone of the output mediator.
+
+        Args:
+          path (Optional[str]): path of the output file.
+
+        Raises:
+          OSError: if the specified output file already exists.
+          ValueError: if path is not set.
+        """
+        if not path:
+            raise ValueError("Missing filename.")
+
+        if os.path.isfile(path):
+            raise OSError(
+                f"Unable to use an already existing file for output [{path:s}]"
+            )
+
+        self._path = path
+
+    def SetAdditionalFields(self, field_names):
+        """Sets the names of additional fields to output.
+
+        Args:
+          field_names (list[str]): names of additional fields to output.
+        """
+        self._field_names.extend(field_names)
+
+    def SetCustomFields(self, field_names_and_values):
+        """Sets the names and values of custom fields to output.
+
+        Args:
+          field_names_and_values (list[tuple[str, str]]): names and values of
+              custom fields to output.
+        """
+        self._custom_fields = dict(field_names_and_values)
+        self._field_names.extend(self._custom_fields.keys())
+
+    def SetFields(self, field_names):
+        """Sets the names of the fields to output.
+
+        Args:
+          field_names (list[str]): names of the fields to output.
+        """
+        self._field_names = field_names
+
+    def SetRowGroupSize(self, row_group_size):
+        """Sets the number of events per row group.
+
+        Args:
+          row_group_size (int): number of events per row group.
+        """
+        self._row_group_size = row_group_size
+
+    def WriteFieldValues(self, output_mediator, field_values):
+        """Writes field values to the output.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+          field_values (dict[str, object]): output field values per name.
+        """
+        for column_values, field_name in zip(self._column_values, self._field_names):
+            column_values.append(field_values.get(field_name))
+
+        self._number_of_buffered_rows += 1
+        if self._number_of_buffered_rows >= self._row_group_size:
+            self._FlushRowGroup()
+
+    def WriteHeader(self, output_mediator):
+        """Writes the header to the output.
+
+        Args:
+          output_mediator (OutputMediator): mediates interactions between output
+              modules and other components, such as storage and dfVFS.
+        """
+        self._schema = self._GetSchema(output_mediator)
+        self._writer = pyarrow.parquet.ParquetWriter(
+            self._path, self._schema, compression=self._COMPRESSION
+        )
+
+        self._column_values = [[] for _ in self._field_names]
+        self._number_of_buffered_rows = 0
+
+
+manager.OutputManager.RegisterOutput(ParquetOutputModule, disabled=pyarrow is None)
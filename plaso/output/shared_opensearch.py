@@ -2,6 +2,10 @@
 
 import logging
 import os
+import pytz
+import queue
+import threading
+import time
 
 from acstore.containers import interface as containers_interface
 
@@ -15,6 +19,7 @@ try:
 except ImportError:
     opensearchpy = None
 
+from plaso.engine import processing_status
 from plaso.lib import errors
 from plaso.output import formatting_helper
 from plaso.output import interface
@@ -61,6 +66,22 @@ class SharedOpenSearchFieldFormattingHelper(formatting_helper.FieldFormattingHel
         Returns:
           str: date and time field.
         """
+        # Note that dfDateTime is used for timestamps before January 1, 1970,
+        # since the date and time strings it produces for negative timestamps
+        # can differ from those of datetime.
+        if event.timestamp is not None and event.timestamp >= 0:
+            if not self._date_time_converter:
+                self._date_time_converter = formatting_helper.ISO8601DateTimeConverter(
+                    pytz.UTC
+                )
+
+            try:
+                return self._date_time_converter.CopyTimestampToString(event.timestamp)
+            except (OverflowError, TypeError, ValueError):
+                pass
+
+        # Note that dfDateTime supports dates and times that are not supported
+        # by datetime.
         date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
             timestamp=event.timestamp
         )
@@ -190,6 +211,281 @@ class SharedOpenSearchFieldFormattingHelper(formatting_helper.FieldFormattingHel
         return output_value
 
 
+class OpenSearchBulkIngester:
+    """Inserts serialized documents into OpenSearch with bulk requests.
+
+    Batches of documents are sent by sender threads, which share the connection
+    pool of the OpenSearch client. The size of the batches that are queued or
+    being sent is bounded and adding a batch blocks until the batch fits, which
+    applies backpressure on the caller. Documents that are rejected, for example
+    because the write queue of the OpenSearch server is full, are sent again
+    after an exponentially increasing delay.
+    """
+
+    # Number of seconds to wait before the first retry.
+    _INITIAL_RETRY_DELAY = 0.5
+
+    # Maximum number of seconds to wait before a retry.
+    _MAXIMUM_RETRY_DELAY = 30.0
+
+    # Maximum number of times a document is sent again.
+    _MAXIMUM_NUMBER_OF_RETRIES = 5
+
+    # HTTP status codes of documents and requests that should be sent again.
+    _RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+
+    def __init__(
+        self,
+        client,
+        index_name,
+        maximum_pending_size,
+        number_of_senders=1,
+        request_timeout=300,
+    ):
+        """Initializes an OpenSearch bulk ingester.
+
+        Args:
+          client (opensearchpy.OpenSearch): OpenSearch client.
+          index_name (str): name of the index.
+          maximum_pending_size (int): maximum number of bytes of serialized
+              documents that are queued or being sent.
+          number_of_senders (Optional[int]): number of threads that send bulk
+              requests concurrently.
+          request_timeout (Optional[int]): number of seconds to wait before
+              a bulk request is timed out.
+        """
+        super().__init__()
+        self._batch_queue = queue.Queue()
+        self._client = client
+        self._condition = threading.Condition()
+        self._exception = None
+        self._index_name = index_name
+        self._maximum_pending_size = maximum_pending_size
+        self._request_timeout = request_timeout
+        self._sender_threads = []
+        self._status = processing_status.OutputStatus()
+
+        for _ in range(number_of_senders):
+            sender_thread = threading.Thread(
+                name="OpenSearchBulkSender", target=self._SenderThreadMain
+            )
+            sender_thread.daemon = True
+            sender_thread.start()
+
+            self._sender_threads.append(sender_thread)
+
+    def _CheckException(self):
+        """Checks if a sender thread failed.
+
+        Raises:
+          RuntimeError: if a sender thread failed.
+        """
+        if self._exception:
+            raise RuntimeError(f"Unable to bulk insert with error: {self._exception!s}")
+
+    def _GetDocumentsToRetry(self, documents, response):
+        """Retrieves the documents that were rejected and should be sent again.
+
+        Args:
+          documents (list[bytes]): serialized documents that were sent.
+          response (dict[str, object]): response of the bulk request.
+
+        Returns:
+          list[bytes]: serialized documents that should be sent again.
+        """
+        if not isinstance(response, dict) or not response.get("errors", False):
+            with self._condition:
+                self._status.number_of_stored_documents += len(documents)
+            return []
+
+        documents_to_retry = []
+        number_of_failed_documents = 0
+        for document, item in zip(documents, response.get("items", [])):
+            _, result = next(iter(item.items()))
+
+            status_code = result.get("status", 200)
+            if status_code in self._RETRY_STATUS_CODES:
+                documents_to_retry.append(document)
+
+            elif status_code >= 300:
+                number_of_failed_documents += 1
+                logger.debug(
+                    f"Unable to insert document with error: {result.get('error')!s}"
+                )
+
+        with self._condition:
+            self._status.number_of_failed_documents += number_of_failed_documents
+            self._status.number_of_stored_documents += (
+                len(documents) - number_of_failed_documents - len(documents_to_retry)
+            )
+
+        return documents_to_retry
+
+    def _SendBatch(self, documents):
+        """Sends a batch of documents to OpenSearch.
+
+        Args:
+          documents (list[bytes]): serialized documents, each consisting of
+              an action and a source line.
+        """
+        number_of_retries = 0
+        retry_delay = self._INITIAL_RETRY_DELAY
+
+        while documents:
+            body = b"".join(documents)
+            try:
+                # pylint: disable=unexpected-keyword-arg
+                response = self._client.bulk(
+                    body=body,
+                    index=self._index_name,
+                    request_timeout=self._request_timeout,
+                )
+                documents_to_retry = self._GetDocumentsToRetry(documents, response)
+
+            except opensearchpy.exceptions.TransportError as exception:
+                if (
+                    not isinstance(exception, opensearchpy.exceptions.ConnectionError)
+                    and exception.status_code not in self._RETRY_STATUS_CODES
+                ):
+                    raise
+
+                documents_to_retry = documents
+
+            with self._condition:
+                self._status.number_of_sent_bytes += len(body)
+
+            if not documents_to_retry:
+                break
+
+            if number_of_retries >= self._MAXIMUM_NUMBER_OF_RETRIES:
+                logger.warning(
+                    f"Unable to insert {len(documents_to_retry):d} documents after "
+                    f"{number_of_retries:d} retries"
+                )
+                with self._condition:
+                    self._status.number_of_failed_documents += len(documents_to_retry)
+                break
+
+            time.sleep(retry_delay)
+
+            documents = documents_to_retry
+            number_of_retries += 1
+            retry_delay = min(retry_delay * 2, self._MAXIMUM_RETRY_DELAY)
+
+            with self._condition:
+                self._status.number_of_retried_documents += len(documents)
+
+    def _SenderThreadMain(self):
+        """The main loop of a sender thread."""
+        while True:
+            documents = self._batch_queue.get()
+            if documents is None:
+                self._batch_queue.task_done()
+                break
+
+            batch_size = sum(len(document) for document in documents)
+            try:
+                # Once a sender thread failed the remaining batches are consumed
+                # without sending them, so that the writer does not block.
+                if self._exception:
+                    with self._condition:
+                        self._status.number_of_failed_documents += len(documents)
+                else:
+                    self._SendBatch(documents)
+
+            except (
+                ValueError,
+                opensearchpy.exceptions.OpenSearchException,
+            ) as exception:
+                # Ignore problematic events
+                logger.warning(f"Unable to bulk insert with error: {exception!s}")
+                with self._condition:
+                    self._status.number_of_failed_documents += len(documents)
+
+            except Exception as exception:  # pylint: disable=broad-except
+                logger.error(f"Unable to bulk insert with error: {exception!s}")
+                with self._condition:
+                    if not self._exception:
+                        self._exception = exception
+                    self._status.number_of_failed_documents += len(documents)
+
+            finally:
+                with self._condition:
+                    self._status.number_of_pending_bytes -= batch_size
+                    self._condition.notify_all()
+
+                self._batch_queue.task_done()
+
+    def AddBatch(self, documents):
+        """Adds a batch of documents to be sent.
+
+        Blocks until the size of the batches that are queued or being sent
+        allows the batch to be added. A batch that is larger than the maximum
+        pending size is added when no other batches are pending.
+
+        Args:
+          documents (list[bytes]): serialized documents, each consisting of
+              an action and a source line.
+
+        Raises:
+          RuntimeError: if a sender thread failed.
+        """
+        batch_size = sum(len(document) for document in documents)
+
+        with self._condition:
+            while (
+                not self._exception
+                and self._status.number_of_pending_bytes > 0
+                and self._status.number_of_pending_bytes + batch_size
+                > self._maximum_pending_size
+            ):
+                self._condition.wait()
+
+            self._CheckException()
+
+            self._status.number_of_pending_bytes += batch_size
+
+        self._batch_queue.put(documents)
+
+    def Close(self):
+        """Waits for the pending batches to be sent and stops the sender threads.
+
+        Raises:
+          RuntimeError: if a sender thread failed.
+        """
+        for _ in self._sender_threads:
+            self._batch_queue.put(None)
+
+        for sender_thread in self._sender_threads:
+            sender_thread.join()
+
+        self._sender_threads = []
+
+        self._CheckException()
+
+    def GetStatus(self):
+        """Retrieves the status of the bulk ingester.
+
+        Returns:
+          OutputStatus: status of the bulk ingester.
+        """
+        output_status = processing_status.OutputStatus()
+        with self._condition:
+            output_status.number_of_failed_documents = (
+                self._status.number_of_failed_documents
+            )
+            output_status.number_of_pending_bytes = self._status.number_of_pending_bytes
+            output_status.number_of_retried_documents = (
+                self._status.number_of_retried_documents
+            )
+            output_status.number_of_sent_bytes = self._status.number_of_sent_bytes
+            output_status.number_of_stored_documents = (
+                self._status.number_of_stored_documents
+            )
+
+        return output_status
+
+
 class SharedOpenSearchOutputModule(interface.OutputModule):
     """Shared functionality for an OpenSearch output module."""
 
@@ -200,11 +496,19 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     SUPPORTS_ADDITIONAL_FIELDS = True
     SUPPORTS_CUSTOM_FIELDS = True
 
+    _DEFAULT_BULK_SIZE = 5 * 1024 * 1024
+
     _DEFAULT_FLUSH_INTERVAL = 1000
 
+    _DEFAULT_NUMBER_OF_BULK_SENDERS = 2
+
     # Number of seconds to wait before a request to OpenSearch is timed out.
     _DEFAULT_REQUEST_TIMEOUT = 300
 
+    # Serializer of the event documents, which is the same serializer as used
+    # by the OpenSearch client.
+    _SERIALIZER = opensearchpy.serializer.JSONSerializer() if opensearchpy else None
+
     _DEFAULT_FIELD_NAMES = [
         "datetime",
         "display_name",
@@ -219,9 +523,12 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
     def __init__(self):
         """Initializes an output module."""
         super().__init__()
+        self._bulk_ingester = None
+        self._bulk_size = self._DEFAULT_BULK_SIZE
         self._client = None
         self._custom_fields = {}
         self._event_documents = []
+        self._event_documents_size = 0
         self._field_names = self._DEFAULT_FIELD_NAMES
         self._field_formatting_helper = SharedOpenSearchFieldFormattingHelper()
         self._flush_interval = self._DEFAULT_FLUSH_INTERVAL
@@ -229,6 +536,7 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
         self._index_name = None
         self._mappings = None
         self._number_of_buffered_events = 0
+        self._number_of_bulk_senders = self._DEFAULT_NUMBER_OF_BULK_SENDERS
         self._password = None
         self._port = None
         self._username = None
@@ -252,11 +560,14 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
         if self._username is not None:
             opensearch_http_auth = (self._username, self._password)
 
+        # Note that the size of the connection pool should allow every bulk
+        # sender to have a connection.
         self._client = opensearchpy.OpenSearch(
             [opensearch_host],
             http_auth=opensearch_http_auth,
             use_ssl=self._use_ssl,
             ca_certs=self._ca_certs,
+            maxsize=max(self._number_of_bulk_senders, 1),
         )
         logger.debug(
             f"Connected to OpenSearch server: {self._host:s} port: {self._port:d} "
@@ -290,25 +601,68 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
                 f"Unable to create OpenSearch index with error: {exception!s}"
             )
 
-    def _FlushEvents(self):
-        """Inserts the buffered event documents into OpenSearch."""
+    def _BufferEventDocument(self, event_document, field_values):
+        """Buffers an event document to be inserted into OpenSearch.
+
+        The buffered event documents are inserted when the flush interval or
+        the bulk size has been reached.
+
+        Args:
+          event_document (dict[str, object]): bulk action of the event document.
+          field_values (dict[str, str]): output field values per name.
+        """
         try:
-            # pylint: disable=unexpected-keyword-arg
-            bulk_arguments = {
-                "body": self._event_documents,
-                "index": self._index_name,
-                "request_timeout": self._DEFAULT_REQUEST_TIMEOUT,
-            }
-            self._client.bulk(**bulk_arguments)
-
-        except (ValueError, opensearchpy.exceptions.OpenSearchException) as exception:
+            serialized_action = self._SERIALIZER.dumps(event_document)
+            serialized_source = self._SERIALIZER.dumps(field_values)
+        except opensearchpy.exceptions.SerializationError as exception:
             # Ignore problematic events
-            logger.warning(f"Unable to bulk insert with error: {exception!s}")
+            logger.warning(f"Unable to serialize event with error: {exception!s}")
+            return
+
+        serialized_action = serialized_action.encode("utf-8")
+        serialized_source = serialized_source.encode("utf-8")
+
+        self._event_documents.append(serialized_action)
+        self._event_documents.append(serialized_source)
+        self._event_documents_size += len(serialized_action) + len(serialized_source)
+        self._number_of_buffered_events += 1
+
+        if (
+            self._number_of_buffered_events > self._flush_interval
+            or self._event_documents_size >= self._bulk_size
+        ):
+            self._FlushEvents()
+
+    def _FlushEvents(self):
+        """Inserts the buffered event documents into OpenSearch."""
+        if self._event_documents:
+            if not self._bulk_ingester:
+                self._bulk_ingester = OpenSearchBulkIngester(
+                    self._client,
+                    self._index_name,
+                    # Allow every sender to send a batch while the next batch
+                    # is queued.
+                    (self._number_of_bulk_senders + 1) * self._bulk_size,
+                    number_of_senders=self._number_of_bulk_senders,
+                    request_timeout=self._DEFAULT_REQUEST_TIMEOUT,
+                )
+
+            self._bulk_ingester.AddBatch(
+                [
+                    b"\n".join([serialized_action, serialized_source, b""])
+                    for serialized_action, serialized_source in zip(
+                        self._event_documents[0::2], self._event_documents[1::2]
+                    )
+                ]
+            )
+
+            logger.debug(
+                f"Queued {self._number_of_buffered_events:d} events for insertion "
+                f"into OpenSearch"
+            )
 
-        logger.debug(
-            "Inserted {self._number_of_buffered_events:d} events into OpenSearch"
-        )
         self._event_documents = []
+        self._event_documents_size = 0
         self._number_of_buffered_events = 0
 
     def _SanitizeField(self, data_type, attribute_name, field):
@@ -336,10 +690,21 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
         """Closes connection to OpenSearch.
 
         Inserts any remaining buffered event documents.
+
+        Raises:
+          RuntimeError: if the event documents cannot be inserted.
         """
-        self._FlushEvents()
+        try:
+            self._FlushEvents()
 
-        self._client = None
+        finally:
+            if self._bulk_ingester:
+                bulk_ingester = self._bulk_ingester
+                self._bulk_ingester = None
+
+                bulk_ingester.Close()
+
+            self._client = None
 
     def GetFieldValues(
         self, output_mediator, event, event_data, event_data_stream, event_tag
@@ -430,6 +795,17 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
 
         return field_values
 
+    def GetStatus(self):
+        """Retrieves the status of the output.
+
+        Returns:
+          OutputStatus: status of the output or None if not available.
+        """
+        if not self._bulk_ingester:
+            return None
+
+        return self._bulk_ingester.GetStatus()
+
     def SetAdditionalFields(self, field_names):
         """Sets the names of additional fields to output.
 
@@ -438,6 +814,16 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
         """
         self._field_names.extend(field_names)
 
+    def SetBulkSize(self, bulk_size):
+        """Sets the bulk size.
+
+        Args:
+          bulk_size (int): number of bytes of serialized events to buffer before
+              doing a bulk insert.
+        """
+        self._bulk_size = bulk_size
+        logger.debug(f"OpenSearch bulk size: {bulk_size:d}")
+
     def SetCustomFields(self, field_names_and_values):
         """Sets the names and values of custom fields to output.
 
@@ -475,6 +861,16 @@ class SharedOpenSearchOutputModule(interface.OutputModule):
         """
         self._mappings = mappings
 
+    def SetNumberOfBulkSenders(self, number_of_bulk_senders):
+        """Sets the number of bulk senders.
+
+        Args:
+          number_of_bulk_senders (int): number of threads that send bulk
+              inserts concurrently.
+        """
+        self._number_of_bulk_senders = number_of_bulk_senders
+        logger.debug(f"OpenSearch number of bulk senders: {number_of_bulk_senders:d}")
+
     def SetPassword(self, password):
         """Sets the password.
 
@@ -3,7 +3,14 @@
 import abc
 import heapq
 import os
+import queue
+import threading
+import zlib
 
+import lz4.frame
+import zstd
+
+from plaso.lib import definitions
 from plaso.output import interface
 
 
@@ -59,9 +66,159 @@ class SortedStringHeap:
         heapq.heappush(self._heap, (sort_key, string))
 
 
+class CompressedTextFileWriter:
+    """Writes text to a compressed file.
+
+    The text is buffered in large blocks, which are encoded, compressed and
+    written on a separate thread. The number of blocks waiting to be compressed
+    is bounded.
+    """
+
+    # Number of characters of text to buffer before a block is compressed.
+    _BLOCK_SIZE = 8 * 1024 * 1024
+
+    # Maximum number of blocks waiting to be compressed.
+    _MAXIMUM_NUMBER_OF_QUEUED_BLOCKS = 4
+
+    def __init__(self, path, compression_format, encoding="utf-8"):
+        """Initializes a compressed text file writer.
+
+        Args:
+          path (str): path of the output file.
+          compression_format (str): compression format.
+          encoding (Optional[str]): encoding of the text.
+
+        Raises:
+          ValueError: if the compression format is not supported.
+        """
+        if compression_format not in definitions.OUTPUT_COMPRESSION_FORMATS:
+            raise ValueError(
+                f"Unsupported output compression format: {compression_format!s}"
+            )
+
+        super().__init__()
+        self._block_queue = queue.Queue(maxsize=self._MAXIMUM_NUMBER_OF_QUEUED_BLOCKS)
+        self._buffer = []
+        self._buffer_size = 0
+        self._compression_format = compression_format
+        self._encoding = encoding
+        self._exception = None
+
+        # pylint: disable=consider-using-with
+        self._file_object = open(path, "wb")
+
+        # The compression thread is a daemon thread so that a writer that is
+        # not closed, for example when an error occurs, does not prevent
+        # the interpreter from exiting.
+        self._compression_thread = threading.Thread(
+            name="OutputCompression", target=self._CompressionThreadMain
+        )
+        self._compression_thread.daemon = True
+        self._compression_thread.start()
+
+    def _CompressionThreadMain(self):
+        """The main loop of the compression thread."""
+        if self._compression_format == definitions.OUTPUT_COMPRESSION_FORMAT_GZIP:
+            compressor = zlib.compressobj(wbits=31)
+        elif self._compression_format == definitions.OUTPUT_COMPRESSION_FORMAT_LZ4:
+            compressor = lz4.frame.LZ4FrameCompressor()
+        else:
+            compressor = None
+
+        block = []
+        try:
+            if self._compression_format == definitions.OUTPUT_COMPRESSION_FORMAT_LZ4:
+                self._file_object.write(compressor.begin())
+
+            while True:
+                block = self._block_queue.get()
+                if block is None:
+                    break
+
+                data = "".join(block).encode(self._encoding)
+
+                # Note that concatenated zstd frames are a valid zstd stream.
+                if compressor:
+                    compressed_data = compressor.compress(data)
+                else:
+                    compressed_data = zstd.compress(data)
+
+                self._file_object.write(compressed_data)
+
+            if compressor:
+                self._file_object.write(compressor.flush())
+
+        except Exception as exception:  # pylint: disable=broad-except
+            # Note that compression libraries, such as lz4, raise their own
+            # exception types.
+            self._exception = exception
+
+            # Consume the remaining blocks so that the writer does not block.
+            while block is not None:
+                block = self._block_queue.get()
+
+    def _QueueBlock(self):
+        """Queues the buffered text to be compressed.
+
+        Raises:
+          OSError: if the compressed data cannot be written.
+        """
+        if self._exception:
+            raise OSError(
+                f"Unable to write compressed output with error: {self._exception!s}"
+            )
+
+        if self._buffer:
+            self._block_queue.put(self._buffer)
+
+        self._buffer = []
+        self._buffer_size = 0
+
+    def close(self):
+        """Compresses and writes the remaining text and closes the file.
+
+        Raises:
+          OSError: if the compressed data cannot be written.
+        """
+        if not self._compression_thread:
+            return
+
+        try:
+            self._QueueBlock()
+
+        finally:
+            self._block_queue.put(None)
+            self._compression_thread.join()
+            self._compression_thread = None
+
+            self._file_object.close()
+
+        if self._exception:
+            raise OSError(
+                f"Unable to write compressed output with error: {self._exception!s}"
+            )
+
+    def write(self, text):
+        """Writes text.
+
+        Args:
+          text (str): text to write.
+
+        Raises:
+          OSError: if the compressed data cannot be written.
+        """
+        self._buffer.append(text)
+        self._buffer_size += len(text)
+
+        if self._buffer_size >= self._BLOCK_SIZE:
+            self._QueueBlock()
+
+
 class TextFileOutputModule(interface.OutputModule):
     """Shared functionality of an output module that writes to a text file."""
 
+    SUPPORTS_OUTPUT_COMPRESSION = True
+
     WRITES_OUTPUT_FILE = True
 
     _ENCODING = "utf-8"
@@ -95,15 +252,19 @@ class TextFileOutputModule(interface.OutputModule):
           dict[str, str]: output field values per name.
         """
 
-    def Open(self, path=None, **kwargs):  # pylint: disable=arguments-differ
+    # pylint: disable=arguments-differ
+    def Open(self, path=None, compression_format=None, **kwargs):
         """Opens the output file.
 
         Args:
           path (Optional[str]): path of the output file.
+          compression_format (Optional[str]): compression format of the output
+              file, where None represents no compression.
 
         Raises:
           OSError: if the specified output file already exists.
-          ValueError: if path is not set.
+          ValueError: if path is not set or the compression format is not
+              supported.
         """
         if not path:
             raise ValueError("Missing path.")
@@ -113,8 +274,13 @@ class TextFileOutputModule(interface.OutputModule):
                 f"Unable to use an already existing file for output [{path:s}]"
             )
 
-        # pylint: disable=consider-using-with
-        self._file_object = open(path, "wt", encoding=self._ENCODING)
+        if compression_format:
+            self._file_object = CompressedTextFileWriter(
+                path, compression_format, encoding=self._ENCODING
+            )
+        else:
+            # pylint: disable=consider-using-with
+            self._file_object = open(path, "wt", encoding=self._ENCODING)
 
     @abc.abstractmethod
     def WriteFieldValues(self, output_mediator, field_values):
@@ -521,6 +521,10 @@ class ChromeCacheParser(interface.FileEntryParser):
                 f"error: {exception!s}"
             )
 
+        # The parse results depend on the data block files, hence they cannot
+        # be reused.
+        parser_mediator.CancelRecordingParseResults()
+
         # TODO: create event based on index file creation time.
         file_system = file_entry.GetFileSystem()
         self._ParseIndexTable(
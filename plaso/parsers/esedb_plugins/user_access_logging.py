@@ -229,6 +229,10 @@ class UserAccessLoggingESEDBPlugin(interface.ESEDBPlugin):
         if table is None:
             raise ValueError("Missing table value.")
 
+        # The parse results depend on the SystemIdentity.mdb database, hence they
+        # cannot be reused.
+        parser_mediator.CancelRecordingParseResults()
+
         if not self._role_mappings:
             system_identity_file_entry = self._GetSystemIdentityDatabase(
                 parser_mediator
@@ -170,6 +170,10 @@ class FseventsdParser(interface.FileObjectParser, dtfabric_helper.DtFabricHelper
 
         current_page_end = page_header.page_size
 
+        # The parse results depend on the modification time of the gzip file,
+        # hence they cannot be reused.
+        parser_mediator.CancelRecordingParseResults()
+
         file_entry = parser_mediator.GetFileEntry()
         date_time = self._GetParentModificationTime(file_entry)
 
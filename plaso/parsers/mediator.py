@@ -34,6 +34,9 @@ class ParserMediator:
     # LCID 0x0409 is en-US.
     _DEFAULT_LCID = 0x0409
 
+    # Maximum number of attribute containers that are recorded as parse results.
+    _MAXIMUM_NUMBER_OF_RECORDED_PARSE_RESULTS = 100000
+
     def __init__(
         self,
         registry_find_specs=None,
@@ -70,6 +73,7 @@ class ParserMediator:
         self._parser_chain_components = []
         self._parsers_cpu_time_profiler = None
         self._parsers_memory_profiler = None
+        self._parse_results = None
         self._preferred_code_page = None
         self._process_information = None
         self._resolver_context = resolver_context
@@ -204,12 +208,49 @@ class ParserMediator:
 
         return self._environment_variables_per_path_spec.get(path_spec.parent)
 
+    def _ProduceWarning(self, warning):
+        """Produces an extraction or recovery warning.
+
+        Args:
+          warning (ExtractionWarning|RecoveryWarning): warning.
+        """
+        self._storage_writer.AddAttributeContainer(warning)
+
+        if warning.CONTAINER_TYPE == warnings.RecoveryWarning.CONTAINER_TYPE:
+            self._number_of_recovery_warnings += 1
+        else:
+            self._number_of_extraction_warnings += 1
+
+        self.last_activity_timestamp = time.time()
+
+    def _RecordParseResult(self, container, corrupted=False, recovered=False):
+        """Records an attribute container as parse result.
+
+        Args:
+          container (AttributeContainer): attribute container, where None
+              represents a result that cannot be recorded, such as an event
+              source, and causes the parse results not to be recorded.
+          corrupted (Optional[bool]): True if the item was corrupted.
+          recovered (Optional[bool]): True if the item was recovered.
+        """
+        if self._parse_results is None:
+            return
+
+        if container is None or (
+            len(self._parse_results) >= self._MAXIMUM_NUMBER_OF_RECORDED_PARSE_RESULTS
+        ):
+            self._parse_results = None
+        else:
+            self._parse_results.append((container, corrupted, recovered))
+
     def AddDateLessLogHelper(self, date_less_log_helper):
         """Adds a date-less log helper.
 
         Args:
           date_less_log_helper (DateLessLogHelper): date-less log helper.
         """
+        self._RecordParseResult(date_less_log_helper)
+
         if self._event_data_stream_identifier:
             date_less_log_helper.SetEventDataStreamIdentifier(
                 self._event_data_stream_identifier
@@ -224,6 +265,8 @@ class ParserMediator:
           message_file (WindowsEventLogMessageFileArtifact): Windows EventLog
               message file.
         """
+        self._RecordParseResult(None)
+
         self._storage_writer.AddAttributeContainer(message_file)
 
     def AddWindowsEventLogMessageString(self, message_string):
@@ -233,6 +276,8 @@ class ParserMediator:
           message_string (WindowsEventLogMessageStringArtifact): Windows EventLog
               message string.
         """
+        self._RecordParseResult(None)
+
         self._storage_writer.AddAttributeContainer(message_string)
 
     def AddWindowsEventLogMessageTable(self, message_table):
@@ -242,6 +287,8 @@ class ParserMediator:
           message_table (WindowsEventLogMessageTabelArtifact): Windows EventLog
               message table.
         """
+        self._RecordParseResult(None)
+
         self._storage_writer.AddAttributeContainer(message_table)
 
     def AddWindowsWevtTemplateEvent(self, event_definition):
@@ -251,6 +298,8 @@ class ParserMediator:
           event_definition (WindowsWevtTemplateEvent): Windows WEVT_TEMPLATE event
               definition.
         """
+        self._RecordParseResult(None)
+
         self._storage_writer.AddAttributeContainer(event_definition)
 
     def AppendToParserChain(self, name):
@@ -262,6 +311,15 @@ class ParserMediator:
         self._cached_parser_chain = None
         self._parser_chain_components.append(name)
 
+    def CancelRecordingParseResults(self):
+        """Cancels recording the parse results.
+
+        Parsers use this when their results depend on other files than the file
+        being parsed, such as a SQLite database Write-Ahead Log (WAL) file, since
+        these are not taken into account when the parse results are reused.
+        """
+        self._RecordParseResult(None)
+
     def ClearParserChain(self):
         """Clears the parser chain."""
         self._cached_parser_chain = None
@@ -340,6 +398,16 @@ class ParserMediator:
         """
         return path_helper.PathHelper.GetDisplayNameForPathSpec(path_spec)
 
+    def GetEnvironmentVariables(self):
+        """Retrieves the environment variables related to the file entry.
+
+        Returns:
+          list[EnvironmentVariableArtifact]: environment variables or None if not
+              available.
+        """
+        path_spec = getattr(self._file_entry, "path_spec", None)
+        return self._GetEnvironmentVariablesByPathSpec(path_spec)
+
     def GetFileEntry(self):
         """Retrieves the active file entry.
 
@@ -433,6 +501,11 @@ class ParserMediator:
 
             self._CreateEventLogMessageFileLookupTables(environment_variables)
 
+        # The Windows EventLog message file depends on the Windows EventLog
+        # providers, which are not taken into account when parse results are
+        # reused.
+        self._RecordParseResult(None)
+
         relative_path = path_helper.PathHelper.GetRelativePathForPathSpec(path_spec)
         lookup_path = relative_path.lower()
 
@@ -507,6 +580,8 @@ class ParserMediator:
         if self._event_data_stream_identifier:
             event_data.SetEventDataStreamIdentifier(self._event_data_stream_identifier)
 
+        self._RecordParseResult(event_data, corrupted=corrupted, recovered=recovered)
+
         event_values_hash = events.CalculateEventValuesHash(
             event_data, self._event_data_stream
         )
@@ -532,6 +607,10 @@ class ParserMediator:
         if not self._storage_writer:
             raise RuntimeError("Storage writer not set.")
 
+        # Event data streams produced by the parsers, such as that of a SQLite
+        # database Write-Ahead Log (WAL) file, cannot be reused.
+        self._RecordParseResult(None)
+
         if not event_data_stream:
             self._event_data_stream = None
             self._event_data_stream_identifier = None
@@ -560,11 +639,42 @@ class ParserMediator:
         if not self._storage_writer:
             raise RuntimeError("Storage writer not set.")
 
+        self._RecordParseResult(None)
+
         self._storage_writer.AddAttributeContainer(event_source)
         self._number_of_event_sources += 1
 
         self.last_activity_timestamp = time.time()
 
+    def ProduceParseResults(self, parse_results):
+        """Produces parse results recorded earlier.
+
+        Args:
+          parse_results (list[tuple[AttributeContainer, bool, bool]]): attribute
+              containers produced by the parsers and if the containers were
+              corrupted and recovered.
+
+        Raises:
+          RuntimeError: when storage writer is not set.
+        """
+        if not self._storage_writer:
+            raise RuntimeError("Storage writer not set.")
+
+        path_spec = getattr(self._file_entry, "path_spec", None)
+
+        for container, corrupted, recovered in parse_results:
+            if container.CONTAINER_TYPE == events.EventData.CONTAINER_TYPE:
+                self.ProduceEventData(
+                    container, corrupted=corrupted, recovered=recovered
+                )
+
+            elif container.CONTAINER_TYPE == events.DateLessLogHelper.CONTAINER_TYPE:
+                self.AddDateLessLogHelper(container)
+
+            else:
+                container.path_spec = path_spec
+                self._ProduceWarning(container)
+
     def ProduceWarning(self, message, path_spec=None, recovered=False):
         """Produces an extraction or recovery warning.
 
@@ -581,8 +691,9 @@ class ParserMediator:
         if not self._storage_writer:
             raise RuntimeError("Storage writer not set.")
 
-        if not path_spec and self._file_entry:
-            path_spec = self._file_entry.path_spec
+        file_entry_path_spec = getattr(self._file_entry, "path_spec", None)
+        if not path_spec:
+            path_spec = file_entry_path_spec
 
         parser_chain = self.GetParserChain()
 
@@ -595,14 +706,14 @@ class ParserMediator:
                 message=message, parser_chain=parser_chain, path_spec=path_spec
             )
 
-        self._storage_writer.AddAttributeContainer(warning)
-
-        if recovered:
-            self._number_of_recovery_warnings += 1
+        # Only warnings about the current file entry can be recorded since
+        # the path specification is replaced when the parse results are reused.
+        if path_spec == file_entry_path_spec:
+            self._RecordParseResult(warning)
         else:
-            self._number_of_extraction_warnings += 1
+            self._RecordParseResult(None)
 
-        self.last_activity_timestamp = time.time()
+        self._ProduceWarning(warning)
 
     def SetWindowsEventLogProviders(self, windows_event_log_providers):
         """Sets the Windows EventLog providers.
@@ -687,6 +798,8 @@ class ParserMediator:
         Args:
           file_entry (dfvfs.FileEntry): file entry.
         """
+        self._RecordParseResult(None)
+
         self._event_data_stream = None
         self._event_data_stream_identifier = None
         self._file_entry = file_entry
@@ -783,6 +896,14 @@ class ParserMediator:
 
         self._process_information = process_information
 
+    def StartRecordingParseResults(self):
+        """Starts recording the parse results.
+
+        The parse results are the attribute containers produced by the parsers,
+        such as event data, date-less log helpers and warnings.
+        """
+        self._parse_results = []
+
     def StopProfiling(self):
         """Stops profiling."""
         if self._format_checks_cpu_time_profiler:
@@ -798,3 +919,16 @@ class ParserMediator:
             self._parsers_memory_profiler = None
 
         self._process_information = None
+
+    def StopRecordingParseResults(self):
+        """Stops recording the parse results.
+
+        Returns:
+          list[tuple[AttributeContainer, bool, bool]]: attribute containers
+              produced by the parsers and if the containers were corrupted and
+              recovered, or None if the parse results could not be recorded,
+              for example because an event source was produced.
+        """
+        parse_results = self._parse_results
+        self._parse_results = None
+        return parse_results
@@ -437,6 +437,10 @@ class OneDriveLogFileParser(interface.FileEntryParser, dtfabric_helper.DtFabricH
         else:
             raise errors.ParseError("Invalid signature found.")
 
+        # The parse results depend on the obfuscated string map file, hence they
+        # cannot be reused.
+        parser_mediator.CancelRecordingParseResults()
+
         parent_file_entry = file_entry.GetParentFileEntry()
 
         obfuscated_string_map_file_entry = parent_file_entry.GetSubFileEntryByName(
@@ -1624,6 +1624,10 @@ class SpotlightStoreDatabaseParser(
         Raises:
           WrongParser: when the file cannot be parsed.
         """
+        # The parse results depend on the streams map files, hence they cannot
+        # be reused.
+        parser_mediator.CancelRecordingParseResults()
+
         parent_file_entry = file_entry.GetParentFileEntry()
 
         file_object = file_entry.GetFileObject()
@@ -448,6 +448,10 @@ class SQLiteParser(interface.FileEntryParser):
         finally:
             database.Close()
 
+        # The parse results depend on whether the database has a Write-Ahead
+        # Log (WAL) file, hence they cannot be reused.
+        parser_mediator.CancelRecordingParseResults()
+
         database_wal, wal_file_entry = self._OpenDatabaseWithWAL(
             parser_mediator, file_entry, file_object, filename
         )
@@ -4781,6 +4781,10 @@ class UnifiedLoggingParser(interface.FileEntryParser):
                 f"Unable to open tracev3 file with error: {exception!s}"
             )
 
+        # The parse results depend on the uuidtext and dsc files, hence they
+        # cannot be reused.
+        parser_mediator.CancelRecordingParseResults()
+
         try:
             for log_entry in tracev3_file.ReadLogEntries():
                 activity_identifier = log_entry.activity_identifier or 0
@@ -277,6 +277,12 @@ class WinRegistryParser(interface.FileObjectParser):
             key_path_prefix = win_registry.GetRegistryFileMapping(registry_file)
             registry_file.SetKeyPathPrefix(key_path_prefix)
             root_key = registry_file.GetRootKey()
+
+            # The parse results depend on the Windows Registry find
+            # specifications, hence they cannot be reused.
+            if parser_mediator.registry_find_specs:
+                parser_mediator.CancelRecordingParseResults()
+
             if root_key:
                 # For now treat AMCache.hve separately.
                 if root_key.name.lower() in self._AMCACHE_ROOT_KEY_NAMES:
@@ -0,0 +1,253 @@
+"""Binary event data serializer.
+
+The binary serialization format stores the attribute values of an event data
+attribute container without attribute names. The data type and names of
+the attributes are stored once per schema, which is referenced by its
+identifier in the serialized data.
+
+The serialized data consists of:
+* the schema identifier, as a 32-bit little-endian integer;
+* per attribute in the schema, a 1 byte value type followed by the value data.
+"""
+
+import json
+import struct
+
+from acstore.containers import interface as containers_interface
+
+from plaso.containers import events
+from plaso.serializer import json_serializer
+
+
+class BinaryEventDataSerializer(json_serializer.JSONAttributeContainerSerializer):
+    """Binary event data serializer.
+
+    Attribute values of types that have no native binary representation, such
+    as date and time values and lists, are stored in their JSON serialized form.
+    """
+
+    _VALUE_TYPE_FALSE = 0
+    _VALUE_TYPE_TRUE = 1
+    _VALUE_TYPE_INTEGER = 2
+    _VALUE_TYPE_FLOAT = 3
+    _VALUE_TYPE_STRING = 4
+    _VALUE_TYPE_IDENTIFIER = 5
+    _VALUE_TYPE_JSON = 6
+
+    _INTEGER_MAXIMUM = (1 << 63) - 1
+    _INTEGER_MINIMUM = -(1 << 63)
+
+    _STRUCT_FLOAT = struct.Struct("<Bd")
+    _STRUCT_INTEGER = struct.Struct("<Bq")
+    _STRUCT_SCHEMA_IDENTIFIER = struct.Struct("<I")
+    _STRUCT_SIZE = struct.Struct("<BI")
+    _STRUCT_VALUE_TYPE = struct.Struct("<B")
+
+    def __init__(self):
+        """Initializes a binary event data serializer."""
+        super().__init__()
+        self._schema_identifiers = {}
+
+        self.schemas = []
+
+    def _ReadValue(self, serialized_data, data_offset):
+        """Reads an attribute value.
+
+        Args:
+          serialized_data (bytes): serialized event data.
+          data_offset (int): offset of the value in the serialized event data.
+
+        Returns:
+          tuple[object, int]: attribute value and offset of the next value.
+
+        Raises:
+          ValueError: if the value type is not supported or the value size
+              exceeds the serialized event data.
+        """
+        value_type = serialized_data[data_offset]
+
+        if value_type == self._VALUE_TYPE_FALSE:
+            return False, data_offset + 1
+
+        if value_type == self._VALUE_TYPE_TRUE:
+            return True, data_offset + 1
+
+        if value_type == self._VALUE_TYPE_INTEGER:
+            _, value = self._STRUCT_INTEGER.unpack_from(serialized_data, data_offset)
+            return value, data_offset + self._STRUCT_INTEGER.size
+
+        if value_type == self._VALUE_TYPE_FLOAT:
+            _, value = self._STRUCT_FLOAT.unpack_from(serialized_data, data_offset)
+            return value, data_offset + self._STRUCT_FLOAT.size
+
+        _, value_size = self._STRUCT_SIZE.unpack_from(serialized_data, data_offset)
+        data_offset += self._STRUCT_SIZE.size
+        data_end_offset = data_offset + value_size
+
+        if data_end_offset > len(serialized_data):
+            raise ValueError(
+                f"Value size: {value_size:d} at offset: {data_offset:d} exceeds "
+                f"serialized data size: {len(serialized_data):d}"
+            )
+
+        value_string = serialized_data[data_offset:data_end_offset].decode(
+            "utf-8", errors="surrogatepass"
+        )
+
+        if value_type == self._VALUE_TYPE_STRING:
+            return value_string, data_end_offset
+
+        if value_type == self._VALUE_TYPE_IDENTIFIER:
+            identifier = containers_interface.AttributeContainerIdentifier()
+            identifier.CopyFromString(value_string)
+            return identifier, data_end_offset
+
+        if value_type == self._VALUE_TYPE_JSON:
+            json_value = json.loads(value_string)
+            if isinstance(json_value, dict):
+                value = self._ConvertJSONToValue(json_value)
+            elif isinstance(json_value, list):
+                value = self._ConvertListToValue(json_value)
+            else:
+                value = json_value
+
+            return value, data_end_offset
+
+        raise ValueError(f"Unsupported value type: {value_type:d}")
+
+    def _WriteValue(self, value):
+        """Writes an attribute value.
+
+        Args:
+          value (object): attribute value.
+
+        Returns:
+          bytes: serialized attribute value.
+        """
+        value_type = type(value)
+
+        if value_type is str:
+            value_data = value.encode("utf-8", errors="surrogatepass")
+            return (
+                self._STRUCT_SIZE.pack(self._VALUE_TYPE_STRING, len(value_data))
+                + value_data
+            )
+
+        if value_type is bool:
+            if value:
+                return self._STRUCT_VALUE_TYPE.pack(self._VALUE_TYPE_TRUE)
+
+            return self._STRUCT_VALUE_TYPE.pack(self._VALUE_TYPE_FALSE)
+
+        if (
+            value_type is int
+            and self._INTEGER_MINIMUM <= value <= self._INTEGER_MAXIMUM
+        ):
+            return self._STRUCT_INTEGER.pack(self._VALUE_TYPE_INTEGER, value)
+
+        if value_type is float:
+            return self._STRUCT_FLOAT.pack(self._VALUE_TYPE_FLOAT, value)
+
+        if value_type is containers_interface.AttributeContainerIdentifier:
+            value_data = value.CopyToString().encode("utf-8")
+            return (
+                self._STRUCT_SIZE.pack(self._VALUE_TYPE_IDENTIFIER, len(value_data))
+                + value_data
+            )
+
+        json_value = self._ConvertValueToJSON(value)
+        value_data = json.dumps(json_value).encode("utf-8")
+        return (
+            self._STRUCT_SIZE.pack(self._VALUE_TYPE_JSON, len(value_data)) + value_data
+        )
+
+    def AddSchema(self, data_type, attribute_names):
+        """Adds a schema.
+
+        Schemas must be added in order of their identifier.
+
+        Args:
+          data_type (str): event data type.
+          attribute_names (list[str]): names of the attributes, other than
+              the data type, in order of their serialized values.
+
+        Returns:
+          int: schema identifier.
+        """
+        schema = (data_type, tuple(attribute_names))
+        schema_identifier = len(self.schemas)
+
+        self._schema_identifiers[schema] = schema_identifier
+        self.schemas.append(schema)
+
+        return schema_identifier
+
+    def ReadSerialized(self, serialized_data):  # pylint: disable=arguments-renamed
+        """Reads event data from serialized form.
+
+        Args:
+          serialized_data (bytes): serialized event data.
+
+        Returns:
+          EventData: event data.
+
+        Raises:
+          ValueError: if the schema or a value type is not supported or
+              the serialized event data is truncated or corrupt.
+        """
+        try:
+            (schema_identifier,) = self._STRUCT_SCHEMA_IDENTIFIER.unpack_from(
+                serialized_data, 0
+            )
+            if schema_identifier >= len(self.schemas):
+                raise ValueError(f"Unsupported schema: {schema_identifier:d}")
+
+            data_type, attribute_names = self.schemas[schema_identifier]
+
+            event_data = events.EventData(data_type=data_type)
+
+            data_offset = self._STRUCT_SCHEMA_IDENTIFIER.size
+            for attribute_name in attribute_names:
+                attribute_value, data_offset = self._ReadValue(
+                    serialized_data, data_offset
+                )
+                setattr(event_data, attribute_name, attribute_value)
+
+        except (IndexError, struct.error) as exception:
+            raise ValueError(
+                f"Unable to read truncated or corrupt serialized data with error: "
+                f"{exception!s}"
+            )
+
+        return event_data
+
+    def WriteSerialized(self, event_data):  # pylint: disable=arguments-renamed
+        """Writes event data to serialized form.
+
+        A schema is added when the event data has a combination of data type
+        and attribute names that was not seen before.
+
+        Args:
+          event_data (EventData): event data.
+
+        Returns:
+          bytes: serialized event data.
+        """
+        attribute_names = []
+        serialized_values = []
+
+        for attribute_name, attribute_value in event_data.GetAttributes():
+            if attribute_name != "data_type":
+                attribute_names.append(attribute_name)
+                serialized_values.append(self._WriteValue(attribute_value))
+
+        schema = (event_data.data_type, tuple(attribute_names))
+
+        schema_identifier = self._schema_identifiers.get(schema, None)
+        if schema_identifier is None:
+            schema_identifier = self.AddSchema(*schema)
+
+        serialized_values.insert(
+            0, self._STRUCT_SCHEMA_IDENTIFIER.pack(schema_identifier)
+        )
+        return b"".join(serialized_values)
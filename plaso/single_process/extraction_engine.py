@@ -13,6 +13,7 @@ from plaso.containers import events
 from plaso.engine import engine
 from plaso.engine import extractors
 from plaso.engine import logger
+from plaso.engine import parse_results_cache
 from plaso.engine import process_info
 from plaso.engine import timeliner
 from plaso.engine import worker
@@ -46,6 +47,7 @@ class SingleProcessEngine(engine.BaseEngine):
         self._number_of_consumed_event_data = 0
         self._number_of_consumed_sources = 0
         self._number_of_produced_events = 0
+        self._parse_results_cache = None
         self._parser_mediator = None
         self._parsers_counter = None
         self._path_spec_extractor = extractors.PathSpecExtractor()
@@ -340,6 +342,29 @@ class SingleProcessEngine(engine.BaseEngine):
         else:
             self._status = definitions.STATUS_INDICATOR_COMPLETED
 
+    def _StartParseResultsCache(self, configuration):
+        """Starts the persistent cache of parse results.
+
+        Args:
+          configuration (ExtractionConfiguration): extraction configuration.
+        """
+        if not configuration.parse_cache_path:
+            return
+
+        cache = parse_results_cache.ParseResultsCache(
+            maximum_size=configuration.parse_cache_size
+        )
+        try:
+            cache.Open(configuration.parse_cache_path)
+        except OSError as exception:
+            logger.warning(
+                f"Unable to open parse results cache with error: {exception!s}"
+            )
+            return
+
+        self._extraction_worker.SetParseResultsCache(cache)
+        self._parse_results_cache = cache
+
     def _StartStatusUpdateThread(self):
         """Starts the status update thread."""
         self._status_update_active = True
@@ -355,6 +380,22 @@ class SingleProcessEngine(engine.BaseEngine):
 
             time.sleep(self._status_update_interval)
 
+    def _StopParseResultsCache(self):
+        """Stops the persistent cache of parse results."""
+        if not self._parse_results_cache:
+            return
+
+        self._extraction_worker.SetParseResultsCache(None)
+
+        logger.debug(
+            f"Parse results cache hits: "
+            f"{self._parse_results_cache.number_of_cache_hits:d}, misses: "
+            f"{self._parse_results_cache.number_of_cache_misses:d}"
+        )
+
+        self._parse_results_cache.Close()
+        self._parse_results_cache = None
+
     def _StopStatusUpdateThread(self):
         """Stops the status update thread."""
         if self._status_update_thread:
@@ -554,6 +595,8 @@ class SingleProcessEngine(engine.BaseEngine):
         if self._storage_profiler:
             self._storage_writer.SetStorageProfiler(self._storage_profiler)
 
+        self._StartParseResultsCache(processing_configuration.extraction)
+
         self._StartStatusUpdateThread()
 
         self._data_types_counter = self._storage_writer.GetDataTypesCounter()
@@ -582,6 +625,8 @@ class SingleProcessEngine(engine.BaseEngine):
             if self._storage_profiler:
                 self._storage_writer.SetStorageProfiler(None)
 
+            self._StopParseResultsCache()
+
             self._StopProfiling()
             parser_mediator.StopProfiling()
 
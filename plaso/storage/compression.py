@@ -0,0 +1,264 @@
+"""Compression of serialized attribute container data in storage."""
+
+import base64
+import collections
+import json
+import zlib
+
+import lz4.block
+import zstd
+
+from plaso.lib import definitions
+
+
+class StorageCompression:
+    """Compression of serialized attribute container data."""
+
+    @classmethod
+    def Compress(cls, compression_format, data, dictionary=None):
+        """Compresses data.
+
+        Args:
+          compression_format (str): compression format.
+          data (bytes): data to compress.
+          dictionary (Optional[bytes]): preset compression dictionary, where
+              None represents no dictionary. Only used by compression formats
+              that support a preset dictionary.
+
+        Returns:
+          bytes: compressed data.
+
+        Raises:
+          ValueError: if the compression format is not supported.
+        """
+        if compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+            if not dictionary:
+                return zlib.compress(data)
+
+            compressor = zlib.compressobj(zdict=dictionary)
+            return compressor.compress(data) + compressor.flush()
+
+        if compression_format == definitions.COMPRESSION_FORMAT_LZ4:
+            if not dictionary:
+                return lz4.block.compress(data)
+
+            return lz4.block.compress(data, dict=dictionary)
+
+        if compression_format == definitions.COMPRESSION_FORMAT_ZSTD:
+            return zstd.compress(data)
+
+        if compression_format == definitions.COMPRESSION_FORMAT_NONE:
+            return data
+
+        raise ValueError(f"Unsupported compression format: {compression_format!s}")
+
+    @classmethod
+    def Decompress(cls, compression_format, compressed_data, dictionary=None):
+        """Decompresses data.
+
+        Args:
+          compression_format (str): compression format.
+          compressed_data (bytes): compressed data.
+          dictionary (Optional[bytes]): preset compression dictionary the data
+              was compressed with, where None represents no dictionary.
+
+        Returns:
+          bytes: decompressed data.
+
+        Raises:
+          ValueError: if the compression format is not supported or the data
+              cannot be decompressed.
+        """
+        try:
+            if compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+                if not dictionary:
+                    return zlib.decompress(compressed_data)
+
+                decompressor = zlib.decompressobj(zdict=dictionary)
+                return decompressor.decompress(compressed_data) + decompressor.flush()
+
+            if compression_format == definitions.COMPRESSION_FORMAT_LZ4:
+                if not dictionary:
+                    return lz4.block.decompress(compressed_data)
+
+                return lz4.block.decompress(compressed_data, dict=dictionary)
+
+            if compression_format == definitions.COMPRESSION_FORMAT_ZSTD:
+                return zstd.decompress(compressed_data)
+
+        except (lz4.block.LZ4BlockError, zlib.error, zstd.Error) as exception:
+            raise ValueError(
+                f"Unable to decompress {compression_format:s} compressed data "
+                f"with error: {exception!s}"
+            )
+
+        if compression_format == definitions.COMPRESSION_FORMAT_NONE:
+            return compressed_data
+
+        raise ValueError(f"Unsupported compression format: {compression_format!s}")
+
+
+class CompressionDictionariesSerializer:
+    """Compression dictionaries serializer.
+
+    The compression dictionaries are serialized as a JSON object that maps
+    an event data type to its base64 encoded dictionary.
+    """
+
+    @classmethod
+    def ReadSerialized(cls, json_string):
+        """Reads compression dictionaries from serialized form.
+
+        Args:
+          json_string (str): JSON serialized compression dictionaries.
+
+        Returns:
+          dict[str, bytes]: compression dictionaries per event data type.
+
+        Raises:
+          ValueError: if the compression dictionaries cannot be read.
+        """
+        try:
+            json_dict = json.loads(json_string)
+        except json.JSONDecodeError as exception:
+            raise ValueError(
+                f"Unable to read compression dictionaries with error: {exception!s}"
+            )
+
+        if not isinstance(json_dict, dict):
+            raise ValueError("Unsupported compression dictionaries")
+
+        return {
+            data_type: base64.b64decode(dictionary)
+            for data_type, dictionary in json_dict.items()
+        }
+
+    @classmethod
+    def WriteSerialized(cls, compression_dictionaries):
+        """Writes compression dictionaries to serialized form.
+
+        Args:
+          compression_dictionaries (dict[str, bytes]): compression dictionaries
+              per event data type.
+
+        Returns:
+          str: JSON serialized compression dictionaries.
+        """
+        json_dict = {
+            data_type: base64.b64encode(dictionary).decode("ascii")
+            for data_type, dictionary in sorted(compression_dictionaries.items())
+        }
+        return json.dumps(json_dict)
+
+
+class CompressionDictionaryTrainer:
+    """Trains compression dictionaries per event data type.
+
+    A dictionary is built from the segments of the sample data that contain
+    the most byte sequences that are shared between samples. The segments with
+    the highest score are stored at the end of the dictionary, since shorter
+    match distances are cheaper to encode.
+    """
+
+    # The number of bytes in a sequence that is counted.
+    _SEQUENCE_SIZE = 8
+
+    # The number of bytes in a dictionary segment.
+    _SEGMENT_SIZE = 32
+
+    # The maximum number of samples per event data type.
+    _MAXIMUM_NUMBER_OF_SAMPLES = 1024
+
+    # The minimum number of samples per event data type for a dictionary to
+    # be trained.
+    _MINIMUM_NUMBER_OF_SAMPLES = 8
+
+    # The default maximum size of a dictionary, in bytes.
+    DEFAULT_MAXIMUM_DICTIONARY_SIZE = 2048
+
+    def __init__(self):
+        """Initializes a compression dictionary trainer."""
+        super().__init__()
+        self._samples_per_data_type = collections.defaultdict(list)
+
+    def _TrainDictionary(self, samples, maximum_size):
+        """Trains a compression dictionary.
+
+        Args:
+          samples (list[bytes]): sample data.
+          maximum_size (int): maximum size of the dictionary, in bytes.
+
+        Returns:
+          bytes: compression dictionary.
+        """
+        sequence_counter = collections.Counter()
+        for sample in samples:
+            sequence_counter.update(
+                {
+                    sample[offset : offset + self._SEQUENCE_SIZE]
+                    for offset in range(len(sample) - self._SEQUENCE_SIZE + 1)
+                }
+            )
+
+        segment_scores = {}
+        for sample in samples:
+            for segment_offset in range(0, len(sample), self._SEGMENT_SIZE):
+                segment = sample[segment_offset : segment_offset + self._SEGMENT_SIZE]
+                if segment in segment_scores:
+                    continue
+
+                score = 0
+                for offset in range(len(segment) - self._SEQUENCE_SIZE + 1):
+                    number_of_samples = sequence_counter[
+                        segment[offset : offset + self._SEQUENCE_SIZE]
+                    ]
+                    if number_of_samples > 1:
+                        score += number_of_samples
+
+                segment_scores[segment] = score
+
+        segments = []
+        dictionary_size = 0
+        for segment, score in sorted(
+            segment_scores.items(), key=lambda item: item[1], reverse=True
+        ):
+            if score == 0 or dictionary_size >= maximum_size:
+                break
+
+            if dictionary_size + len(segment) <= maximum_size:
+                segments.append(segment)
+                dictionary_size += len(segment)
+
+        return b"".join(reversed(segments))
+
+    def AddSample(self, data_type, data):
+        """Adds sample data.
+
+        Args:
+          data_type (str): event data type.
+          data (bytes): serialized event data.
+        """
+        samples = self._samples_per_data_type[data_type]
+        if len(samples) < self._MAXIMUM_NUMBER_OF_SAMPLES:
+            samples.append(data)
+
+    def Train(self, maximum_size=DEFAULT_MAXIMUM_DICTIONARY_SIZE):
+        """Trains compression dictionaries.
+
+        Args:
+          maximum_size (Optional[int]): maximum size of a dictionary, in bytes.
+
+        Returns:
+          dict[str, bytes]: compression dictionaries per event data type.
+              Event data types with too few samples have no dictionary.
+        """
+        compression_dictionaries = {}
+        for data_type, samples in sorted(self._samples_per_data_type.items()):
+            if len(samples) < self._MINIMUM_NUMBER_OF_SAMPLES:
+                continue
+
+            dictionary = self._TrainDictionary(samples, maximum_size)
+            if dictionary:
+                compression_dictionaries[data_type] = dictionary
+
+        return compression_dictionaries
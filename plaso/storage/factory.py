@@ -31,6 +31,11 @@ class StorageFactory:
         if storage_format == definitions.STORAGE_FORMAT_SQLITE:
             return sqlite_file.SQLiteStorageFile()
 
+        if storage_format == definitions.STORAGE_FORMAT_SQLITE_SHARDED:
+            storage_file = sqlite_file.SQLiteStorageFile()
+            storage_file.event_shard_period = definitions.EVENT_SHARD_PERIOD_MONTH
+            return storage_file
+
         return None
 
     @classmethod
@@ -63,6 +68,11 @@ class StorageFactory:
         if storage_format == definitions.STORAGE_FORMAT_SQLITE:
             return sqlite_writer.SQLiteStorageWriter()
 
+        if storage_format == definitions.STORAGE_FORMAT_SQLITE_SHARDED:
+            return sqlite_writer.SQLiteStorageWriter(
+                event_shard_period=definitions.EVENT_SHARD_PERIOD_MONTH
+            )
+
         if storage_format == definitions.STORAGE_FORMAT_REDIS and redis_writer:
             return redis_writer.RedisStorageWriter()
 
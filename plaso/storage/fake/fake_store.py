@@ -14,6 +14,8 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
     """
 
     _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
+    _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+    _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
 
     def __init__(self):
         """Initializes a fake (in-memory only) store."""
@@ -53,6 +55,35 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
 
         return iter(sorted_events.PopEvents())
 
+    def GetSortedEventTriples(self, time_range=None, event_filter=None):
+        """Retrieves the events, event data and event data streams.
+
+        Args:
+          time_range (Optional[TimeRange]): time range used to filter events
+              that fall in a specific period.
+          event_filter (Optional[EventObjectFilter]): This argument is ignored by
+              the fake store, all events are returned.
+
+        Yields:
+          tuple[EventObject, EventData, EventDataStream]: event, event data and
+              event data stream, where the event data stream is None if not set.
+        """
+        for event in self.GetSortedEvents(time_range=time_range):
+            event_data_identifier = event.GetEventDataIdentifier()
+            event_data = self.GetAttributeContainerByIdentifier(
+                self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier
+            )
+
+            event_data_stream = None
+
+            event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+            if event_data_stream_identifier:
+                event_data_stream = self.GetAttributeContainerByIdentifier(
+                    self._CONTAINER_TYPE_EVENT_DATA_STREAM, event_data_stream_identifier
+                )
+
+            yield event, event_data, event_data_stream
+
     def SetSerializersProfiler(self, serializers_profiler):
         """Sets the serializers profiler.
 
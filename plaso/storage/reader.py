@@ -2,6 +2,8 @@
 
 import collections
 
+from acstore.containers import interface as containers_interface
+
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.storage import logger
@@ -16,6 +18,7 @@ class StorageReader:
     def __init__(self):
         """Initializes a storage reader."""
         super().__init__()
+        self._event_tag_sequence_numbers = None
         self._serializers_profiler = None
         self._storage_profiler = None
         self._store = None
@@ -29,11 +32,39 @@ class StorageReader:
         """Make usable with "with" statement."""
         self.Close()
 
+    def _ReadEventTagSequenceNumbers(self):
+        """Reads the sequence numbers of the event tags per event.
+
+        Only the sequence numbers are kept in memory, where the event tag itself
+        is read when an event with an event tag is looked up.
+        """
+        self._event_tag_sequence_numbers = {}
+
+        if not self.HasAttributeContainers(self._CONTAINER_TYPE_EVENT_TAG):
+            return
+
+        for event_tag in self.GetAttributeContainers(self._CONTAINER_TYPE_EVENT_TAG):
+            event_identifier = event_tag.GetEventIdentifier()
+            if not event_identifier:
+                continue
+
+            event_sequence_number = event_identifier.sequence_number
+            if event_sequence_number in self._event_tag_sequence_numbers:
+                logger.warning("More than 1 event tag returned.")
+                continue
+
+            event_tag_identifier = event_tag.GetIdentifier()
+            self._event_tag_sequence_numbers[event_sequence_number] = (
+                event_tag_identifier.sequence_number
+            )
+
     def Close(self):
         """Closes the storage reader."""
         self._store.Close()
         self._store = None
 
+        self._event_tag_sequence_numbers = None
+
     def GetAttributeContainerByIdentifier(self, container_type, identifier):
         """Retrieves a specific type of container with a specific identifier.
 
@@ -110,6 +141,9 @@ class StorageReader:
     def GetEventTagByEventIdentifer(self, event_identifier):
         """Retrieves the event tag of a specific event.
 
+        The event tags are looked up in an in-memory map, that is read the first
+        time this function is called, to prevent a query per event.
+
         Args:
           event_identifier (AttributeContainerIdentifier): event attribute
               container identifier.
@@ -117,21 +151,62 @@ class StorageReader:
         Returns:
           EventTag: event tag or None if the event has no event tag.
         """
-        lookup_key = event_identifier.CopyToString()
+        if self._event_tag_sequence_numbers is None:
+            self._ReadEventTagSequenceNumbers()
 
-        event_tags = list(
-            self.GetAttributeContainers(
-                self._CONTAINER_TYPE_EVENT_TAG,
-                filter_expression=f'_event_identifier == "{lookup_key:s}"',
-            )
+        if not self._event_tag_sequence_numbers:
+            return None
+
+        event_tag_sequence_number = self._event_tag_sequence_numbers.get(
+            event_identifier.sequence_number, None
         )
-        if not event_tags:
+        if event_tag_sequence_number is None:
             return None
 
-        if len(event_tags) > 1:
-            logger.warning("More than 1 event tag returned.")
+        event_tag_identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT_TAG,
+            sequence_number=event_tag_sequence_number,
+        )
+        return self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_TAG, event_tag_identifier
+        )
 
-        return event_tags[0]
+    def GetEventShardPeriod(self):
+        """Retrieves the event shard period of the underlying storage file.
+
+        Returns:
+          str: period of the time-bucketed tables the events are stored in or
+              None if the events are not stored in shards.
+        """
+        return getattr(self._store, "event_shard_period", None)
+
+    def GetEventTimestampBoundaries(self, number_of_events):
+        """Retrieves timestamps that split the events into similar sized groups.
+
+        Args:
+          number_of_events (int): number of events per group.
+
+        Returns:
+          list[int]: timestamp of the first event of every group, followed by
+              the timestamp of the last event, sorted by time.
+        """
+        get_timestamp_boundaries = getattr(
+            self._store, "GetEventTimestampBoundaries", None
+        )
+        if get_timestamp_boundaries:
+            return get_timestamp_boundaries(number_of_events)
+
+        timestamps = []
+        last_timestamp = None
+        for event_index, event in enumerate(self._store.GetSortedEvents()):
+            if event_index % number_of_events == 0:
+                timestamps.append(event.timestamp)
+            last_timestamp = event.timestamp
+
+        if last_timestamp is not None:
+            timestamps.append(last_timestamp)
+
+        return timestamps
 
     def GetFormatVersion(self):
         """Retrieves the format version of the underlying storage file.
@@ -199,6 +274,46 @@ class StorageReader:
         """
         return self._store.GetSortedEvents(time_range=time_range)
 
+    def GetSortedEventTriples(self, time_range=None, event_filter=None):
+        """Retrieves the events, event data and event data streams.
+
+        The events are returned in increasing chronological order together with
+        their event data and event data stream, which prevents having to look up
+        the event data and event data stream of every event separately.
+
+        Args:
+          time_range (Optional[TimeRange]): time range used to filter events
+              that fall in a specific period.
+          event_filter (Optional[EventObjectFilter]): event filter the store can
+              use to skip events that cannot match the filter. The events that
+              are returned still need to be matched against the filter.
+
+        Returns:
+          generator(tuple[EventObject, EventData, EventDataStream]): event, event
+              data and event data stream generator, where the event data stream
+              is None if not set.
+        """
+        return self._store.GetSortedEventTriples(
+            time_range=time_range, event_filter=event_filter
+        )
+
+    def GetWarningsCounters(self):
+        """Retrieves the warnings counters.
+
+        Returns:
+          dict[str, collections.Counter]: warnings counters per counter name,
+              such as "extraction_warnings_by_parser_chain".
+        """
+        warnings_counters = {}
+        if self.HasAttributeContainers("warning_count"):
+            for warning_count in self.GetAttributeContainers("warning_count"):
+                warnings_counter = warnings_counters.setdefault(
+                    warning_count.counter_name, collections.Counter()
+                )
+                warnings_counter[warning_count.name] = warning_count
+
+        return warnings_counters
+
     def HasAttributeContainers(self, container_type):
         """Determines if a store contains a specific type of attribute container.
 
@@ -598,6 +598,38 @@ class RedisAttributeContainerStore(BaseRedisAttributeContainerStore):
                 self._CONTAINER_TYPE_EVENT, identifier
             )
 
+    def GetSortedEventTriples(self, time_range=None, event_filter=None):
+        """Retrieves the events, event data and event data streams.
+
+        Args:
+          time_range (Optional[TimeRange]): This argument is not supported by the
+              Redis store.
+          event_filter (Optional[EventObjectFilter]): This argument is ignored by
+              the Redis store, all events are returned.
+
+        Yields:
+          tuple[EventObject, EventData, EventDataStream]: event, event data and
+              event data stream, where the event data stream is None if not set.
+
+        Raises:
+          RuntimeError: if a time_range argument is specified.
+        """
+        for event in self.GetSortedEvents(time_range=time_range):
+            event_data_identifier = event.GetEventDataIdentifier()
+            event_data = self.GetAttributeContainerByIdentifier(
+                self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier
+            )
+
+            event_data_stream = None
+
+            event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+            if event_data_stream_identifier:
+                event_data_stream = self.GetAttributeContainerByIdentifier(
+                    self._CONTAINER_TYPE_EVENT_DATA_STREAM, event_data_stream_identifier
+                )
+
+            yield event, event_data, event_data_stream
+
     def SetSerializersProfiler(self, serializers_profiler):
         """Sets the serializers profiler.
 
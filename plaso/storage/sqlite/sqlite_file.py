@@ -1,26 +1,148 @@
 """SQLite-based storage file."""
 
 import ast
+import bisect
+import collections
+import datetime
+import heapq
 import json
+import operator
 import sqlite3
-import zlib
+import struct
 
 from acstore import sqlite_store
 from acstore.containers import interface as containers_interface
 
 from plaso.containers import events
 from plaso.lib import definitions
+from plaso.serializer import binary_serializer
 from plaso.serializer import json_serializer
+from plaso.storage import compression
+
+
+class _EventShardIndex:
+    """Index of the event shard tables by event sequence number.
+
+    Consecutive sequence numbers of events that are stored in the same event
+    shard table are indexed as a single range, since events are typically added
+    in batches with similar timestamps.
+    """
+
+    def __init__(self):
+        """Initializes an event shard index."""
+        super().__init__()
+        # Ranges of sequence numbers as a list of first sequence number, last
+        # sequence number and event shard table name, sorted by first sequence
+        # number.
+        self._ranges = []
+        self._ranges_first_sequence_number = []
+
+    def _GetRangeIndex(self, sequence_number):
+        """Retrieves the index of the range that contains a sequence number.
+
+        Args:
+          sequence_number (int): event sequence number.
+
+        Returns:
+          int: index of the range or None if not available.
+        """
+        range_index = (
+            bisect.bisect_right(self._ranges_first_sequence_number, sequence_number) - 1
+        )
+        if range_index < 0 or sequence_number > self._ranges[range_index][1]:
+            return None
+
+        return range_index
+
+    def AddSequenceNumber(self, sequence_number, shard_name):
+        """Adds a sequence number that is larger than the indexed sequence numbers.
+
+        Args:
+          sequence_number (int): event sequence number.
+          shard_name (str): name of the event shard table that contains the event.
+        """
+        if self._ranges:
+            last_range = self._ranges[-1]
+            if last_range[2] == shard_name and last_range[1] + 1 == sequence_number:
+                last_range[1] = sequence_number
+                return
+
+        self._ranges.append([sequence_number, sequence_number, shard_name])
+        self._ranges_first_sequence_number.append(sequence_number)
+
+    def GetShardName(self, sequence_number):
+        """Retrieves the name of the event shard table of a sequence number.
+
+        Args:
+          sequence_number (int): event sequence number.
+
+        Returns:
+          str: name of the event shard table that contains the event or None if
+              not available.
+        """
+        range_index = self._GetRangeIndex(sequence_number)
+        if range_index is None:
+            return None
+
+        return self._ranges[range_index][2]
+
+    def SetShardName(self, sequence_number, shard_name):
+        """Sets the name of the event shard table of a sequence number.
+
+        Args:
+          sequence_number (int): event sequence number.
+          shard_name (str): name of the event shard table that contains the event.
+        """
+        range_index = self._GetRangeIndex(sequence_number)
+        if range_index is None:
+            range_index = bisect.bisect_right(
+                self._ranges_first_sequence_number, sequence_number
+            )
+            ranges = [[sequence_number, sequence_number, shard_name]]
+            number_of_replaced_ranges = 0
+
+        else:
+            first_sequence_number, last_sequence_number, range_shard_name = (
+                self._ranges[range_index]
+            )
+            if range_shard_name == shard_name:
+                return
+
+            ranges = []
+            if first_sequence_number < sequence_number:
+                ranges.append(
+                    [first_sequence_number, sequence_number - 1, range_shard_name]
+                )
+
+            ranges.append([sequence_number, sequence_number, shard_name])
+
+            if sequence_number < last_sequence_number:
+                ranges.append(
+                    [sequence_number + 1, last_sequence_number, range_shard_name]
+                )
+
+            number_of_replaced_ranges = 1
+
+        range_end_index = range_index + number_of_replaced_ranges
+        self._ranges[range_index:range_end_index] = ranges
+        self._ranges_first_sequence_number[range_index:range_end_index] = [
+            first_sequence_number for first_sequence_number, _, _ in ranges
+        ]
 
 
 class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     """SQLite-based storage file.
 
     Attributes:
+      compression_dictionaries (dict[str, bytes]): preset compression
+          dictionaries per event data type.
       compression_format (str): compression format.
+      event_data_serialization_format (str): serialization format of event data.
+      event_shard_period (str): period of the time-bucketed tables the events
+          are stored in, where None represents a single event table.
     """
 
-    _FORMAT_VERSION = 20260516
+    _FORMAT_VERSION = 20261016
 
     # The earliest format version, stored in-file, that this class
     # is able to append (write).
@@ -28,7 +150,7 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     # The earliest format version, stored in-file, that this class
     # is able to upgrade (write new format features).
-    _UPGRADE_COMPATIBLE_FORMAT_VERSION = 20260516
+    _UPGRADE_COMPATIBLE_FORMAT_VERSION = 20261016
 
     # The earliest format version, stored in-file, that this class
     # is able to read.
@@ -36,15 +158,71 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
     _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+    _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
     _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+    # The maximum number of cached event data streams of the sorted event
+    # triples.
+    _MAXIMUM_CACHED_EVENT_DATA_STREAMS = 1024
+
+    # The number of rows of the sorted event triples that are fetched at once.
+    _SORTED_EVENT_TRIPLES_BATCH_SIZE = 1024
+
+    _CREATE_EVENT_DATA_SCHEMA_TABLE_QUERY = (
+        "CREATE TABLE event_data_schema (_identifier INTEGER PRIMARY KEY, "
+        "data_type TEXT, attribute_names TEXT);"
+    )
+
+    # Event data attributes that are stored in indexed columns next to
+    # the serialized event data, so that events can be filtered by SQL.
+    _EVENT_DATA_INDEXED_COLUMNS = ("_parser_chain", "data_type")
+
+    _CREATE_EVENT_SHARD_TABLE_QUERY = (
+        "CREATE TABLE event_shard (_identifier INTEGER PRIMARY KEY, name TEXT, "
+        "start_timestamp BIGINT, end_timestamp BIGINT);"
+    )
+
+    _INSERT_EVENT_SHARD_QUERY = (
+        "INSERT INTO event_shard (name, start_timestamp, end_timestamp) "
+        "VALUES (?, ?, ?)"
+    )
+
+    # The range of timestamps that can be represented by a Python datetime
+    # object. Events outside this range are stored in the first or last shard.
+    _MAXIMUM_SHARD_TIMESTAMP = 253402300799999999
+    _MINIMUM_SHARD_TIMESTAMP = -62135596800000000
+
+    _POSIX_EPOCH = datetime.datetime(1970, 1, 1)
+
+    _INSERT_EVENT_DATA_SCHEMA_QUERY = (
+        "INSERT INTO event_data_schema (_identifier, data_type, attribute_names) "
+        "VALUES (?, ?, ?)"
+    )
+
+    # Compressed event data in a storage file with compression dictionaries
+    # is prefixed with the index of the dictionary, where 0 represents no
+    # dictionary.
+    _STRUCT_COMPRESSION_DICTIONARY_INDEX = struct.Struct("<H")
+
     def __init__(self):
         """Initializes a SQLite-based storage file."""
         super().__init__()
+        self._column_names_per_table = None
+        self._compression_dictionaries_by_index = []
+        self._compression_dictionary_indexes = {}
+        self._event_data_has_indexed_columns = False
+        self._event_data_serializer = None
+        self._event_shard_index = None
+        self._event_shards = {}
+        self._last_event_shard = None
+        self._number_of_written_event_data_schemas = 0
         self._serializer = json_serializer.JSONAttributeContainerSerializer
         self._serializers_profiler = None
 
-        self.compression_format = definitions.COMPRESSION_FORMAT_ZLIB
+        self.compression_dictionaries = {}
+        self.compression_format = definitions.DEFAULT_COMPRESSION_FORMAT
+        self.event_data_serialization_format = definitions.SERIALIZER_FORMAT_BINARY
+        self.event_shard_period = None
 
     def _CheckStorageMetadata(self, metadata_values, check_readable_only=False):
         """Checks the storage metadata.
@@ -65,6 +243,90 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
         if compression_format not in definitions.COMPRESSION_FORMATS:
             raise OSError(f"Unsupported compression format: {compression_format!s}")
 
+        if (
+            "compression_dictionaries" in metadata_values
+            and compression_format
+            not in definitions.COMPRESSION_FORMATS_WITH_DICTIONARY
+        ):
+            raise OSError(
+                f"Unsupported compression dictionaries for compression format: "
+                f"{compression_format!s}"
+            )
+
+        # Storage files without an event data serialization format store event
+        # data in the JSON serialization format.
+        event_data_serialization_format = metadata_values.get(
+            "event_data_serialization_format", definitions.SERIALIZER_FORMAT_JSON
+        )
+        if (
+            event_data_serialization_format
+            not in definitions.EVENT_DATA_SERIALIZER_FORMATS
+        ):
+            raise OSError(
+                f"Unsupported event data serialization format: "
+                f"{event_data_serialization_format!s}"
+            )
+
+        event_shard_period = metadata_values.get("event_shard_period", None)
+        if (
+            event_shard_period is not None
+            and event_shard_period not in definitions.EVENT_SHARD_PERIODS
+        ):
+            raise OSError(f"Unsupported event shard period: {event_shard_period!s}")
+
+    def _CommitWriteCache(self, container_type):
+        """Commits the write cache for a specific type of attribute container.
+
+        Args:
+          container_type (str): attribute container type.
+        """
+        if container_type == self._CONTAINER_TYPE_EVENT and self.event_shard_period:
+            for shard_name in self._event_shards.keys():
+                super()._CommitWriteCache(shard_name)
+        else:
+            super()._CommitWriteCache(container_type)
+
+    def _CompressData(self, container, serialized_data):
+        """Compresses serialized attribute container data.
+
+        Args:
+          container (AttributeContainer): attribute container.
+          serialized_data (bytes): serialized attribute container data.
+
+        Returns:
+          bytes: compressed attribute container data.
+
+        Raises:
+          OSError: if the data cannot be compressed.
+        """
+        dictionary = None
+        dictionary_index = None
+        if (
+            self._compression_dictionaries_by_index
+            and container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA
+        ):
+            dictionary_index = self._compression_dictionary_indexes.get(
+                container.data_type, 0
+            )
+            dictionary = self._compression_dictionaries_by_index[dictionary_index]
+
+        try:
+            compressed_data = compression.StorageCompression.Compress(
+                self.compression_format, serialized_data, dictionary=dictionary
+            )
+        except ValueError as exception:
+            raise OSError(f"Unable to compress data with error: {exception!s}")
+
+        if dictionary_index is not None:
+            compressed_data = b"".join(
+                [
+                    self._STRUCT_COMPRESSION_DICTIONARY_INDEX.pack(dictionary_index),
+                    compressed_data,
+                ]
+            )
+
+        return compressed_data
+
     def _CreateAttributeContainerFromRow(
         self, container_type, column_names, row, first_column_index
     ):
@@ -85,9 +347,9 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
                 container_type, column_names, row, first_column_index
             )
 
-        if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+        if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
             compressed_data = row[first_column_index]
-            serialized_data = zlib.decompress(compressed_data)
+            serialized_data = self._DecompressData(container_type, compressed_data)
         else:
             compressed_data = b""
             serialized_data = row[first_column_index]
@@ -117,17 +379,46 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
         if schema and container_type != self._CONTAINER_TYPE_EVENT_DATA:
             super()._CreateAttributeContainerTable(container_type)
         else:
-            if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
+            if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
                 data_column_type = "BLOB"
             else:
                 data_column_type = "TEXT"
 
-            query = (
-                f"CREATE TABLE {container_type:s} (_identifier INTEGER PRIMARY KEY "
-                f"AUTOINCREMENT, _data {data_column_type:s});"
-            )
+            column_definitions = [
+                "_identifier INTEGER PRIMARY KEY AUTOINCREMENT",
+                f"_data {data_column_type:s}",
+            ]
+            if (
+                container_type == self._CONTAINER_TYPE_EVENT_DATA
+                and self._event_data_has_indexed_columns
+            ):
+                column_definitions.extend(
+                    [
+                        f"{column_name:s} TEXT"
+                        for column_name in self._EVENT_DATA_INDEXED_COLUMNS
+                    ]
+                )
+
+            column_definitions = ", ".join(column_definitions)
+            queries = [f"CREATE TABLE {container_type:s} ({column_definitions:s});"]
+
+            if (
+                container_type == self._CONTAINER_TYPE_EVENT_DATA
+                and self._event_data_has_indexed_columns
+            ):
+                queries.extend(
+                    [
+                        (
+                            f"CREATE INDEX event_data_{column_name.lstrip('_'):s} "
+                            f"ON event_data ({column_name:s})"
+                        )
+                        for column_name in self._EVENT_DATA_INDEXED_COLUMNS
+                    ]
+                )
+
             try:
-                self._cursor.execute(query)
+                for query in queries:
+                    self._cursor.execute(query)
             except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
                 raise OSError(f"Unable to query storage file with error: {exception!s}")
 
@@ -138,52 +429,653 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
             except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
                 raise OSError(f"Unable to query storage file with error: {exception!s}")
 
-    def _DeserializeAttributeContainer(self, container_type, serialized_data):
-        """Deserializes an attribute container.
+    def _DecompressData(self, container_type, compressed_data):
+        """Decompresses attribute container data.
+
+        Args:
+          container_type (str): attribute container type.
+          compressed_data (bytes): compressed attribute container data.
+
+        Returns:
+          bytes: serialized attribute container data.
+
+        Raises:
+          OSError: if the data cannot be decompressed.
+        """
+        dictionary = None
+        if (
+            self._compression_dictionaries_by_index
+            and container_type == self._CONTAINER_TYPE_EVENT_DATA
+        ):
+            (dictionary_index,) = self._STRUCT_COMPRESSION_DICTIONARY_INDEX.unpack_from(
+                compressed_data, 0
+            )
+            if dictionary_index >= len(self._compression_dictionaries_by_index):
+                raise OSError(
+                    f"Unsupported compression dictionary: {dictionary_index:d}"
+                )
+
+            dictionary = self._compression_dictionaries_by_index[dictionary_index]
+            compressed_data = compressed_data[
+                self._STRUCT_COMPRESSION_DICTIONARY_INDEX.size :
+            ]
+
+        try:
+            return compression.StorageCompression.Decompress(
+                self.compression_format, compressed_data, dictionary=dictionary
+            )
+        except ValueError as exception:
+            raise OSError(f"Unable to decompress data with error: {exception!s}")
+
+    def _DeserializeAttributeContainer(self, container_type, serialized_data):
+        """Deserializes an attribute container.
+
+        Args:
+          container_type (str): attribute container type.
+          serialized_data (bytes): serialized attribute container data.
+
+        Returns:
+          AttributeContainer: attribute container or None.
+
+        Raises:
+          OSError: if the serialized data cannot be decoded.
+        """
+        if not serialized_data:
+            return None
+
+        if self._serializers_profiler:
+            self._serializers_profiler.StartTiming(container_type)
+
+        try:
+            if (
+                container_type == self._CONTAINER_TYPE_EVENT_DATA
+                and self._event_data_serializer
+            ):
+                container = self._event_data_serializer.ReadSerialized(serialized_data)
+            else:
+                serialized_string = serialized_data.decode("utf-8")
+                container = self._serializer.ReadSerialized(serialized_string)
+
+        except UnicodeDecodeError as exception:
+            raise OSError(f"Unable to decode serialized data with error: {exception!s}")
+
+        except (TypeError, ValueError) as exception:
+            # TODO: consider re-reading attribute container with error correction.
+            raise OSError(f"Unable to read serialized data with error: {exception!s}")
+
+        finally:
+            if self._serializers_profiler:
+                self._serializers_profiler.StopTiming(container_type)
+
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+            serialized_identifier = getattr(
+                container, "_event_data_stream_identifier", None
+            )
+            if isinstance(serialized_identifier, str):
+                event_data_stream_identifier = (
+                    containers_interface.AttributeContainerIdentifier()
+                )
+                event_data_stream_identifier.CopyFromString(serialized_identifier)
+                container.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+        return container
+
+    def _CreateEventShard(self, shard_name, start_timestamp, end_timestamp):
+        """Creates an event shard table and adds it to the manifest.
+
+        Args:
+          shard_name (str): name of the event shard table.
+          start_timestamp (int): first timestamp of the events in the shard.
+          end_timestamp (int): last timestamp of the events in the shard.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
+
+        column_definitions = ["_identifier INTEGER PRIMARY KEY"]
+        for name, data_type in sorted(schema.items()):
+            data_type = self._schema_helper.GetStorageDataType(data_type)
+            column_definitions.append(f"{name:s} {data_type:s}")
+
+        column_definitions = ", ".join(column_definitions)
+
+        try:
+            self._cursor.execute(
+                f"CREATE TABLE {shard_name:s} ({column_definitions:s});"
+            )
+            self._cursor.execute(
+                f"CREATE INDEX {shard_name:s}_timestamp ON {shard_name:s} (timestamp)"
+            )
+            self._cursor.execute(
+                self._INSERT_EVENT_SHARD_QUERY,
+                (shard_name, start_timestamp, end_timestamp),
+            )
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        self._event_shards[shard_name] = (start_timestamp, end_timestamp)
+
+    def _EventDataTableHasIndexedColumns(self):
+        """Determines if the event data table has the indexed columns.
+
+        Storage files written before the indexed columns were introduced only
+        store the serialized event data.
+
+        Returns:
+          bool: True if the event data table has the indexed columns or does
+              not exist yet, False otherwise.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        column_names = self._GetTableColumnNames(self._CONTAINER_TYPE_EVENT_DATA)
+        if column_names is None:
+            return True
+
+        return all(
+            column_name in column_names
+            for column_name in self._EVENT_DATA_INDEXED_COLUMNS
+        )
+
+    def _GetAttributeContainerSchema(self, container_type):
+        """Retrieves the schema of an attribute container.
+
+        Storage files written before an attribute was added to the schema of
+        an attribute container have no column for the attribute, hence the
+        attribute is omitted from the schema used for these storage files.
+
+        Args:
+          container_type (str): attribute container type.
+
+        Returns:
+          dict[str, str]: attribute container schema or an empty dictionary if
+              no schema available.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        schema = super()._GetAttributeContainerSchema(container_type)
+        if (
+            not schema
+            or self._column_names_per_table is None
+            or container_type == self._CONTAINER_TYPE_EVENT_DATA
+        ):
+            return schema
+
+        column_names = self._column_names_per_table.get(container_type, None)
+        if column_names is None:
+            column_names = self._GetTableColumnNames(container_type)
+            if column_names is None:
+                return schema
+
+            self._column_names_per_table[container_type] = column_names
+
+        if column_names.issuperset(schema.keys()):
+            return schema
+
+        return {
+            name: data_type
+            for name, data_type in schema.items()
+            if name in column_names
+        }
+
+    def _GetEventColumnValues(self, event):
+        """Retrieves the column names and values of an event.
+
+        Args:
+          event (EventObject): event.
+
+        Returns:
+          tuple[list[str], list[object]]: column names and values.
+
+        Raises:
+          OSError: if an event attribute cannot be serialized.
+        """
+        schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
+
+        column_names = []
+        values = []
+        for name, data_type in sorted(schema.items()):
+            attribute_value = getattr(event, name, None)
+            try:
+                value = self._schema_helper.SerializeValue(data_type, attribute_value)
+            except OSError:
+                raise OSError(
+                    f"Unsupported event attribute: {name:s} data type: {data_type:s}"
+                )
+
+            column_names.append(name)
+            values.append(value)
+
+        return column_names, values
+
+    def _GetEventShardByTimestamp(self, timestamp):
+        """Retrieves the event shard table of a timestamp.
+
+        The event shard table is created if it does not exist.
+
+        Args:
+          timestamp (int): number of microseconds since January 1, 1970,
+              00:00:00 UTC.
+
+        Returns:
+          str: name of the event shard table.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        timestamp = min(
+            max(timestamp or 0, self._MINIMUM_SHARD_TIMESTAMP),
+            self._MAXIMUM_SHARD_TIMESTAMP,
+        )
+
+        # Events are typically added in batches with similar timestamps.
+        if self._last_event_shard:
+            shard_name, start_timestamp, end_timestamp = self._last_event_shard
+            if start_timestamp <= timestamp <= end_timestamp:
+                return shard_name
+
+        date_time = self._GetShardDateTime(timestamp)
+        start_date_time = datetime.datetime(date_time.year, date_time.month, 1)
+        if date_time.month == 12:
+            if date_time.year < datetime.MAXYEAR:
+                end_date_time = datetime.datetime(date_time.year + 1, 1, 1)
+            else:
+                end_date_time = None
+        else:
+            end_date_time = datetime.datetime(date_time.year, date_time.month + 1, 1)
+
+        start_timestamp = self._GetShardTimestamp(start_date_time)
+        if end_date_time:
+            end_timestamp = self._GetShardTimestamp(end_date_time) - 1
+        else:
+            end_timestamp = self._MAXIMUM_SHARD_TIMESTAMP
+
+        shard_name = f"event_shard_{date_time.year:04d}{date_time.month:02d}"
+        if shard_name not in self._event_shards:
+            self._CreateEventShard(shard_name, start_timestamp, end_timestamp)
+
+        self._last_event_shard = (shard_name, start_timestamp, end_timestamp)
+
+        return shard_name
+
+    def _GetEventShardsInTimeRange(self, time_range=None):
+        """Retrieves the event shard tables that overlap with a time range.
+
+        Args:
+          time_range (Optional[TimeRange]): time range, where None represents
+              all events.
+
+        Returns:
+          list[str]: names of the event shard tables, sorted by time.
+        """
+        shard_names = []
+        for shard_name, (start_timestamp, end_timestamp) in sorted(
+            self._event_shards.items(), key=lambda item: item[1]
+        ):
+            if time_range:
+                if (
+                    time_range.start_timestamp is not None
+                    and end_timestamp < time_range.start_timestamp
+                ):
+                    continue
+
+                if (
+                    time_range.end_timestamp is not None
+                    and start_timestamp > time_range.end_timestamp
+                ):
+                    continue
+
+            shard_names.append(shard_name)
+
+        return shard_names
+
+    def _GetEventTables(self, time_range=None):
+        """Retrieves the tables that contain events.
+
+        Args:
+          time_range (Optional[TimeRange]): time range, where None represents
+              all events.
+
+        Returns:
+          list[str]: names of the tables that contain events, sorted by time.
+        """
+        if not self.event_shard_period:
+            return [self._CONTAINER_TYPE_EVENT]
+
+        return self._GetEventShardsInTimeRange(time_range=time_range)
+
+    def _GetEventByIndex(self, index):
+        """Retrieves a specific event from the event shard tables.
+
+        Args:
+          index (int): event index.
+
+        Returns:
+          EventObject: event or None if not available.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        event = self._GetCachedAttributeContainer(self._CONTAINER_TYPE_EVENT, index)
+        if event:
+            return event
+
+        self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+        schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
+        column_names = sorted(schema.keys())
+        column_names_string = ", ".join(column_names)
+
+        row_number = index + 1
+        event_shard_index = self._GetEventShardIndex()
+        shard_name = event_shard_index.GetShardName(row_number)
+        if not shard_name:
+            return None
+
+        query = (
+            f"SELECT {column_names_string:s} FROM {shard_name:s} "
+            f"WHERE _identifier = {row_number:d}"
+        )
+        try:
+            self._cursor.execute(query)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        row = self._cursor.fetchone()
+        if not row:
+            return None
+
+        event = self._CreateAttributeContainerFromRow(
+            self._CONTAINER_TYPE_EVENT, column_names, row, 0
+        )
+        identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT, sequence_number=row_number
+        )
+        event.SetIdentifier(identifier)
+
+        self._CacheAttributeContainerByIndex(event, index)
+        return event
+
+    def _GetEventShardIndex(self):
+        """Retrieves the index of the event shard tables by sequence number.
+
+        The index is built from the identifiers of the events in the event shard
+        tables the first time it is needed and is updated as events are written.
+
+        Returns:
+          _EventShardIndex: event shard index.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        if self._event_shard_index is None:
+            self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+            queries = [
+                (
+                    f"SELECT _identifier, '{shard_name:s}' FROM {shard_name:s} "
+                    f"ORDER BY _identifier"
+                )
+                for shard_name in self._event_shards.keys()
+            ]
+
+            event_shard_index = _EventShardIndex()
+            for sequence_number, shard_name in self._GetSortedRows(
+                queries, operator.itemgetter(0), "get_event_shard_index"
+            ):
+                event_shard_index.AddSequenceNumber(sequence_number, shard_name)
+
+            self._event_shard_index = event_shard_index
+
+        return self._event_shard_index
+
+    def _GetEventsFromShards(
+        self, filter_expression=None, order_by_timestamp=False, time_range=None
+    ):
+        """Retrieves events from the event shard tables.
+
+        Args:
+          filter_expression (Optional[str]): SQL expression to filter events by.
+          order_by_timestamp (Optional[bool]): True if the events should be
+              returned in chronological order, otherwise the events are
+              returned in order of addition.
+          time_range (Optional[TimeRange]): time range used to select the event
+              shard tables.
+
+        Yields:
+          EventObject: event.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+        schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
+        column_names = sorted(schema.keys())
+        column_names_string = ", ".join(column_names)
+
+        if order_by_timestamp:
+            order_by = "timestamp, _identifier"
+            timestamp_column_index = column_names.index("timestamp") + 1
+            sort_key = operator.itemgetter(timestamp_column_index, 0)
+        else:
+            order_by = "_identifier"
+            sort_key = operator.itemgetter(0)
+
+        queries = []
+        for shard_name in self._GetEventShardsInTimeRange(time_range=time_range):
+            query = f"SELECT _identifier, {column_names_string:s} FROM {shard_name:s}"
+            if filter_expression:
+                query = f"{query:s} WHERE {filter_expression:s}"
+
+            queries.append(f"{query:s} ORDER BY {order_by:s}")
+
+        for row in self._GetSortedRows(queries, sort_key, "get_containers"):
+            event = self._CreateAttributeContainerFromRow(
+                self._CONTAINER_TYPE_EVENT, column_names, row, 1
+            )
+            identifier = containers_interface.AttributeContainerIdentifier(
+                name=self._CONTAINER_TYPE_EVENT, sequence_number=row[0]
+            )
+            event.SetIdentifier(identifier)
+
+            yield event
+
+    def _GetEventFilterAttributeExpressions(self):
+        """Retrieves the SQL expressions of the event attributes to filter on.
+
+        Returns:
+          dict[str, str]: SQL expressions per event attribute name, of the
+              GetSortedEventTriples query.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        attribute_expressions = {"timestamp": "event.timestamp"}
+
+        if self._event_data_has_indexed_columns:
+            for column_name in self._EVENT_DATA_INDEXED_COLUMNS:
+                attribute_expressions[column_name] = f"event_data.{column_name:s}"
+
+        if self._HasTable(self._CONTAINER_TYPE_EVENT_TAG):
+            # The event identifier is stored as "event.#", where # is the sequence
+            # number, which is the row identifier of the event. The labels of all
+            # event tags of the event are concatenated.
+            attribute_expressions["tag"] = (
+                "(SELECT GROUP_CONCAT(event_tag.labels) FROM event_tag WHERE "
+                "event_tag._event_identifier = 'event.' || event._identifier)"
+            )
+
+        return attribute_expressions
+
+    def _GetNumberOfAttributeContainerRows(self, container_type):
+        """Retrieves the number of attribute container rows.
+
+        Args:
+          container_type (str): attribute container type.
+
+        Returns:
+          int: the number of rows of a specified attribute container type.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        if container_type != self._CONTAINER_TYPE_EVENT or not self.event_shard_period:
+            return super()._GetNumberOfAttributeContainerRows(container_type)
+
+        self._CommitWriteCache(container_type)
+
+        # The identifiers of events are unique across the event shard tables.
+        number_of_rows = 0
+        for shard_name in self._event_shards.keys():
+            query = f"SELECT MAX(_identifier) FROM {shard_name:s}"
+            try:
+                self._cursor.execute(query)
+            except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+            row = self._cursor.fetchone()
+            if row and row[0]:
+                number_of_rows = max(number_of_rows, row[0])
+
+        return number_of_rows
+
+    def _GetTableColumnNames(self, table_name):
+        """Retrieves the names of the columns of a table.
+
+        Args:
+          table_name (str): name of the table.
+
+        Returns:
+          set[str]: names of the columns or None if the table does not exist.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        if not self._HasTable(table_name):
+            return None
+
+        query = f"PRAGMA table_info({table_name:s})"
+        try:
+            self._cursor.execute(query)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        return {row[1] for row in self._cursor.fetchall()}
+
+    def _GetShardDateTime(self, timestamp):
+        """Retrieves the date and time of a timestamp to determine its shard.
 
         Args:
-          container_type (str): attribute container type.
-          serialized_data (bytes): serialized attribute container data.
+          timestamp (int): number of microseconds since January 1, 1970,
+              00:00:00 UTC, within the range supported by shards.
 
         Returns:
-          AttributeContainer: attribute container or None.
+          datetime.datetime: date and time.
+        """
+        return self._POSIX_EPOCH + datetime.timedelta(microseconds=timestamp)
+
+    def _GetShardTimestamp(self, date_time):
+        """Retrieves the timestamp of a date and time of a shard boundary.
+
+        Args:
+          date_time (datetime.datetime): date and time.
+
+        Returns:
+          int: number of microseconds since January 1, 1970, 00:00:00 UTC.
+        """
+        time_delta = date_time - self._POSIX_EPOCH
+        return (
+            (time_delta.days * 86400 + time_delta.seconds) * 1000000
+        ) + time_delta.microseconds
+
+    def _GetSortedRows(self, queries, sort_key, profiling_name):
+        """Retrieves the rows of queries merged in sorted order.
+
+        Every query must return its rows sorted by the sort key, for example
+        one query per event shard table.
+
+        Args:
+          queries (list[str]): queries.
+          sort_key (function): function that returns the sort key of a row.
+          profiling_name (str): name of the storage profiling measurement.
+
+        Yields:
+          tuple[object]: row.
 
         Raises:
-          OSError: if the serialized data cannot be decoded.
+          OSError: when there is an error querying the storage file.
         """
-        if not serialized_data:
-            return None
+        row_generators = [
+            self._GetRowsOfQuery(query, profiling_name) for query in queries
+        ]
+        if len(row_generators) == 1:
+            yield from row_generators[0]
+        else:
+            yield from heapq.merge(*row_generators, key=sort_key)
 
-        if self._serializers_profiler:
-            self._serializers_profiler.StartTiming(container_type)
+    def _GetRowsOfQuery(self, query, profiling_name):
+        """Retrieves the rows of a query in batches.
+
+        Args:
+          query (str): query.
+          profiling_name (str): name of the storage profiling measurement.
+
+        Yields:
+          tuple[object]: row.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        # Use a local cursor to prevent another query interrupting the generator.
+        cursor = self._connection.cursor()
 
         try:
-            serialized_string = serialized_data.decode("utf-8")
-            container = self._serializer.ReadSerialized(serialized_string)
+            cursor.execute(query)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(f"Unable to query storage file with error: {exception!s}")
 
-        except UnicodeDecodeError as exception:
-            raise OSError(f"Unable to decode serialized data with error: {exception!s}")
+        while True:
+            if self._storage_profiler:
+                self._storage_profiler.StartTiming(profiling_name)
 
-        except (TypeError, ValueError) as exception:
-            # TODO: consider re-reading attribute container with error correction.
-            raise OSError(f"Unable to read serialized data with error: {exception!s}")
+            try:
+                rows = cursor.fetchmany(self._SORTED_EVENT_TRIPLES_BATCH_SIZE)
 
-        finally:
-            if self._serializers_profiler:
-                self._serializers_profiler.StopTiming(container_type)
+            finally:
+                if self._storage_profiler:
+                    self._storage_profiler.StopTiming(profiling_name)
 
-        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
-            serialized_identifier = getattr(
-                container, "_event_data_stream_identifier", None
+            if not rows:
+                break
+
+            yield from rows
+
+    def _ReadEventDataSchemas(self):
+        """Reads the event data schemas of the binary serialization format.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        query = (
+            "SELECT data_type, attribute_names FROM event_data_schema "
+            "ORDER BY _identifier"
+        )
+        try:
+            self._cursor.execute(query)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        for data_type, attribute_names in self._cursor.fetchall():
+            self._event_data_serializer.AddSchema(
+                data_type, json.loads(attribute_names)
             )
-            if serialized_identifier:
-                event_data_stream_identifier = (
-                    containers_interface.AttributeContainerIdentifier()
-                )
-                event_data_stream_identifier.CopyFromString(serialized_identifier)
-                container.SetEventDataStreamIdentifier(event_data_stream_identifier)
 
-        return container
+        self._number_of_written_event_data_schemas = len(
+            self._event_data_serializer.schemas
+        )
 
     def _ReadAndCheckStorageMetadata(self, check_readable_only=False):
         """Reads storage metadata and checks that the values are valid.
@@ -203,8 +1095,76 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
         )
         self.format_version = metadata_values["format_version"]
         self.compression_format = metadata_values["compression_format"]
+
+        self.compression_dictionaries = {}
+        serialized_dictionaries = metadata_values.get("compression_dictionaries", None)
+        if serialized_dictionaries:
+            try:
+                self.compression_dictionaries = (
+                    compression.CompressionDictionariesSerializer.ReadSerialized(
+                        serialized_dictionaries
+                    )
+                )
+            except ValueError as exception:
+                raise OSError(
+                    f"Unable to read compression dictionaries with error: "
+                    f"{exception!s}"
+                )
+
+        self._SetCompressionDictionaries()
+
+        self.event_data_serialization_format = metadata_values.get(
+            "event_data_serialization_format", definitions.SERIALIZER_FORMAT_JSON
+        )
         self.serialization_format = metadata_values["serialization_format"]
 
+        self._event_data_serializer = None
+        if self.event_data_serialization_format == (
+            definitions.SERIALIZER_FORMAT_BINARY
+        ):
+            self._event_data_serializer = binary_serializer.BinaryEventDataSerializer()
+            self._ReadEventDataSchemas()
+
+        self._column_names_per_table = {}
+        self._event_data_has_indexed_columns = self._EventDataTableHasIndexedColumns()
+
+        self.event_shard_period = metadata_values.get("event_shard_period", None)
+
+        self._event_shard_index = None
+        self._event_shards = {}
+        self._last_event_shard = None
+        if self.event_shard_period:
+            self._ReadEventShards()
+
+    def _ReadEventShards(self):
+        """Reads the event shards from the manifest.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        query = "SELECT name, start_timestamp, end_timestamp FROM event_shard"
+        try:
+            self._cursor.execute(query)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        for shard_name, start_timestamp, end_timestamp in self._cursor.fetchall():
+            self._event_shards[shard_name] = (start_timestamp, end_timestamp)
+
+    def _SetCompressionDictionaries(self):
+        """Sets the compression dictionaries to look up by index."""
+        self._compression_dictionaries_by_index = []
+        self._compression_dictionary_indexes = {}
+
+        if self.compression_dictionaries:
+            self._compression_dictionaries_by_index.append(None)
+
+            for data_type, dictionary in sorted(self.compression_dictionaries.items()):
+                self._compression_dictionary_indexes[data_type] = len(
+                    self._compression_dictionaries_by_index
+                )
+                self._compression_dictionaries_by_index.append(dictionary)
+
     def _SerializeAttributeContainer(self, container):
         """Serializes an attribute container.
 
@@ -221,6 +1181,12 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
             self._serializers_profiler.StartTiming(container.CONTAINER_TYPE)
 
         try:
+            if (
+                container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA
+                and self._event_data_serializer
+            ):
+                return self._event_data_serializer.WriteSerialized(container)
+
             json_dict = self._serializer.WriteSerializedDict(container)
 
             if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
@@ -252,6 +1218,27 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
         return serialized_string
 
+    def _WriteEventDataSchemas(self):
+        """Writes new event data schemas of the binary serialization format.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        schemas = self._event_data_serializer.schemas
+        for schema_identifier in range(
+            self._number_of_written_event_data_schemas, len(schemas)
+        ):
+            data_type, attribute_names = schemas[schema_identifier]
+            try:
+                self._cursor.execute(
+                    self._INSERT_EVENT_DATA_SCHEMA_QUERY,
+                    (schema_identifier, data_type, json.dumps(attribute_names)),
+                )
+            except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        self._number_of_written_event_data_schemas = len(schemas)
+
     def _WriteMetadata(self):
         """Writes metadata.
 
@@ -266,10 +1253,120 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
                 f"{exception!s}"
             )
 
+        if (
+            self.compression_dictionaries
+            and self.compression_format
+            not in definitions.COMPRESSION_FORMATS_WITH_DICTIONARY
+        ):
+            raise OSError(
+                f"Unsupported compression dictionaries for compression format: "
+                f"{self.compression_format:s}"
+            )
+
         self._WriteMetadataValue("format_version", f"{self._FORMAT_VERSION:d}")
         self._WriteMetadataValue("compression_format", self.compression_format)
+
+        if self.compression_dictionaries:
+            self._WriteMetadataValue(
+                "compression_dictionaries",
+                compression.CompressionDictionariesSerializer.WriteSerialized(
+                    self.compression_dictionaries
+                ),
+            )
+
+        self._SetCompressionDictionaries()
+
+        self._WriteMetadataValue(
+            "event_data_serialization_format", self.event_data_serialization_format
+        )
         self._WriteMetadataValue("serialization_format", self.serialization_format)
 
+        self._event_data_serializer = None
+        if self.event_data_serialization_format == (
+            definitions.SERIALIZER_FORMAT_BINARY
+        ):
+            try:
+                self._cursor.execute(self._CREATE_EVENT_DATA_SCHEMA_TABLE_QUERY)
+            except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                raise OSError(
+                    f"Unable to query attribute container store with error: "
+                    f"{exception!s}"
+                )
+
+            self._event_data_serializer = binary_serializer.BinaryEventDataSerializer()
+            self._number_of_written_event_data_schemas = 0
+
+        self._column_names_per_table = None
+        self._event_data_has_indexed_columns = True
+
+        self._event_shard_index = None
+        self._event_shards = {}
+        self._last_event_shard = None
+        if self.event_shard_period:
+            if self.event_shard_period not in definitions.EVENT_SHARD_PERIODS:
+                raise OSError(
+                    f"Unsupported event shard period: {self.event_shard_period!s}"
+                )
+
+            self._WriteMetadataValue("event_shard_period", self.event_shard_period)
+
+            try:
+                self._cursor.execute(self._CREATE_EVENT_SHARD_TABLE_QUERY)
+            except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                raise OSError(
+                    f"Unable to query attribute container store with error: "
+                    f"{exception!s}"
+                )
+
+    def _WriteExistingAttributeContainer(self, container):
+        """Writes an existing attribute container to the store.
+
+        Args:
+          container (AttributeContainer): attribute container.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        if container.CONTAINER_TYPE != self._CONTAINER_TYPE_EVENT or not (
+            self.event_shard_period
+        ):
+            super()._WriteExistingAttributeContainer(container)
+            return
+
+        self._CommitWriteCache(container.CONTAINER_TYPE)
+
+        identifier = container.GetIdentifier()
+        column_names, values = self._GetEventColumnValues(container)
+
+        event_shard_index = self._GetEventShardIndex()
+
+        # The event can have been moved to another shard by a timestamp change.
+        previous_shard_name = event_shard_index.GetShardName(identifier.sequence_number)
+        if previous_shard_name:
+            query = (
+                f"DELETE FROM {previous_shard_name:s} "
+                f"WHERE _identifier = {identifier.sequence_number:d}"
+            )
+            try:
+                self._cursor.execute(query)
+            except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        shard_name = self._GetEventShardByTimestamp(container.timestamp)
+
+        column_names_string = ", ".join(["_identifier"] + column_names)
+        values_string = ", ".join(["?"] * (len(column_names) + 1))
+        query = (
+            f"INSERT INTO {shard_name:s} ({column_names_string:s}) "
+            f"VALUES ({values_string:s})"
+        )
+        try:
+            self._cursor.execute(query, [identifier.sequence_number] + values)
+        except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+            raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+        event_shard_index.SetShardName(identifier.sequence_number, shard_name)
+
     def _WriteNewAttributeContainer(self, container):
         """Writes a new attribute container to the store.
 
@@ -282,7 +1379,12 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
           OSError: when there is an error querying the storage file.
         """
         schema = self._GetAttributeContainerSchema(container.CONTAINER_TYPE)
-        if schema and container.CONTAINER_TYPE != self._CONTAINER_TYPE_EVENT_DATA:
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT and (
+            self.event_shard_period
+        ):
+            self._WriteNewEvent(container)
+
+        elif schema and container.CONTAINER_TYPE != self._CONTAINER_TYPE_EVENT_DATA:
             super()._WriteNewAttributeContainer(container)
         else:
             next_sequence_number = self._GetAttributeContainerNextSequenceNumber(
@@ -300,8 +1402,14 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
             serialized_data = self._SerializeAttributeContainer(container)
 
-            if self.compression_format == definitions.COMPRESSION_FORMAT_ZLIB:
-                compressed_data = zlib.compress(serialized_data)
+            if self._event_data_serializer and (
+                self._number_of_written_event_data_schemas
+                < len(self._event_data_serializer.schemas)
+            ):
+                self._WriteEventDataSchemas()
+
+            if self.compression_format != definitions.COMPRESSION_FORMAT_NONE:
+                compressed_data = self._CompressData(container, serialized_data)
                 serialized_data = sqlite3.Binary(compressed_data)
             else:
                 compressed_data = ""
@@ -318,11 +1426,48 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
             column_names = ["_data"]
             values = [serialized_data]
 
+            if (
+                container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA
+                and self._event_data_has_indexed_columns
+            ):
+                for column_name in self._EVENT_DATA_INDEXED_COLUMNS:
+                    column_names.append(column_name)
+                    values.append(getattr(container, column_name, None))
+
             self._CacheAttributeContainerForWrite(
                 container.CONTAINER_TYPE, column_names, values
             )
             self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
 
+    def _WriteNewEvent(self, event):
+        """Writes a new event to its event shard table.
+
+        Args:
+          event (EventObject): event.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        next_sequence_number = self._GetAttributeContainerNextSequenceNumber(
+            self._CONTAINER_TYPE_EVENT
+        )
+        identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT, sequence_number=next_sequence_number
+        )
+        event.SetIdentifier(identifier)
+
+        shard_name = self._GetEventShardByTimestamp(event.timestamp)
+        column_names, values = self._GetEventColumnValues(event)
+
+        # The identifier is stored explicitly to keep it unique across shards.
+        self._CacheAttributeContainerForWrite(
+            shard_name, ["_identifier"] + column_names, [next_sequence_number] + values
+        )
+        self._CacheAttributeContainerByIndex(event, next_sequence_number - 1)
+
+        if self._event_shard_index is not None:
+            self._event_shard_index.AddSequenceNumber(next_sequence_number, shard_name)
+
     def GetAttributeContainerByIndex(self, container_type, index):
         """Retrieves a specific attribute container.
 
@@ -337,6 +1482,9 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
           OSError: when the store is closed or when there is an error querying the
               storage file.
         """
+        if container_type == self._CONTAINER_TYPE_EVENT and self.event_shard_period:
+            return self._GetEventByIndex(index)
+
         schema = self._GetAttributeContainerSchema(container_type)
         if schema and container_type != self._CONTAINER_TYPE_EVENT_DATA:
             return super().GetAttributeContainerByIndex(container_type, index)
@@ -402,7 +1550,17 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
           OSError: when there is an error querying the storage file.
         """
         schema = self._GetAttributeContainerSchema(container_type)
-        if schema and container_type != self._CONTAINER_TYPE_EVENT_DATA:
+        if container_type == self._CONTAINER_TYPE_EVENT and self.event_shard_period:
+            sql_filter_expression = None
+            if filter_expression:
+                expression_ast = ast.parse(filter_expression, mode="eval")
+                sql_filter_expression = sqlite_store.PythonAST2SQL(expression_ast.body)
+
+            yield from self._GetEventsFromShards(
+                filter_expression=sql_filter_expression
+            )
+
+        elif schema and container_type != self._CONTAINER_TYPE_EVENT_DATA:
             yield from super().GetAttributeContainers(
                 container_type, filter_expression=filter_expression
             )
@@ -418,6 +1576,59 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
                 filter_expression=sql_filter_expression,
             )
 
+    def GetEventTimestampBoundaries(self, number_of_events):
+        """Retrieves timestamps that split the events into similar sized groups.
+
+        Only the timestamp column is read and numbered by SQLite, which is much
+        faster than reading the events.
+
+        Args:
+          number_of_events (int): number of events per group.
+
+        Returns:
+          list[int]: timestamp of the first event of every group, followed by
+              the timestamp of the last event, sorted by time.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+        if not self._attribute_container_sequence_numbers[self._CONTAINER_TYPE_EVENT]:
+            return []
+
+        timestamps = []
+        last_timestamp = None
+
+        # Note that event shard tables do not overlap in time, hence their
+        # timestamps are sorted when the tables are queried in order.
+        for table_name in self._GetEventTables():
+            queries = [
+                (
+                    f"SELECT timestamp FROM (SELECT timestamp, ROW_NUMBER() OVER "
+                    f"(ORDER BY timestamp) AS row_number FROM {table_name:s}) "
+                    f"WHERE (row_number - 1) % {number_of_events:d} = 0"
+                ),
+                f"SELECT MAX(timestamp) FROM {table_name:s}",
+            ]
+            try:
+                self._cursor.execute(queries[0])
+                timestamps.extend(row[0] for row in self._cursor.fetchall())
+
+                self._cursor.execute(queries[1])
+                row = self._cursor.fetchone()
+
+            except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+                raise OSError(f"Unable to query storage file with error: {exception!s}")
+
+            if row and row[0] is not None:
+                last_timestamp = row[0]
+
+        if last_timestamp is not None:
+            timestamps.append(last_timestamp)
+
+        return [timestamp for timestamp in timestamps if timestamp is not None]
+
     def GetSortedEvents(self, time_range=None):
         """Retrieves the events in increasing chronological order.
 
@@ -435,14 +1646,23 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
         if time_range:
             filter_expression = []
 
-            if time_range.start_timestamp:
+            if time_range.start_timestamp is not None:
                 filter_expression.append(f"timestamp >= {time_range.start_timestamp:d}")
 
-            if time_range.end_timestamp:
+            if time_range.end_timestamp is not None:
                 filter_expression.append(f"timestamp <= {time_range.end_timestamp:d}")
 
             filter_expression = " AND ".join(filter_expression)
 
+        if self.event_shard_period:
+            # The events of the event shard tables that overlap with the time
+            # range are merged in chronological order.
+            return self._GetEventsFromShards(
+                filter_expression=filter_expression,
+                order_by_timestamp=True,
+                time_range=time_range,
+            )
+
         return self._GetAttributeContainersWithFilter(
             self._CONTAINER_TYPE_EVENT,
             column_names=column_names,
@@ -450,6 +1670,149 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
             order_by="timestamp",
         )
 
+    def GetSortedEventTriples(self, time_range=None, event_filter=None):
+        """Retrieves the events, event data and event data streams.
+
+        The events and their event data are read by a single query, ordered by
+        increasing chronological order, and fetched in batches. The event data
+        streams, that are typically shared by many events, are looked up in
+        a least-recently-used cache.
+
+        The part of the event filter that can be represented by SQL, such as
+        timestamp ranges, data types, parser chains and tag labels, is added
+        to the query. The events returned still need to be matched against
+        the event filter.
+
+        Args:
+          time_range (Optional[TimeRange]): time range used to filter events that fall
+              in a specific period.
+          event_filter (Optional[EventObjectFilter]): event filter used to skip
+              events that cannot match the filter.
+
+        Yields:
+          tuple[EventObject, EventData, EventDataStream]: event, event data and
+              event data stream, where the event data stream is None if not set.
+
+        Raises:
+          OSError: when there is an error querying the storage file.
+        """
+        self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+        self._CommitWriteCache(self._CONTAINER_TYPE_EVENT_DATA)
+        self._CommitWriteCache(self._CONTAINER_TYPE_EVENT_TAG)
+
+        number_of_events = self._attribute_container_sequence_numbers[
+            self._CONTAINER_TYPE_EVENT
+        ]
+        if not number_of_events:
+            return
+
+        schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
+        column_names = sorted(schema.keys())
+
+        column_names_string = ", ".join(
+            [f"event.{column_name:s}" for column_name in column_names]
+        )
+
+        # The event data identifier is stored as "event_data.#", where # is
+        # the sequence number, which is the row identifier of the event data.
+        first_character_index = len(self._CONTAINER_TYPE_EVENT_DATA) + 2
+        event_data_row_identifier = (
+            f"CAST(SUBSTR(event._event_data_identifier, "
+            f"{first_character_index:d}) AS INTEGER)"
+        )
+
+        filter_expression = []
+
+        if time_range:
+            if time_range.start_timestamp is not None:
+                filter_expression.append(
+                    f"event.timestamp >= {time_range.start_timestamp:d}"
+                )
+
+            if time_range.end_timestamp is not None:
+                filter_expression.append(
+                    f"event.timestamp <= {time_range.end_timestamp:d}"
+                )
+
+        if event_filter:
+            attribute_expressions = self._GetEventFilterAttributeExpressions()
+            sql_expression = event_filter.GetSQLExpression(attribute_expressions)
+            if sql_expression:
+                filter_expression.append(f"({sql_expression:s})")
+
+        filter_expression = " AND ".join(filter_expression)
+
+        # With event shards every event shard table that overlaps with the time
+        # range is queried separately and the results are merged.
+        queries = []
+        for table_name in self._GetEventTables(time_range=time_range):
+            query = (
+                f"SELECT event._identifier, {column_names_string:s}, "
+                f"event_data._identifier, event_data._data "
+                f"FROM {table_name:s} AS event "
+                f"JOIN event_data ON event_data._identifier = "
+                f"{event_data_row_identifier:s}"
+            )
+            if filter_expression:
+                query = f"{query:s} WHERE {filter_expression:s}"
+
+            queries.append(f"{query:s} ORDER BY event.timestamp, event._identifier")
+
+        event_data_column_index = len(column_names) + 1
+        event_data_streams = collections.OrderedDict()
+
+        timestamp_column_index = column_names.index("timestamp") + 1
+        rows = self._GetSortedRows(
+            queries,
+            operator.itemgetter(timestamp_column_index, 0),
+            "get_sorted_event_triples",
+        )
+        for row in rows:
+            event = self._CreateAttributeContainerFromRow(
+                self._CONTAINER_TYPE_EVENT, column_names, row, 1
+            )
+            identifier = containers_interface.AttributeContainerIdentifier(
+                name=self._CONTAINER_TYPE_EVENT, sequence_number=row[0]
+            )
+            event.SetIdentifier(identifier)
+
+            event_data = self._CreateAttributeContainerFromRow(
+                self._CONTAINER_TYPE_EVENT_DATA,
+                ["_data"],
+                row,
+                event_data_column_index + 1,
+            )
+            identifier = containers_interface.AttributeContainerIdentifier(
+                name=self._CONTAINER_TYPE_EVENT_DATA,
+                sequence_number=row[event_data_column_index],
+            )
+            event_data.SetIdentifier(identifier)
+
+            event_data_stream = None
+
+            event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+            if event_data_stream_identifier:
+                lookup_key = event_data_stream_identifier.sequence_number
+
+                event_data_stream = event_data_streams.get(lookup_key, None)
+                if event_data_stream:
+                    event_data_streams.move_to_end(lookup_key, last=False)
+
+                else:
+                    event_data_stream = self.GetAttributeContainerByIdentifier(
+                        self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+                        event_data_stream_identifier,
+                    )
+                    if len(event_data_streams) >= (
+                        self._MAXIMUM_CACHED_EVENT_DATA_STREAMS
+                    ):
+                        event_data_streams.popitem(last=True)
+
+                    event_data_streams[lookup_key] = event_data_stream
+                    event_data_streams.move_to_end(lookup_key, last=False)
+
+            yield event, event_data, event_data_stream
+
     def SetSerializersProfiler(self, serializers_profiler):
         """Sets the serializers profiler.
 
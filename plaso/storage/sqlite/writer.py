@@ -8,13 +8,19 @@ from plaso.storage.sqlite import sqlite_file
 class SQLiteStorageWriter(writer.StorageWriter):
     """SQLite-based storage writer."""
 
-    def __init__(self, storage_type=definitions.STORAGE_TYPE_SESSION):
+    def __init__(
+        self, event_shard_period=None, storage_type=definitions.STORAGE_TYPE_SESSION
+    ):
         """Initializes a storage writer.
 
         Args:
+          event_shard_period (Optional[str]): period of the time-bucketed tables
+              the events are stored in, where None represents a single event
+              table. Only used when a new SQLite database is created.
           storage_type (Optional[str]): storage type.
         """
-        super().__init__()
+        super().__init__(storage_type=storage_type)
+        self._event_shard_period = event_shard_period
         self._first_written_event_data_index = 0
         self._first_written_event_source_index = 0
         self._written_event_data_index = 0
@@ -107,11 +113,24 @@ class SQLiteStorageWriter(writer.StorageWriter):
         return event_source
 
     # pylint: disable=arguments-differ
-    def Open(self, path=None, **unused_kwargs):
+    def Open(
+        self,
+        path=None,
+        compression_dictionaries=None,
+        compression_format=None,
+        **unused_kwargs,
+    ):
         """Opens the storage writer.
 
+        The compression dictionaries and format are only used when a new
+        SQLite database is created, an existing database keeps its own.
+
         Args:
           path (Optional[str]): path to the output SQLite database.
+          compression_dictionaries (Optional[dict[str, bytes]]): preset
+              compression dictionaries per event data type.
+          compression_format (Optional[str]): compression format, where None
+              represents the default compression format.
 
         Raises:
           OSError: if the storage writer is already opened.
@@ -121,6 +140,15 @@ class SQLiteStorageWriter(writer.StorageWriter):
 
         self._store = sqlite_file.SQLiteStorageFile()
 
+        if compression_dictionaries:
+            self._store.compression_dictionaries = compression_dictionaries
+
+        if compression_format:
+            self._store.compression_format = compression_format
+
+        if self._event_shard_period:
+            self._store.event_shard_period = self._event_shard_period
+
         if self._serializers_profiler:
             self._store.SetSerializersProfiler(self._serializers_profiler)
 
@@ -25,6 +25,14 @@ class StorageWriter(reader.StorageReader):
     _CONTAINER_TYPE_EXTRACTION_WARNING = warnings.ExtractionWarning.CONTAINER_TYPE
     _CONTAINER_TYPE_PREPROCESSING_WARNING = warnings.PreprocessingWarning.CONTAINER_TYPE
     _CONTAINER_TYPE_RECOVERY_WARNING = warnings.RecoveryWarning.CONTAINER_TYPE
+    _CONTAINER_TYPE_TIMELINING_WARNING = warnings.TimeliningWarning.CONTAINER_TYPE
+
+    # Prefixes of the names of the warnings counters per warning type.
+    _WARNINGS_COUNTER_NAME_PREFIXES = {
+        _CONTAINER_TYPE_EXTRACTION_WARNING: "extraction_warnings",
+        _CONTAINER_TYPE_RECOVERY_WARNING: "recovery_warnings",
+        _CONTAINER_TYPE_TIMELINING_WARNING: "timelining_warnings",
+    }
 
     # The maximum number of cached event tags
     _MAXIMUM_CACHED_EVENT_TAGS = 32 * 1024
@@ -39,6 +47,7 @@ class StorageWriter(reader.StorageReader):
         self._attribute_containers_counter = collections.Counter()
         self._event_tag_per_event_identifier = collections.OrderedDict()
         self._storage_type = storage_type
+        self._warnings_counters = collections.defaultdict(collections.Counter)
 
     def _CacheEventTagByEventIdentifier(self, event_tag, event_identifier):
         """Caches a specific event tag.
@@ -94,6 +103,24 @@ class StorageWriter(reader.StorageReader):
 
         return event_tag
 
+    def _CountWarning(self, counter_name_prefix, warning):
+        """Counts a warning by parser chain and path specification.
+
+        Args:
+          counter_name_prefix (str): prefix of the name of the warnings counters,
+              such as "extraction_warnings".
+          warning (AttributeContainer): warning attribute container.
+        """
+        path_spec = getattr(warning, "path_spec", None)
+        path_spec_string = path_spec.comparable if path_spec else "N/A"
+
+        self._warnings_counters[f"{counter_name_prefix:s}_by_parser_chain"][
+            warning.parser_chain
+        ] += 1
+        self._warnings_counters[f"{counter_name_prefix:s}_by_path_spec"][
+            path_spec_string
+        ] += 1
+
     def _RaiseIfNotWritable(self):
         """Raises if the storage writer is not writable.
 
@@ -118,6 +145,20 @@ class StorageWriter(reader.StorageReader):
 
         self._attribute_containers_counter[container.CONTAINER_TYPE] += 1
 
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
+            # Force the event tags to be reread on the next event tag lookup.
+            self._event_tag_sequence_numbers = None
+
+        elif self._storage_type == definitions.STORAGE_TYPE_SESSION:
+            # The warnings are counted in the session storage so that the
+            # aggregated counts do not have to be determined by reading all
+            # the warnings afterwards.
+            counter_name_prefix = self._WARNINGS_COUNTER_NAME_PREFIXES.get(
+                container.CONTAINER_TYPE, None
+            )
+            if counter_name_prefix:
+                self._CountWarning(counter_name_prefix, container)
+
     def AddOrUpdateEventTag(self, event_tag):
         """Adds a new or updates an existing event tag.
 
@@ -154,6 +195,13 @@ class StorageWriter(reader.StorageReader):
         """
         self._RaiseIfNotWritable()
 
+        if self._warnings_counters:
+            stored_warnings_counters = self.GetWarningsCounters()
+            self.UpdateWarningsCounters(
+                stored_warnings_counters, self._warnings_counters
+            )
+            self._warnings_counters = collections.defaultdict(collections.Counter)
+
         self._store.Close()
         self._store = None
 
@@ -243,14 +291,16 @@ class StorageWriter(reader.StorageReader):
               additional values.
         """
         for key, value in event_labels_counter.items():
-            parser_count = stored_event_labels_counter.get(key)
-            if parser_count:
-                parser_count.number_of_events += value
-                self.UpdateAttributeContainer(parser_count)
+            event_label_count = stored_event_labels_counter.get(key)
+            if event_label_count:
+                event_label_count.number_of_events += value
+                self.UpdateAttributeContainer(event_label_count)
             else:
-                parser_count = counts.ParserCount(name=key, number_of_events=value)
-                event_labels_counter[key] = parser_count
-                self.AddAttributeContainer(parser_count)
+                event_label_count = counts.EventLabelCount(
+                    label=key, number_of_events=value
+                )
+                event_labels_counter[key] = event_label_count
+                self.AddAttributeContainer(event_label_count)
 
     def UpdateParsersCounter(self, stored_parsers_counter, parsers_counter):
         """Updates the parsers counter.
@@ -269,3 +319,28 @@ class StorageWriter(reader.StorageReader):
                 parser_count = counts.ParserCount(name=key, number_of_events=value)
                 parsers_counter[key] = parser_count
                 self.AddAttributeContainer(parser_count)
+
+    def UpdateWarningsCounters(self, stored_warnings_counters, warnings_counters):
+        """Updates the warnings counters.
+
+        Args:
+          stored_warnings_counters (dict[str, collections.Counter]): the stored
+              warnings counters per counter name.
+          warnings_counters (dict[str, collections.Counter]): the warnings
+              counters per counter name with additional values.
+        """
+        for counter_name, warnings_counter in warnings_counters.items():
+            stored_warnings_counter = stored_warnings_counters.setdefault(
+                counter_name, collections.Counter()
+            )
+            for key, value in warnings_counter.items():
+                warning_count = stored_warnings_counter.get(key)
+                if warning_count:
+                    warning_count.number_of_events += value
+                    self.UpdateAttributeContainer(warning_count)
+                else:
+                    warning_count = counts.WarningCount(
+                        counter_name=counter_name, name=key, number_of_events=value
+                    )
+                    stored_warnings_counter[key] = warning_count
+                    self.AddAttributeContainer(warning_count)
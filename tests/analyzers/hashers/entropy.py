@@ -3,6 +3,8 @@
 
 import unittest
 
+from unittest import mock
+
 from plaso.analyzers.hashers import entropy
 
 from tests.analyzers.hashers import test_lib
@@ -11,6 +13,8 @@ from tests.analyzers.hashers import test_lib
 class EntropyHasherTest(test_lib.HasherTestCase):
     """Tests the Entropy hasher."""
 
+    # pylint: disable=protected-access
+
     def testFileHashMatchesEmptyFile(self):
         """Tests that hasher matches the hash of an empty file."""
         hasher = entropy.EntropyHasher()
@@ -21,6 +25,26 @@ class EntropyHasherTest(test_lib.HasherTestCase):
         hasher = entropy.EntropyHasher()
         self._AssertTestPathStringDigestMatch(hasher, ["syslog.zip"], "7.264319")
 
+    def testFileHashMatchesKnownFileWithoutNumPy(self):
+        """Tests that hasher matches the hash of a known file without NumPy."""
+        with mock.patch.object(entropy, "numpy", None):
+            hasher = entropy.EntropyHasher()
+            self._AssertTestPathStringDigestMatch(hasher, ["syslog.zip"], "7.264319")
+
+    def testUpdate(self):
+        """Tests the Update function."""
+        hasher = entropy.EntropyHasher()
+
+        hasher.Update(b"\x03\x01\x03")
+        hasher.Update(b"")
+        hasher.Update(b"\x02\x01\x02\x00")
+
+        self.assertEqual(hasher._file_length, 7)
+        self.assertEqual(hasher._byte_frequencies[:4], [1, 2, 2, 2])
+        self.assertEqual(sum(hasher._byte_frequencies), 7)
+        self.assertEqual(hasher._byte_values, [3, 1, 2, 0])
+        self.assertEqual(hasher.GetStringDigest(), "1.950212")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for the Hashing analyzer."""
 
+import hashlib
 import unittest
 
 from plaso.containers import analyzer_result
@@ -45,6 +46,49 @@ class HashingAnalyzerTest(shared_test_lib.BaseTestCase):
         self.assertEqual(first_result.attribute_value, "4")
         self.assertEqual(len(results), 1)
 
+    def testHashFileWithThreadPool(self):
+        """Tests that results are produced correctly by the hashers thread pool."""
+        analyzer = hashing_analyzer.HashingAnalyzer()
+        analyzer.SetHasherNames("md5,sha256")
+
+        test_data = b"".join(
+            [
+                bytes([block_index]) * analyzer._MINIMUM_THREADED_DATA_SIZE
+                for block_index in range(3)
+            ]
+        )
+
+        data_offset = 0
+        for read_size in (analyzer._MINIMUM_THREADED_DATA_SIZE, 10, 2048, None):
+            data = test_data[data_offset:]
+            if read_size is not None:
+                data = data[:read_size]
+
+            analyzer.Analyze(data)
+            data_offset += len(data)
+
+        self.assertIsNotNone(analyzer._hashers_thread_pool)
+
+        results = {
+            result.attribute_name: result.attribute_value
+            for result in analyzer.GetResults()
+        }
+        self.assertEqual(analyzer._pending_updates, [])
+
+        expected_results = {
+            "md5_hash": hashlib.md5(test_data).hexdigest(),
+            "sha256_hash": hashlib.sha256(test_data).hexdigest(),
+        }
+        self.assertEqual(results, expected_results)
+
+        analyzer.Reset()
+        analyzer.Analyze(test_data)
+        results = {
+            result.attribute_name: result.attribute_value
+            for result in analyzer.GetResults()
+        }
+        self.assertEqual(results, expected_results)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,15 +20,39 @@ class ExtractionArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
 
     if _PYTHON3_13_OR_LATER:
         _EXPECTED_OUTPUT = f"""\
-usage: cli_helper.py [--extract_winreg_binary] [--preferred_year YEAR]
+usage: cli_helper.py [--data_stream_deduplication POLICY]
+                     [--extract_winreg_binary] [--parse_cache DIRECTORY]
+                     [--parse_cache_size SIZE] [--preferred_year YEAR]
                      [--skip_compressed_streams]
 
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --data_stream_deduplication, --data-stream-deduplication POLICY
+                        Deduplication policy of data streams with identical
+                        content, such as files in multiple Volume Shadow
+                        Snapshots (VSS). The content of a duplicate data
+                        stream is not extracted, but its file system metadata
+                        is. Supported policies are: content, to deduplicate
+                        data streams with identical content, location, to
+                        deduplicate data streams with identical content and
+                        location and none, to not deduplicate data streams.
+                        The default is none.
   --extract_winreg_binary, --extract-winreg-binary
                         Extract binary Windows Registry values. WARNING: This
                         can make processing significantly slower.
+  --parse_cache, --parse-cache DIRECTORY
+                        Path to the directory of a persistent cache of parse
+                        results. The parse results of data streams that were
+                        parsed by an earlier run with the same parsers and
+                        plaso version, such as re-running on the same source,
+                        are reused instead of parsing the data streams again.
+                        The directory is created if it does not exist.
+  --parse_cache_size, --parse-cache-size SIZE
+                        Maximum size in bytes of the persistent cache of parse
+                        results. The least recently used parse results are
+                        removed when the cache exceeds this size. The default
+                        is 4 GiB.
   --preferred_year, --preferred-year YEAR
                         When a format\'s timestamp does not include a year,
                         e.g. syslog, use this as the initial year instead of
@@ -40,15 +64,39 @@ Test argument parser.
 
     else:
         _EXPECTED_OUTPUT = f"""\
-usage: cli_helper.py [--extract_winreg_binary] [--preferred_year YEAR]
+usage: cli_helper.py [--data_stream_deduplication POLICY]
+                     [--extract_winreg_binary] [--parse_cache DIRECTORY]
+                     [--parse_cache_size SIZE] [--preferred_year YEAR]
                      [--skip_compressed_streams]
 
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --data_stream_deduplication POLICY, --data-stream-deduplication POLICY
+                        Deduplication policy of data streams with identical
+                        content, such as files in multiple Volume Shadow
+                        Snapshots (VSS). The content of a duplicate data
+                        stream is not extracted, but its file system metadata
+                        is. Supported policies are: content, to deduplicate
+                        data streams with identical content, location, to
+                        deduplicate data streams with identical content and
+                        location and none, to not deduplicate data streams.
+                        The default is none.
   --extract_winreg_binary, --extract-winreg-binary
                         Extract binary Windows Registry values. WARNING: This
                         can make processing significantly slower.
+  --parse_cache DIRECTORY, --parse-cache DIRECTORY
+                        Path to the directory of a persistent cache of parse
+                        results. The parse results of data streams that were
+                        parsed by an earlier run with the same parsers and
+                        plaso version, such as re-running on the same source,
+                        are reused instead of parsing the data streams again.
+                        The directory is created if it does not exist.
+  --parse_cache_size SIZE, --parse-cache-size SIZE
+                        Maximum size in bytes of the persistent cache of parse
+                        results. The least recently used parse results are
+                        removed when the cache exceeds this size. The default
+                        is 4 GiB.
   --preferred_year YEAR, --preferred-year YEAR
                         When a format\'s timestamp does not include a year,
                         e.g. syslog, use this as the initial year instead of
@@ -74,12 +122,32 @@ Test argument parser.
         test_tool = tools.CLITool()
         extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
 
+        self.assertEqual(test_tool._data_stream_deduplication, "none")
+        self.assertIsNone(test_tool._parse_cache_path)
+        self.assertIsNone(test_tool._parse_cache_size)
         self.assertIsNone(test_tool._preferred_year)
         self.assertTrue(test_tool._process_compressed_streams)
 
         with self.assertRaises(errors.BadConfigObject):
             extraction.ExtractionArgumentsHelper.ParseOptions(options, None)
 
+        options.data_stream_deduplication = "bogus"
+
+        with self.assertRaises(errors.BadConfigOption):
+            extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
+        options.data_stream_deduplication = "none"
+        options.parse_cache_size = 0
+
+        with self.assertRaises(errors.BadConfigOption):
+            extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
+        options.parse_cache_size = None
+        options.parse_cache = self._GetTestFilePath(["syslog", "syslog"])
+
+        with self.assertRaises(errors.BadConfigOption):
+            extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
+
         # TODO: improve test coverage.
 
 
@@ -26,6 +26,7 @@ class OpenSearchTimesketchOutputArgumentsHelperTest(
     if _PYTHON3_13_OR_LATER:
         _EXPECTED_OUTPUT = f"""\
 usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
+                     [--bulk_size SIZE] [--bulk_senders NUMBER]
                      [--opensearch-server HOSTNAME] [--opensearch-port PORT]
                      [--opensearch-user USERNAME]
                      [--opensearch-password PASSWORD]
@@ -37,6 +38,12 @@ usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --bulk_senders, --bulk-senders NUMBER
+                        Number of bulk inserts to OpenSearch that are sent
+                        concurrently.
+  --bulk_size, --bulk-size SIZE
+                        Size in bytes of the serialized events to queue up
+                        before bulk insert to OpenSearch.
   --ca_certificates_file_path, --ca-certificates-file-path PATH
                         Path to a file containing a list of root certificates
                         to trust.
@@ -69,6 +76,7 @@ Test argument parser.
     else:
         _EXPECTED_OUTPUT = f"""\
 usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
+                     [--bulk_size SIZE] [--bulk_senders NUMBER]
                      [--opensearch-server HOSTNAME] [--opensearch-port PORT]
                      [--opensearch-user USERNAME]
                      [--opensearch-password PASSWORD]
@@ -80,6 +88,12 @@ usage: cli_helper.py [--index_name NAME] [--flush_interval INTERVAL]
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --bulk_senders NUMBER, --bulk-senders NUMBER
+                        Number of bulk inserts to OpenSearch that are sent
+                        concurrently.
+  --bulk_size SIZE, --bulk-size SIZE
+                        Size in bytes of the serialized events to queue up
+                        before bulk insert to OpenSearch.
   --ca_certificates_file_path PATH, --ca-certificates-file-path PATH
                         Path to a file containing a list of root certificates
                         to trust.
@@ -20,12 +20,17 @@ class OutputModulesArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
 
     if _PYTHON3_13_OR_LATER:
         _EXPECTED_OUTPUT = f"""\
-usage: cli_helper.py [-o FORMAT] [-w OUTPUT_FILE] [--fields FIELDS]
+usage: cli_helper.py [-o FORMAT] [-w OUTPUT_FILE]
+                     [--output_compression FORMAT] [--fields FIELDS]
 
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
   --fields FIELDS       Defines which fields should be included in the output.
+  --output_compression, --output-compression FORMAT
+                        Compression format of the output file, supported
+                        compression formats are: gzip, lz4 and zstd. Only
+                        supported by output formats that write text.
   -o, --output_format, --output-format FORMAT
                         The output format. Use "-o list" to see a list of
                         available output formats.
@@ -35,12 +40,17 @@ Test argument parser.
 
     else:
         _EXPECTED_OUTPUT = f"""\
-usage: cli_helper.py [-o FORMAT] [-w OUTPUT_FILE] [--fields FIELDS]
+usage: cli_helper.py [-o FORMAT] [-w OUTPUT_FILE]
+                     [--output_compression FORMAT] [--fields FIELDS]
 
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
   --fields FIELDS       Defines which fields should be included in the output.
+  --output_compression FORMAT, --output-compression FORMAT
+                        Compression format of the output file, supported
+                        compression formats are: gzip, lz4 and zstd. Only
+                        supported by output formats that write text.
   -o FORMAT, --output_format FORMAT, --output-format FORMAT
                         The output format. Use "-o list" to see a list of
                         available output formats.
@@ -69,6 +79,17 @@ Test argument parser.
 
         self.assertEqual(test_tool._output_format, options.output_format)
         self.assertEqual(test_tool._output_filename, options.write)
+        self.assertIsNone(test_tool._output_compression)
+
+        options.output_compression = "gzip"
+        output_modules.OutputModulesArgumentsHelper.ParseOptions(options, test_tool)
+        self.assertEqual(test_tool._output_compression, "gzip")
+
+        options.output_compression = "bogus"
+        with self.assertRaises(errors.BadConfigOption):
+            output_modules.OutputModulesArgumentsHelper.ParseOptions(options, test_tool)
+
+        options.output_compression = None
 
         # Test with a configuration object missing.
         with self.assertRaises(errors.BadConfigObject):
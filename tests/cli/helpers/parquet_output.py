@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for the Parquet output module CLI arguments helper."""
+
+import sys
+import unittest
+
+from plaso.cli.helpers import parquet_output
+from plaso.lib import errors
+from plaso.output import parquet
+
+from tests.cli import test_lib as cli_test_lib
+from tests.cli.helpers import test_lib
+
+
+class ParquetOutputArgumentsHelperTest(test_lib.OutputModuleArgumentsHelperTest):
+    """Tests the Parquet output module CLI arguments helper."""
+
+    # pylint: disable=no-member,protected-access
+
+    _PYTHON3_13_OR_LATER = sys.version_info[0:2] >= (3, 13)
+
+    if _PYTHON3_13_OR_LATER:
+        _EXPECTED_OUTPUT = f"""\
+usage: cli_helper.py [--fields FIELDS] [--row_group_size NUMBER]
+
+Test argument parser.
+
+{cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --fields FIELDS       Defines which fields should be included in the output.
+  --row_group_size, --row-group-size NUMBER
+                        Number of events that are buffered and written per row
+                        group.
+"""
+    else:
+        _EXPECTED_OUTPUT = f"""\
+usage: cli_helper.py [--fields FIELDS] [--row_group_size NUMBER]
+
+Test argument parser.
+
+{cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --fields FIELDS       Defines which fields should be included in the output.
+  --row_group_size NUMBER, --row-group-size NUMBER
+                        Number of events that are buffered and written per row
+                        group.
+"""
+
+    def testAddArguments(self):
+        """Tests the AddArguments function."""
+        argument_parser = self._GetTestArgumentParser("cli_helper.py")
+
+        parquet_output.ParquetOutputArgumentsHelper.AddArguments(argument_parser)
+
+        output = self._RunArgparseFormatHelp(argument_parser)
+        self.assertEqual(output, self._EXPECTED_OUTPUT)
+
+    def testParseOptions(self):
+        """Tests the ParseOptions function."""
+        options = cli_test_lib.TestOptions()
+        output_module = parquet.ParquetOutputModule()
+
+        with self.assertRaises(errors.BadConfigOption):
+            parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+                options, output_module
+            )
+
+        options.write = "plaso.parquet"
+        parquet_output.ParquetOutputArgumentsHelper.ParseOptions(options, output_module)
+
+        options.row_group_size = 0
+        with self.assertRaises(errors.BadConfigOption):
+            parquet_output.ParquetOutputArgumentsHelper.ParseOptions(
+                options, output_module
+            )
+
+        with self.assertRaises(errors.BadConfigObject):
+            parquet_output.ParquetOutputArgumentsHelper.ParseOptions(options, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """Tests for the storage format CLI arguments helper."""
 
+import os
 import sys
 import unittest
 
 from plaso.cli import tools
 from plaso.cli.helpers import storage_format
 from plaso.lib import errors
+from plaso.storage import compression
 
+from tests import test_lib as shared_test_lib
 from tests.cli import test_lib as cli_test_lib
 
 
@@ -20,14 +23,24 @@ class StorageFormatArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
 
     if _PYTHON3_13_OR_LATER:
         _EXPECTED_OUTPUT = f"""\
-usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+usage: cli_helper.py [--storage_format FORMAT] [--storage_compression FORMAT]
+                     [--storage_compression_dictionaries PATH]
+                     [--task_storage_format FORMAT]
 
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --storage_compression, --storage-compression FORMAT
+                        Compression format of the storage file, the default
+                        is: zlib. Supported options: lz4, none, zlib, zstd
+  --storage_compression_dictionaries, --storage-compression-dictionaries PATH
+                        Path to a file containing compression dictionaries per
+                        event data type, such as created by
+                        utils/benchmark_storage_compression.py. Only supported
+                        by the lz4 and zlib storage compression formats.
   --storage_format, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
-                        Supported options: sqlite
+                        Supported options: sqlite, sqlite_sharded
   --task_storage_format, --task-storage-format FORMAT
                         Format for task storage, the default is: sqlite.
                         Supported options: redis, sqlite
@@ -35,14 +48,24 @@ Test argument parser.
 
     else:
         _EXPECTED_OUTPUT = f"""\
-usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+usage: cli_helper.py [--storage_format FORMAT] [--storage_compression FORMAT]
+                     [--storage_compression_dictionaries PATH]
+                     [--task_storage_format FORMAT]
 
 Test argument parser.
 
 {cli_test_lib.ARGPARSE_OPTIONS:s}:
+  --storage_compression FORMAT, --storage-compression FORMAT
+                        Compression format of the storage file, the default
+                        is: zlib. Supported options: lz4, none, zlib, zstd
+  --storage_compression_dictionaries PATH, --storage-compression-dictionaries PATH
+                        Path to a file containing compression dictionaries per
+                        event data type, such as created by
+                        utils/benchmark_storage_compression.py. Only supported
+                        by the lz4 and zlib storage compression formats.
   --storage_format FORMAT, --storage-format FORMAT
                         Format of the storage file, the default is: sqlite.
-                        Supported options: sqlite
+                        Supported options: sqlite, sqlite_sharded
   --task_storage_format FORMAT, --task-storage-format FORMAT
                         Format for task storage, the default is: sqlite.
                         Supported options: redis, sqlite
@@ -67,8 +90,43 @@ Test argument parser.
         storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
 
         self.assertEqual(test_tool._storage_format, options.storage_format)
+        self.assertEqual(test_tool._storage_compression_format, "zlib")
+        self.assertIsNone(test_tool._storage_compression_dictionaries)
         self.assertEqual(test_tool._task_storage_format, options.task_storage_format)
 
+        options.storage_compression = "lz4"
+        storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
+        self.assertEqual(test_tool._storage_compression_format, "lz4")
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "dictionaries.json")
+            with open(test_path, "w", encoding="utf-8") as file_object:
+                file_object.write(
+                    compression.CompressionDictionariesSerializer.WriteSerialized(
+                        {"test:event": b"test dictionary"}
+                    )
+                )
+
+            options.storage_compression_dictionaries = test_path
+            storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
+            self.assertEqual(
+                test_tool._storage_compression_dictionaries,
+                {"test:event": b"test dictionary"},
+            )
+
+            with self.assertRaises(errors.BadConfigOption):
+                options.storage_compression = "zstd"
+                storage_format.StorageFormatArgumentsHelper.ParseOptions(
+                    options, test_tool
+                )
+
+        options.storage_compression = "bogus"
+        options.storage_compression_dictionaries = None
+        with self.assertRaises(errors.BadConfigOption):
+            storage_format.StorageFormatArgumentsHelper.ParseOptions(options, test_tool)
+
+        options.storage_compression = "zlib"
+
         with self.assertRaises(errors.BadConfigObject):
             storage_format.StorageFormatArgumentsHelper.ParseOptions(options, None)
 
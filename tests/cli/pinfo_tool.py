@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 """Tests for the pinfo CLI tool."""
 
+import os
 import unittest
 
 from plaso.cli import pinfo_tool
+from plaso.containers import warnings
+from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.storage.sqlite import writer as sqlite_writer
 
+from tests import test_lib as shared_test_lib
 from tests.cli import test_lib
 
 
@@ -34,7 +39,72 @@ Parser (plugin) name : Number of events
 Storage files are different.
 """
 
-    # TODO: add test for _CalculateStorageCounters.
+    def _CreateStoreWithWarnings(self, path, storage_type):
+        """Creates a store with warnings.
+
+        Args:
+          path (str): path of the store.
+          storage_type (str): storage type, where task storage is used to create
+              a store without warnings counters.
+        """
+        storage_writer = sqlite_writer.SQLiteStorageWriter(storage_type=storage_type)
+        storage_writer.Open(path=path)
+
+        try:
+            for parser_chain in ("filestat", "filestat", "winreg"):
+                warning = warnings.ExtractionWarning(
+                    message="test", parser_chain=parser_chain
+                )
+                storage_writer.AddAttributeContainer(warning)
+
+            warning = warnings.TimeliningWarning(message="test", parser_chain="winreg")
+            storage_writer.AddAttributeContainer(warning)
+
+        finally:
+            storage_writer.Close()
+
+    def testCalculateStorageCounters(self):
+        """Tests the _CalculateStorageCounters function."""
+        test_tool = pinfo_tool.PinfoTool()
+
+        for storage_type in (
+            definitions.STORAGE_TYPE_SESSION,
+            definitions.STORAGE_TYPE_TASK,
+        ):
+            with shared_test_lib.TempDirectory() as temp_directory:
+                test_path = os.path.join(temp_directory, "plaso.sqlite")
+                self._CreateStoreWithWarnings(test_path, storage_type)
+
+                storage_reader = test_tool._GetStorageReader(test_path)
+                try:
+                    stored_warnings_counters = test_tool._GetStoredWarningsCounters(
+                        storage_reader
+                    )
+                    storage_counters = test_tool._CalculateStorageCounters(
+                        storage_reader
+                    )
+
+                finally:
+                    storage_reader.Close()
+
+            if storage_type == definitions.STORAGE_TYPE_SESSION:
+                self.assertIsNotNone(stored_warnings_counters)
+            else:
+                self.assertIsNone(stored_warnings_counters)
+
+            warnings_counter = storage_counters["extraction_warnings_by_parser_chain"]
+            self.assertEqual(warnings_counter["filestat"].number_of_events, 2)
+            self.assertEqual(warnings_counter["winreg"].number_of_events, 1)
+
+            warnings_counter = storage_counters["extraction_warnings_by_path_spec"]
+            self.assertEqual(warnings_counter["N/A"].number_of_events, 3)
+
+            warnings_counter = storage_counters["recovery_warnings_by_parser_chain"]
+            self.assertEqual(len(warnings_counter), 0)
+
+            warnings_counter = storage_counters["timelining_warnings_by_parser_chain"]
+            self.assertEqual(warnings_counter["winreg"].number_of_events, 1)
+
     # TODO: add test for _CompareStores.
 
     def testGenerateAnalysisResultsReportAsJSON(self):
@@ -103,6 +103,7 @@ class PsortToolTest(test_lib.CLIToolTestCase):
             _EXPECTED_PROCESSING_OPTIONS = f"""\
 usage: psort_test.py [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--workers WORKERS]
 
 Test argument parser.
 
@@ -122,11 +123,15 @@ Test argument parser.
                         default timeout is 15.0 minutes. If a worker process
                         exceeds this timeout it is killed by the main
                         (foreman) process.
+  --workers WORKERS     Number of worker processes that format the events of
+                        the output. The default is 0, which formats the events
+                        in the main process.
 """
         else:
             _EXPECTED_PROCESSING_OPTIONS = f"""\
 usage: psort_test.py [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--workers WORKERS]
 
 Test argument parser.
 
@@ -146,6 +151,9 @@ Test argument parser.
                         default timeout is 15.0 minutes. If a worker process
                         exceeds this timeout it is killed by the main
                         (foreman) process.
+  --workers WORKERS     Number of worker processes that format the events of
+                        the output. The default is 0, which formats the events
+                        in the main process.
 """
     else:
         if _PYTHON3_13_OR_LATER:
@@ -153,6 +161,7 @@ Test argument parser.
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--workers WORKERS]
 
 Test argument parser.
 
@@ -180,12 +189,16 @@ Test argument parser.
                         default timeout is 15.0 minutes. If a worker process
                         exceeds this timeout it is killed by the main
                         (foreman) process.
+  --workers WORKERS     Number of worker processes that format the events of
+                        the output. The default is 0, which formats the events
+                        in the main process.
 """
         else:
             _EXPECTED_PROCESSING_OPTIONS = f"""\
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
+                     [--workers WORKERS]
 
 Test argument parser.
 
@@ -213,6 +226,9 @@ Test argument parser.
                         default timeout is 15.0 minutes. If a worker process
                         exceeds this timeout it is killed by the main
                         (foreman) process.
+  --workers WORKERS     Number of worker processes that format the events of
+                        the output. The default is 0, which formats the events
+                        in the main process.
 """
 
     # TODO: add test for _CreateOutputModule.
@@ -295,11 +311,52 @@ Test argument parser.
         options.status_view_interval = 0.5
         options.storage_file = self._GetTestFilePath(["psort_test.plaso"])
 
+        with self.assertRaises(errors.BadConfigOption):
+            test_tool.ParseOptions(options)
+
+        options = test_lib.TestOptions()
+        options.additional_storage_files = [self._GetTestFilePath(["bogus.plaso"])]
+        options.output_format = "null"
+        options.status_view_interval = 0.5
+        options.storage_file = self._GetTestFilePath(["psort_test.plaso"])
+
         with self.assertRaises(errors.BadConfigOption):
             test_tool.ParseOptions(options)
 
         # TODO: improve test coverage.
 
+    def testProcessStorageWithAdditionalStorageFiles(self):
+        """Tests the ProcessStorage function with additional storage files."""
+        storage_file_path = self._GetTestFilePath(["psort_test.plaso"])
+        self._SkipIfPathNotExists(storage_file_path)
+
+        output_writer = test_lib.TestOutputWriter(encoding="utf-8")
+
+        outputs = []
+        for additional_storage_files in ([], [storage_file_path]):
+            test_tool = psort_tool.PsortTool(output_writer=output_writer)
+
+            options = test_lib.TestOptions()
+            options.additional_storage_files = additional_storage_files
+            options.data_location = shared_test_lib.DATA_PATH
+            options.output_format = "dynamic"
+            options.status_view_interval = 0.5
+            options.status_view_mode = "none"
+            options.storage_file = storage_file_path
+
+            with shared_test_lib.TempDirectory() as temp_directory:
+                options.write = os.path.join(temp_directory, "output.csv")
+
+                test_tool.ParseOptions(options)
+                test_tool.ProcessStorage()
+
+                with io.open(options.write, "rt", encoding="utf-8") as file_object:
+                    outputs.append(file_object.read())
+
+        # The events of the additional storage file are duplicates.
+        self.assertEqual(len(outputs[0].split("\n")), 22)
+        self.assertEqual(outputs[1], outputs[0])
+
     def testProcessStorageWithMissingParameters(self):
         """Tests the ProcessStorage function with parameters missing."""
         encoding = "utf-8"
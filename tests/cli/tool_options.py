@@ -147,7 +147,7 @@ Test argument parser.
                         besides the default fields. Multiple additional field
                         names can be defined as a list of comma separated
                         values. Output formats that support additional fields
-                        are: dynamic, opensearch and xlsx.
+                        are: dynamic, opensearch, parquet and xlsx.
   --custom_fields, --custom-fields CUSTOM_FIELDS
                         Defines custom fields to be included in the output
                         besides the default fields. A custom field is defined
@@ -155,7 +155,7 @@ Test argument parser.
                         defined as list of comma separated values. Note that
                         regular fields will are favoured above custom fields
                         with same name. Output formats that support this are:
-                        dynamic, opensearch and xlsx.
+                        dynamic, opensearch, parquet and xlsx.
   --custom_formatter_definitions, --custom-formatter-definitions PATH
                         Path to a file containing custom event formatter
                         definitions, which is a .yaml file. Custom event
@@ -196,7 +196,7 @@ Test argument parser.
                         besides the default fields. Multiple additional field
                         names can be defined as a list of comma separated
                         values. Output formats that support additional fields
-                        are: dynamic, opensearch and xlsx.
+                        are: dynamic, opensearch, parquet and xlsx.
   --custom_fields CUSTOM_FIELDS, --custom-fields CUSTOM_FIELDS
                         Defines custom fields to be included in the output
                         besides the default fields. A custom field is defined
@@ -204,7 +204,7 @@ Test argument parser.
                         defined as list of comma separated values. Note that
                         regular fields will are favoured above custom fields
                         with same name. Output formats that support this are:
-                        dynamic, opensearch and xlsx.
+                        dynamic, opensearch, parquet and xlsx.
   --custom_formatter_definitions PATH, --custom-formatter-definitions PATH
                         Path to a file containing custom event formatter
                         definitions, which is a .yaml file. Custom event
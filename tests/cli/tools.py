@@ -56,6 +56,17 @@ Test argument parser.
     # TODO: add test for _ConfigureLogging
     # TODO: add test for _EncodeString
 
+    def testGetPrintableComparableString(self):
+        """Tests the _GetPrintableComparableString function."""
+        cli_tool = tools.CLITool()
+
+        printable_string = cli_tool._GetPrintableComparableString(
+            "type: OS, location: /tmp/te\x00st\ntype: GZIP\n"
+        )
+        self.assertEqual(
+            printable_string, "type: OS, location: /tmp/te\\x00st\ntype: GZIP\n"
+        )
+
     def testParseInformationalOptions(self):
         """Tests the _ParseInformationalOptions function."""
         test_tool = tools.CLITool()
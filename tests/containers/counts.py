@@ -34,5 +34,18 @@ class ParserCountTest(shared_test_lib.BaseTestCase):
         self.assertEqual(attribute_names, expected_attribute_names)
 
 
+class WarningCountTest(shared_test_lib.BaseTestCase):
+    """Tests for the warning count attribute container."""
+
+    def testGetAttributeNames(self):
+        """Tests the GetAttributeNames function."""
+        attribute_container = counts.WarningCount()
+
+        expected_attribute_names = ["counter_name", "name", "number_of_events"]
+
+        attribute_names = sorted(attribute_container.GetAttributeNames())
+        self.assertEqual(attribute_names, expected_attribute_names)
+
+
 if __name__ == "__main__":
     unittest.main()
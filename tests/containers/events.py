@@ -115,6 +115,7 @@ class EventDataStreamTest(shared_test_lib.BaseTestCase):
         attribute_container = events.EventDataStream()
 
         expected_attribute_names = [
+            "duplicate_of",
             "file_entropy",
             "md5_hash",
             "path_spec",
@@ -44,8 +44,33 @@ class TaskTest(shared_test_lib.BaseTestCase):
         self.assertNotEqual(retry_task.identifier, task.identifier)
         self.assertTrue(task.has_retry)
         self.assertFalse(retry_task.has_retry)
+        self.assertEqual(retry_task.original_task_identifier, task.identifier)
         self.assertEqual(retry_task.path_spec, task.path_spec)
 
+        # A retry task of a retry task refers to the originally abandoned task.
+        second_retry_task = retry_task.CreateRetryTask()
+        self.assertEqual(second_retry_task.original_task_identifier, task.identifier)
+
+        task = tasks.Task(session_identifier=session_identifier)
+        task.path_specs = ["test_path_spec1", "test_path_spec2"]
+
+        retry_task = task.CreateRetryTask()
+        self.assertEqual(retry_task.path_specs, task.path_specs)
+
+    def testGetPathSpecs(self):
+        """Tests the GetPathSpecs function."""
+        session_identifier = f"{uuid.uuid4().hex:s}"
+        task = tasks.Task(session_identifier=session_identifier)
+
+        self.assertEqual(task.GetPathSpecs(), [])
+
+        task.path_spec = "test_path_spec"
+        self.assertEqual(task.GetPathSpecs(), ["test_path_spec"])
+
+        task.path_spec = None
+        task.path_specs = ["test_path_spec1", "test_path_spec2"]
+        self.assertEqual(task.GetPathSpecs(), ["test_path_spec1", "test_path_spec2"])
+
     def testUpdateProcessingTime(self):
         """Tests the UpdateProcessingTime function."""
         session_identifier = f"{uuid.uuid4().hex:s}"
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for the block-cached file-like object."""
+
+import os
+import unittest
+import zipfile
+
+from plaso.engine import cached_file_object
+
+from tests import test_lib as shared_test_lib
+
+
+class BlockCachedFileObjectTest(shared_test_lib.BaseTestCase):
+    """Tests for the block-cached file-like object."""
+
+    # pylint: disable=protected-access
+
+    def _GetTestFileObject(self):
+        """Retrieves a test file-like object and its data.
+
+        Returns:
+          tuple[dfvfs.FileIO, bytes]: test file-like object and its data.
+        """
+        test_file_path = self._GetTestFilePath(["syslog", "syslog"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with open(test_file_path, "rb") as file_object:
+            test_data = file_object.read()
+
+        file_entry = self._GetTestFileEntry(["syslog", "syslog"])
+        return file_entry.GetFileObject(), test_data
+
+    def testRead(self):
+        """Tests the read function."""
+        file_object, test_data = self._GetTestFileObject()
+
+        test_file_object = cached_file_object.BlockCachedFileObject(
+            file_object, block_size=100
+        )
+        self.assertEqual(test_file_object.get_size(), len(test_data))
+
+        data = test_file_object.read()
+        self.assertEqual(data, test_data)
+        self.assertEqual(test_file_object.get_offset(), len(test_data))
+        self.assertEqual(test_file_object.number_of_cache_hits, 0)
+        self.assertEqual(test_file_object.number_of_cache_misses, 16)
+
+        data = test_file_object.read()
+        self.assertEqual(data, b"")
+
+        test_file_object.seek(150, os.SEEK_SET)
+        data = test_file_object.read(300)
+        self.assertEqual(data, test_data[150:450])
+        self.assertEqual(test_file_object.tell(), 450)
+        self.assertEqual(test_file_object.number_of_cache_hits, 4)
+        self.assertEqual(test_file_object.number_of_cache_misses, 16)
+
+        test_file_object.seek(-10, os.SEEK_END)
+        data = test_file_object.read(100)
+        self.assertEqual(data, test_data[-10:])
+
+        test_file_object.seek(len(test_data) + 10, os.SEEK_SET)
+        data = test_file_object.read(100)
+        self.assertEqual(data, b"")
+
+        with self.assertRaises(OSError):
+            test_file_object.read(-1)
+
+    def testReadWithMaximumCacheSize(self):
+        """Tests the read function with a maximum cache size."""
+        file_object, test_data = self._GetTestFileObject()
+
+        test_file_object = cached_file_object.BlockCachedFileObject(
+            file_object, block_size=100, maximum_cache_size=400
+        )
+
+        data = test_file_object.read()
+        self.assertEqual(data, test_data)
+        self.assertEqual(len(test_file_object._blocks), 4)
+        self.assertEqual(list(test_file_object._blocks.keys()), [0, 1, 2, 3])
+
+        test_file_object.seek(1000, os.SEEK_SET)
+        data = test_file_object.read(200)
+        self.assertEqual(data, test_data[1000:1200])
+        self.assertEqual(list(test_file_object._blocks.keys()), [2, 3, 10, 11])
+        self.assertLessEqual(test_file_object._cached_data_size, 400)
+
+        test_file_object.seek(250, os.SEEK_SET)
+        data = test_file_object.read(100)
+        self.assertEqual(data, test_data[250:350])
+        self.assertEqual(list(test_file_object._blocks.keys()), [10, 11, 2, 3])
+
+    def testSeek(self):
+        """Tests the seek function."""
+        file_object, test_data = self._GetTestFileObject()
+
+        test_file_object = cached_file_object.BlockCachedFileObject(file_object)
+
+        test_file_object.seek(10, os.SEEK_SET)
+        self.assertEqual(test_file_object.get_offset(), 10)
+
+        test_file_object.seek(10, os.SEEK_CUR)
+        self.assertEqual(test_file_object.get_offset(), 20)
+
+        test_file_object.seek(-10, os.SEEK_END)
+        self.assertEqual(test_file_object.get_offset(), len(test_data) - 10)
+
+        with self.assertRaises(OSError):
+            test_file_object.seek(-10, os.SEEK_SET)
+
+        with self.assertRaises(OSError):
+            test_file_object.seek(10, 99)
+
+    def testZipFile(self):
+        """Tests reading a ZIP file through the file-like object."""
+        file_entry = self._GetTestFileEntry(["Document.docx"])
+        file_object = file_entry.GetFileObject()
+
+        with cached_file_object.BlockCachedFileObject(file_object) as test_file_object:
+            self.assertTrue(test_file_object.readable())
+            self.assertTrue(test_file_object.seekable())
+            self.assertFalse(test_file_object.writable())
+
+            with zipfile.ZipFile(test_file_object, "r") as zip_file:
+                self.assertIn("docProps/core.xml", zip_file.namelist())
+
+
+if __name__ == "__main__":
+    unittest.main()
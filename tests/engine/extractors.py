@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for the extractor classes."""
 
+import hashlib
 import os
 import shutil
 import unittest
@@ -10,8 +11,11 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
+from dfwinreg import registry_searcher
 
+from plaso.containers import artifacts
 from plaso.engine import extractors
+from plaso.engine import parse_results_cache
 from plaso.parsers import mediator as parsers_mediator
 
 from tests import test_lib as shared_test_lib
@@ -21,6 +25,8 @@ from tests.engine import test_lib
 class EventDataExtractorTest(test_lib.EngineTestCase):
     """Tests for the event data extractor."""
 
+    # pylint: disable=protected-access
+
     def _CreateParserMediator(self, storage_writer, file_entry=None):
         """Creates a parser mediator.
 
@@ -40,6 +46,82 @@ class EventDataExtractorTest(test_lib.EngineTestCase):
         return parser_mediator
 
     # TODO: add test for _CheckParserCanProcessFileEntry
+
+    def testGetParseResultsKey(self):
+        """Tests the _GetParseResultsKey function."""
+        test_file_path = self._GetTestFilePath(["syslog_image.dd"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_extractor = extractors.EventDataExtractor()
+
+        os_path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path
+        )
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_TSK,
+            location="/logs/hidden.zip",
+            parent=os_path_spec,
+        )
+        file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+        file_object = file_entry.GetFileObject()
+
+        storage_writer = self._CreateStorageWriter()
+        parser_mediator = self._CreateParserMediator(
+            storage_writer, file_entry=file_entry
+        )
+
+        key = test_extractor._GetParseResultsKey(
+            parser_mediator, file_entry, "", file_object
+        )
+        self.assertIsNotNone(key)
+
+        key_with_same_values = test_extractor._GetParseResultsKey(
+            parser_mediator, file_entry, "", file_object
+        )
+        self.assertEqual(key_with_same_values, key)
+
+        # A digest of the content that was calculated before is reused.
+        file_object.seek(0, os.SEEK_SET)
+        content_hash = hashlib.blake2b(file_object.read(), digest_size=16)
+
+        key_with_content_digest = test_extractor._GetParseResultsKey(
+            parser_mediator,
+            file_entry,
+            "",
+            file_object,
+            content_digest=f"blake2b:{content_hash.hexdigest():s}",
+        )
+        self.assertEqual(key_with_content_digest, key)
+
+        key_with_content_digest = test_extractor._GetParseResultsKey(
+            parser_mediator,
+            file_entry,
+            "",
+            file_object,
+            content_digest=f"sha256:{hashlib.sha256().hexdigest():s}",
+        )
+        self.assertNotEqual(key_with_content_digest, key)
+
+        # The key depends on the environment variables of the file system.
+        system_configuration = artifacts.SystemConfigurationArtifact()
+        system_configuration.environment_variables = [
+            artifacts.EnvironmentVariableArtifact(
+                case_sensitive=False, name="SystemRoot", value="C:\\Windows"
+            )
+        ]
+        system_configuration.path_specs = [path_spec]
+
+        parser_mediator = parsers_mediator.ParserMediator(
+            system_configurations=[system_configuration]
+        )
+        parser_mediator.SetStorageWriter(storage_writer)
+        parser_mediator.SetFileEntry(file_entry)
+
+        key_with_environment_variables = test_extractor._GetParseResultsKey(
+            parser_mediator, file_entry, "", file_object
+        )
+        self.assertNotEqual(key_with_environment_variables, key)
+
     # TODO: add test for _GetSignatureMatchParserNames
     # TODO: add test for _InitializeParserObjects
     # TODO: add test for _ParseDataStreamWithParser
@@ -82,6 +164,144 @@ class EventDataExtractorTest(test_lib.EngineTestCase):
         )
         self.assertEqual(number_of_warnings, 0)
 
+    def testParseDataStreamWithParseResultsCache(self):
+        """Tests the ParseDataStream function with a parse results cache."""
+        test_file_path = self._GetTestFilePath(["recycler", "INFO2"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_extractor = extractors.EventDataExtractor(
+            parser_filter_expression="recycle_bin_info2"
+        )
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path
+        )
+        file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_cache = parse_results_cache.ParseResultsCache()
+            test_cache.Open(temp_directory)
+
+            try:
+                test_extractor.SetParseResultsCache(test_cache)
+
+                for _ in range(2):
+                    storage_writer = self._CreateStorageWriter()
+                    parser_mediator = self._CreateParserMediator(
+                        storage_writer, file_entry=file_entry
+                    )
+
+                    test_extractor.ParseDataStream(parser_mediator, file_entry, "")
+
+                    number_of_event_data = (
+                        storage_writer.GetNumberOfAttributeContainers("event_data")
+                    )
+                    self.assertEqual(number_of_event_data, 4)
+
+                    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+                        "extraction_warning"
+                    )
+                    self.assertEqual(number_of_warnings, 0)
+
+                self.assertEqual(test_cache.number_of_cache_hits, 1)
+                self.assertEqual(test_cache.number_of_cache_misses, 1)
+
+            finally:
+                test_extractor.SetParseResultsCache(None)
+                test_cache.Close()
+
+    def testParseDataStreamWithParseResultsCacheAndWAL(self):
+        """Tests the ParseDataStream function with a cache and a SQLite WAL."""
+        test_file_path = self._GetTestFilePath(["wal_database.db"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_file_path = self._GetTestFilePath(["wal_database.db-wal"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_extractor = extractors.EventDataExtractor(
+            parser_filter_expression="sqlite"
+        )
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS,
+            location=self._GetTestFilePath(["wal_database.db"]),
+        )
+        file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_cache = parse_results_cache.ParseResultsCache()
+            test_cache.Open(temp_directory)
+
+            try:
+                test_extractor.SetParseResultsCache(test_cache)
+
+                for _ in range(2):
+                    storage_writer = self._CreateStorageWriter()
+                    parser_mediator = self._CreateParserMediator(
+                        storage_writer, file_entry=file_entry
+                    )
+
+                    test_extractor.ParseDataStream(parser_mediator, file_entry, "")
+
+                    # The event data stream of the WAL file is produced by the parser.
+                    number_of_event_data_streams = (
+                        storage_writer.GetNumberOfAttributeContainers(
+                            "event_data_stream"
+                        )
+                    )
+                    self.assertEqual(number_of_event_data_streams, 1)
+
+                # The parse results of a SQLite database are not cached.
+                self.assertEqual(test_cache.number_of_cache_hits, 0)
+                self.assertEqual(test_cache.number_of_cache_misses, 2)
+
+            finally:
+                test_extractor.SetParseResultsCache(None)
+                test_cache.Close()
+
+    def testParseDataStreamWithParseResultsCacheAndRegistryFindSpecs(self):
+        """Tests the ParseDataStream function with a cache and find specs."""
+        test_file_path = self._GetTestFilePath(["NTUSER.DAT"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        test_extractor = extractors.EventDataExtractor(
+            parser_filter_expression="winreg"
+        )
+
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path
+        )
+        file_entry = path_spec_resolver.Resolver.OpenFileEntry(path_spec)
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_cache = parse_results_cache.ParseResultsCache()
+            test_cache.Open(temp_directory)
+
+            try:
+                test_extractor.SetParseResultsCache(test_cache)
+
+                for _ in range(2):
+                    storage_writer = self._CreateStorageWriter()
+                    parser_mediator = self._CreateParserMediator(
+                        storage_writer, file_entry=file_entry
+                    )
+                    parser_mediator.registry_find_specs = [
+                        registry_searcher.FindSpec(
+                            key_path="HKEY_CURRENT_USER\\Software\\Microsoft"
+                        )
+                    ]
+
+                    test_extractor.ParseDataStream(parser_mediator, file_entry, "")
+
+                # The parse results of a Windows Registry file parsed with find
+                # specifications are not cached.
+                self.assertEqual(test_cache.number_of_cache_hits, 0)
+                self.assertEqual(test_cache.number_of_cache_misses, 2)
+
+            finally:
+                test_extractor.SetParseResultsCache(None)
+                test_cache.Close()
+
     def testParseDataStreamWithForceParser(self):
         """Tests the ParseDataStream function with force parser."""
         test_file_path = self._GetTestFilePath(["UsnJrnl.raw"])
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Tests for the persistent cache of parse results."""
+
+import unittest
+
+from plaso.containers import event_sources
+from plaso.containers import events
+from plaso.containers import warnings
+from plaso.engine import parse_results_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class ParseResultsCacheTest(shared_test_lib.BaseTestCase):
+    """Tests for the persistent cache of parse results."""
+
+    # pylint: disable=protected-access
+
+    def _CreateParseResults(self, body):
+        """Creates parse results.
+
+        Args:
+          body (str): body of the test event data.
+
+        Returns:
+          list[tuple[AttributeContainer, bool, bool]]: parse results.
+        """
+        event_data = events.EventData(data_type="test:event")
+        event_data.body = body
+        event_data.parser = "test_parser"
+
+        warning = warnings.RecoveryWarning(
+            message="test warning", parser_chain="test_parser"
+        )
+
+        return [(event_data, False, False), (warning, True, True)]
+
+    def testSerializeParseResults(self):
+        """Tests the _SerializeParseResults and _DeserializeParseResults functions."""
+        test_cache = parse_results_cache.ParseResultsCache()
+
+        parse_results = self._CreateParseResults("test body")
+        data = test_cache._SerializeParseResults(parse_results)
+        self.assertIsNotNone(data)
+
+        parse_results = test_cache._DeserializeParseResults(data)
+        self.assertEqual(len(parse_results), 2)
+
+        container, corrupted, recovered = parse_results[0]
+        self.assertEqual(container.CONTAINER_TYPE, "event_data")
+        self.assertEqual(container.body, "test body")
+        self.assertFalse(corrupted)
+        self.assertFalse(recovered)
+
+        container, corrupted, recovered = parse_results[1]
+        self.assertEqual(container.CONTAINER_TYPE, "recovery_warning")
+        self.assertEqual(container.message, "test warning")
+        self.assertTrue(corrupted)
+        self.assertTrue(recovered)
+
+        event_data = events.EventData(data_type="test:event")
+        event_data.binary = b"\x00\x01"
+
+        data = test_cache._SerializeParseResults([(event_data, False, False)])
+        self.assertIsNone(data)
+
+        event_source = event_sources.EventSource()
+
+        data = test_cache._SerializeParseResults([(event_source, False, False)])
+        self.assertIsNone(data)
+
+        with self.assertRaises(ValueError):
+            test_cache._DeserializeParseResults(b"bogus")
+
+    def testOpenClose(self):
+        """Tests the Open and Close functions."""
+        test_cache = parse_results_cache.ParseResultsCache()
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_cache.Open(temp_directory)
+
+            with self.assertRaises(OSError):
+                test_cache.Open(temp_directory)
+
+            test_cache.Close()
+
+            with self.assertRaises(OSError):
+                test_cache.Close()
+
+    def testGetAndSetParseResults(self):
+        """Tests the GetParseResults and SetParseResults functions."""
+        test_cache = parse_results_cache.ParseResultsCache()
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_cache.Open(temp_directory)
+
+            try:
+                parse_results = test_cache.GetParseResults("key1")
+                self.assertIsNone(parse_results)
+
+                test_cache.SetParseResults("key1", self._CreateParseResults("body1"))
+
+                parse_results = test_cache.GetParseResults("key1")
+                self.assertIsNotNone(parse_results)
+                self.assertEqual(len(parse_results), 2)
+                self.assertEqual(parse_results[0][0].body, "body1")
+
+                self.assertEqual(test_cache.number_of_cache_hits, 1)
+                self.assertEqual(test_cache.number_of_cache_misses, 1)
+
+            finally:
+                test_cache.Close()
+
+            # Test if the parse results are persistent.
+            test_cache = parse_results_cache.ParseResultsCache()
+            test_cache.Open(temp_directory)
+
+            try:
+                parse_results = test_cache.GetParseResults("key1")
+                self.assertIsNotNone(parse_results)
+
+            finally:
+                test_cache.Close()
+
+    def testSetParseResultsWithMaximumSize(self):
+        """Tests the SetParseResults function with a maximum size."""
+        parse_results = self._CreateParseResults("body")
+
+        test_cache = parse_results_cache.ParseResultsCache()
+        data_size = len(test_cache._SerializeParseResults(parse_results))
+
+        test_cache = parse_results_cache.ParseResultsCache(maximum_size=2 * data_size)
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_cache.Open(temp_directory)
+
+            try:
+                test_cache.SetParseResults("key1", parse_results)
+                test_cache.SetParseResults("key2", parse_results)
+
+                # Accessing key1 makes key2 the least recently used parse results.
+                self.assertIsNotNone(test_cache.GetParseResults("key1"))
+
+                test_cache.SetParseResults("key3", parse_results)
+
+                self.assertIsNotNone(test_cache.GetParseResults("key1"))
+                self.assertIsNone(test_cache.GetParseResults("key2"))
+                self.assertIsNotNone(test_cache.GetParseResults("key3"))
+
+            finally:
+                test_cache.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -99,6 +99,15 @@ class ProcessingStatusTest(unittest.TestCase):
             "test", "Idle", 12345, 2000000, "test process", 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
         )
 
+    def testUpdateOutputStatus(self):
+        """Tests the UpdateOutputStatus function."""
+        output_status = processing_status.OutputStatus()
+
+        status = processing_status.ProcessingStatus()
+        status.UpdateOutputStatus(output_status)
+
+        self.assertEqual(status.output_status, output_status)
+
     def testUpdateTasksStatus(self):
         """Tests the UpdateTasksStatus function."""
         task_status = processing_status.TasksStatus()
@@ -22,6 +22,37 @@ class TaggingFileTestCase(shared_test_lib.BaseTestCase):
         tagging_rules = tag_file.GetEventTaggingRules()
         self.assertEqual(len(tagging_rules), 5)
 
+    def testGetEventTaggingRulesIndex(self):
+        """Tests the GetEventTaggingRulesIndex function."""
+        test_file_path = self._GetTestFilePath(["tagging_file", "valid.txt"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        tag_file = tagging_file.TaggingFile(test_file_path)
+
+        tagging_rules_index = tag_file.GetEventTaggingRulesIndex()
+
+        tagging_rules = tagging_rules_index.GetTaggingRulesByDataType(
+            "windows:evt:record"
+        )
+        label_names = [label_name for label_name, _ in tagging_rules]
+        self.assertEqual(
+            label_names,
+            ["file_downloaded", "login_attempt", "security_event", "text_contains"],
+        )
+
+        tagging_rules = tagging_rules_index.GetTaggingRulesByDataType(
+            "chrome:history:file_downloaded"
+        )
+        self.assertEqual(len(tagging_rules), 2)
+
+        label_name, filter_objects = tagging_rules[0]
+        self.assertEqual(label_name, "file_downloaded")
+        self.assertEqual(len(filter_objects), 2)
+
+        tagging_rules = tagging_rules_index.GetTaggingRulesByDataType("fs:stat")
+        label_names = [label_name for label_name, _ in tagging_rules]
+        self.assertEqual(label_names, ["file_downloaded", "text_contains"])
+
     def testGetEventTaggingRulesInvalidSyntax(self):
         """Tests the GetEventTaggingRules function on a file with invalid syntax."""
         test_file_path = self._GetTestFilePath(["tagging_file", "invalid_syntax.txt"])
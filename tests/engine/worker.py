@@ -2,6 +2,9 @@
 """Tests the event extraction worker."""
 
 import collections
+import hashlib
+import os
+import shutil
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -229,10 +232,12 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
         file_object = file_entry.GetFileObject()
         display_name = parser_mediator.GetDisplayName()
         event_data_stream = events.EventDataStream()
+        content_hash = hashlib.blake2b(digest_size=16)
 
-        extraction_worker._AnalyzeFileObject(
-            file_object, display_name, event_data_stream
+        result = extraction_worker._AnalyzeFileObject(
+            file_object, display_name, event_data_stream, content_hash=content_hash
         )
+        self.assertTrue(result)
 
         storage_writer.UpdateAttributeContainer(session)
 
@@ -243,6 +248,14 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
         event_attribute = getattr(event_data_stream, "test_result", None)
         self.assertEqual(event_attribute, "is_vegetable")
 
+        # The content hash is updated with the entire content of the file-like
+        # object while it is analyzed.
+        expected_content_hash = hashlib.blake2b(digest_size=16)
+        file_object.seek(0, os.SEEK_SET)
+        expected_content_hash.update(file_object.read())
+
+        self.assertEqual(content_hash.digest(), expected_content_hash.digest())
+
     def testCanSkipDataStream(self):
         """Tests the _CanSkipDataStream function."""
         extraction_worker = worker.EventExtractionWorker()
@@ -365,6 +378,89 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
         storage_writer.Close()
 
+    def testGetContentDigest(self):
+        """Tests the _GetContentDigest function."""
+        extraction_worker = worker.EventExtractionWorker()
+
+        file_entry = self._GetTestFileEntry(["syslog", "syslog"])
+        file_object = extraction_worker._GetCachedFileObject(file_entry, "")
+
+        event_data_stream = events.EventDataStream()
+
+        content_digest = extraction_worker._GetContentDigest(None, event_data_stream)
+        self.assertIsNone(content_digest)
+
+        content_digest = extraction_worker._GetContentDigest(
+            file_object, event_data_stream
+        )
+        self.assertEqual(content_digest, "blake2b:7677081b97a13a39ff4f3872fe07c628")
+
+        # The content hash that was updated while analyzing is used instead of
+        # reading the content again.
+        content_hash = hashlib.blake2b(digest_size=16)
+        file_object.seek(0, os.SEEK_SET)
+        content_hash.update(file_object.read())
+
+        content_digest = extraction_worker._GetContentDigest(
+            None, event_data_stream, content_hash=content_hash
+        )
+        self.assertEqual(content_digest, "blake2b:7677081b97a13a39ff4f3872fe07c628")
+
+        # The SHA-256 hash calculated by the hashing analyzer is reused.
+        event_data_stream.sha256_hash = (
+            "1f0105612f6ad2d225d6bd9ba631148740e312598878adcd2b74098a3dc50f4c"
+        )
+
+        content_digest = extraction_worker._GetContentDigest(
+            file_object, event_data_stream
+        )
+        self.assertEqual(
+            content_digest,
+            "sha256:1f0105612f6ad2d225d6bd9ba631148740e312598878adcd2b74098a3dc50f4c",
+        )
+
+    def testGetDuplicateDataStream(self):
+        """Tests the _GetDuplicateDataStream function."""
+        configuration = configurations.ExtractionConfiguration()
+        configuration.data_stream_deduplication = "content"
+
+        extraction_worker = worker.EventExtractionWorker()
+        extraction_worker.SetExtractionConfiguration(configuration)
+
+        file_entry = self._GetTestFileEntry(["syslog", "syslog"])
+        file_object = extraction_worker._GetCachedFileObject(file_entry, "")
+        content_digest = extraction_worker._GetContentDigest(
+            file_object, events.EventDataStream()
+        )
+
+        duplicate_of = extraction_worker._GetDuplicateDataStream(
+            file_entry, "", "OS:/store1/syslog", file_object, content_digest
+        )
+        self.assertIsNone(duplicate_of)
+
+        duplicate_of = extraction_worker._GetDuplicateDataStream(
+            file_entry, "", "OS:/store2/syslog", file_object, content_digest
+        )
+        self.assertEqual(duplicate_of, "OS:/store1/syslog")
+
+        # A data stream is not a duplicate of itself, such as when a task is
+        # retried.
+        duplicate_of = extraction_worker._GetDuplicateDataStream(
+            file_entry, "", "OS:/store1/syslog", file_object, content_digest
+        )
+        self.assertIsNone(duplicate_of)
+
+        file_entry = self._GetTestFileEntry(["syslog", "syslog_cron.log"])
+        file_object = extraction_worker._GetCachedFileObject(file_entry, "")
+        content_digest = extraction_worker._GetContentDigest(
+            file_object, events.EventDataStream()
+        )
+
+        duplicate_of = extraction_worker._GetDuplicateDataStream(
+            file_entry, "", "OS:/store2/syslog_cron.log", file_object, content_digest
+        )
+        self.assertIsNone(duplicate_of)
+
     def testIsMetadataFile(self):
         """Tests the _IsMetadataFile function."""
         extraction_worker = worker.EventExtractionWorker()
@@ -397,6 +493,18 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
         self._TestProcessPathSpec(storage_writer, path_spec, expected_event_data_counts)
 
+    def testProcessPathSpecZipBasedFile(self):
+        """Tests the ProcessPathSpec function on a ZIP-based file."""
+        path_spec = self._GetTestFilePathSpec(["Document.docx"])
+        storage_writer = fake_writer.FakeStorageWriter()
+
+        expected_event_data_counts = {
+            "fs:stat": 1,
+            "openxml:metadata": 1,
+        }
+
+        self._TestProcessPathSpec(storage_writer, path_spec, expected_event_data_counts)
+
     def testProcessPathSpecCompressedFileGZIP(self):
         """Tests the ProcessPathSpec function on a gzip compressed file."""
         path_spec = self._GetTestFilePathSpec(["syslog.gz"])
@@ -697,6 +805,68 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     # TODO: add tests for SetProcessingProfiler
     # TODO: add tests for SignalAbort
 
+    def testProcessPathSpecWithDataStreamDeduplication(self):
+        """Tests the ProcessPathSpec function with data stream deduplication."""
+        test_file_path = self._GetTestFilePath(["syslog", "syslog"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            for directory_name in ("store1", "store2"):
+                directory_path = os.path.join(temp_directory, directory_name)
+                os.mkdir(directory_path)
+                shutil.copy(test_file_path, directory_path)
+
+            path_spec = path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=temp_directory
+            )
+
+            # The copies have different locations and are both extracted.
+            configuration = configurations.ExtractionConfiguration()
+            configuration.data_stream_deduplication = "location"
+
+            extraction_worker = worker.EventExtractionWorker()
+            extraction_worker.SetExtractionConfiguration(configuration)
+
+            storage_writer = fake_writer.FakeStorageWriter()
+
+            expected_event_data_counts = {
+                "fs:stat": 5,
+                "syslog:cron:task_run": 6,
+                "syslog:line": 26,
+            }
+
+            self._TestProcessPathSpec(
+                storage_writer,
+                path_spec,
+                expected_event_data_counts,
+                extraction_worker=extraction_worker,
+            )
+
+            self.assertEqual(len(extraction_worker._data_stream_index), 2)
+
+            # The content of the second copy is not extracted.
+            configuration.data_stream_deduplication = "content"
+
+            extraction_worker = worker.EventExtractionWorker()
+            extraction_worker.SetExtractionConfiguration(configuration)
+
+            storage_writer = fake_writer.FakeStorageWriter()
+
+            expected_event_data_counts = {
+                "fs:stat": 5,
+                "syslog:cron:task_run": 3,
+                "syslog:line": 13,
+            }
+
+            self._TestProcessPathSpec(
+                storage_writer,
+                path_spec,
+                expected_event_data_counts,
+                extraction_worker=extraction_worker,
+            )
+
+        self.assertEqual(len(extraction_worker._data_stream_index), 1)
+
     def testExtractionWorkerHashing(self):
         """Test that the worker sets up and runs hashing code correctly."""
         extraction_worker = worker.EventExtractionWorker()
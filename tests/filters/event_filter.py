@@ -5,14 +5,81 @@ import unittest
 
 from plaso.containers import events
 from plaso.filters import event_filter
+from plaso.lib import definitions
 from plaso.lib import errors
 
+from tests.containers import test_lib as containers_test_lib
 from tests.filters import test_lib
 
 
 class EventObjectFilterTest(test_lib.FilterTestCase):
     """Tests for the event object filter."""
 
+    # pylint: disable=protected-access
+
+    _TEST_EVENTS = [
+        {
+            "_parser_chain": "filestat",
+            "data_type": "fs:stat",
+            "filename": "/usr/local/etc/issue",
+            "md5_hash": "4fd2cd2fbd3b4d0ad1d0d52a4f0a1e77",
+            "timestamp": "2020-12-23 15:00:00",
+            "timestamp_desc": definitions.TIME_DESCRIPTION_MODIFICATION,
+        },
+        {
+            "_parser_chain": "winevtx",
+            "data_type": "windows:evtx:record",
+            "event_identifier": 4624,
+            "source_name": "Microsoft-Windows-Security-Auditing",
+            "strings": ["user", "Logon Type 10"],
+            "timestamp": "2021-01-01 00:00:00",
+            "timestamp_desc": definitions.TIME_DESCRIPTION_WRITTEN,
+        },
+        {
+            "_parser_chain": "winevtx",
+            "data_type": "windows:evtx:record",
+            "event_identifier": 0,
+            "source_name": "",
+            "timestamp": "2019-06-01 12:30:00",
+            "timestamp_desc": definitions.TIME_DESCRIPTION_WRITTEN,
+        },
+        {
+            "data_type": "syslog:line",
+            "body": "session opened for user root by (uid=0)",
+            "reporter": "CRON",
+            "timestamp": "2020-12-23 15:00:00",
+            "timestamp_desc": definitions.TIME_DESCRIPTION_WRITTEN,
+        },
+    ]
+
+    _TEST_FILTER_EXPRESSIONS = [
+        "data_type is 'fs:stat'",
+        "data_type not is 'fs:stat'",
+        "data_type != 'fs:stat'",
+        "parser is 'winevtx' and event_identifier == 4624",
+        "event_identifier > 100 or reporter contains 'cron'",
+        "event_identifier >= 4624 and event_identifier <= 4625",
+        "event_identifier < 4624",
+        "source_name is ''",
+        "source_name contains 'security' and data_type not is 'fs:stat'",
+        "source_name not contains 'Security'",
+        "strings contains 'Logon Type 10'",
+        "filename contains PATH('etc/issue')",
+        "md5_hash is '4fd2cd2fbd3b4d0ad1d0d52a4f0a1e77'",
+        "body regexp 'session (opened|closed)'",
+        "body iregexp 'SESSION OPENED'",
+        "tag contains 'Malware'",
+        "tag not contains 'Malware'",
+        "timestamp is DATETIME('2020-12-23T15:00:00')",
+        "timestamp > DATETIME('2020-01-01T00:00:00') and "
+        "timestamp_desc contains 'Written'",
+        "(data_type is 'fs:stat' or data_type is 'syslog:line') and "
+        "(filename contains 'issue' or body contains 'root')",
+        "data_type is 'syslog:line' and (reporter is 'CRON' or (body contains "
+        "'uid=0' and body not contains 'closed'))",
+        "unknown_attribute is 'value' or unknown_attribute not is 'value'",
+    ]
+
     def testCompilerFilter(self):
         """Tests the CompileFilter function."""
         test_filter = event_filter.EventObjectFilter()
@@ -66,6 +133,94 @@ class EventObjectFilterTest(test_lib.FilterTestCase):
         result = test_filter.Match(None, event_data, None, None)
         self.assertFalse(result)
 
+    def testMatchWithCompiledFilter(self):
+        """Tests that the compiled filter matches the same as the filter."""
+        event_tag = events.EventTag()
+        event_tag.AddLabels(["Malware"])
+
+        for filter_expression in self._TEST_FILTER_EXPRESSIONS:
+            test_filter = event_filter.EventObjectFilter()
+            test_filter.CompileFilter(filter_expression)
+
+            for event_values in self._TEST_EVENTS:
+                event, event_data, event_data_stream = (
+                    containers_test_lib.CreateEventFromValues(event_values)
+                )
+                for test_event_tag in (None, event_tag):
+                    expected_result = test_filter._event_filter.Matches(
+                        event, event_data, event_data_stream, test_event_tag
+                    )
+                    result = test_filter.Match(
+                        event, event_data, event_data_stream, test_event_tag
+                    )
+                    self.assertEqual(result, expected_result, msg=filter_expression)
+
+    def testGetDataTypes(self):
+        """Tests the GetDataTypes function."""
+        test_filter = event_filter.EventObjectFilter()
+
+        data_types = test_filter.GetDataTypes()
+        self.assertIsNone(data_types)
+
+        test_filter.CompileFilter(
+            "data_type is 'fs:stat' AND filename contains 'Windows/Tasks/At'"
+        )
+
+        data_types = test_filter.GetDataTypes()
+        self.assertEqual(data_types, frozenset(["fs:stat"]))
+
+        test_filter.CompileFilter(
+            "(data_type is 'windows:evt:record' OR "
+            "data_type is 'windows:evtx:record') AND event_identifier is 4624"
+        )
+
+        data_types = test_filter.GetDataTypes()
+        self.assertEqual(
+            data_types, frozenset(["windows:evt:record", "windows:evtx:record"])
+        )
+
+        test_filter.CompileFilter("data_type is 'fs:stat' OR filename contains 'At'")
+
+        data_types = test_filter.GetDataTypes()
+        self.assertIsNone(data_types)
+
+        test_filter.CompileFilter("data_type not is 'fs:stat'")
+
+        data_types = test_filter.GetDataTypes()
+        self.assertIsNone(data_types)
+
+    def testGetSQLExpression(self):
+        """Tests the GetSQLExpression function."""
+        attribute_expressions = {
+            "_parser_chain": "event_data._parser_chain",
+            "data_type": "event_data.data_type",
+            "timestamp": "event.timestamp",
+        }
+
+        test_filter = event_filter.EventObjectFilter()
+
+        sql_expression = test_filter.GetSQLExpression(attribute_expressions)
+        self.assertIsNone(sql_expression)
+
+        test_filter.CompileFilter(
+            'parser is "filestat" and timestamp > DATETIME("2020-12-23T15:00:00") '
+            'and filename contains "issue"'
+        )
+
+        sql_expression = test_filter.GetSQLExpression(attribute_expressions)
+        self.assertEqual(
+            sql_expression,
+            (
+                "((event_data._parser_chain = 'filestat') AND "
+                "(event.timestamp >= 1608735599999999))"
+            ),
+        )
+
+        test_filter.CompileFilter('message contains "issue"')
+
+        sql_expression = test_filter.GetSQLExpression(attribute_expressions)
+        self.assertIsNone(sql_expression)
+
 
 if __name__ == "__main__":
     unittest.main()
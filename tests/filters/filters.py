@@ -3,6 +3,8 @@
 
 import unittest
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+
 from plaso.containers import events
 from plaso.filters import filters
 from plaso.lib import definitions
@@ -10,6 +12,13 @@ from plaso.lib import definitions
 from tests import test_lib as shared_test_lib
 from tests.containers import test_lib as containers_test_lib
 
+_ATTRIBUTE_EXPRESSIONS = {
+    "_parser_chain": "event_data._parser_chain",
+    "data_type": "event_data.data_type",
+    "tag": "event_tag.labels",
+    "timestamp": "event.timestamp",
+}
+
 
 class FalseFilter(filters.Operator):
     """A filter which always evaluates to False for testing."""
@@ -112,6 +121,58 @@ class AndFilterTest(shared_test_lib.BaseTestCase):
         result = filter_object.Matches(event, event_data, None, None)
         self.assertFalse(result)
 
+    def testGetSQLExpression(self):
+        """Tests the GetSQLExpression function."""
+        data_type_filter_object = filters.EqualsOperator(
+            arguments=["data_type", "test:event"]
+        )
+        true_filter_object = TrueFilter()
+
+        filter_object = filters.AndFilter(
+            arguments=[data_type_filter_object, true_filter_object]
+        )
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(sql_expression, "(event_data.data_type = 'test:event')")
+
+        filter_object = filters.AndFilter(
+            arguments=[true_filter_object, true_filter_object]
+        )
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
+    def testGetDataTypes(self):
+        """Tests the GetDataTypes function."""
+        data_type_filter_object = filters.InSet(
+            arguments=["data_type", ["test:event", "test:other"]]
+        )
+        true_filter_object = TrueFilter()
+
+        filter_object = filters.AndFilter(
+            arguments=[data_type_filter_object, true_filter_object]
+        )
+
+        data_types = filter_object.GetDataTypes()
+        self.assertEqual(data_types, frozenset(["test:event", "test:other"]))
+
+        filter_object = filters.AndFilter(
+            arguments=[
+                data_type_filter_object,
+                filters.EqualsOperator(arguments=["data_type", "test:event"]),
+            ]
+        )
+
+        data_types = filter_object.GetDataTypes()
+        self.assertEqual(data_types, frozenset(["test:event"]))
+
+        filter_object = filters.AndFilter(
+            arguments=[true_filter_object, true_filter_object]
+        )
+
+        data_types = filter_object.GetDataTypes()
+        self.assertIsNone(data_types)
+
 
 class OrFilterTest(shared_test_lib.BaseTestCase):
     """Tests the boolean OR filter."""
@@ -148,6 +209,58 @@ class OrFilterTest(shared_test_lib.BaseTestCase):
         result = filter_object.Matches(event, event_data, None, None)
         self.assertFalse(result)
 
+    def testGetSQLExpression(self):
+        """Tests the GetSQLExpression function."""
+        data_type_filter_object = filters.EqualsOperator(
+            arguments=["data_type", "test:event"]
+        )
+        parser_filter_object = filters.EqualsOperator(
+            arguments=["_parser_chain", "test_parser"]
+        )
+
+        filter_object = filters.OrFilter(
+            arguments=[data_type_filter_object, parser_filter_object]
+        )
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(
+            sql_expression,
+            (
+                "(event_data.data_type = 'test:event') OR "
+                "(event_data._parser_chain = 'test_parser')"
+            ),
+        )
+
+        filter_object = filters.OrFilter(
+            arguments=[data_type_filter_object, TrueFilter()]
+        )
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
+    def testGetDataTypes(self):
+        """Tests the GetDataTypes function."""
+        data_type_filter_object = filters.EqualsOperator(
+            arguments=["data_type", "test:event"]
+        )
+        other_data_type_filter_object = filters.EqualsOperator(
+            arguments=["data_type", "test:other"]
+        )
+
+        filter_object = filters.OrFilter(
+            arguments=[data_type_filter_object, other_data_type_filter_object]
+        )
+
+        data_types = filter_object.GetDataTypes()
+        self.assertEqual(data_types, frozenset(["test:event", "test:other"]))
+
+        filter_object = filters.OrFilter(
+            arguments=[data_type_filter_object, TrueFilter()]
+        )
+
+        data_types = filter_object.GetDataTypes()
+        self.assertIsNone(data_types)
+
 
 class IdentityFilterTest(shared_test_lib.BaseTestCase):
     """Tests the filter which always evaluates to True."""
@@ -226,6 +339,53 @@ class GenericBinaryOperatorTest(shared_test_lib.BaseTestCase):
         test_value = filter_object._GetValue("tag", event, event_data, None, event_tag)
         self.assertEqual(test_value, ["browser_search"])
 
+    def testGetSQLExpression(self):
+        """Tests the GetSQLExpression function."""
+        filter_object = filters.EqualsOperator(arguments=["data_type", "it's"])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(sql_expression, "event_data.data_type = 'it''s'")
+
+        filter_object.FlipBool()
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
+        filter_object = filters.EqualsOperator(arguments=["filename", "/etc/issue"])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
+        filter_object = filters.EqualsOperator(arguments=["data_type", 1])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
+        date_time = dfdatetime_posix_time.PosixTime(timestamp=1608735600)
+
+        filter_object = filters.EqualsOperator(arguments=["timestamp", date_time])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(
+            sql_expression,
+            "event.timestamp BETWEEN 1608735599999999 AND 1608735600000001",
+        )
+
+        filter_object = filters.LessThanOperator(arguments=["timestamp", date_time])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(sql_expression, "event.timestamp <= 1608735600000001")
+
+        filter_object = filters.GreaterEqualOperator(arguments=["timestamp", date_time])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(sql_expression, "event.timestamp >= 1608735599999999")
+
+        filter_object = filters.NotEqualsOperator(arguments=["timestamp", date_time])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
     # TODO: add tests for FlipBool function
 
 
@@ -244,6 +404,24 @@ class EqualsOperatorTest(shared_test_lib.BaseTestCase):
         result = filter_object._CompareValue(10, 10)
         self.assertTrue(result)
 
+    def testGetDataTypes(self):
+        """Tests the GetDataTypes function."""
+        filter_object = filters.EqualsOperator(arguments=["data_type", "test:event"])
+
+        data_types = filter_object.GetDataTypes()
+        self.assertEqual(data_types, frozenset(["test:event"]))
+
+        filter_object = filters.EqualsOperator(arguments=["parser", "test:event"])
+
+        data_types = filter_object.GetDataTypes()
+        self.assertIsNone(data_types)
+
+        filter_object = filters.EqualsOperator(arguments=["data_type", "test:event"])
+        filter_object.FlipBool()
+
+        data_types = filter_object.GetDataTypes()
+        self.assertIsNone(data_types)
+
 
 class NotEqualsOperatorTest(shared_test_lib.BaseTestCase):
     """Tests the not equals operator."""
@@ -337,8 +515,88 @@ class GreaterEqualOperatorTest(shared_test_lib.BaseTestCase):
         self.assertTrue(result)
 
 
-# TODO: add tests for Contains
-# TODO: add tests for InSet
+class ContainsTest(shared_test_lib.BaseTestCase):
+    """Tests the contains operator."""
+
+    def testGetSQLExpression(self):
+        """Tests the GetSQLExpression function."""
+        filter_object = filters.Contains(arguments=["_parser_chain", "win_reg%"])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(
+            sql_expression,
+            "event_data._parser_chain LIKE '%win\\_reg\\%%' ESCAPE '\\'",
+        )
+
+        filter_object = filters.Contains(arguments=["tag", "browser_search"])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(
+            sql_expression,
+            "event_tag.labels LIKE '%\"browser\\_search\"%' ESCAPE '\\'",
+        )
+
+        filter_object = filters.Contains(arguments=["data_type", "\u00edmynd"])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
+
+class InSetTest(shared_test_lib.BaseTestCase):
+    """Tests the in set operator."""
+
+    # pylint: disable=protected-access
+
+    def testCompileCompareFunction(self):
+        """Tests the _CompileCompareFunction function."""
+        for filter_value in (["a", "b", 1, 2.5], [["a"], "b"]):
+            filter_object = filters.InSet(arguments=["test_value", filter_value])
+            compare_function = filter_object._CompileCompareFunction()
+
+            for event_value in ("a", "c", "ab", 1, 1.0, True, 2.5, ["a", 1], ["a", 3]):
+                expected_result = filter_object._CompareValue(event_value, filter_value)
+                result = compare_function(event_value)
+                self.assertEqual(result, expected_result)
+
+    def testGetSQLExpression(self):
+        """Tests the GetSQLExpression function."""
+        filter_object = filters.InSet(
+            arguments=["data_type", ["test:event", "test:other"]]
+        )
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertEqual(
+            sql_expression, "event_data.data_type IN ('test:event', 'test:other')"
+        )
+
+        filter_object = filters.InSet(arguments=["data_type", "test:event"])
+
+        sql_expression = filter_object.GetSQLExpression(_ATTRIBUTE_EXPRESSIONS)
+        self.assertIsNone(sql_expression)
+
+    def testGetDataTypes(self):
+        """Tests the GetDataTypes function."""
+        filter_object = filters.InSet(
+            arguments=["data_type", ["test:event", "test:other"]]
+        )
+
+        data_types = filter_object.GetDataTypes()
+        self.assertEqual(data_types, frozenset(["test:event", "test:other"]))
+
+        filter_object = filters.InSet(arguments=["data_type", "test:event"])
+
+        data_types = filter_object.GetDataTypes()
+        self.assertIsNone(data_types)
+
+        filter_object = filters.InSet(
+            arguments=["data_type", ["test:event", "test:other"]]
+        )
+        filter_object.FlipBool()
+
+        data_types = filter_object.GetDataTypes()
+        self.assertIsNone(data_types)
+
+
 # TODO: add tests for Regexp
 # TODO: add tests for RegexpInsensitive
 
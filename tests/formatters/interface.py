@@ -181,6 +181,56 @@ class ConditionalEventFormatterTest(test_lib.EventFormatterTestCase):
             )
             event_formatter._CreateFormatStringMaps()
 
+    def testCompile(self):
+        """Tests the Compile function."""
+        event_formatter = interface.ConditionalEventFormatter(
+            data_type="test", format_string_pieces=self._TEST_FORMAT_STRING_PIECES
+        )
+        event_formatter.Compile()
+
+        self.assertEqual(len(event_formatter._compiled_format_string_pieces), 5)
+        self.assertEqual(len(event_formatter._compiled_format_string_short_pieces), 0)
+
+        attribute_name, format_string_piece, _ = (
+            event_formatter._compiled_format_string_pieces[2]
+        )
+        self.assertEqual(attribute_name, "numeric")
+        self.assertEqual(format_string_piece, "Value: 0x{numeric:02x}")
+
+        with self.assertRaises(RuntimeError):
+            format_string_pieces = ["{too} {many} formatting placeholders"]
+            event_formatter = interface.ConditionalEventFormatter(
+                data_type="test", format_string_pieces=format_string_pieces
+            )
+            event_formatter.Compile()
+
+        # An invalid format string piece is reported only once.
+        message = event_formatter.GetMessage({"too": 1, "many": 2})
+        self.assertEqual(message, "")
+
+    def testCompileFormatString(self):
+        """Tests the _CompileFormatString function."""
+        event_formatter = interface.ConditionalEventFormatter(data_type="test")
+        event_values = {"numeric": 12, "text": "café"}
+
+        test_format_strings = [
+            ("Comment {{escaped}}", None),
+            ("Value: {numeric}", 12),
+            ("Value: 0x{numeric:02x} (hex)", 12),
+            ("Text: {text!r}", "café"),
+            ("Text: {text!a:>12s}", "café"),
+            ("Text: {text:{numeric}s}", "café"),
+            ("{numeric} and {text}", 12),
+        ]
+        for format_string, attribute_value in test_format_strings:
+            format_function = event_formatter._CompileFormatString(format_string)
+            formatted_string = format_function(event_values, attribute_value)
+            self.assertEqual(formatted_string, format_string.format(**event_values))
+
+        format_function = event_formatter._CompileFormatString("Value: {bogus")
+        with self.assertRaises(ValueError):
+            format_function(event_values, None)
+
     def testGetFormatStringAttributeNames(self):
         """Tests the GetFormatStringAttributeNames function."""
         event_formatter = interface.ConditionalEventFormatter(
@@ -228,6 +278,38 @@ class ConditionalEventFormatterTest(test_lib.EventFormatterTestCase):
         )
         self.assertEqual(message_short, expected_message_short)
 
+    def testGetMessageShortWithFormatString(self):
+        """Tests the GetMessageShort function with a short format string."""
+        event_formatter = interface.ConditionalEventFormatter(
+            data_type="test",
+            format_string_pieces=self._TEST_FORMAT_STRING_PIECES,
+            format_string_short_pieces="{description} and {numeric}",
+        )
+        _, event_data, _ = containers_test_lib.CreateEventFromValues(
+            self._TEST_EVENTS[0]
+        )
+        event_values = event_data.CopyToDict()
+
+        message_short = event_formatter.GetMessageShort(event_values)
+        self.assertEqual(message_short, "this is beyond words and 12")
+
+        # A format string that cannot be formatted falls back to the event values.
+        event_formatter = interface.ConditionalEventFormatter(
+            data_type="test",
+            format_string_pieces=self._TEST_FORMAT_STRING_PIECES,
+            format_string_short_pieces="Value: {numeric:s}",
+        )
+
+        message_short = event_formatter.GetMessageShort(event_values)
+        self.assertTrue(message_short.startswith("_event_values_hash: "))
+
+        event_formatter = interface.ConditionalEventFormatter(
+            data_type="test", format_string_pieces=["Value: {numeric", "Comment"]
+        )
+
+        message = event_formatter.GetMessage(event_values)
+        self.assertIn("numeric: 12", message)
+
 
 if __name__ == "__main__":
     unittest.main()
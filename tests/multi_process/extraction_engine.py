@@ -3,31 +3,108 @@
 
 import collections
 import os
+import time
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import events
 from plaso.containers import sessions
+from plaso.containers import warnings
 from plaso.lib import definitions
 from plaso.engine import configurations
 from plaso.multi_process import extraction_engine
+from plaso.storage.sqlite import reader as sqlite_reader
 from plaso.storage.sqlite import writer as sqlite_writer
 
 from tests import test_lib as shared_test_lib
 
 
+class _FailingSQLiteStorageReader(sqlite_reader.SQLiteStorageReader):
+    """SQLite storage reader that fails after reading a number of containers."""
+
+    def __init__(self, path, maximum_number_of_containers):
+        """Initializes a storage reader.
+
+        Args:
+          path (str): path to the input file.
+          maximum_number_of_containers (int): number of attribute containers
+              that can be read before reading fails.
+        """
+        super().__init__(path)
+        self._number_of_containers = 0
+        self._maximum_number_of_containers = maximum_number_of_containers
+
+    def GetAttributeContainers(self, container_type, filter_expression=None):
+        """Retrieves a specific type of attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the resulting
+              attribute containers by.
+
+        Yields:
+          AttributeContainer: attribute container.
+
+        Raises:
+          OSError: if the maximum number of attribute containers was read.
+        """
+        for container in super().GetAttributeContainers(
+            container_type, filter_expression=filter_expression
+        ):
+            if self._number_of_containers >= self._maximum_number_of_containers:
+                raise OSError("Unable to read attribute container.")
+
+            self._number_of_containers += 1
+            yield container
+
+
+class _FailingMergeExtractionMultiProcessEngine(
+    extraction_engine.ExtractionMultiProcessEngine
+):
+    """Extraction engine that fails to read task stores of tasks not retried."""
+
+    # pylint: disable=arguments-differ,unused-argument
+
+    def _GetMergeTaskStorage(self, task_storage_format, task, profile_storage=True):
+        """Retrieves a task store ready to be merged with the session store.
+
+        Args:
+          task_storage_format (str): storage format used to store task results.
+          task (Task): task the storage changes are part of.
+          profile_storage (Optional[bool]): True if the storage profiler should
+              be set.
+
+        Returns:
+          StorageReader: storage reader of the task storage.
+        """
+        merge_storage_file_path = self._GetMergeTaskStorageFilePath(
+            task_storage_format, task
+        )
+        if task.original_task_identifier:
+            return sqlite_reader.SQLiteStorageReader(merge_storage_file_path)
+
+        return _FailingSQLiteStorageReader(merge_storage_file_path, 3)
+
+
 class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
     """Tests for the task-based multi-process extraction engine."""
 
-    def testProcessSource(self):
-        """Tests the PreprocessSource and ProcessSource functions."""
+    def _ProcessSource(self, test_engine):
+        """Processes a test source with an extraction engine.
+
+        Args:
+          test_engine (ExtractionMultiProcessEngine): extraction engine.
+
+        Returns:
+          tuple[ProcessingStatus, int, int, int, collections.Counter]: processing
+              status, number of events, number of extraction warnings, number of
+              recovery warnings and parsers counter.
+        """
         test_artifacts_path = shared_test_lib.GetTestFilePath(["artifacts"])
         self._SkipIfPathNotExists(test_artifacts_path)
 
-        test_engine = extraction_engine.ExtractionMultiProcessEngine(
-            maximum_number_of_tasks=100
-        )
         test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
 
         test_file_path = self._GetTestFilePath(["ímynd.dd"])
@@ -91,6 +168,119 @@ class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
             finally:
                 storage_writer.Close()
 
+        return (
+            processing_status,
+            number_of_events,
+            number_of_extraction_warnings,
+            number_of_recovery_warnings,
+            parsers_counter,
+        )
+
+    def _CreateTaskStore(self, test_engine, task):
+        """Creates a processed task store for testing.
+
+        Args:
+          test_engine (ExtractionMultiProcessEngine): extraction engine.
+          task (Task): task.
+        """
+        test_engine._task_manager.UpdateTaskAsProcessingByIdentifier(task.identifier)
+
+        task_storage_writer = sqlite_writer.SQLiteStorageWriter()
+        task_storage_writer.Open(path=test_engine._GetProcessedStorageFilePath(task))
+
+        try:
+            for _ in range(5):
+                event_data = events.EventData(data_type="test:event")
+                task_storage_writer.AddAttributeContainer(event_data)
+
+                warning = warnings.ExtractionWarning(message="test warning")
+                task_storage_writer.AddAttributeContainer(warning)
+
+        finally:
+            task_storage_writer.Close()
+
+    def testMergeTaskStorageWithReadError(self):
+        """Tests the _MergeTaskStorage function with a task store read error."""
+        session = sessions.Session()
+
+        test_engine = _FailingMergeExtractionMultiProcessEngine()
+        test_engine._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_engine._merge_task_storage_path = os.path.join(temp_directory, "merge")
+            os.mkdir(test_engine._merge_task_storage_path)
+
+            test_engine._processed_task_storage_path = os.path.join(
+                temp_directory, "processed"
+            )
+            os.mkdir(test_engine._processed_task_storage_path)
+
+            task = test_engine._task_manager.CreateTask(session.identifier)
+            self._CreateTaskStore(test_engine, task)
+
+            temp_file = os.path.join(temp_directory, "storage.plaso")
+            storage_writer = sqlite_writer.SQLiteStorageWriter()
+            storage_writer.Open(path=temp_file)
+
+            try:
+                for _ in range(100):
+                    test_engine._MergeTaskStorage(storage_writer, session.identifier)
+                    if task.identifier in test_engine._task_manager._tasks_abandoned:
+                        break
+
+                    time.sleep(0.01)
+
+                self.assertIn(
+                    task.identifier, test_engine._task_manager._tasks_abandoned
+                )
+
+                # The attribute containers read before the error are merged.
+                number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+                    "event_data"
+                )
+                self.assertEqual(number_of_event_data, 3)
+
+                retry_task = test_engine._task_manager.CreateRetryTask()
+                self.assertIsNotNone(retry_task)
+                self._CreateTaskStore(test_engine, retry_task)
+
+                for _ in range(100):
+                    test_engine._MergeTaskStorage(storage_writer, session.identifier)
+                    if not test_engine._task_manager.HasPendingTasks():
+                        break
+
+                    time.sleep(0.01)
+
+                number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+                    "event_data"
+                )
+                number_of_extraction_warnings = (
+                    storage_writer.GetNumberOfAttributeContainers("extraction_warning")
+                )
+
+            finally:
+                test_engine._StopMergeTaskStoragePrefetching()
+                storage_writer.Close()
+
+        # The attribute containers merged before the error are not merged again
+        # when the retry task is merged.
+        self.assertEqual(number_of_event_data, 5)
+        self.assertEqual(number_of_extraction_warnings, 5)
+        self.assertEqual(test_engine._failed_merge_helpers, {})
+
+    def testProcessSource(self):
+        """Tests the PreprocessSource and ProcessSource functions."""
+        test_engine = extraction_engine.ExtractionMultiProcessEngine(
+            maximum_number_of_tasks=100
+        )
+        (
+            processing_status,
+            number_of_events,
+            number_of_extraction_warnings,
+            number_of_recovery_warnings,
+            parsers_counter,
+        ) = self._ProcessSource(test_engine)
+
         self.assertFalse(processing_status.aborted)
 
         self.assertEqual(number_of_events, 15)
@@ -100,6 +290,85 @@ class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
         expected_parsers_counter = collections.Counter({"filestat": 15, "total": 15})
         self.assertEqual(parsers_counter, expected_parsers_counter)
 
+    def testProcessSourceWithoutTaskBatches(self):
+        """Tests the ProcessSource function without task batches."""
+        test_engine = extraction_engine.ExtractionMultiProcessEngine(
+            maximum_number_of_tasks=100, task_batch_maximum_number_of_path_specs=0
+        )
+        (
+            processing_status,
+            number_of_events,
+            number_of_extraction_warnings,
+            number_of_recovery_warnings,
+            parsers_counter,
+        ) = self._ProcessSource(test_engine)
+
+        self.assertFalse(processing_status.aborted)
+
+        self.assertEqual(number_of_events, 15)
+        self.assertEqual(number_of_extraction_warnings, 0)
+        self.assertEqual(number_of_recovery_warnings, 0)
+
+        expected_parsers_counter = collections.Counter({"filestat": 15, "total": 15})
+        self.assertEqual(parsers_counter, expected_parsers_counter)
+
+    def testProcessSourceWithRecoveredRecords(self):
+        """Tests the ProcessSource function with recovered records."""
+        test_artifacts_path = shared_test_lib.GetTestFilePath(["artifacts"])
+        self._SkipIfPathNotExists(test_artifacts_path)
+
+        test_file_path = self._GetTestFilePath(["SysEvent.Evt"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        source_path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path
+        )
+
+        session = sessions.Session()
+
+        processing_configuration = configurations.ProcessingConfiguration()
+        processing_configuration.data_location = shared_test_lib.DATA_PATH
+        processing_configuration.parser_filter_expression = "winevt"
+        processing_configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+        test_engine = extraction_engine.ExtractionMultiProcessEngine(
+            maximum_number_of_tasks=100
+        )
+        test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "storage.plaso")
+            storage_writer = sqlite_writer.SQLiteStorageWriter()
+            storage_writer.Open(path=temp_file)
+
+            try:
+                processing_status = test_engine.ProcessSourceMulti(
+                    storage_writer,
+                    session.identifier,
+                    processing_configuration,
+                    [],
+                    [source_path_spec],
+                    storage_file_path=temp_directory,
+                )
+
+                parsers_counter = storage_writer.GetParsersCounter()
+                event_labels_counter = storage_writer.GetEventLabelsCounter()
+
+            finally:
+                storage_writer.Close()
+
+        self.assertFalse(processing_status.aborted)
+
+        self.assertEqual(parsers_counter["winevt"].number_of_events, 13002)
+        self.assertEqual(parsers_counter["total"].number_of_events, 13002)
+        self.assertNotIn("recovered", parsers_counter)
+
+        event_labels = {
+            label: event_label_count.number_of_events
+            for label, event_label_count in event_labels_counter.items()
+        }
+        self.assertEqual(event_labels, {"recovered": 876, "total": 876})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,12 +3,16 @@
 
 import unittest
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.engine import configurations
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.multi_process import extraction_process
@@ -99,6 +103,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
         )
         with shared_test_lib.TempDirectory() as temp_directory:
             configuration = configurations.ProcessingConfiguration()
+            configuration.data_location = shared_test_lib.DATA_PATH
             configuration.task_storage_path = temp_directory
 
             test_process = extraction_process.ExtractionWorkerProcess(
@@ -109,6 +114,57 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
             output_task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
             output_task_queue.Close(abort=True)
 
+    def testProcessEventData(self):
+        """Tests the _ProcessEventData function."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            configuration = configurations.ProcessingConfiguration()
+            configuration.task_storage_path = temp_directory
+
+            test_process = extraction_process.ExtractionWorkerProcess(
+                None, configuration, [], [], None, name="TestWorker"
+            )
+            test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+                data_location=shared_test_lib.DATA_PATH
+            )
+
+            task_storage_writer = self._CreateStorageWriter()
+
+            event_data = events.EventData(data_type="fs:stat")
+            event_data.access_time = dfdatetime_posix_time.PosixTime(
+                timestamp=1281647191
+            )
+            event_data.modification_time = dfdatetime_posix_time.PosixTime(
+                timestamp=1281643591
+            )
+            event_data._parser_chain = "filestat"
+            task_storage_writer.AddAttributeContainer(event_data)
+
+            test_process._ProcessEventData(task_storage_writer)
+
+            self.assertEqual(test_process._number_of_consumed_event_data, 1)
+            self.assertEqual(test_process._number_of_produced_events, 2)
+
+            number_of_events = task_storage_writer.GetNumberOfAttributeContainers(
+                "event"
+            )
+            self.assertEqual(number_of_events, 2)
+
+            data_type_counts = {
+                data_type_count.name: data_type_count.number_of_events
+                for data_type_count in task_storage_writer.GetAttributeContainers(
+                    "data_type_count"
+                )
+            }
+            self.assertEqual(data_type_counts, {"fs:stat": 2, "total": 2})
+
+            parser_counts = {
+                parser_count.name: parser_count.number_of_events
+                for parser_count in task_storage_writer.GetAttributeContainers(
+                    "parser_count"
+                )
+            }
+            self.assertEqual(parser_counts, {"filestat": 2, "total": 2})
+
     def testProcessPathSpec(self):
         """Tests the _ProcessPathSpec function."""
         test_file_path = self._GetTestFilePath(["testdir", "filter_1.txt"])
@@ -145,6 +201,9 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
             test_process = extraction_process.ExtractionWorkerProcess(
                 None, configuration, [], [], None, name="TestWorker"
             )
+            test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+                data_location=shared_test_lib.DATA_PATH
+            )
             test_process._extraction_worker = TestEventExtractionWorker()
 
             task_storage_writer = self._CreateStorageWriter()
@@ -154,6 +213,47 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
             task = tasks.Task(session_identifier=session.identifier)
             test_process._ProcessTask(task)
 
+            self.assertEqual(test_process._number_of_consumed_sources, 0)
+
+    def testProcessTaskWithBatch(self):
+        """Tests the _ProcessTask function with a batched task."""
+        test_file_path1 = self._GetTestFilePath(["testdir", "filter_1.txt"])
+        self._SkipIfPathNotExists(test_file_path1)
+
+        test_file_path2 = self._GetTestFilePath(["testdir", "filter_3.txt"])
+        self._SkipIfPathNotExists(test_file_path2)
+
+        session = sessions.Session()
+        with shared_test_lib.TempDirectory() as temp_directory:
+            configuration = configurations.ProcessingConfiguration()
+            configuration.task_storage_path = temp_directory
+            configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+
+            test_process = extraction_process.ExtractionWorkerProcess(
+                None, configuration, [], [], None, name="TestWorker"
+            )
+            test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+                data_location=shared_test_lib.DATA_PATH
+            )
+            test_process._extraction_worker = TestEventExtractionWorker()
+
+            task_storage_writer = self._CreateStorageWriter()
+            test_process._parser_mediator = self._CreateParserMediator(
+                task_storage_writer
+            )
+            task = tasks.Task(session_identifier=session.identifier)
+            task.path_specs = [
+                path_spec_factory.Factory.NewPathSpec(
+                    dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path1
+                ),
+                path_spec_factory.Factory.NewPathSpec(
+                    dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path2
+                ),
+            ]
+            test_process._ProcessTask(task)
+
+            self.assertEqual(test_process._number_of_consumed_sources, 2)
+
     def testStartAndStopProfiling(self):
         """Tests the _StartProfiling and _StopProfiling functions."""
         with shared_test_lib.TempDirectory() as temp_directory:
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Tests for the classes to assist in merging attribute containers of tasks."""
+
+import functools
+import os
+import time
+import unittest
+
+from acstore.containers import interface as containers_interface
+
+from plaso.containers import events
+from plaso.containers import warnings
+from plaso.lib import errors
+from plaso.multi_process import merge_helpers
+from plaso.storage.sqlite import reader as sqlite_reader
+from plaso.storage.sqlite import writer as sqlite_writer
+
+from tests import test_lib as shared_test_lib
+
+
+class _FailingSQLiteStorageReader(sqlite_reader.SQLiteStorageReader):
+    """SQLite storage reader that fails to read extraction warnings."""
+
+    def GetAttributeContainers(self, container_type, filter_expression=None):
+        """Retrieves a specific type of attribute containers.
+
+        Args:
+          container_type (str): attribute container type.
+          filter_expression (Optional[str]): expression to filter the resulting
+              attribute containers by.
+
+        Returns:
+          generator(AttributeContainer): attribute container generator.
+
+        Raises:
+          OSError: if the attribute containers are extraction warnings.
+        """
+        if container_type == "extraction_warning":
+            raise OSError("Unable to read extraction warnings.")
+
+        return super().GetAttributeContainers(
+            container_type, filter_expression=filter_expression
+        )
+
+
+class ExtractionTaskMergeHelperTest(shared_test_lib.BaseTestCase):
+    """Tests for the extraction task merge helper."""
+
+    def _CreateTaskStore(self, path):
+        """Creates a task store for testing.
+
+        Args:
+          path (str): path of the task store.
+        """
+        storage_writer = sqlite_writer.SQLiteStorageWriter()
+        storage_writer.Open(path=path)
+
+        try:
+            event_data = events.EventData(data_type="test:event")
+            storage_writer.AddAttributeContainer(event_data)
+
+            warning = warnings.ExtractionWarning(message="test warning")
+            storage_writer.AddAttributeContainer(warning)
+
+        finally:
+            storage_writer.Close()
+
+    def _GetAttributeContainers(self, merge_helper):
+        """Retrieves all the attribute containers from a merge helper.
+
+        Args:
+          merge_helper (BaseTaskMergeHelper): merge helper.
+
+        Returns:
+          list[AttributeContainer]: attribute containers.
+        """
+        containers = []
+        while not merge_helper.fully_merged:
+            container = merge_helper.GetAttributeContainer()
+            if container:
+                containers.append(container)
+            elif not merge_helper.fully_merged:
+                time.sleep(0.01)
+
+        return containers
+
+    def testGetAttributeContainer(self):
+        """Tests the GetAttributeContainer function."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "task.sqlite")
+            self._CreateTaskStore(temp_file)
+
+            task_storage_reader = sqlite_reader.SQLiteStorageReader(temp_file)
+            merge_helper = merge_helpers.ExtractionTaskMergeHelper(
+                task_storage_reader, "test"
+            )
+
+            containers = self._GetAttributeContainers(merge_helper)
+            merge_helper.Close()
+
+        container_types = [container.CONTAINER_TYPE for container in containers]
+        self.assertEqual(container_types, ["event_data", "extraction_warning"])
+
+
+class PrefetchingExtractionTaskMergeHelperTest(ExtractionTaskMergeHelperTest):
+    """Tests for the prefetching extraction task merge helper."""
+
+    def testGetAttributeContainer(self):
+        """Tests the GetAttributeContainer function."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "task.sqlite")
+            self._CreateTaskStore(temp_file)
+
+            open_task_storage_reader = functools.partial(
+                sqlite_reader.SQLiteStorageReader, temp_file
+            )
+            merge_helper = merge_helpers.PrefetchingExtractionTaskMergeHelper(
+                open_task_storage_reader, "test", maximum_number_of_queued_containers=1
+            )
+
+            containers = self._GetAttributeContainers(merge_helper)
+            merge_helper.Close()
+
+        container_types = [container.CONTAINER_TYPE for container in containers]
+        self.assertEqual(container_types, ["event_data", "extraction_warning"])
+
+        self.assertEqual(merge_helper.number_of_queued_containers, 0)
+        self.assertIsNone(merge_helper.GetAttributeContainer())
+
+    def testGetAttributeContainerWithMissingTaskStore(self):
+        """Tests the GetAttributeContainer function with a missing task store."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "task.sqlite")
+
+            open_task_storage_reader = functools.partial(
+                sqlite_reader.SQLiteStorageReader, temp_file
+            )
+            merge_helper = merge_helpers.PrefetchingExtractionTaskMergeHelper(
+                open_task_storage_reader, "test"
+            )
+
+            with self.assertRaises(errors.TaskMergeError):
+                self._GetAttributeContainers(merge_helper)
+
+            merge_helper.Close()
+
+        self.assertFalse(merge_helper.fully_merged)
+
+    def testGetAttributeContainerWithReadError(self):
+        """Tests the GetAttributeContainer function with a read error."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "task.sqlite")
+            self._CreateTaskStore(temp_file)
+
+            open_task_storage_reader = functools.partial(
+                _FailingSQLiteStorageReader, temp_file
+            )
+            merge_helper = merge_helpers.PrefetchingExtractionTaskMergeHelper(
+                open_task_storage_reader, "test"
+            )
+
+            containers = []
+            with self.assertRaises(errors.TaskMergeError):
+                while not merge_helper.fully_merged:
+                    container = merge_helper.GetAttributeContainer()
+                    if container:
+                        containers.append(container)
+                    else:
+                        time.sleep(0.01)
+
+            merge_helper.Close()
+
+        container_types = [container.CONTAINER_TYPE for container in containers]
+        self.assertEqual(container_types, ["event_data"])
+
+        self.assertEqual(merge_helper.number_of_merged_containers, 1)
+        self.assertFalse(merge_helper.fully_merged)
+
+    def testGetAttributeContainerWithFailedMergeHelper(self):
+        """Tests the GetAttributeContainer function with a failed merge helper."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "task.sqlite")
+            self._CreateTaskStore(temp_file)
+
+            open_task_storage_reader = functools.partial(
+                _FailingSQLiteStorageReader, temp_file
+            )
+            failed_merge_helper = merge_helpers.PrefetchingExtractionTaskMergeHelper(
+                open_task_storage_reader, "test"
+            )
+
+            with self.assertRaises(errors.TaskMergeError):
+                self._GetAttributeContainers(failed_merge_helper)
+
+            failed_merge_helper.Close()
+
+            identifier = containers_interface.AttributeContainerIdentifier(
+                name="event_data", sequence_number=1
+            )
+            failed_merge_helper.SetAttributeContainerIdentifier(
+                "event_data.1", identifier
+            )
+
+            # The attribute containers merged by the failed merge helper are
+            # skipped.
+            open_task_storage_reader = functools.partial(
+                sqlite_reader.SQLiteStorageReader, temp_file
+            )
+            merge_helper = merge_helpers.PrefetchingExtractionTaskMergeHelper(
+                open_task_storage_reader,
+                "test_retry",
+                failed_merge_helper=failed_merge_helper,
+            )
+
+            containers = self._GetAttributeContainers(merge_helper)
+            merge_helper.Close()
+
+        container_types = [container.CONTAINER_TYPE for container in containers]
+        self.assertEqual(container_types, ["extraction_warning"])
+
+        self.assertEqual(merge_helper.number_of_merged_containers, 2)
+        self.assertTrue(merge_helper.fully_merged)
+
+        result_identifier = merge_helper.GetAttributeContainerIdentifier("event_data.1")
+        self.assertEqual(result_identifier, identifier)
+
+    def testClose(self):
+        """Tests the Close function before all containers were merged."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "task.sqlite")
+            self._CreateTaskStore(temp_file)
+
+            open_task_storage_reader = functools.partial(
+                sqlite_reader.SQLiteStorageReader, temp_file
+            )
+            merge_helper = merge_helpers.PrefetchingExtractionTaskMergeHelper(
+                open_task_storage_reader, "test", maximum_number_of_queued_containers=1
+            )
+            merge_helper.Close()
+
+        self.assertFalse(merge_helper.fully_merged)
+
+
+if __name__ == "__main__":
+    unittest.main()
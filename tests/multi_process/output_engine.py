@@ -175,6 +175,22 @@ class PsortEventHeapTest(test_lib.MultiProcessingTestCase):
         self.assertEqual(len(event_heap._heap), 1)
 
 
+class PsortFieldValuesRecorderTest(test_lib.MultiProcessingTestCase):
+    """Tests for the psort output field values recorder."""
+
+    def testWriteFieldValues(self):
+        """Tests the WriteFieldValues function."""
+        recorder = output_engine.PsortFieldValuesRecorder(TestOutputModule())
+
+        recorder.WriteFieldValues(None, {"field": "value"})
+        recorder.WriteMACBGroupFieldValues(None, [{"field": "macb"}])
+
+        self.assertEqual(
+            recorder.field_values,
+            [(False, {"field": "value"}), (True, [{"field": "macb"}])],
+        )
+
+
 class OutputAndFormattingMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     """Tests for the multi-processing engine."""
 
@@ -325,7 +341,7 @@ class OutputAndFormattingMultiProcessEngineTest(test_lib.MultiProcessingTestCase
             )
 
             test_engine._ExportEvents(
-                storage_reader, output_module, deduplicate_events=False
+                [storage_reader], output_module, deduplicate_events=False
             )
 
         self.assertEqual(len(output_module.events), 17)
@@ -355,13 +371,111 @@ class OutputAndFormattingMultiProcessEngineTest(test_lib.MultiProcessingTestCase
                 formatters_directory_path
             )
 
-            test_engine._ExportEvents(storage_reader, output_module)
+            test_engine._ExportEvents([storage_reader], output_module)
 
         self.assertEqual(len(output_module.events), 15)
         self.assertEqual(len(output_module.macb_groups), 3)
 
+    def testInternalExportEventsWithMultipleStorageReaders(self):
+        """Tests the _ExportEvents function with multiple storage readers."""
+        test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            storage_readers = []
+            for name in ("storage1.plaso", "storage2.plaso"):
+                temp_file = os.path.join(temp_directory, name)
+                self._CreateTestStorageFile(temp_file)
+
+                storage_readers.append(
+                    storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file)
+                )
+
+            try:
+                output_module = TestOutputModule()
+                test_engine._ExportEvents(
+                    storage_readers, output_module, deduplicate_events=False
+                )
+
+                self.assertEqual(len(output_module.events), 34)
+                self.assertEqual(len(output_module.macb_groups), 6)
+
+                # Duplicate events in different storage files are removed.
+                output_module = TestOutputModule()
+                test_engine._ExportEvents(storage_readers, output_module)
+
+                self.assertEqual(len(output_module.events), 15)
+                self.assertEqual(len(output_module.macb_groups), 3)
+
+            finally:
+                for storage_reader in storage_readers:
+                    storage_reader.Close()
+
     # TODO: add test for _FlushExportBuffer.
 
+    def testGetSortedEventTriples(self):
+        """Tests the _GetSortedEventTriples function."""
+        test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            storage_readers = []
+            for name in ("storage1.plaso", "storage2.plaso"):
+                temp_file = os.path.join(temp_directory, name)
+                self._CreateTestStorageFile(temp_file)
+
+                storage_readers.append(
+                    storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file)
+                )
+
+            try:
+                sorted_event_triples = list(
+                    test_engine._GetSortedEventTriples(storage_readers)
+                )
+            finally:
+                for storage_reader in storage_readers:
+                    storage_reader.Close()
+
+        self.assertEqual(len(sorted_event_triples), 34)
+
+        timestamps = [event.timestamp for _, event, _, _ in sorted_event_triples]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        storage_indexes = [
+            storage_index for storage_index, _, _, _ in sorted_event_triples
+        ]
+        self.assertEqual(storage_indexes[:6], [0, 1, 0, 0, 1, 1])
+        self.assertEqual(storage_indexes.count(0), 17)
+
+    def testGetWorkerTimeRanges(self):
+        """Tests the _GetWorkerTimeRanges function."""
+        test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            temp_file = os.path.join(temp_directory, "storage.plaso")
+            self._CreateTestStorageFile(temp_file)
+
+            storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+                temp_file
+            )
+
+            try:
+                time_ranges = test_engine._GetWorkerTimeRanges(storage_reader, 2)
+            finally:
+                storage_reader.Close()
+
+        time_ranges = [
+            (time_range.start_timestamp, time_range.end_timestamp)
+            for time_range in time_ranges
+        ]
+        # Events with the same timestamp are in the same time range.
+        expected_time_ranges = [
+            (2134324321, 5134024320),
+            (5134024321, 5134324320),
+            (5134324321, 5134324321),
+            (5134324322, 15134324320),
+            (15134324321, 15134324321),
+        ]
+        self.assertEqual(time_ranges, expected_time_ranges)
+
     def testExportEvents(self):
         """Tests the ExportEvents function."""
         test_file_path = self._GetTestFilePath(["psort_test.plaso"])
@@ -403,6 +517,134 @@ class OutputAndFormattingMultiProcessEngineTest(test_lib.MultiProcessingTestCase
         )
         self.assertEqual(lines[14], expected_line)
 
+    def testExportEventsWithMultipleStorageReaders(self):
+        """Tests the ExportEvents function with multiple storage readers."""
+        test_file_path = self._GetTestFilePath(["psort_test.plaso"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        configuration = configurations.ProcessingConfiguration()
+        configuration.data_location = shared_test_lib.DATA_PATH
+        configuration.preferred_language = "en-US"
+
+        outputs = []
+        for number_of_storage_readers in (1, 2):
+            test_file_object = io.StringIO()
+
+            storage_readers = [
+                storage_factory.StorageFactory.CreateStorageReaderForFile(
+                    test_file_path
+                )
+                for _ in range(number_of_storage_readers)
+            ]
+
+            output_module = dynamic.DynamicOutputModule()
+            output_module._file_object = test_file_object
+
+            test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+            try:
+                test_engine.ExportEvents(
+                    storage_readers[0],
+                    output_module,
+                    configuration,
+                    additional_storage_readers=storage_readers[1:],
+                )
+            finally:
+                for storage_reader in storage_readers:
+                    storage_reader.Close()
+
+            outputs.append(test_file_object.getvalue())
+
+        # The events of the second storage file are duplicates of the first.
+        self.assertEqual(len(outputs[1].split("\n")), 22)
+        self.assertEqual(outputs[1], outputs[0])
+
+    def testExportEventsWithDifferentStorageReaders(self):
+        """Tests the ExportEvents function with different storage readers."""
+        test_file_paths = [
+            self._GetTestFilePath(["psort_test.plaso"]),
+            self._GetTestFilePath(["pinfo_test.plaso"]),
+        ]
+        for test_file_path in test_file_paths:
+            self._SkipIfPathNotExists(test_file_path)
+
+        configuration = configurations.ProcessingConfiguration()
+        configuration.data_location = shared_test_lib.DATA_PATH
+        configuration.preferred_language = "en-US"
+
+        outputs = []
+        for storage_file_paths in (
+            test_file_paths[:1],
+            test_file_paths[1:],
+            test_file_paths,
+        ):
+            test_file_object = io.StringIO()
+
+            storage_readers = [
+                storage_factory.StorageFactory.CreateStorageReaderForFile(
+                    storage_file_path
+                )
+                for storage_file_path in storage_file_paths
+            ]
+
+            output_module = dynamic.DynamicOutputModule()
+            output_module._file_object = test_file_object
+
+            test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+            try:
+                test_engine.ExportEvents(
+                    storage_readers[0],
+                    output_module,
+                    configuration,
+                    additional_storage_readers=storage_readers[1:],
+                )
+            finally:
+                for storage_reader in storage_readers:
+                    storage_reader.Close()
+
+            outputs.append(test_file_object.getvalue().splitlines())
+
+        # The merged output contains the events of both storage files, formatted
+        # as in the output of the individual storage files.
+        expected_lines = sorted(outputs[0][1:] + outputs[1][1:])
+        self.assertEqual(sorted(outputs[2][1:]), expected_lines)
+
+    def testExportEventsWithWorkers(self):
+        """Tests the ExportEvents function with worker processes."""
+        test_file_path = self._GetTestFilePath(["psort_test.plaso"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        configuration = configurations.ProcessingConfiguration()
+        configuration.data_location = shared_test_lib.DATA_PATH
+        configuration.preferred_language = "en-US"
+
+        outputs = []
+        for number_of_worker_processes in (0, 2):
+            test_file_object = io.StringIO()
+
+            storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+                test_file_path
+            )
+
+            output_module = dynamic.DynamicOutputModule()
+            output_module._file_object = test_file_object
+
+            test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+            test_engine.ExportEvents(
+                storage_reader,
+                output_module,
+                configuration,
+                number_of_worker_processes=number_of_worker_processes,
+                storage_file_path=test_file_path,
+            )
+
+            outputs.append(test_file_object.getvalue())
+
+        self.assertEqual(len(outputs[1].split("\n")), 22)
+        self.assertEqual(outputs[1], outputs[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -240,6 +240,30 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
 
         manager._UpdateLatestProcessingTime(task)
 
+    def testAbandonMergingTask(self):
+        """Tests the AbandonMergingTask function."""
+        manager = task_manager.TaskManager()
+
+        task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+        task.storage_file_size = 10
+
+        with self.assertRaises(KeyError):
+            manager.AbandonMergingTask(task)
+
+        manager.UpdateTaskAsPendingMerge(task)
+        result_task = manager.GetTaskPendingMerge(None)
+        self.assertIsNotNone(result_task)
+
+        manager.AbandonMergingTask(task)
+
+        self.assertEqual(len(manager._tasks_merging), 0)
+        self.assertEqual(len(manager._tasks_abandoned), 1)
+
+        # The abandoned task is retried.
+        retry_task = manager.CreateRetryTask()
+        self.assertIsNotNone(retry_task)
+        self.assertTrue(task.has_retry)
+
     def testCheckTaskToMerge(self):
         """Tests the CheckTaskToMerge function."""
         manager = task_manager.TaskManager()
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """Tests for the output module field formatting helper."""
 
+import datetime
+import random
 import unittest
 
+import pytz
+
+from acstore.containers import interface as containers_interface
+
 from dfdatetime import posix_time as dfdatetime_posix_time
 from dfdatetime import semantic_time as dfdatetime_semantic_time
 
@@ -22,6 +28,98 @@ class TestFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
     _FIELD_FORMAT_CALLBACKS = {"zone": "_FormatTimeZone"}
 
 
+class ISO8601DateTimeConverterTest(test_lib.OutputModuleTestCase):
+    """Tests the ISO 8601 date and time converter."""
+
+    _TIME_ZONES = [
+        "America/New_York",
+        "Asia/Kolkata",
+        "Australia/Lord_Howe",
+        "Europe/Amsterdam",
+        "Etc/GMT+5",
+        "UTC",
+    ]
+
+    def _CopyTimestampToString(self, time_zone, timestamp):
+        """Copies a timestamp to a string without caching.
+
+        Args:
+          time_zone (pytz.tzinfo): time zone.
+          timestamp (int): number of microseconds since January 1, 1970
+              00:00:00 UTC.
+
+        Returns:
+          str: date and time string or None if the date and time cannot be
+              represented.
+        """
+        try:
+            datetime_object = datetime.datetime(
+                1970, 1, 1, tzinfo=pytz.UTC
+            ) + datetime.timedelta(microseconds=timestamp)
+            datetime_object = datetime_object.astimezone(time_zone)
+        except OverflowError:
+            return None
+
+        iso8601_string = datetime_object.isoformat()
+        return (
+            f"{iso8601_string[:19]:s}.{datetime_object.microsecond:06d}"
+            f"{iso8601_string[-6:]:s}"
+        )
+
+    def testCopyTimestampToString(self):
+        """Tests the CopyTimestampToString function."""
+        converter = formatting_helper.ISO8601DateTimeConverter(
+            pytz.timezone("Europe/Amsterdam")
+        )
+
+        date_time_string = converter.CopyTimestampToString(1340821021000000)
+        self.assertEqual(date_time_string, "2012-06-27T20:17:01.000000+02:00")
+
+        date_time_string = converter.CopyTimestampToString(1356635821000001)
+        self.assertEqual(date_time_string, "2012-12-27T20:17:01.000001+01:00")
+
+        date_time_string = converter.CopyTimestampToString(-1)
+        self.assertEqual(date_time_string, "1970-01-01T00:59:59.999999+01:00")
+
+        with self.assertRaises(OverflowError):
+            converter.CopyTimestampToString(253402300800000000)
+
+    def testCopyTimestampToStringWithRandomTimestamps(self):
+        """Tests the CopyTimestampToString function with random timestamps."""
+        random_number_generator = random.Random(1970)
+
+        for time_zone_name in self._TIME_ZONES:
+            time_zone = pytz.timezone(time_zone_name)
+            converter = formatting_helper.ISO8601DateTimeConverter(time_zone)
+
+            timestamp = 0
+            for _ in range(2000):
+                # Alternate between timestamps that are close to the previous
+                # timestamp and timestamps in the entire supported range.
+                if random_number_generator.random() < 0.5:
+                    timestamp += random_number_generator.randint(
+                        -7200000000, 7200000000
+                    )
+                else:
+                    timestamp = random_number_generator.randint(
+                        -62135596800000000, 253402300799999999
+                    )
+
+                expected_date_time_string = self._CopyTimestampToString(
+                    time_zone, timestamp
+                )
+                if expected_date_time_string is None:
+                    with self.assertRaises(OverflowError):
+                        converter.CopyTimestampToString(timestamp)
+                else:
+                    date_time_string = converter.CopyTimestampToString(timestamp)
+                    self.assertEqual(
+                        date_time_string,
+                        expected_date_time_string,
+                        f"Time zone: {time_zone_name:s}, timestamp: {timestamp:d}",
+                    )
+
+
 class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
     """Test the output module field formatting helper."""
 
@@ -507,6 +605,74 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
         )
         self.assertEqual(username_string, "-")
 
+    def testGetCachedEventDataFieldValues(self):
+        """Tests the _GetCachedEventDataFieldValues function."""
+        output_mediator = self._CreateOutputMediator()
+
+        formatters_directory_path = self._GetTestFilePath(["formatters"])
+        output_mediator.ReadMessageFormattersFromDirectory(formatters_directory_path)
+
+        test_helper = formatting_helper.FieldFormattingHelper()
+        test_helper._MAXIMUM_NUMBER_OF_CACHED_EVENT_DATA = 2
+
+        event, event_data, event_data_stream = (
+            containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0])
+        )
+        event_data.SetIdentifier(
+            containers_interface.AttributeContainerIdentifier(
+                name=event_data.CONTAINER_TYPE, sequence_number=1
+            )
+        )
+
+        message_string = test_helper._FormatMessage(
+            output_mediator, event, event_data, event_data_stream
+        )
+
+        cached_field_values = test_helper._GetCachedEventDataFieldValues(
+            output_mediator, event_data
+        )
+        self.assertEqual(cached_field_values["message"], message_string)
+        self.assertIn("message_short", cached_field_values)
+
+        # Event data with the same identifier is formatted only once.
+        event_data.text = "Changed text"
+
+        cached_message_string = test_helper._FormatMessage(
+            output_mediator, event, event_data, event_data_stream
+        )
+        self.assertEqual(cached_message_string, message_string)
+
+        # Event data with the same identifier from another storage reader is
+        # formatted separately.
+        other_output_mediator = self._CreateOutputMediator()
+        other_output_mediator.ReadMessageFormattersFromDirectory(
+            formatters_directory_path
+        )
+
+        other_message_string = test_helper._FormatMessage(
+            other_output_mediator, event, event_data, event_data_stream
+        )
+        self.assertNotEqual(other_message_string, message_string)
+
+        # The least recently used event data is evicted first.
+        for sequence_number in range(2, 4):
+            event_data.SetIdentifier(
+                containers_interface.AttributeContainerIdentifier(
+                    name=event_data.CONTAINER_TYPE, sequence_number=sequence_number
+                )
+            )
+            test_helper._FormatMessage(
+                output_mediator, event, event_data, event_data_stream
+            )
+
+        self.assertEqual(
+            list(test_helper._event_data_field_values_cache.keys()),
+            [
+                (id(output_mediator), "event_data.2"),
+                (id(output_mediator), "event_data.3"),
+            ],
+        )
+
     # TODO: add coverage for _ReportEventError
 
     def testGetFormattedField(self):
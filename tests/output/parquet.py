@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Tests for the Parquet output module."""
+
+import os
+import unittest
+
+from dfdatetime import semantic_time as dfdatetime_semantic_time
+
+from plaso.containers import events
+from plaso.lib import definitions
+from plaso.output import parquet
+
+from tests import test_lib as shared_test_lib
+from tests.containers import test_lib as containers_test_lib
+from tests.output import test_lib
+
+
+class ParquetOutputModuleTest(test_lib.OutputModuleTestCase):
+    """Test the Parquet output module."""
+
+    # pylint: disable=protected-access
+
+    _TEST_EVENTS = [
+        {
+            "data_type": "test:event",
+            "hostname": "ubuntu",
+            "filename": "log/syslog.1",
+            "text": (
+                "Reporter <CRON> PID: 8442 (pam_unix(cron:session): session\n "
+                "closed for user root)"
+            ),
+            "timestamp": "2012-06-27 18:17:01",
+            "timestamp_desc": definitions.TIME_DESCRIPTION_METADATA_MODIFICATION,
+        }
+    ]
+
+    def testGetFieldValues(self):
+        """Tests the GetFieldValues function."""
+        output_mediator = self._CreateOutputMediator()
+
+        formatters_directory_path = self._GetTestFilePath(["formatters"])
+        output_mediator.ReadMessageFormattersFromDirectory(formatters_directory_path)
+
+        output_module = parquet.ParquetOutputModule()
+
+        event, event_data, event_data_stream = (
+            containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0])
+        )
+
+        event_tag = events.EventTag()
+        event_tag.AddLabels(["Malware", "Printed"])
+
+        expected_field_values = {
+            "datetime": 1340821021000000,
+            "display_name": "-",
+            "message": (
+                "Reporter <CRON> PID: 8442 (pam_unix(cron:session): session "
+                "closed for user root)"
+            ),
+            "parser": "-",
+            "source": "FILE",
+            "source_long": "Test log file",
+            "tag": "Malware Printed",
+            "timestamp_desc": "Metadata Modification Time",
+        }
+
+        field_values = output_module.GetFieldValues(
+            output_mediator, event, event_data, event_data_stream, event_tag
+        )
+
+        self.assertEqual(field_values, expected_field_values)
+
+        # An event without a date and time value has a null datetime.
+        event.date_time = dfdatetime_semantic_time.NotSet()
+
+        field_values = output_module.GetFieldValues(
+            output_mediator, event, event_data, event_data_stream, event_tag
+        )
+        self.assertIsNone(field_values["datetime"])
+
+        event.date_time = None
+        event.timestamp = 0
+
+        field_values = output_module.GetFieldValues(
+            output_mediator, event, event_data, event_data_stream, event_tag
+        )
+        self.assertIsNone(field_values["datetime"])
+
+    def testWriteFieldValues(self):
+        """Tests the WriteFieldValues function.
+
+        Raises:
+          SkipTest: if pyarrow is missing.
+        """
+        if parquet.pyarrow is None:
+            raise unittest.SkipTest("missing pyarrow")
+
+        output_mediator = self._CreateOutputMediator()
+
+        formatters_directory_path = self._GetTestFilePath(["formatters"])
+        output_mediator.ReadMessageFormattersFromDirectory(formatters_directory_path)
+
+        output_module = parquet.ParquetOutputModule()
+        output_module.SetAdditionalFields(["data_type", "hostname"])
+        output_module.SetRowGroupSize(2)
+
+        event, event_data, event_data_stream = (
+            containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0])
+        )
+
+        event_tag = events.EventTag()
+        event_tag.AddLabels(["Malware", "Printed"])
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "parquet.out")
+
+            output_module.Open(path=path)
+
+            try:
+                output_module.WriteHeader(output_mediator)
+
+                field_values = output_module.GetFieldValues(
+                    output_mediator, event, event_data, event_data_stream, event_tag
+                )
+
+                for _ in range(4):
+                    output_module.WriteFieldValues(output_mediator, field_values)
+
+                event.date_time = dfdatetime_semantic_time.NotSet()
+                event.timestamp = 0
+
+                field_values = output_module.GetFieldValues(
+                    output_mediator, event, event_data, event_data_stream, event_tag
+                )
+                output_module.WriteFieldValues(output_mediator, field_values)
+
+            finally:
+                output_module.Close()
+
+            parquet_file = parquet.pyarrow.parquet.ParquetFile(path)
+
+            self.assertEqual(parquet_file.metadata.num_rows, 5)
+            self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+
+            table = parquet_file.read()
+
+        expected_column_names = [
+            "datetime",
+            "timestamp_desc",
+            "source",
+            "source_long",
+            "message",
+            "parser",
+            "display_name",
+            "tag",
+            "data_type",
+            "hostname",
+        ]
+        self.assertEqual(table.column_names, expected_column_names)
+
+        field_type = table.schema.field("datetime").type
+        self.assertTrue(parquet.pyarrow.types.is_timestamp(field_type))
+        self.assertEqual(field_type.tz, "UTC")
+
+        for column_name in ("data_type", "hostname", "parser", "source"):
+            field_type = table.schema.field(column_name).type
+            self.assertTrue(parquet.pyarrow.types.is_dictionary(field_type))
+
+        rows = table.to_pylist()
+        self.assertEqual(rows[0]["data_type"], "test:event")
+        self.assertEqual(rows[0]["datetime"].isoformat(), "2012-06-27T18:17:01+00:00")
+        self.assertEqual(rows[0]["hostname"], "ubuntu")
+        self.assertEqual(rows[0]["parser"], "-")
+        self.assertEqual(rows[0]["tag"], "Malware Printed")
+        self.assertIsNone(rows[4]["datetime"])
+
+    def testWriteHeader(self):
+        """Tests the WriteHeader function.
+
+        Raises:
+          SkipTest: if pyarrow is missing.
+        """
+        if parquet.pyarrow is None:
+            raise unittest.SkipTest("missing pyarrow")
+
+        output_mediator = self._CreateOutputMediator()
+        output_module = parquet.ParquetOutputModule()
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "parquet.out")
+
+            output_module.Open(path=path)
+
+            with self.assertRaises(OSError):
+                with open(path, "wb"):
+                    pass
+                output_module.Open(path=path)
+
+            os.remove(path)
+
+            try:
+                output_module.WriteHeader(output_mediator)
+            finally:
+                output_module.Close()
+
+            parquet_file = parquet.pyarrow.parquet.ParquetFile(path)
+
+            self.assertEqual(parquet_file.metadata.num_rows, 0)
+            self.assertEqual(len(parquet_file.schema_arrow), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
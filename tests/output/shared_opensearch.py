@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Tests for the shared functionality for OpenSearch output modules."""
 
+import json
+import threading
 import unittest
 
+from http import server as http_server
 from unittest.mock import MagicMock
 
 from dfvfs.path import fake_path_spec
@@ -35,6 +38,200 @@ class TestOpenSearchOutputModule(shared_opensearch.SharedOpenSearchOutputModule)
         return
 
 
+class TestOpenSearchRequestHandler(http_server.BaseHTTPRequestHandler):
+    """HTTP request handler that stands in for an OpenSearch server.
+
+    The first time a document is sent it is rejected when its identifier is
+    odd, to simulate a full write queue, or failed when its identifier is
+    a multiple of 10.
+    """
+
+    # pylint: disable=invalid-name
+
+    def _WriteJSONResponse(self, json_dict):
+        """Writes a JSON response.
+
+        Args:
+          json_dict (dict[str, object]): JSON response.
+        """
+        data = json.dumps(json_dict).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", f"{len(data):d}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        """Handles a POST request."""
+        content_length = int(self.headers.get("Content-Length", 0))
+        lines = self.rfile.read(content_length).splitlines()
+
+        items = []
+        for source_line in lines[1::2]:
+            identifier = json.loads(source_line)["identifier"]
+
+            with self.server.lock:
+                if identifier % 10 == 0:
+                    status_code = 400
+                elif identifier % 2 == 1 and identifier not in self.server.rejected:
+                    self.server.rejected.add(identifier)
+                    status_code = 429
+                else:
+                    self.server.stored.append(identifier)
+                    status_code = 201
+
+            items.append({"index": {"_index": "test", "status": status_code}})
+
+        self._WriteJSONResponse({"errors": True, "items": items, "took": 1})
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Ignores log messages."""
+        return
+
+
+class OpenSearchBulkIngesterTest(test_lib.OutputModuleTestCase):
+    """Tests the OpenSearch bulk ingester."""
+
+    # pylint: disable=protected-access
+
+    def setUp(self):
+        """Makes preparations before running an individual test."""
+        self._server = http_server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), TestOpenSearchRequestHandler
+        )
+        self._server.lock = threading.Lock()
+        self._server.rejected = set()
+        self._server.stored = []
+
+        self._server_thread = threading.Thread(target=self._server.serve_forever)
+        self._server_thread.start()
+
+    def tearDown(self):
+        """Cleans up after running an individual test."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._server_thread.join()
+
+    def testAddBatch(self):
+        """Tests the AddBatch function.
+
+        Raises:
+          SkipTest: if opensearch-py is missing.
+        """
+        if shared_opensearch.opensearchpy is None:
+            raise unittest.SkipTest("missing opensearch-py")
+
+        _, port = self._server.server_address
+        client = shared_opensearch.opensearchpy.OpenSearch(
+            [{"host": "127.0.0.1", "port": port}], maxsize=4
+        )
+
+        bulk_ingester = shared_opensearch.OpenSearchBulkIngester(
+            client, "test", 256, number_of_senders=4
+        )
+        bulk_ingester._INITIAL_RETRY_DELAY = 0.01
+
+        for batch_index in range(10):
+            documents = [
+                b'{"index": {"_index": "test"}}\n'
+                + json.dumps({"identifier": identifier}).encode("utf-8")
+                + b"\n"
+                for identifier in range(batch_index * 10, batch_index * 10 + 10)
+            ]
+            bulk_ingester.AddBatch(documents)
+
+            # A batch that is larger than the maximum pending size is only added
+            # when no other batches are pending.
+            batch_size = sum(len(document) for document in documents)
+            output_status = bulk_ingester.GetStatus()
+            self.assertLessEqual(
+                output_status.number_of_pending_bytes, max(batch_size, 256)
+            )
+
+        bulk_ingester.Close()
+
+        self.assertEqual(
+            sorted(self._server.stored),
+            [identifier for identifier in range(100) if identifier % 10 != 0],
+        )
+
+        output_status = bulk_ingester.GetStatus()
+        self.assertEqual(output_status.number_of_failed_documents, 10)
+        self.assertEqual(output_status.number_of_pending_bytes, 0)
+        self.assertEqual(output_status.number_of_retried_documents, 50)
+        self.assertGreater(output_status.number_of_sent_bytes, 0)
+        self.assertEqual(output_status.number_of_stored_documents, 90)
+
+    def testAddBatchWithSenderError(self):
+        """Tests the AddBatch function with an error in a sender thread.
+
+        Raises:
+          SkipTest: if opensearch-py is missing.
+        """
+        if shared_opensearch.opensearchpy is None:
+            raise unittest.SkipTest("missing opensearch-py")
+
+        client = MagicMock()
+        client.bulk.side_effect = KeyError("errors")
+
+        bulk_ingester = shared_opensearch.OpenSearchBulkIngester(
+            client, "test", 16, number_of_senders=1
+        )
+
+        documents = [b'{"index": {"_index": "test"}}\n{"identifier": 1}\n']
+        bulk_ingester.AddBatch(documents)
+
+        # A batch that is larger than the maximum pending size is only added
+        # when the previous batch failed.
+        with self.assertRaises(RuntimeError):
+            bulk_ingester.AddBatch(documents)
+
+        with self.assertRaises(RuntimeError):
+            bulk_ingester.Close()
+
+        output_status = bulk_ingester.GetStatus()
+        self.assertEqual(output_status.number_of_failed_documents, 1)
+        self.assertEqual(output_status.number_of_pending_bytes, 0)
+
+
+class SharedOpenSearchFieldFormattingHelperTest(test_lib.OutputModuleTestCase):
+    """Tests the shared OpenSearch output module field formatting helper."""
+
+    # pylint: disable=protected-access
+
+    _TEST_EVENTS = [
+        {
+            "data_type": "syslog:line",
+            "timestamp": "2012-06-27 18:17:01+00:00",
+            "timestamp_desc": definitions.TIME_DESCRIPTION_WRITTEN,
+        }
+    ]
+
+    def testFormatDateTime(self):
+        """Tests the _FormatDateTime function."""
+        output_mediator = self._CreateOutputMediator()
+        test_helper = shared_opensearch.SharedOpenSearchFieldFormattingHelper()
+
+        event, event_data, event_data_stream = (
+            containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0])
+        )
+
+        date_time_string = test_helper._FormatDateTime(
+            output_mediator, event, event_data, event_data_stream
+        )
+        self.assertEqual(date_time_string, "2012-06-27T18:17:01.000000+00:00")
+
+        # Test with a timestamp before January 1, 1970, which is formatted
+        # by dfDateTime.
+        event.timestamp = -845302042337319
+
+        date_time_string = test_helper._FormatDateTime(
+            output_mediator, event, event_data, event_data_stream
+        )
+        self.assertEqual(date_time_string, "1943-03-19T09:52:37.662681+00:00")
+
+
 class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
     """Tests the shared functionality for OpenSearch output modules."""
 
@@ -153,6 +350,43 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
         self.assertEqual(field_values, expected_field_values)
 
+    def testGetStatus(self):
+        """Tests the GetStatus function.
+
+        Raises:
+          SkipTest: if opensearch-py is missing.
+        """
+        if shared_opensearch.opensearchpy is None:
+            raise unittest.SkipTest("missing opensearch-py")
+
+        output_module = TestOpenSearchOutputModule()
+
+        output_status = output_module.GetStatus()
+        self.assertIsNone(output_status)
+
+        output_module._Connect()
+        output_module._BufferEventDocument(
+            {"index": {"_index": "test"}}, {"message": "test"}
+        )
+        output_module._FlushEvents()
+
+        output_status = output_module.GetStatus()
+        self.assertIsNotNone(output_status)
+
+        output_module.Close()
+
+        self.assertEqual(output_module._client, None)
+
+    def testSetBulkSize(self):
+        """Tests the SetBulkSize function."""
+        output_module = TestOpenSearchOutputModule()
+
+        self.assertEqual(output_module._bulk_size, output_module._DEFAULT_BULK_SIZE)
+
+        output_module.SetBulkSize(1024)
+
+        self.assertEqual(output_module._bulk_size, 1024)
+
     def testSetFlushInterval(self):
         """Tests the SetFlushInterval function."""
         output_module = TestOpenSearchOutputModule()
@@ -175,6 +409,19 @@ class SharedOpenSearchOutputModuleTest(test_lib.OutputModuleTestCase):
 
         self.assertEqual(output_module._index_name, "test_index")
 
+    def testSetNumberOfBulkSenders(self):
+        """Tests the SetNumberOfBulkSenders function."""
+        output_module = TestOpenSearchOutputModule()
+
+        self.assertEqual(
+            output_module._number_of_bulk_senders,
+            output_module._DEFAULT_NUMBER_OF_BULK_SENDERS,
+        )
+
+        output_module.SetNumberOfBulkSenders(4)
+
+        self.assertEqual(output_module._number_of_bulk_senders, 4)
+
     def testSetPassword(self):
         """Tests the SetPassword function."""
         output_module = TestOpenSearchOutputModule()
@@ -1,19 +1,128 @@
 #!/usr/bin/env python3
 """Tests for the shared functionality for text file based output modules."""
 
+import gzip
 import io
+import os
+import subprocess
+import sys
 import unittest
 
+import lz4.frame
+import zstd
+
+from plaso.lib import definitions
 from plaso.output import text_file
 
+from tests import test_lib as shared_test_lib
 from tests.output import test_lib
 
 
+class CompressedTextFileWriterTest(test_lib.OutputModuleTestCase):
+    """Tests for the compressed text file writer."""
+
+    # pylint: disable=protected-access
+
+    _DECOMPRESS_FUNCTIONS = {
+        definitions.OUTPUT_COMPRESSION_FORMAT_GZIP: gzip.decompress,
+        definitions.OUTPUT_COMPRESSION_FORMAT_LZ4: lz4.frame.decompress,
+        definitions.OUTPUT_COMPRESSION_FORMAT_ZSTD: zstd.decompress,
+    }
+
+    def testWriteAndClose(self):
+        """Tests the write and close functions."""
+        lines = [f"line {index:d} with ímynd text\n" for index in range(1000)]
+        expected_data = "".join(lines).encode("utf-8")
+
+        with shared_test_lib.TempDirectory() as temporary_directory:
+            for compression_format in sorted(definitions.OUTPUT_COMPRESSION_FORMATS):
+                path = os.path.join(temporary_directory, compression_format)
+
+                writer = text_file.CompressedTextFileWriter(path, compression_format)
+                # Use a small block size so that multiple blocks are compressed.
+                writer._BLOCK_SIZE = 1024
+
+                for line in lines:
+                    writer.write(line)
+
+                writer.close()
+
+                with open(path, "rb") as file_object:
+                    compressed_data = file_object.read()
+
+                self.assertLess(len(compressed_data), len(expected_data))
+
+                decompress_function = self._DECOMPRESS_FUNCTIONS[compression_format]
+                self.assertEqual(decompress_function(compressed_data), expected_data)
+
+            with self.assertRaises(ValueError):
+                text_file.CompressedTextFileWriter(
+                    os.path.join(temporary_directory, "bogus"), "bogus"
+                )
+
+    def testWriteWithoutClose(self):
+        """Tests that a writer that is not closed does not block exiting."""
+        with shared_test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "gzip")
+
+            script = "\n".join(
+                [
+                    "from plaso.output import text_file",
+                    f"writer = text_file.CompressedTextFileWriter({path!r}, 'gzip')",
+                    "writer.write('test')",
+                ]
+            )
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                check=False,
+                cwd=shared_test_lib.PROJECT_PATH,
+                timeout=60,
+            )
+            self.assertEqual(result.returncode, 0)
+
+    def testWriteWithCompressionError(self):
+        """Tests the write function with an error in the compression thread."""
+        with shared_test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "gzip")
+
+            writer = text_file.CompressedTextFileWriter(
+                path, definitions.OUTPUT_COMPRESSION_FORMAT_GZIP
+            )
+            writer._BLOCK_SIZE = 1
+
+            # Bytes cannot be joined with text by the compression thread.
+            with self.assertRaises(OSError):
+                for _ in range(1000):
+                    writer.write(b"bytes")
+
+            with self.assertRaises(OSError):
+                writer.close()
+
+
 class TextFileOutputModuleTest(test_lib.OutputModuleTestCase):
     """Tests for the shared functionality for text file based output modules."""
 
     # pylint: disable=protected-access
 
+    def testOpen(self):
+        """Tests the Open function."""
+        with shared_test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "output.gz")
+
+            output_module = text_file.TextFileOutputModule()
+            output_module.Open(
+                path=path,
+                compression_format=definitions.OUTPUT_COMPRESSION_FORMAT_GZIP,
+            )
+            output_module.WriteLine("test")
+            output_module.Close()
+
+            with gzip.open(path, "rt", encoding="utf-8") as file_object:
+                self.assertEqual(file_object.read(), "test\n")
+
+            with self.assertRaises(OSError):
+                output_module.Open(path=path)
+
     def testWriteHeader(self):
         """Tests the WriteHeader function."""
         test_file_object = io.StringIO()
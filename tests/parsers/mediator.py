@@ -109,6 +109,16 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
         display_name = parser_mediator.GetDisplayNameForPathSpec(os_path_spec)
         self.assertEqual(display_name, f"OS:{test_file_path:s}")
 
+    def testGetEnvironmentVariables(self):
+        """Tests the GetEnvironmentVariables function."""
+        parser_mediator = mediator.ParserMediator()
+
+        storage_writer = fake_writer.FakeStorageWriter()
+        parser_mediator.SetStorageWriter(storage_writer)
+
+        environment_variables = parser_mediator.GetEnvironmentVariables()
+        self.assertIsNone(environment_variables)
+
     def testGetFileEntry(self):
         """Tests the GetFileEntry function."""
         parser_mediator = mediator.ParserMediator()
@@ -260,6 +270,50 @@ class ParsersMediatorTest(test_lib.ParserTestCase):
 
         parser_mediator.SignalAbort()
 
+    def testStartAndStopRecordingParseResults(self):
+        """Tests the Start and StopRecordingParseResults functions."""
+        parser_mediator = mediator.ParserMediator()
+
+        storage_writer = fake_writer.FakeStorageWriter()
+        parser_mediator.SetStorageWriter(storage_writer)
+
+        storage_writer.Open()
+
+        try:
+            parser_mediator.ProduceEventDataStream(events.EventDataStream())
+
+            event_data = events.EventData()
+            event_data._parser_chain = "test_parser"
+            event_data.data_type = "test"
+
+            parser_mediator.StartRecordingParseResults()
+            parser_mediator.ProduceEventData(event_data)
+            parse_results = parser_mediator.StopRecordingParseResults()
+
+            self.assertEqual(parse_results, [(event_data, False, False)])
+
+            # Parse results that cannot be reused are not recorded.
+            parser_mediator.StartRecordingParseResults()
+            parser_mediator.CancelRecordingParseResults()
+            parse_results = parser_mediator.StopRecordingParseResults()
+
+            self.assertIsNone(parse_results)
+
+            parser_mediator.StartRecordingParseResults()
+            parser_mediator.ProduceEventDataStream(events.EventDataStream())
+            parse_results = parser_mediator.StopRecordingParseResults()
+
+            self.assertIsNone(parse_results)
+
+            parser_mediator.StartRecordingParseResults()
+            parser_mediator.SetFileEntry(None)
+            parse_results = parser_mediator.StopRecordingParseResults()
+
+            self.assertIsNone(parse_results)
+
+        finally:
+            storage_writer.Close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Tests for the binary event data serializer."""
+
+import unittest
+
+from acstore.containers import interface as containers_interface
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+from plaso.containers import events
+from plaso.serializer import binary_serializer
+
+from tests import test_lib as shared_test_lib
+
+
+class BinaryEventDataSerializerTest(shared_test_lib.BaseTestCase):
+    """Tests for the binary event data serializer."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestEventData(self):
+        """Creates test event data.
+
+        Returns:
+          EventData: event data.
+        """
+        event_data = events.EventData()
+        event_data._ignored = "Not serialized"
+        event_data._parser_chain = "test_parser"
+        event_data.data_type = "test:event2"
+
+        event_data.a_tuple = ("some item", [234, 52, 15])
+        event_data.boolean = True
+        event_data.date_time = dfdatetime_posix_time.PosixTime(timestamp=1621839644)
+        event_data.empty_string = ""
+        event_data.float = -122.082203542683
+        event_data.integer = 34
+        event_data.large_integer = 1 << 70
+        event_data.my_list = ["asf", 4234, 2, 54, "asf"]
+        event_data.null_value = None
+        event_data.string = "Normal string"
+        event_data.unicode_string = "And I am a unicorn. ímynd"
+        event_data.zero_integer = 0
+
+        event_data_stream_identifier = (
+            containers_interface.AttributeContainerIdentifier(
+                name="event_data_stream", sequence_number=1
+            )
+        )
+        event_data.SetEventDataStreamIdentifier(event_data_stream_identifier)
+
+        return event_data
+
+    def _GetComparableDict(self, event_data):
+        """Retrieves the attribute values of event data that compare by value.
+
+        Args:
+          event_data (EventData): event data.
+
+        Returns:
+          dict[str, object]: attribute values without the date and time value
+              and event data stream identifier.
+        """
+        event_data_dict = event_data.CopyToDict()
+        del event_data_dict["_event_data_stream_identifier"]
+        del event_data_dict["date_time"]
+        return event_data_dict
+
+    def testAddSchema(self):
+        """Tests the AddSchema function."""
+        serializer = binary_serializer.BinaryEventDataSerializer()
+
+        schema_identifier = serializer.AddSchema("test:event", ["integer"])
+        self.assertEqual(schema_identifier, 0)
+
+        schema_identifier = serializer.AddSchema("test:event", ["string"])
+        self.assertEqual(schema_identifier, 1)
+
+        self.assertEqual(len(serializer.schemas), 2)
+
+    def testReadAndWriteSerialized(self):
+        """Tests the ReadSerialized and WriteSerialized functions."""
+        expected_event_data = self._CreateTestEventData()
+
+        serializer = binary_serializer.BinaryEventDataSerializer()
+
+        serialized_data = serializer.WriteSerialized(expected_event_data)
+        self.assertIsInstance(serialized_data, bytes)
+        self.assertEqual(len(serializer.schemas), 1)
+
+        data_type, attribute_names = serializer.schemas[0]
+        self.assertEqual(data_type, "test:event2")
+        self.assertNotIn("data_type", attribute_names)
+        self.assertNotIn("null_value", attribute_names)
+        self.assertIn("_parser_chain", attribute_names)
+
+        # Event data with the same attributes reuses the schema.
+        serialized_data = serializer.WriteSerialized(expected_event_data)
+        self.assertEqual(len(serializer.schemas), 1)
+
+        event_data = serializer.ReadSerialized(serialized_data)
+        self.assertIsInstance(event_data, events.EventData)
+
+        self.assertEqual(
+            self._GetComparableDict(event_data),
+            self._GetComparableDict(expected_event_data),
+        )
+
+        event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+        self.assertIsNotNone(event_data_stream_identifier)
+        self.assertEqual(event_data_stream_identifier.name, "event_data_stream")
+        self.assertEqual(event_data_stream_identifier.sequence_number, 1)
+
+        self.assertIsInstance(event_data.date_time, dfdatetime_posix_time.PosixTime)
+        self.assertEqual(event_data.date_time.timestamp, 1621839644)
+
+        # A serializer with the same schemas can read the serialized data.
+        other_serializer = binary_serializer.BinaryEventDataSerializer()
+        for data_type, attribute_names in serializer.schemas:
+            other_serializer.AddSchema(data_type, attribute_names)
+
+        event_data = other_serializer.ReadSerialized(serialized_data)
+        self.assertEqual(
+            self._GetComparableDict(event_data),
+            self._GetComparableDict(expected_event_data),
+        )
+
+        # A serializer without the schema cannot read the serialized data.
+        other_serializer = binary_serializer.BinaryEventDataSerializer()
+        with self.assertRaises(ValueError):
+            other_serializer.ReadSerialized(serialized_data)
+
+    def testReadSerializedWithTruncatedData(self):
+        """Tests the ReadSerialized function with truncated serialized data."""
+        serializer = binary_serializer.BinaryEventDataSerializer()
+
+        serialized_data = serializer.WriteSerialized(self._CreateTestEventData())
+
+        for data_size in range(len(serialized_data)):
+            with self.assertRaises(ValueError):
+                serializer.ReadSerialized(serialized_data[:data_size])
+
+        # Test with a value size that exceeds the serialized data.
+        event_data = events.EventData(data_type="test:event")
+        event_data.string = "Normal string"
+
+        serialized_data = bytearray(serializer.WriteSerialized(event_data))
+        serialized_data[5:9] = b"\xff\x00\x00\x00"
+
+        with self.assertRaises(ValueError):
+            serializer.ReadSerialized(bytes(serialized_data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Tests for the compression of serialized attribute container data."""
+
+import unittest
+
+from plaso.lib import definitions
+from plaso.storage import compression
+
+from tests import test_lib as shared_test_lib
+
+
+class StorageCompressionTest(shared_test_lib.BaseTestCase):
+    """Tests for the compression of serialized attribute container data."""
+
+    _TEST_DATA = b'{"data_type": "test:event", "string": "Normal string"}' * 8
+
+    def testCompressAndDecompress(self):
+        """Tests the Compress and Decompress functions."""
+        for compression_format in sorted(definitions.COMPRESSION_FORMATS):
+            compressed_data = compression.StorageCompression.Compress(
+                compression_format, self._TEST_DATA
+            )
+            if compression_format != definitions.COMPRESSION_FORMAT_NONE:
+                self.assertLess(len(compressed_data), len(self._TEST_DATA))
+
+            data = compression.StorageCompression.Decompress(
+                compression_format, compressed_data
+            )
+            self.assertEqual(data, self._TEST_DATA)
+
+        with self.assertRaises(ValueError):
+            compression.StorageCompression.Compress("bogus", self._TEST_DATA)
+
+        with self.assertRaises(ValueError):
+            compression.StorageCompression.Decompress("bogus", self._TEST_DATA)
+
+        with self.assertRaises(ValueError):
+            compression.StorageCompression.Decompress(
+                definitions.COMPRESSION_FORMAT_ZLIB, b"bogus"
+            )
+
+    def testCompressAndDecompressWithDictionary(self):
+        """Tests the Compress and Decompress functions with a dictionary."""
+        dictionary = b'{"data_type": "test:event", "string": "Normal string"}'
+
+        for compression_format in sorted(
+            definitions.COMPRESSION_FORMATS_WITH_DICTIONARY
+        ):
+            compressed_data = compression.StorageCompression.Compress(
+                compression_format, self._TEST_DATA, dictionary=dictionary
+            )
+            data = compression.StorageCompression.Decompress(
+                compression_format, compressed_data, dictionary=dictionary
+            )
+            self.assertEqual(data, self._TEST_DATA)
+
+
+class CompressionDictionariesSerializerTest(shared_test_lib.BaseTestCase):
+    """Tests for the compression dictionaries serializer."""
+
+    def testReadAndWriteSerialized(self):
+        """Tests the ReadSerialized and WriteSerialized functions."""
+        expected_dictionaries = {"test:event": b"\x00test\xff"}
+
+        json_string = compression.CompressionDictionariesSerializer.WriteSerialized(
+            expected_dictionaries
+        )
+        self.assertEqual(json_string, '{"test:event": "AHRlc3T/"}')
+
+        dictionaries = compression.CompressionDictionariesSerializer.ReadSerialized(
+            json_string
+        )
+        self.assertEqual(dictionaries, expected_dictionaries)
+
+        with self.assertRaises(ValueError):
+            compression.CompressionDictionariesSerializer.ReadSerialized("bogus")
+
+        with self.assertRaises(ValueError):
+            compression.CompressionDictionariesSerializer.ReadSerialized("[]")
+
+
+class CompressionDictionaryTrainerTest(shared_test_lib.BaseTestCase):
+    """Tests for the compression dictionary trainer."""
+
+    def testTrain(self):
+        """Tests the AddSample and Train functions."""
+        trainer = compression.CompressionDictionaryTrainer()
+
+        for index in range(16):
+            trainer.AddSample(
+                "test:event",
+                (
+                    f'{{"data_type": "test:event", "filename": '
+                    f'"/Users/username/AppData/Local/file{index:d}.dat"}}'
+                ).encode("utf-8"),
+            )
+
+        trainer.AddSample("test:other", b"too few samples")
+
+        dictionaries = trainer.Train(maximum_size=64)
+        self.assertEqual(list(dictionaries.keys()), ["test:event"])
+
+        dictionary = dictionaries["test:event"]
+        self.assertGreater(len(dictionary), 0)
+        self.assertLessEqual(len(dictionary), 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
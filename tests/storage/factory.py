@@ -3,6 +3,7 @@
 
 import unittest
 
+from plaso.lib import definitions
 from plaso.storage import factory
 from plaso.storage.sqlite import reader as sqlite_reader
 from plaso.storage.sqlite import writer as sqlite_writer
@@ -23,6 +24,16 @@ class StorageFactoryTest(test_lib.StorageTestCase):
         )
         self.assertIsInstance(storage_reader, sqlite_reader.SQLiteStorageReader)
 
+    def testCreateStorageWriter(self):
+        """Test the CreateStorageWriter function."""
+        storage_writer = factory.StorageFactory.CreateStorageWriter(
+            definitions.STORAGE_FORMAT_SQLITE_SHARDED
+        )
+        self.assertIsInstance(storage_writer, sqlite_writer.SQLiteStorageWriter)
+
+        storage_writer = factory.StorageFactory.CreateStorageWriter("bogus")
+        self.assertIsNone(storage_writer)
+
     def testCreateStorageWriterForFile(self):
         """Test the CreateStorageWriterForFile function."""
         test_file_path = self._GetTestFilePath(["psort_test.plaso"])
@@ -101,6 +101,11 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
 
             event_tag.AddLabel("Label2")
 
+            test_event_tag = storage_writer.GetEventTagByEventIdentifer(
+                event_identifier
+            )
+            self.assertIsNone(test_event_tag)
+
             storage_writer.AddOrUpdateEventTag(event_tag)
 
             number_of_containers = storage_writer.GetNumberOfAttributeContainers(
@@ -108,6 +113,12 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
             )
             self.assertEqual(number_of_containers, 2)
 
+            test_event_tag = storage_writer.GetEventTagByEventIdentifer(
+                event_identifier
+            )
+            self.assertIsNotNone(test_event_tag)
+            self.assertEqual(test_event_tag.labels, ["Label2"])
+
             event_tag = events.EventTag()
             event_identifier = test_events[1].GetIdentifier()
             event_tag.SetEventIdentifier(event_identifier)
@@ -147,6 +158,25 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
         finally:
             storage_writer.Close()
 
+    def testGetSortedEventTriples(self):
+        """Tests the GetSortedEventTriples function."""
+        storage_writer = fake_writer.FakeStorageWriter()
+        storage_writer.Open()
+
+        try:
+            self._AddTestEvents(storage_writer)
+
+            test_event_triples = list(storage_writer.GetSortedEventTriples())
+            self.assertEqual(len(test_event_triples), 4)
+
+            event, event_data, event_data_stream = test_event_triples[0]
+            self.assertIsNotNone(event)
+            self.assertEqual(event_data.data_type, "syslog:line")
+            self.assertIsNotNone(event_data_stream)
+
+        finally:
+            storage_writer.Close()
+
         # TODO: add test with time range.
 
     def testOpenClose(self):
@@ -5,7 +5,9 @@ import unittest
 
 from acstore.containers import interface as containers_interface
 
+from plaso.containers import counts
 from plaso.containers import event_sources
+from plaso.containers import events
 from plaso.storage import reader
 from plaso.storage.fake import fake_store
 
@@ -94,6 +96,64 @@ class StorageReaderTest(test_lib.StorageTestCase):
         finally:
             test_reader._store.Close()
 
+    def testGetEventTagByEventIdentifer(self):
+        """Tests the GetEventTagByEventIdentifer function."""
+        test_reader = reader.StorageReader()
+        test_reader._store = fake_store.FakeStore()
+        test_reader._store.Open()
+
+        try:
+            event = events.EventObject()
+            test_reader._store.AddAttributeContainer(event)
+            event_identifier = event.GetIdentifier()
+
+            test_event_tag = test_reader.GetEventTagByEventIdentifer(event_identifier)
+            self.assertIsNone(test_event_tag)
+
+            event_tag = events.EventTag()
+            event_tag.AddLabel("Malware")
+            event_tag.SetEventIdentifier(event_identifier)
+            test_reader._store.AddAttributeContainer(event_tag)
+
+            # Reset the event tags map, since the reader expects a read-only store.
+            test_reader._event_tag_sequence_numbers = None
+
+            test_event_tag = test_reader.GetEventTagByEventIdentifer(event_identifier)
+            self.assertIsNotNone(test_event_tag)
+            self.assertEqual(test_event_tag.labels, ["Malware"])
+
+            other_event = events.EventObject()
+            test_reader._store.AddAttributeContainer(other_event)
+
+            test_event_tag = test_reader.GetEventTagByEventIdentifer(
+                other_event.GetIdentifier()
+            )
+            self.assertIsNone(test_event_tag)
+
+        finally:
+            test_reader._store.Close()
+
+    def testGetEventTimestampBoundaries(self):
+        """Tests the GetEventTimestampBoundaries function."""
+        test_reader = reader.StorageReader()
+        test_reader._store = fake_store.FakeStore()
+        test_reader._store.Open()
+
+        try:
+            timestamps = test_reader.GetEventTimestampBoundaries(2)
+            self.assertEqual(timestamps, [])
+
+            for timestamp in (3, 1, 2):
+                event = events.EventObject()
+                event.timestamp = timestamp
+                test_reader._store.AddAttributeContainer(event)
+
+            timestamps = test_reader.GetEventTimestampBoundaries(2)
+            self.assertEqual(timestamps, [1, 3, 3])
+
+        finally:
+            test_reader._store.Close()
+
     def testGetFormatVersion(self):
         """Tests the GetFormatVersion function."""
         test_reader = reader.StorageReader()
@@ -131,6 +191,35 @@ class StorageReaderTest(test_lib.StorageTestCase):
     # TODO: add tests for GetSessions
     # TODO: add tests for GetSortedEvents
 
+    def testGetWarningsCounters(self):
+        """Tests the GetWarningsCounters function."""
+        test_reader = reader.StorageReader()
+        test_reader._store = fake_store.FakeStore()
+        test_reader._store.Open()
+
+        try:
+            warnings_counters = test_reader.GetWarningsCounters()
+            self.assertEqual(warnings_counters, {})
+
+            warning_count = counts.WarningCount(
+                counter_name="extraction_warnings_by_parser_chain",
+                name="filestat",
+                number_of_events=3,
+            )
+            test_reader._store.AddAttributeContainer(warning_count)
+
+            warnings_counters = test_reader.GetWarningsCounters()
+
+        finally:
+            test_reader._store.Close()
+
+        self.assertEqual(
+            list(warnings_counters.keys()), ["extraction_warnings_by_parser_chain"]
+        )
+
+        warnings_counter = warnings_counters["extraction_warnings_by_parser_chain"]
+        self.assertEqual(warnings_counter["filestat"].number_of_events, 3)
+
     def testHasAttributeContainers(self):
         """Tests the HasAttributeContainers function."""
         test_reader = reader.StorageReader()
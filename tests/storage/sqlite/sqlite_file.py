@@ -5,7 +5,9 @@ import os
 import unittest
 
 from plaso.containers import events
+from plaso.filters import event_filter
 from plaso.lib import definitions
+from plaso.storage import time_range as storage_time_range
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -31,6 +33,62 @@ class _TestSQLiteStorageFileV20221023(sqlite_file.SQLiteStorageFile):
     _READ_COMPATIBLE_FORMAT_VERSION = 20211121
 
 
+class EventShardIndexTest(shared_test_lib.BaseTestCase):
+    """Tests for the event shard index."""
+
+    # pylint: disable=protected-access
+
+    def testAddSequenceNumber(self):
+        """Tests the AddSequenceNumber function."""
+        event_shard_index = sqlite_file._EventShardIndex()
+
+        event_shard_index.AddSequenceNumber(1, "event_shard_200904")
+        event_shard_index.AddSequenceNumber(2, "event_shard_200904")
+        event_shard_index.AddSequenceNumber(3, "event_shard_201204")
+        event_shard_index.AddSequenceNumber(5, "event_shard_201204")
+
+        self.assertEqual(len(event_shard_index._ranges), 3)
+
+    def testGetShardName(self):
+        """Tests the GetShardName function."""
+        event_shard_index = sqlite_file._EventShardIndex()
+
+        self.assertIsNone(event_shard_index.GetShardName(1))
+
+        event_shard_index.AddSequenceNumber(1, "event_shard_200904")
+        event_shard_index.AddSequenceNumber(2, "event_shard_200904")
+        event_shard_index.AddSequenceNumber(3, "event_shard_201204")
+        event_shard_index.AddSequenceNumber(5, "event_shard_201204")
+
+        self.assertIsNone(event_shard_index.GetShardName(0))
+        self.assertEqual(event_shard_index.GetShardName(2), "event_shard_200904")
+        self.assertEqual(event_shard_index.GetShardName(3), "event_shard_201204")
+        self.assertIsNone(event_shard_index.GetShardName(4))
+        self.assertEqual(event_shard_index.GetShardName(5), "event_shard_201204")
+        self.assertIsNone(event_shard_index.GetShardName(6))
+
+    def testSetShardName(self):
+        """Tests the SetShardName function."""
+        event_shard_index = sqlite_file._EventShardIndex()
+
+        for sequence_number in range(1, 4):
+            event_shard_index.AddSequenceNumber(sequence_number, "event_shard_200904")
+
+        event_shard_index.SetShardName(2, "event_shard_201204")
+
+        self.assertEqual(len(event_shard_index._ranges), 3)
+        self.assertEqual(event_shard_index.GetShardName(1), "event_shard_200904")
+        self.assertEqual(event_shard_index.GetShardName(2), "event_shard_201204")
+        self.assertEqual(event_shard_index.GetShardName(3), "event_shard_200904")
+
+        # Test with a sequence number that is not indexed.
+        event_shard_index.SetShardName(5, "event_shard_201204")
+
+        self.assertEqual(len(event_shard_index._ranges), 4)
+        self.assertIsNone(event_shard_index.GetShardName(4))
+        self.assertEqual(event_shard_index.GetShardName(5), "event_shard_201204")
+
+
 class SQLiteStorageFileTest(test_lib.StorageTestCase):
     """Tests for the SQLite-based storage file object."""
 
@@ -79,6 +137,17 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
                 test_store._CheckStorageMetadata(metadata_values)
 
             metadata_values["compression_format"] = definitions.COMPRESSION_FORMAT_ZLIB
+            metadata_values["format_version"] = f"{test_store._FORMAT_VERSION:d}"
+            metadata_values["event_data_serialization_format"] = "bogus"
+            with self.assertRaises(OSError):
+                test_store._CheckStorageMetadata(metadata_values)
+
+            metadata_values["event_data_serialization_format"] = (
+                definitions.SERIALIZER_FORMAT_BINARY
+            )
+            metadata_values["format_version"] = f"{test_store._FORMAT_VERSION:d}"
+            test_store._CheckStorageMetadata(metadata_values)
+
             metadata_values["serialization_format"] = None
             with self.assertRaises(OSError):
                 test_store._CheckStorageMetadata(metadata_values)
@@ -112,6 +181,56 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
     # TODO: add tests for _CreateAttributeContainerFromRow
     # TODO: add tests for _DeserializeAttributeContainer
 
+    def testGetAttributeContainerSchema(self):
+        """Tests the _GetAttributeContainerSchema function."""
+        event_data_stream = events.EventDataStream()
+        event_data_stream.md5_hash = "8f0bf95a7959baad9666b21a7feed79d"
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "plaso.sqlite")
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                schema = test_store._GetAttributeContainerSchema(
+                    event_data_stream.CONTAINER_TYPE
+                )
+                self.assertIn("duplicate_of", schema)
+
+                test_store.AddAttributeContainer(event_data_stream)
+                test_store._CommitWriteCache(event_data_stream.CONTAINER_TYPE)
+
+                # Simulate a storage file written before the duplicate_of
+                # attribute was added to the schema.
+                test_store._cursor.execute(
+                    "ALTER TABLE event_data_stream DROP COLUMN duplicate_of"
+                )
+
+            finally:
+                test_store.Close()
+
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path, read_only=True)
+
+            try:
+                schema = test_store._GetAttributeContainerSchema(
+                    event_data_stream.CONTAINER_TYPE
+                )
+                self.assertNotIn("duplicate_of", schema)
+                self.assertIn("md5_hash", schema)
+
+                containers = list(
+                    test_store.GetAttributeContainers(event_data_stream.CONTAINER_TYPE)
+                )
+                self.assertEqual(len(containers), 1)
+                self.assertEqual(
+                    containers[0].md5_hash, "8f0bf95a7959baad9666b21a7feed79d"
+                )
+                self.assertIsNone(containers[0].duplicate_of)
+
+            finally:
+                test_store.Close()
+
     def testGetAttributeContainersWithFilter(self):
         """Tests the _GetAttributeContainersWithFilter function."""
         event_data_stream = events.EventDataStream()
@@ -313,6 +432,281 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
     # TODO: add tests for CheckSupportedFormat
 
+    def testCompressionFormats(self):
+        """Tests reading and writing event data in the compression formats."""
+        compression_dictionaries = {
+            "test:event": b'"data_type": "test:event", "string": "Normal string"'
+        }
+
+        with shared_test_lib.TempDirectory() as temp_directory:
+            for compression_format in sorted(definitions.COMPRESSION_FORMATS):
+                for dictionaries in ({}, compression_dictionaries):
+                    if dictionaries and compression_format not in (
+                        definitions.COMPRESSION_FORMATS_WITH_DICTIONARY
+                    ):
+                        continue
+
+                    test_path = os.path.join(
+                        temp_directory,
+                        f"{compression_format:s}-{len(dictionaries):d}.sqlite",
+                    )
+                    test_store = sqlite_file.SQLiteStorageFile()
+                    test_store.compression_dictionaries = dictionaries
+                    test_store.compression_format = compression_format
+                    test_store.Open(path=test_path, read_only=False)
+
+                    try:
+                        event_data = events.EventData(data_type="test:event")
+                        event_data.string = "Normal string"
+                        test_store.AddAttributeContainer(event_data)
+
+                        event_data = events.EventData(data_type="test:other")
+                        event_data.string = "Other string"
+                        test_store.AddAttributeContainer(event_data)
+
+                    finally:
+                        test_store.Close()
+
+                    test_store = sqlite_file.SQLiteStorageFile()
+                    test_store.Open(path=test_path, read_only=True)
+
+                    try:
+                        self.assertEqual(
+                            test_store.compression_format, compression_format
+                        )
+                        self.assertEqual(
+                            test_store.compression_dictionaries, dictionaries
+                        )
+
+                        containers = list(
+                            test_store.GetAttributeContainers(
+                                events.EventData.CONTAINER_TYPE
+                            )
+                        )
+                        self.assertEqual(len(containers), 2)
+                        self.assertEqual(containers[0].string, "Normal string")
+                        self.assertEqual(containers[1].string, "Other string")
+
+                    finally:
+                        test_store.Close()
+
+            test_path = os.path.join(temp_directory, "unsupported.sqlite")
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.compression_dictionaries = compression_dictionaries
+            test_store.compression_format = definitions.COMPRESSION_FORMAT_ZSTD
+
+            with self.assertRaises(OSError):
+                test_store.Open(path=test_path, read_only=False)
+
+    def testEventDataSerializationFormats(self):
+        """Tests reading and writing event data in the serialization formats."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            for serialization_format in (
+                definitions.SERIALIZER_FORMAT_BINARY,
+                definitions.SERIALIZER_FORMAT_JSON,
+            ):
+                test_path = os.path.join(
+                    temp_directory, f"{serialization_format:s}.sqlite"
+                )
+                test_store = sqlite_file.SQLiteStorageFile()
+                test_store.event_data_serialization_format = serialization_format
+                test_store.Open(path=test_path, read_only=False)
+
+                try:
+                    event_data_stream = events.EventDataStream()
+                    test_store.AddAttributeContainer(event_data_stream)
+
+                    event_data = events.EventData(data_type="test:event")
+                    event_data.integer = 34
+                    event_data.string = "Normal string"
+                    event_data.SetEventDataStreamIdentifier(
+                        event_data_stream.GetIdentifier()
+                    )
+                    test_store.AddAttributeContainer(event_data)
+
+                    event_data = events.EventData(data_type="test:event")
+                    event_data.string = "Other string"
+                    test_store.AddAttributeContainer(event_data)
+
+                finally:
+                    test_store.Close()
+
+                test_store = sqlite_file.SQLiteStorageFile()
+                test_store.Open(path=test_path, read_only=True)
+
+                try:
+                    self.assertEqual(
+                        test_store.event_data_serialization_format,
+                        serialization_format,
+                    )
+
+                    containers = list(
+                        test_store.GetAttributeContainers(
+                            events.EventData.CONTAINER_TYPE
+                        )
+                    )
+                    self.assertEqual(len(containers), 2)
+
+                    self.assertEqual(containers[0].data_type, "test:event")
+                    self.assertEqual(containers[0].integer, 34)
+                    self.assertEqual(containers[0].string, "Normal string")
+
+                    event_data_stream_identifier = containers[
+                        0
+                    ].GetEventDataStreamIdentifier()
+                    self.assertIsNotNone(event_data_stream_identifier)
+                    self.assertEqual(event_data_stream_identifier.sequence_number, 1)
+
+                    self.assertEqual(containers[1].string, "Other string")
+                    self.assertIsNone(containers[1].GetEventDataStreamIdentifier())
+
+                finally:
+                    test_store.Close()
+
+    def testEventShards(self):
+        """Tests storing events in event shard tables."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "plaso.sqlite")
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.event_shard_period = definitions.EVENT_SHARD_PERIOD_MONTH
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for event, event_data, _ in containers_test_lib.CreateEventsFromValues(
+                    self._TEST_EVENTS
+                ):
+                    test_store.AddAttributeContainer(event_data)
+
+                    event.SetEventDataIdentifier(event_data.GetIdentifier())
+                    test_store.AddAttributeContainer(event)
+
+                event_tag = events.EventTag()
+                event_tag.AddLabel("Malware")
+                event_tag.SetEventIdentifier(event.GetIdentifier())
+                test_store.AddAttributeContainer(event_tag)
+
+                self.assertEqual(
+                    sorted(test_store._event_shards.keys()),
+                    ["event_shard_200904", "event_shard_201204"],
+                )
+                self.assertFalse(test_store._HasTable("event"))
+
+            finally:
+                test_store.Close()
+
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path)
+
+            try:
+                self.assertEqual(
+                    test_store.event_shard_period,
+                    definitions.EVENT_SHARD_PERIOD_MONTH,
+                )
+                self.assertEqual(len(test_store._event_shards), 2)
+
+                number_of_events = test_store.GetNumberOfAttributeContainers("event")
+                self.assertEqual(number_of_events, 4)
+
+                test_events = list(test_store.GetAttributeContainers("event"))
+                self.assertEqual(len(test_events), 4)
+
+                sequence_numbers = [
+                    event.GetIdentifier().sequence_number for event in test_events
+                ]
+                self.assertEqual(sequence_numbers, [1, 2, 3, 4])
+
+                test_event = test_store.GetAttributeContainerByIndex("event", 3)
+                self.assertIsNotNone(test_event)
+                self.assertEqual(test_event.timestamp, test_events[3].timestamp)
+
+                test_event = test_store.GetAttributeContainerByIndex("event", 4)
+                self.assertIsNone(test_event)
+
+                timestamps = [event.timestamp for event in test_store.GetSortedEvents()]
+                self.assertEqual(timestamps, sorted(timestamps))
+                self.assertEqual(len(timestamps), 4)
+
+                timestamps = test_store.GetEventTimestampBoundaries(2)
+                self.assertEqual(
+                    timestamps,
+                    [
+                        1238934459000000,
+                        1334940286000000,
+                        1334966206929596,
+                        1334966206929596,
+                    ],
+                )
+
+                time_range = storage_time_range.TimeRange(
+                    1334880000000000, 1334966399999999
+                )
+                test_events = list(test_store.GetSortedEvents(time_range=time_range))
+                self.assertEqual(len(test_events), 3)
+
+                test_event_triples = list(test_store.GetSortedEventTriples())
+                self.assertEqual(len(test_event_triples), 4)
+
+                timestamps = [event.timestamp for event, _, _ in test_event_triples]
+                self.assertEqual(timestamps, sorted(timestamps))
+
+                test_event_triples = list(
+                    test_store.GetSortedEventTriples(time_range=time_range)
+                )
+                self.assertEqual(len(test_event_triples), 3)
+
+                test_filter = event_filter.EventObjectFilter()
+                test_filter.CompileFilter('tag contains "Malware"')
+                test_event_triples = list(
+                    test_store.GetSortedEventTriples(event_filter=test_filter)
+                )
+                self.assertEqual(len(test_event_triples), 1)
+
+            finally:
+                test_store.Close()
+
+            # Test moving an event to another event shard table.
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                test_event = test_store.GetAttributeContainerByIndex("event", 1)
+                self.assertIsNotNone(test_event)
+
+                event_shard_index = test_store._event_shard_index
+                self.assertEqual(
+                    event_shard_index.GetShardName(2), "event_shard_201204"
+                )
+
+                test_event.timestamp = 1238934459000000
+                test_store.UpdateAttributeContainer(test_event)
+
+                self.assertEqual(
+                    event_shard_index.GetShardName(1), "event_shard_201204"
+                )
+                self.assertEqual(
+                    event_shard_index.GetShardName(2), "event_shard_200904"
+                )
+                self.assertEqual(
+                    event_shard_index.GetShardName(3), "event_shard_201204"
+                )
+
+            finally:
+                test_store.Close()
+
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path)
+
+            try:
+                test_event = test_store.GetAttributeContainerByIndex("event", 1)
+                self.assertIsNotNone(test_event)
+                self.assertEqual(test_event.timestamp, 1238934459000000)
+
+                number_of_events = test_store.GetNumberOfAttributeContainers("event")
+                self.assertEqual(number_of_events, 4)
+
+            finally:
+                test_store.Close()
+
     def testGetAttributeContainers(self):
         """Tests the GetAttributeContainers function."""
         event_data_stream = events.EventDataStream()
@@ -417,6 +811,44 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
             finally:
                 test_store.Close()
 
+    def testGetEventTimestampBoundaries(self):
+        """Tests the GetEventTimestampBoundaries function."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "plaso.sqlite")
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                timestamps = test_store.GetEventTimestampBoundaries(2)
+                self.assertEqual(timestamps, [])
+
+                for event, event_data, _ in containers_test_lib.CreateEventsFromValues(
+                    self._TEST_EVENTS
+                ):
+                    test_store.AddAttributeContainer(event_data)
+
+                    event.SetEventDataIdentifier(event_data.GetIdentifier())
+                    test_store.AddAttributeContainer(event)
+
+            finally:
+                test_store.Close()
+
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path)
+
+            try:
+                timestamps = test_store.GetEventTimestampBoundaries(2)
+                self.assertEqual(
+                    timestamps,
+                    [1238934459000000, 1334961526929596, 1334966206929596],
+                )
+
+                timestamps = test_store.GetEventTimestampBoundaries(10)
+                self.assertEqual(timestamps, [1238934459000000, 1334966206929596])
+
+            finally:
+                test_store.Close()
+
     def testGetNumberOfAttributeContainers(self):
         """Tests the GetNumberOfAttributeContainers function."""
         event_data_stream = events.EventDataStream()
@@ -485,6 +917,145 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
         # TODO: add test with time range.
 
+    def testGetSortedEventTriples(self):
+        """Tests the GetSortedEventTriples function."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "plaso.sqlite")
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for (
+                    event,
+                    event_data,
+                    event_data_stream,
+                ) in containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS):
+                    test_store.AddAttributeContainer(event_data_stream)
+
+                    event_data.SetEventDataStreamIdentifier(
+                        event_data_stream.GetIdentifier()
+                    )
+                    test_store.AddAttributeContainer(event_data)
+
+                    event.SetEventDataIdentifier(event_data.GetIdentifier())
+                    test_store.AddAttributeContainer(event)
+
+            finally:
+                test_store.Close()
+
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path)
+
+            try:
+                test_events = list(test_store.GetSortedEvents())
+                test_event_triples = list(test_store.GetSortedEventTriples())
+                self.assertEqual(len(test_event_triples), 4)
+
+                for test_event, (event, event_data, event_data_stream) in zip(
+                    test_events, test_event_triples
+                ):
+                    self.assertEqual(event.timestamp, test_event.timestamp)
+                    self.assertEqual(
+                        event.GetIdentifier().CopyToString(),
+                        test_event.GetIdentifier().CopyToString(),
+                    )
+
+                    event_data_identifier = test_event.GetEventDataIdentifier()
+                    expected_event_data = test_store.GetAttributeContainerByIdentifier(
+                        event_data.CONTAINER_TYPE, event_data_identifier
+                    )
+                    self.assertEqual(
+                        event_data.GetIdentifier().CopyToString(),
+                        event_data_identifier.CopyToString(),
+                    )
+                    self.assertEqual(
+                        event_data.data_type, expected_event_data.data_type
+                    )
+                    self.assertEqual(
+                        event_data.GetAttributeValuesString(),
+                        expected_event_data.GetAttributeValuesString(),
+                    )
+
+                    self.assertIsNotNone(event_data_stream)
+                    self.assertEqual(
+                        event_data_stream.GetIdentifier().CopyToString(),
+                        event_data.GetEventDataStreamIdentifier().CopyToString(),
+                    )
+
+                time_range = storage_time_range.TimeRange(
+                    1334880000000000, 1334966399999999
+                )
+                test_event_triples = list(
+                    test_store.GetSortedEventTriples(time_range=time_range)
+                )
+                self.assertEqual(len(test_event_triples), 3)
+
+            finally:
+                test_store.Close()
+
+    def testGetSortedEventTriplesWithEventFilter(self):
+        """Tests the GetSortedEventTriples function with an event filter."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "plaso.sqlite")
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path, read_only=False)
+
+            try:
+                for event, event_data, _ in containers_test_lib.CreateEventsFromValues(
+                    self._TEST_EVENTS
+                ):
+                    test_store.AddAttributeContainer(event_data)
+
+                    event.SetEventDataIdentifier(event_data.GetIdentifier())
+                    test_store.AddAttributeContainer(event)
+
+                event_tag = events.EventTag()
+                event_tag.AddLabel("Malware")
+                event_tag.SetEventIdentifier(event.GetIdentifier())
+                test_store.AddAttributeContainer(event_tag)
+
+            finally:
+                test_store.Close()
+
+            test_store = sqlite_file.SQLiteStorageFile()
+            test_store.Open(path=test_path)
+
+            try:
+                self.assertTrue(test_store._event_data_has_indexed_columns)
+
+                test_filter = event_filter.EventObjectFilter()
+
+                test_filter.CompileFilter('data_type is "syslog:line"')
+                test_event_triples = list(
+                    test_store.GetSortedEventTriples(event_filter=test_filter)
+                )
+                self.assertEqual(len(test_event_triples), 1)
+
+                test_filter.CompileFilter(
+                    'parser is "test_parser" and '
+                    'timestamp > DATETIME("2012-04-20T22:00:00")'
+                )
+                test_event_triples = list(
+                    test_store.GetSortedEventTriples(event_filter=test_filter)
+                )
+                self.assertEqual(len(test_event_triples), 2)
+
+                test_filter.CompileFilter('tag contains "Malware"')
+                test_event_triples = list(
+                    test_store.GetSortedEventTriples(event_filter=test_filter)
+                )
+                self.assertEqual(len(test_event_triples), 1)
+
+                # The message attribute cannot be represented by SQL.
+                test_filter.CompileFilter('message contains "test"')
+                test_event_triples = list(
+                    test_store.GetSortedEventTriples(event_filter=test_filter)
+                )
+                self.assertEqual(len(test_event_triples), 4)
+
+            finally:
+                test_store.Close()
+
     def testHasAttributeContainers(self):
         """Tests the HasAttributeContainers function."""
         event_data_stream = events.EventDataStream()
@@ -5,6 +5,7 @@ import os
 import unittest
 
 from plaso.containers import events
+from plaso.containers import warnings
 from plaso.lib import definitions
 from plaso.storage.sqlite import writer as sqlite_writer
 
@@ -184,6 +185,67 @@ class SQLiteStorageWriterTest(test_lib.StorageTestCase):
             with self.assertRaises(OSError):
                 storage_writer.Close()
 
+    def testWarningsCounters(self):
+        """Tests that the warnings counters are maintained."""
+        with shared_test_lib.TempDirectory() as temp_directory:
+            test_path = os.path.join(temp_directory, "plaso.sqlite")
+            storage_writer = sqlite_writer.SQLiteStorageWriter()
+            storage_writer.Open(path=test_path)
+
+            try:
+                for parser_chain in ("filestat", "filestat", "winreg"):
+                    warning = warnings.ExtractionWarning(
+                        message="test", parser_chain=parser_chain
+                    )
+                    storage_writer.AddAttributeContainer(warning)
+
+            finally:
+                storage_writer.Close()
+
+            storage_writer.Open(path=test_path)
+
+            try:
+                warning = warnings.ExtractionWarning(
+                    message="test", parser_chain="winreg"
+                )
+                storage_writer.AddAttributeContainer(warning)
+
+                warning = warnings.RecoveryWarning(
+                    message="test", parser_chain="filestat"
+                )
+                storage_writer.AddAttributeContainer(warning)
+
+            finally:
+                storage_writer.Close()
+
+            storage_writer.Open(path=test_path)
+
+            try:
+                warnings_counters = storage_writer.GetWarningsCounters()
+
+            finally:
+                storage_writer.Close()
+
+        self.assertEqual(
+            sorted(warnings_counters.keys()),
+            [
+                "extraction_warnings_by_parser_chain",
+                "extraction_warnings_by_path_spec",
+                "recovery_warnings_by_parser_chain",
+                "recovery_warnings_by_path_spec",
+            ],
+        )
+
+        warnings_counter = warnings_counters["extraction_warnings_by_parser_chain"]
+        self.assertEqual(warnings_counter["filestat"].number_of_events, 2)
+        self.assertEqual(warnings_counter["winreg"].number_of_events, 2)
+
+        warnings_counter = warnings_counters["extraction_warnings_by_path_spec"]
+        self.assertEqual(warnings_counter["N/A"].number_of_events, 4)
+
+        warnings_counter = warnings_counters["recovery_warnings_by_parser_chain"]
+        self.assertEqual(warnings_counter["filestat"].number_of_events, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Script to benchmark the event filters.
+
+Synthetic events are matched against event filter expressions, both by
+interpreting the filter tree and with the compiled match function.
+"""
+
+import argparse
+import sys
+import time
+
+from plaso.containers import events
+from plaso.filters import event_filter
+
+
+class EventFiltersBenchmark:
+    """Event filters benchmark."""
+
+    FILTER_EXPRESSIONS = {
+        "data_type": "data_type is 'windows:evtx:record'",
+        "and": (
+            "data_type is 'windows:evtx:record' AND "
+            "source_name is 'Microsoft-Windows-Security-Auditing' AND "
+            "event_identifier is 4624"
+        ),
+        "or": (
+            "data_type is 'fs:stat' OR data_type is 'windows:prefetch:execution' "
+            "OR data_type is 'windows:registry:userassist'"
+        ),
+        "contains": "data_type is 'fs:stat' AND filename contains 'Windows/Tasks/At'",
+        "regexp": "body iregexp 'session (opened|closed) for user'",
+        "timestamp": (
+            "timestamp > DATETIME('2020-01-01T00:00:00') AND "
+            "timestamp_desc contains 'Written'"
+        ),
+    }
+
+    _DATA_TYPES = [
+        "fs:stat",
+        "syslog:line",
+        "windows:evtx:record",
+        "windows:prefetch:execution",
+        "windows:registry:userassist",
+    ]
+
+    def _CreateEvent(self, index):
+        """Creates a synthetic event.
+
+        Args:
+          index (int): index of the event.
+
+        Returns:
+          tuple[EventObject, EventData, EventDataStream]: event, event data and
+              event data stream.
+        """
+        event = events.EventObject()
+        event.timestamp = 1577836800000000 + (index - 512) * 86400000000
+        event.timestamp_desc = "Content Modification Time"
+        if index % 2:
+            event.timestamp_desc = "Creation Time"
+
+        event_data = events.EventData()
+        event_data.data_type = self._DATA_TYPES[index % len(self._DATA_TYPES)]
+        event_data.body = f"session opened for user user{index:d} by (uid=0)"
+        event_data.event_identifier = 4624 + index % 4
+        event_data.filename = f"/Windows/Tasks/At{index:d}.job"
+        event_data.source_name = "Microsoft-Windows-Security-Auditing"
+
+        event_data_stream = events.EventDataStream()
+        event_data_stream.md5_hash = f"{index:032x}"
+
+        return event, event_data, event_data_stream
+
+    def Run(self, filter_expression, number_of_events):
+        """Runs the benchmark of a filter expression.
+
+        Args:
+          filter_expression (str): filter expression.
+          number_of_events (int): number of synthetic events to match.
+
+        Returns:
+          tuple[float, float]: number of events matched per second by
+              interpreting the filter and with the compiled match function.
+        """
+        test_filter = event_filter.EventObjectFilter()
+        test_filter.CompileFilter(filter_expression)
+
+        # pylint: disable=protected-access
+        interpreted_filter = test_filter._event_filter
+
+        # Create a limited set of distinct events so that creating them is not
+        # part of the benchmark.
+        events_set = [self._CreateEvent(index) for index in range(1024)]
+
+        start_time = time.perf_counter()
+        for index in range(number_of_events):
+            event, event_data, event_data_stream = events_set[index % 1024]
+            interpreted_filter.Matches(event, event_data, event_data_stream, None)
+
+        interpreted_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for index in range(number_of_events):
+            event, event_data, event_data_stream = events_set[index % 1024]
+            test_filter.Match(event, event_data, event_data_stream, None)
+
+        compiled_time = time.perf_counter() - start_time
+
+        return (
+            number_of_events / max(interpreted_time, 1e-9),
+            number_of_events / max(compiled_time, 1e-9),
+        )
+
+
+def Main():
+    """The main program function.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks the interpreted and compiled event filters on synthetic "
+            "events."
+        )
+    )
+    argument_parser.add_argument(
+        "--number_of_events",
+        "--number-of-events",
+        dest="number_of_events",
+        type=int,
+        default=1000000,
+        help="number of synthetic events to match per filter expression.",
+    )
+    options = argument_parser.parse_args()
+
+    if options.number_of_events <= 0:
+        print("Number of events must be larger than 0.")
+        return 1
+
+    benchmark = EventFiltersBenchmark()
+
+    print(f"{'Filter':<16s} {'Interpreted/s':>14s} {'Compiled/s':>14s}")
+
+    for name, filter_expression in benchmark.FILTER_EXPRESSIONS.items():
+        interpreted_per_second, compiled_per_second = benchmark.Run(
+            filter_expression, options.number_of_events
+        )
+        print(
+            f"{name:<16s} {interpreted_per_second:14.0f} "
+            f"{compiled_per_second:14.0f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
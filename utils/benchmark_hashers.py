@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Script to benchmark the hashing analyzer.
+
+Synthetic data is hashed in blocks of the analyzer size limit, both by
+updating the hashers serially and by the hashing analyzer, which updates
+the hashers in parallel on a thread pool.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from plaso.analyzers import hashing_analyzer
+from plaso.analyzers.hashers import manager as hashers_manager
+
+
+class HashersBenchmark:
+    """Hashers benchmark."""
+
+    def Run(self, hasher_names_string, data_size):
+        """Runs the benchmark.
+
+        Args:
+          hasher_names_string (str): comma separated names of hashers to run.
+          data_size (int): size of the synthetic data to hash.
+
+        Returns:
+          tuple[float, float]: number of bytes hashed per second by updating
+              the hashers serially and by the hashing analyzer.
+        """
+        analyzer = hashing_analyzer.HashingAnalyzer()
+        analyzer.SetHasherNames(hasher_names_string)
+
+        hasher_names = hashers_manager.HashersManager.GetHasherNamesFromString(
+            hasher_names_string
+        )
+        hashers = hashers_manager.HashersManager.GetHashers(hasher_names)
+
+        block_size = analyzer.SIZE_LIMIT
+        data = os.urandom(block_size)
+        number_of_blocks = max(data_size // block_size, 1)
+
+        start_time = time.perf_counter()
+        for _ in range(number_of_blocks):
+            for hasher in hashers:
+                hasher.Update(data)
+
+        for hasher in hashers:
+            hasher.GetStringDigest()
+
+        serial_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for _ in range(number_of_blocks):
+            analyzer.Analyze(data)
+
+        analyzer.GetResults()
+
+        threaded_time = time.perf_counter() - start_time
+
+        number_of_bytes = number_of_blocks * block_size
+
+        return (
+            number_of_bytes / max(serial_time, 1e-9),
+            number_of_bytes / max(threaded_time, 1e-9),
+        )
+
+
+def Main():
+    """The main program function.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks serial and threaded hashing of synthetic data by "
+            "the hashing analyzer."
+        )
+    )
+    argument_parser.add_argument(
+        "--data_size",
+        "--data-size",
+        dest="data_size",
+        type=int,
+        default=1024,
+        help="size of the synthetic data to hash in MiB.",
+    )
+    argument_parser.add_argument(
+        "--hashers",
+        dest="hashers",
+        type=str,
+        default="md5,sha1,sha256",
+        help="comma separated names of hashers to benchmark.",
+    )
+    options = argument_parser.parse_args()
+
+    if options.data_size <= 0:
+        print("Data size must be larger than 0.")
+        return 1
+
+    benchmark = HashersBenchmark()
+
+    serial_per_second, threaded_per_second = benchmark.Run(
+        options.hashers, options.data_size * 1024 * 1024
+    )
+
+    print(f"{'Hashers':<24s} {'Serial MiB/s':>14s} {'Threaded MiB/s':>14s}")
+    print(
+        f"{options.hashers:<24s} {serial_per_second / (1024 * 1024):14.1f} "
+        f"{threaded_per_second / (1024 * 1024):14.1f}"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
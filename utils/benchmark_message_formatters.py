@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Script to benchmark the message formatters.
+
+Synthetic event values are formatted with a message formatter per formatter
+type, including the formatters that use the boolean, enumeration, flags and
+custom event formatter helpers.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from plaso import formatters  # pylint: disable=unused-import
+from plaso.output import mediator
+
+
+class MessageFormattersBenchmark:
+    """Message formatters benchmark."""
+
+    _FORMATTERS_DEFINITION = "\n".join(
+        [
+            "type: 'basic'",
+            "data_type: 'benchmark:basic'",
+            "message: 'Name: {name} Size: {size:d} bytes Offset: 0x{offset:08x}'",
+            "short_message: 'Name: {name}'",
+            "short_source: 'TEST'",
+            "source: 'Benchmark'",
+            "---",
+            "type: 'conditional'",
+            "data_type: 'benchmark:conditional'",
+            "message:",
+            "- 'Name: {name}'",
+            "- 'Size: {size:d} bytes'",
+            "- 'Offset: 0x{offset:08x}'",
+            "- 'Optional: {optional}'",
+            "short_message:",
+            "- 'Name: {name}'",
+            "short_source: 'TEST'",
+            "source: 'Benchmark'",
+            "---",
+            "type: 'conditional'",
+            "data_type: 'benchmark:boolean'",
+            "boolean_helpers:",
+            "- input_attribute: 'hidden'",
+            "  output_attribute: 'hidden_string'",
+            "  value_if_false: 'visible'",
+            "  value_if_true: 'hidden'",
+            "message:",
+            "- 'Name: {name}'",
+            "- '({hidden_string})'",
+            "short_message:",
+            "- 'Name: {name}'",
+            "short_source: 'TEST'",
+            "source: 'Benchmark'",
+            "---",
+            "type: 'conditional'",
+            "data_type: 'benchmark:enumeration'",
+            "enumeration_helpers:",
+            "- input_attribute: 'value_type'",
+            "  output_attribute: 'value_type'",
+            "  default_value: 'UNKNOWN'",
+            "  values:",
+            "    1: 'REG_SZ'",
+            "    3: 'REG_BINARY'",
+            "    4: 'REG_DWORD_LE'",
+            "message:",
+            "- 'Name: {name}'",
+            "- 'Type: {value_type}'",
+            "short_message:",
+            "- 'Name: {name}'",
+            "short_source: 'TEST'",
+            "source: 'Benchmark'",
+            "---",
+            "type: 'conditional'",
+            "data_type: 'benchmark:flags'",
+            "flags_helpers:",
+            "- input_attribute: 'reason_flags'",
+            "  output_attribute: 'reason'",
+            "  values:",
+            "    0x00000001: 'DATA_OVERWRITE'",
+            "    0x00000002: 'DATA_EXTEND'",
+            "    0x00000100: 'FILE_CREATE'",
+            "    0x00000200: 'FILE_DELETE'",
+            "message:",
+            "- 'Name: {name}'",
+            "- 'Reason: {reason}'",
+            "short_message:",
+            "- 'Name: {name}'",
+            "short_source: 'TEST'",
+            "source: 'Benchmark'",
+            "---",
+            "type: 'conditional'",
+            "data_type: 'benchmark:custom'",
+            "custom_helpers:",
+            "- identifier: 'ntfs_file_reference'",
+            "  output_attribute: 'file_reference'",
+            "message:",
+            "- 'Name: {name}'",
+            "- 'File reference: {file_reference}'",
+            "short_message:",
+            "- 'Name: {name}'",
+            "short_source: 'TEST'",
+            "source: 'Benchmark'",
+            "",
+        ]
+    )
+
+    FORMATTER_TYPES = [
+        "basic",
+        "boolean",
+        "conditional",
+        "custom",
+        "enumeration",
+        "flags",
+    ]
+
+    def __init__(self):
+        """Initializes a message formatters benchmark."""
+        super().__init__()
+        self._output_mediator = mediator.OutputMediator(None)
+
+    def _CreateEventValues(self, formatter_type, index):
+        """Creates synthetic event values.
+
+        Args:
+          formatter_type (str): formatter type.
+          index (int): index of the event.
+
+        Returns:
+          dict[str, object]: event values.
+        """
+        event_values = {
+            "data_type": f"benchmark:{formatter_type:s}",
+            "name": f"C:\\Windows\\System32\\file{index:d}.dll",
+            "offset": index * 512,
+            "size": index % 65536,
+        }
+        if formatter_type == "boolean":
+            event_values["hidden"] = bool(index % 2)
+
+        elif formatter_type == "custom":
+            event_values["file_reference"] = (index % 8 << 48) | index
+
+        elif formatter_type == "enumeration":
+            event_values["value_type"] = index % 5
+
+        elif formatter_type == "flags":
+            event_values["reason_flags"] = index % 0x400
+
+        return event_values
+
+    def LoadFormatters(self, temporary_directory):
+        """Loads the message formatters.
+
+        Args:
+          temporary_directory (str): path of the directory to store the message
+              formatters file in.
+        """
+        path = os.path.join(temporary_directory, "formatters.yaml")
+        with open(path, "w", encoding="utf-8") as file_object:
+            file_object.write(self._FORMATTERS_DEFINITION)
+
+        self._output_mediator.ReadMessageFormattersFromFile(path)
+
+    def Run(self, formatter_type, number_of_events):
+        """Runs the benchmark of a formatter type.
+
+        Args:
+          formatter_type (str): formatter type.
+          number_of_events (int): number of synthetic events to format.
+
+        Returns:
+          float: number of events formatted per second.
+        """
+        message_formatter = self._output_mediator.GetMessageFormatter(
+            f"benchmark:{formatter_type:s}"
+        )
+
+        # Create a limited set of distinct event values so that creating them
+        # is not part of the benchmark.
+        event_values_set = [
+            self._CreateEventValues(formatter_type, index) for index in range(1024)
+        ]
+
+        start_time = time.perf_counter()
+        for index in range(number_of_events):
+            event_values = dict(event_values_set[index % 1024])
+            message_formatter.FormatEventValues(self._output_mediator, event_values)
+            message_formatter.GetMessage(event_values)
+            message_formatter.GetMessageShort(event_values)
+
+        format_time = time.perf_counter() - start_time
+
+        return number_of_events / max(format_time, 1e-9)
+
+
+def Main():
+    """The main program function.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks the message formatters on synthetic events per formatter "
+            "type."
+        )
+    )
+    argument_parser.add_argument(
+        "--number_of_events",
+        "--number-of-events",
+        dest="number_of_events",
+        type=int,
+        default=1000000,
+        help="number of synthetic events to format per formatter type.",
+    )
+    options = argument_parser.parse_args()
+
+    if options.number_of_events <= 0:
+        print("Number of events must be larger than 0.")
+        return 1
+
+    benchmark = MessageFormattersBenchmark()
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        benchmark.LoadFormatters(temporary_directory)
+
+    print(f"{'Formatter':<16s} {'Events/s':>12s}")
+
+    for formatter_type in benchmark.FORMATTER_TYPES:
+        events_per_second = benchmark.Run(formatter_type, options.number_of_events)
+        print(f"{formatter_type:<16s} {events_per_second:12.0f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Script to benchmark the compression formats of the storage file.
+
+The event data of a reference storage file is written to and read from
+a storage file per compression format. For the compression formats that
+support a preset compression dictionary the benchmark is also run with
+dictionaries trained on the event data of the reference storage file.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from plaso.lib import definitions
+from plaso.serializer import binary_serializer
+from plaso.serializer import json_serializer
+from plaso.storage import compression
+from plaso.storage.sqlite import sqlite_file
+
+
+class StorageCompressionBenchmark:
+    """Storage compression benchmark."""
+
+    _CONTAINER_TYPE_EVENT_DATA = "event_data"
+
+    def __init__(self, event_data_serialization_format):
+        """Initializes a storage compression benchmark.
+
+        Args:
+          event_data_serialization_format (str): serialization format of event
+              data.
+        """
+        super().__init__()
+        self._event_data = []
+        self._event_data_serialization_format = event_data_serialization_format
+        self._serialized_data_size = 0
+
+    def _ReadEventData(self, path):
+        """Reads event data from a storage file.
+
+        Args:
+          path (str): path of the storage file.
+
+        Returns:
+          int: number of event data read.
+        """
+        storage_file = sqlite_file.SQLiteStorageFile()
+        storage_file.Open(path=path, read_only=True)
+
+        try:
+            number_of_event_data = 0
+            for _ in storage_file.GetAttributeContainers(
+                self._CONTAINER_TYPE_EVENT_DATA
+            ):
+                number_of_event_data += 1
+
+        finally:
+            storage_file.Close()
+
+        return number_of_event_data
+
+    def _WriteEventData(self, path, compression_format, compression_dictionaries):
+        """Writes the event data to a new storage file.
+
+        Args:
+          path (str): path of the storage file.
+          compression_format (str): compression format.
+          compression_dictionaries (dict[str, bytes]): compression dictionaries
+              per event data type.
+        """
+        storage_file = sqlite_file.SQLiteStorageFile()
+        storage_file.compression_dictionaries = compression_dictionaries
+        storage_file.compression_format = compression_format
+        storage_file.event_data_serialization_format = (
+            self._event_data_serialization_format
+        )
+        storage_file.Open(path=path, read_only=False)
+
+        try:
+            for event_data in self._event_data:
+                storage_file.AddAttributeContainer(event_data)
+
+        finally:
+            storage_file.Close()
+
+    def LoadReferenceStorageFile(self, path):
+        """Loads the event data of a reference storage file.
+
+        Args:
+          path (str): path of the reference storage file.
+        """
+        storage_file = sqlite_file.SQLiteStorageFile()
+        storage_file.Open(path=path, read_only=True)
+
+        try:
+            self._event_data = list(
+                storage_file.GetAttributeContainers(self._CONTAINER_TYPE_EVENT_DATA)
+            )
+
+        finally:
+            storage_file.Close()
+
+        self._serialized_data_size = sum(
+            len(serialized_data) for _, serialized_data in self.SerializeEventData()
+        )
+
+    def Run(self, compression_format, compression_dictionaries, temporary_directory):
+        """Runs the benchmark of a compression format.
+
+        Args:
+          compression_format (str): compression format.
+          compression_dictionaries (dict[str, bytes]): compression dictionaries
+              per event data type.
+          temporary_directory (str): path of the directory to store the storage
+              file in.
+
+        Returns:
+          tuple[float, float, int]: write and read throughput in MiB per second
+              of serialized event data and size of the storage file.
+        """
+        path = os.path.join(temporary_directory, f"{compression_format:s}.plaso")
+        if os.path.exists(path):
+            os.remove(path)
+
+        start_time = time.perf_counter()
+        self._WriteEventData(path, compression_format, compression_dictionaries)
+        write_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self._ReadEventData(path)
+        read_time = time.perf_counter() - start_time
+
+        size_in_mib = self._serialized_data_size / (1024.0 * 1024.0)
+
+        return (
+            size_in_mib / max(write_time, 1e-9),
+            size_in_mib / max(read_time, 1e-9),
+            os.path.getsize(path),
+        )
+
+    def SerializeEventData(self):
+        """Serializes the event data.
+
+        Yields:
+          tuple[str, bytes]: event data type and serialized event data.
+        """
+        if self._event_data_serialization_format == (
+            definitions.SERIALIZER_FORMAT_BINARY
+        ):
+            serializer = binary_serializer.BinaryEventDataSerializer()
+        else:
+            serializer = json_serializer.JSONAttributeContainerSerializer
+
+        for event_data in self._event_data:
+            serialized_data = serializer.WriteSerialized(event_data)
+            if isinstance(serialized_data, str):
+                serialized_data = serialized_data.encode("utf-8")
+
+            yield event_data.data_type, serialized_data
+
+
+def Main():
+    """The main program function.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks the compression formats of the storage file on the event "
+            "data of a reference storage file."
+        )
+    )
+    argument_parser.add_argument(
+        "--dictionary_size",
+        "--dictionary-size",
+        dest="dictionary_size",
+        type=int,
+        default=(
+            compression.CompressionDictionaryTrainer.DEFAULT_MAXIMUM_DICTIONARY_SIZE
+        ),
+        help="maximum size of a trained compression dictionary, in bytes.",
+    )
+    argument_parser.add_argument(
+        "--event_data_serialization_format",
+        "--event-data-serialization-format",
+        dest="event_data_serialization_format",
+        choices=sorted(definitions.EVENT_DATA_SERIALIZER_FORMATS),
+        type=str,
+        default=definitions.SERIALIZER_FORMAT_BINARY,
+        help="serialization format of event data.",
+    )
+    argument_parser.add_argument(
+        "--write_dictionaries",
+        "--write-dictionaries",
+        dest="dictionaries_path",
+        type=str,
+        default=None,
+        help=(
+            "path of a file to write the trained compression dictionaries to, "
+            "which can be used with log2timeline.py "
+            "--storage_compression_dictionaries."
+        ),
+    )
+    argument_parser.add_argument(
+        "storage_file",
+        type=str,
+        help="path of the reference storage file.",
+    )
+    options = argument_parser.parse_args()
+
+    if not os.path.isfile(options.storage_file):
+        print(f"No such file: {options.storage_file:s}")
+        return 1
+
+    benchmark = StorageCompressionBenchmark(options.event_data_serialization_format)
+    benchmark.LoadReferenceStorageFile(options.storage_file)
+
+    trainer = compression.CompressionDictionaryTrainer()
+    for data_type, serialized_data in benchmark.SerializeEventData():
+        trainer.AddSample(data_type, serialized_data)
+
+    compression_dictionaries = trainer.Train(maximum_size=options.dictionary_size)
+
+    if options.dictionaries_path:
+        with open(options.dictionaries_path, "w", encoding="utf-8") as file_object:
+            file_object.write(
+                compression.CompressionDictionariesSerializer.WriteSerialized(
+                    compression_dictionaries
+                )
+            )
+
+    print(
+        f"Trained compression dictionaries for: {len(compression_dictionaries):d} "
+        f"event data types"
+    )
+    print("")
+    print(
+        f"{'Compression':<16s} {'Write MiB/s':>12s} {'Read MiB/s':>12s} {'Size':>12s}"
+    )
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        for compression_format in sorted(definitions.COMPRESSION_FORMATS):
+            runs = [(compression_format, {})]
+            if compression_format in definitions.COMPRESSION_FORMATS_WITH_DICTIONARY:
+                runs.append((f"{compression_format:s}+dict", compression_dictionaries))
+
+            for name, dictionaries in runs:
+                write_throughput, read_throughput, file_size = benchmark.Run(
+                    compression_format, dictionaries, temporary_directory
+                )
+                print(
+                    f"{name:<16s} {write_throughput:12.2f} {read_throughput:12.2f} "
+                    f"{file_size:12d}"
+                )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
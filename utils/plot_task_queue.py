@@ -44,7 +44,15 @@ def Main():
         print(f"No such directory: {options.profile_path:s}")
         return 1
 
-    names = ["time", "queued", "processing", "to_merge", "abandoned", "total"]
+    names = [
+        "time",
+        "queued",
+        "processing",
+        "to_merge",
+        "abandoned",
+        "total",
+        "merge_queue",
+    ]
 
     glob_expression = os.path.join(options.profile_path, "task_queue-*.csv.gz")
     for csv_file_name in glob.glob(glob_expression):